@@ -1,8 +1,10 @@
 from .config import BacktestConfig, WalkForwardConfig
 from .costs import CostModel
 from .engine import EventBacktester, MarketEvent
-from .reporting import BacktestReport, PerformanceReport, build_performance_report
+from .portfolio_engine import PortfolioBacktester
+from .reporting import BacktestReport, BacktestReporter
 from .simulator import TradeSimulator
+from .vectorized import ColumnarBars, VectorizedBacktester
 from .walk_forward import WalkForwardRunner
 
 __all__ = [
@@ -12,8 +14,10 @@ __all__ = [
     "EventBacktester",
     "MarketEvent",
     "BacktestReport",
-    "PerformanceReport",
+    "BacktestReporter",
     "TradeSimulator",
-    "build_performance_report",
     "WalkForwardRunner",
+    "ColumnarBars",
+    "VectorizedBacktester",
+    "PortfolioBacktester",
 ]
@@ -0,0 +1,253 @@
+"""
+Streaming storage for batch backtest results.
+
+Batch runs write results as they arrive instead of holding every report in
+the parent process:
+
+- ``summary/part-NNNNN.parquet``: one row per symbol (metrics or error),
+  flushed every ``flush_rows`` results so a crash loses at most one chunk
+- ``trades/symbol=<SYMBOL>/part-0.parquet`` and
+  ``equity/symbol=<SYMBOL>/part-0.parquet``: written by the worker that ran
+  the symbol, so full reports never cross the process boundary
+
+``BatchSummary`` aggregates summary rows one at a time, either live while
+results stream in or afterwards by scanning the summary parts in record
+batches; its memory does not depend on the number of symbols.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .reporting import EquityArrays, write_equity_parquet
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_DIR = "summary"
+TRADES_DIR = "trades"
+EQUITY_DIR = "equity"
+
+SUMMARY_SCHEMA = pa.schema([
+    ("symbol", pa.string()),
+    ("error", pa.string()),
+    ("total_return_pct", pa.float64()),
+    ("sharpe_ratio", pa.float64()),
+    ("max_drawdown_pct", pa.float64()),
+    ("win_rate_pct", pa.float64()),
+    ("total_trades", pa.int64()),
+    ("execution_time_seconds", pa.float64()),
+])
+
+TRADE_COLUMNS = (
+    "symbol", "side", "quantity", "entry_price", "exit_price",
+    "entry_time", "exit_time", "realized_pnl", "fees", "tags",
+)
+
+
+def summary_row(symbol: str, report: Any = None, error: Optional[str] = None,
+                execution_time_seconds: float = 0.0) -> Dict[str, Any]:
+    """Build a summary row from a finished report (or an error)."""
+    metrics = getattr(report, 'metrics', None)
+    return {
+        'symbol': symbol,
+        'error': error,
+        'total_return_pct': metrics.total_return_pct if metrics else None,
+        'sharpe_ratio': metrics.sharpe_ratio if metrics else None,
+        'max_drawdown_pct': metrics.max_drawdown_pct if metrics else None,
+        'win_rate_pct': metrics.win_rate_pct if metrics else None,
+        'total_trades': metrics.total_trades if metrics else None,
+        'execution_time_seconds': execution_time_seconds,
+    }
+
+
+def _partition_path(output_dir: Union[str, Path], kind: str, symbol: str) -> Path:
+    return Path(output_dir) / kind / f"symbol={symbol}" / "part-0.parquet"
+
+
+def _write_atomic(table: pa.Table, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def write_symbol_partitions(output_dir: Union[str, Path], symbol: str, report: Any) -> Dict[str, int]:
+    """
+    Write one symbol's trades and equity curve to their partitions.
+
+    Called in the worker process that produced ``report``; it accepts a
+    ``BacktestReport`` or any object with ``trade_log``/``equity_curve``
+    (or ``portfolio_accounting`` carrying them).
+
+    Returns:
+        Row counts written: {'trades': n, 'equity': m}
+    """
+    source = getattr(report, 'portfolio_accounting', None) or report
+    trades = list(getattr(source, 'trade_log', None) or getattr(report, 'trade_log', None) or [])
+    curve = getattr(report, 'equity_arrays', None)
+    if curve is None:
+        curve = EquityArrays.from_points(list(getattr(source, 'equity_curve', None) or []))
+
+    if trades:
+        columns: Dict[str, List[Any]] = {name: [] for name in TRADE_COLUMNS}
+        for trade in trades:
+            for name in TRADE_COLUMNS:
+                value = getattr(trade, name, None)
+                if name == 'tags':
+                    value = list(value or [])
+                elif name in ('quantity', 'entry_price', 'exit_price', 'realized_pnl', 'fees'):
+                    value = float(value) if value is not None else None
+                columns[name].append(value)
+        _write_atomic(pa.table(columns), _partition_path(output_dir, TRADES_DIR, symbol))
+
+    if len(curve):
+        path = _partition_path(output_dir, EQUITY_DIR, symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        write_equity_parquet(curve, str(tmp_path))
+        os.replace(tmp_path, path)
+
+    return {'trades': len(trades), 'equity': len(curve)}
+
+
+@dataclass
+class BatchSummary:
+    """Running aggregate over batch summary rows."""
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_trades: int = 0
+    return_sum: float = 0.0
+    sharpe_sum: float = 0.0
+    metric_rows: int = 0
+    best: Optional[Tuple[str, float]] = None
+    worst: Optional[Tuple[str, float]] = None
+    max_failures: int = 20
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+
+    def update(self, row: Dict[str, Any]) -> None:
+        """Fold one summary row into the aggregate."""
+        self.total += 1
+
+        if row.get('error'):
+            self.failed += 1
+            if len(self.failures) < self.max_failures:
+                self.failures.append((row['symbol'], row['error']))
+            return
+
+        self.successful += 1
+        self.total_trades += row.get('total_trades') or 0
+        total_return = row.get('total_return_pct')
+        if total_return is None or math.isnan(total_return):
+            return
+        self.metric_rows += 1
+        self.return_sum += total_return
+        self.sharpe_sum += row.get('sharpe_ratio') or 0.0
+        if self.best is None or total_return > self.best[1]:
+            self.best = (row['symbol'], total_return)
+        if self.worst is None or total_return < self.worst[1]:
+            self.worst = (row['symbol'], total_return)
+
+    @property
+    def mean_return_pct(self) -> float:
+        return self.return_sum / self.metric_rows if self.metric_rows else 0.0
+
+    @property
+    def mean_sharpe_ratio(self) -> float:
+        return self.sharpe_sum / self.metric_rows if self.metric_rows else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total_symbols': self.total,
+            'successful': self.successful,
+            'failed': self.failed,
+            'total_trades': self.total_trades,
+            'mean_return_pct': self.mean_return_pct,
+            'mean_sharpe_ratio': self.mean_sharpe_ratio,
+            'best': {'symbol': self.best[0], 'total_return_pct': self.best[1]} if self.best else None,
+            'worst': {'symbol': self.worst[0], 'total_return_pct': self.worst[1]} if self.worst else None,
+            'failures': [{'symbol': s, 'error': e} for s, e in self.failures],
+        }
+
+    @classmethod
+    def from_parquet(cls, output_dir: Union[str, Path], batch_size: int = 65_536) -> "BatchSummary":
+        """Recompute the aggregate by streaming the summary parts in record batches."""
+        summary = cls()
+        for row in iter_summary_rows(output_dir, batch_size):
+            summary.update(row)
+        return summary
+
+
+def _summary_parts(output_dir: Union[str, Path]) -> List[Path]:
+    return sorted((Path(output_dir) / SUMMARY_DIR).glob("part-*.parquet"))
+
+
+def iter_summary_rows(output_dir: Union[str, Path], batch_size: int = 65_536) -> Iterator[Dict[str, Any]]:
+    """Yield summary rows from every flushed part, one record batch in memory at a time."""
+    for path in _summary_parts(output_dir):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+
+
+class BatchResultWriter:
+    """
+    Appends batch summary rows to chunked Parquet parts.
+
+    Rows are buffered up to ``flush_rows`` and then written as a new part
+    file; the running ``summary`` is updated as each row is added.
+    """
+
+    def __init__(self, output_dir: Union[str, Path], flush_rows: int = 256):
+        self.output_dir = Path(output_dir)
+        self.summary_dir = self.output_dir / SUMMARY_DIR
+        self.summary_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self.summary = BatchSummary()
+        self._buffer: List[Dict[str, Any]] = []
+        existing = _summary_parts(self.output_dir)
+        self._next_part = int(existing[-1].stem.split("-")[1]) + 1 if existing else 0
+
+    def __enter__(self) -> "BatchResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Record one symbol's summary row."""
+        self.summary.update(row)
+        self._buffer.append(row)
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as a new summary part."""
+        if not self._buffer:
+            return
+        table = pa.Table.from_pylist(self._buffer, schema=SUMMARY_SCHEMA)
+        _write_atomic(table, self.summary_dir / f"part-{self._next_part:05d}.parquet")
+        self._next_part += 1
+        self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+
+    def completed_symbols(self) -> Set[str]:
+        """Symbols with a flushed summary row (successful or not)."""
+        symbols: Set[str] = set()
+        for path in _summary_parts(self.output_dir):
+            symbols.update(pq.read_table(path, columns=['symbol']).column('symbol').to_pylist())
+        return symbols
+
+    def resume(self) -> Set[str]:
+        """Reload the running summary from flushed parts and return the symbols already recorded."""
+        self.summary = BatchSummary.from_parquet(self.output_dir)
+        return self.completed_symbols()
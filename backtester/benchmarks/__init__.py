@@ -0,0 +1,6 @@
+"""
+Backtester performance benchmarks.
+
+Standalone timing scripts over synthetic data; run a module with
+``python -m backtester.benchmarks.<name>``.
+"""
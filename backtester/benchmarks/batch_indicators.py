@@ -0,0 +1,94 @@
+"""
+Multi-symbol batch indicator benchmark.
+
+Computes SMA, EMA, RSI, ATR, Bollinger Bands, MACD, ADX and stochastics
+for a (time x symbol) panel, once with the 2-D functions in
+``indicators.batch`` and once with one ``indicators.realtime`` call per
+symbol per indicator.
+
+Usage:
+    python -m backtester.benchmarks.batch_indicators --symbols 1500 --bars 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from indicators import batch, realtime
+
+
+def synthetic_panel(bars: int, symbols: int, seed: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Geometric random-walk highs, lows and closes; a tenth of the symbols list part-way through."""
+    rng = np.random.default_rng(seed)
+    closes = 1000 * np.exp(np.cumsum(rng.normal(0, 0.015, (bars, symbols)), axis=0))
+    highs = closes * (1 + rng.uniform(0, 0.01, (bars, symbols)))
+    lows = closes * (1 - rng.uniform(0, 0.01, (bars, symbols)))
+    for col in rng.choice(symbols, symbols // 10, replace=False):
+        listed = rng.integers(1, bars // 2)
+        closes[:listed, col] = highs[:listed, col] = lows[:listed, col] = np.nan
+    return highs, lows, closes
+
+
+def _per_symbol(fn: Callable, *panels: np.ndarray) -> Callable[[], None]:
+    def run_all() -> None:
+        for col in range(panels[0].shape[1]):
+            listed = int(np.argmax(~np.isnan(panels[-1][:, col])))
+            fn(*(p[listed:, col] for p in panels))
+    return run_all
+
+
+def run(symbols: int = 1500, bars: int = 2000, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Return best-of-``repeat`` seconds per indicator for the per-symbol loop and the batch functions."""
+    highs, lows, closes = synthetic_panel(bars, symbols)
+    hlc = (highs, lows, closes)
+    cases = {
+        "sma_20": (_per_symbol(lambda c: realtime.moving_average_simple(c, 20), closes),
+                   lambda: batch.moving_average_simple(closes, 20)),
+        "ema_20": (_per_symbol(lambda c: realtime.moving_average_exponential(c, 20), closes),
+                   lambda: batch.moving_average_exponential(closes, 20)),
+        "rsi_14": (_per_symbol(realtime.relative_strength_index, closes),
+                   lambda: batch.relative_strength_index(closes)),
+        "atr_14": (_per_symbol(realtime.average_true_range, *hlc), lambda: batch.average_true_range(*hlc)),
+        "bollinger_20": (_per_symbol(realtime.bollinger_bands, closes), lambda: batch.bollinger_bands(closes)),
+        "macd": (_per_symbol(realtime.moving_average_convergence_divergence, closes),
+                 lambda: batch.moving_average_convergence_divergence(closes)),
+        "adx_14": (_per_symbol(realtime.average_directional_index, *hlc),
+                   lambda: batch.average_directional_index(*hlc)),
+        "stochastic": (_per_symbol(realtime.stochastic_oscillator, *hlc), lambda: batch.stochastic_oscillator(*hlc)),
+    }
+
+    def best(fn: Callable) -> float:
+        elapsed = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            elapsed = min(elapsed, time.perf_counter() - started)
+        return elapsed
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {name: {"per_symbol": best(loop), "batch": best(panel)} for name, (loop, panel) in cases.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=1500, help="Symbols (panel columns)")
+    parser.add_argument("--bars", type=int, default=2000, help="Bars per symbol (panel rows)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (best is kept)")
+    args = parser.parse_args()
+
+    results = run(symbols=args.symbols, bars=args.bars, repeat=args.repeat)
+    print(f"{'indicator':>14}  {'per-symbol s':>12}  {'batch s':>8}  {'speedup':>8}")
+    for name, timing in results.items():
+        print(f"{name:>14}  {timing['per_symbol']:>12.3f}  {timing['batch']:>8.3f}  "
+              f"{timing['per_symbol'] / timing['batch']:>7.1f}x")
+    loop_total = sum(t["per_symbol"] for t in results.values())
+    batch_total = sum(t["batch"] for t in results.values())
+    print(f"{'total':>14}  {loop_total:>12.3f}  {batch_total:>8.3f}  {loop_total / batch_total:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Candlestick pattern scanner benchmark.
+
+Compares running every ``detect_*`` candlestick detector from
+``indicators.patterns`` separately (each one recomputing body, range and
+shadows) with the fused ``scan_candlestick_bitmask`` pass, and times the
+latest-bar mode (``scan_latest_candle``) that a live feed calls once per
+new bar.
+
+Usage:
+    python -m backtester.benchmarks.candlestick_scanner --bars 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from indicators import patterns
+
+
+def detector_scan(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> list:
+    """Every candlestick detector called on its own."""
+    return [
+        patterns.detect_doji(opens, highs, lows, closes),
+        patterns.detect_hammer(opens, highs, lows, closes),
+        patterns.detect_spinning_top(opens, highs, lows, closes),
+        patterns.detect_engulfing(opens, highs, lows, closes),
+        patterns.detect_morning_star(opens, highs, lows, closes),
+        patterns.detect_evening_star(opens, highs, lows, closes),
+        patterns.detect_three_white_soldiers(opens, highs, lows, closes),
+        patterns.detect_three_black_crows(opens, highs, lows, closes),
+        patterns.detect_piercing_line(opens, highs, lows, closes),
+        patterns.detect_dark_cloud_cover(opens, highs, lows, closes),
+        patterns.detect_harami(opens, highs, lows, closes),
+        patterns.detect_marubozu(opens, highs, lows, closes),
+        patterns.detect_abandoned_baby(opens, highs, lows, closes),
+        patterns.detect_kicking(opens, highs, lows, closes),
+        patterns.detect_tweezer_top_bottom(highs, lows, closes),
+        patterns.detect_rising_falling_window(opens, highs, lows, closes),
+        patterns.detect_three_methods(opens, highs, lows, closes),
+        patterns.detect_tasuki_gap(opens, highs, lows, closes),
+    ]
+
+
+def synthetic_candles(bars: int, seed: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Random-walk opens, highs, lows and closes."""
+    rng = np.random.default_rng(seed)
+    closes = 2500 * np.exp(np.cumsum(rng.normal(0, 0.002, bars)))
+    opens = np.concatenate([closes[:1], closes[:-1]]) * (1 + rng.normal(0, 0.0005, bars))
+    highs = np.maximum(opens, closes) * (1 + rng.uniform(0, 0.001, bars))
+    lows = np.minimum(opens, closes) * (1 - rng.uniform(0, 0.001, bars))
+    return opens, highs, lows, closes
+
+
+def run(bars: int = 100_000, repeat: int = 5) -> Dict[str, float]:
+    """Return best-of-``repeat`` milliseconds for each scan mode."""
+    opens, highs, lows, closes = synthetic_candles(bars)
+
+    def best_ms(fn: Callable) -> float:
+        elapsed = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            elapsed = min(elapsed, time.perf_counter() - started)
+        return elapsed * 1000
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "detectors_ms": best_ms(lambda: detector_scan(opens, highs, lows, closes)),
+            "fused_ms": best_ms(lambda: patterns.scan_candlestick_bitmask(opens, highs, lows, closes)),
+            "latest_bar_ms": best_ms(lambda: patterns.scan_latest_candle(opens, highs, lows, closes)),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bars", type=int, default=100_000, help="Bars in the series")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is kept)")
+    args = parser.parse_args()
+
+    result = run(bars=args.bars, repeat=args.repeat)
+    print(f"separate detectors: {result['detectors_ms']:.2f} ms")
+    print(f"fused bitmask scan: {result['fused_ms']:.2f} ms "
+          f"({result['detectors_ms'] / result['fused_ms']:.1f}x)")
+    print(f"latest bar only:    {result['latest_bar_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
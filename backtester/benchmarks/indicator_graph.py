@@ -0,0 +1,82 @@
+"""
+Indicator panel benchmark: shared DAG vs independent calls.
+
+Evaluates MACD, Bollinger Bands, Keltner Channels, ATR, ADX and Supertrend
+over one series once through ``indicators.graph.IndicatorGraph`` (shared
+true range, ATR and EMAs) and once as independent ``indicators.realtime``
+calls, each recomputing its own intermediates. Keltner Channels are
+composed from ``realtime`` EMA and ATR, as ``technicals.keltner_channels``
+does.
+
+Usage:
+    python -m backtester.benchmarks.indicator_graph --bars 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import numpy as np
+
+from indicators import realtime
+from indicators.graph import IndicatorGraph, request
+
+from .realtime_indicators import synthetic_bars
+
+PANEL = ['macd', 'bollinger_bands', 'keltner_channels', request('atr', period=14),
+         request('adx', period=14), request('supertrend', period=10, multiplier=3.0)]
+
+
+def independent_panel(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Dict[str, object]:
+    ema = realtime.moving_average_exponential((highs + lows + closes) / 3, 20)
+    atr = realtime.average_true_range(highs, lows, closes, 20)
+    return {
+        "macd": realtime.moving_average_convergence_divergence(closes),
+        "bollinger_bands": realtime.bollinger_bands(closes),
+        "keltner_channels": (ema[1:] + 2.0 * atr, ema, ema[1:] - 2.0 * atr),
+        "atr_14": realtime.average_true_range(highs, lows, closes, 14),
+        "adx_14": realtime.average_directional_index(highs, lows, closes, 14),
+        "supertrend_10_3.0": realtime.supertrend(highs, lows, closes, 10, 3.0),
+    }
+
+
+def run(bars: int = 100_000, repeat: int = 5) -> Dict[str, float]:
+    """Return best-of-``repeat`` milliseconds per panel evaluation, plus graph node counts."""
+    highs, lows, closes = synthetic_bars(bars)
+    graph = IndicatorGraph(PANEL)
+    data = {"high": highs, "low": lows, "close": closes}
+
+    def best_ms(fn: Callable) -> float:
+        elapsed = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            elapsed = min(elapsed, time.perf_counter() - started)
+        return elapsed * 1000
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "independent_ms": best_ms(lambda: independent_panel(highs, lows, closes)),
+            "graph_ms": best_ms(lambda: graph.evaluate(data)),
+            "graph_nodes": len(graph.nodes),
+            "unshared_nodes": graph.naive_node_count(),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bars", type=int, default=100_000, help="Bars in the series")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is kept)")
+    args = parser.parse_args()
+
+    result = run(bars=args.bars, repeat=args.repeat)
+    print(f"nodes: {result['graph_nodes']} shared vs {result['unshared_nodes']} unshared")
+    print(f"independent calls: {result['independent_ms']:.2f} ms")
+    print(f"indicator graph:   {result['graph_ms']:.2f} ms "
+          f"({result['independent_ms'] / result['graph_ms']:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
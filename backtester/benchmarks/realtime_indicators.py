@@ -0,0 +1,150 @@
+"""
+Loop-based realtime indicator benchmark.
+
+Measures per-call latency of ``aroon``, ``get_pivots``,
+``rank_correlation_index``, ``parabolic_sar``, ``supertrend`` and
+``zig_zag`` from ``indicators.realtime`` on a 10k-bar window, next to the
+explicit per-bar Python loops they replaced (kept below as baselines).
+``supertrend`` has no baseline: the loop version raised on every input
+long enough to produce an ATR value.
+
+Usage:
+    python -m backtester.benchmarks.realtime_indicators --bars 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from indicators import realtime
+
+
+def loop_aroon(highs: np.ndarray, lows: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    aroon_up = np.zeros(len(highs) - period + 1)
+    aroon_down = np.zeros(len(highs) - period + 1)
+    for i in range(period - 1, len(highs)):
+        days_since_high = period - 1 - np.argmax(highs[i - period + 1:i + 1])
+        days_since_low = period - 1 - np.argmin(lows[i - period + 1:i + 1])
+        aroon_up[i - period + 1] = ((period - days_since_high) / period) * 100
+        aroon_down[i - period + 1] = ((period - days_since_low) / period) * 100
+    return aroon_up, aroon_down
+
+
+def loop_get_pivots(highs: np.ndarray, lows: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    pivot_highs, pivot_lows = [], []
+    for i in range(length, len(highs) - length):
+        if all(highs[i] > highs[i - j] for j in range(1, length + 1)) and \
+                all(highs[i] > highs[i + j] for j in range(1, length + 1)):
+            pivot_highs.append(i)
+        if all(lows[i] < lows[i - j] for j in range(1, length + 1)) and \
+                all(lows[i] < lows[i + j] for j in range(1, length + 1)):
+            pivot_lows.append(i)
+    return np.array(pivot_highs), np.array(pivot_lows)
+
+
+def loop_rank_correlation_index(closes: np.ndarray, period: int) -> np.ndarray:
+    result = np.zeros(len(closes) - period + 1)
+    for i in range(period, len(closes) + 1):
+        price_rank = np.argsort(np.argsort(closes[i - period:i]))
+        d = price_rank - np.arange(period)
+        result[i - period] = 1 - 6 * np.sum(d**2) / (period * (period**2 - 1))
+    return result
+
+
+def loop_parabolic_sar(highs: np.ndarray, lows: np.ndarray, acceleration: float = 0.02,
+                       max_acceleration: float = 0.2) -> np.ndarray:
+    sar = np.zeros(len(highs))
+    sar[0] = lows[0]
+    ep, af, uptrend = highs[0], acceleration, True
+    for i in range(1, len(highs)):
+        sar[i] = sar[i - 1] + af * (ep - sar[i - 1])
+        if uptrend:
+            if lows[i] <= sar[i]:
+                uptrend, sar[i], ep, af = False, ep, lows[i], acceleration
+            elif highs[i] > ep:
+                ep, af = highs[i], min(af + acceleration, max_acceleration)
+        else:
+            if highs[i] >= sar[i]:
+                uptrend, sar[i], ep, af = True, ep, highs[i], acceleration
+            elif lows[i] < ep:
+                ep, af = lows[i], min(af + acceleration, max_acceleration)
+    return sar
+
+
+def loop_zig_zag(highs: np.ndarray, lows: np.ndarray, threshold: float = 0.05) -> List[Tuple[float, int]]:
+    pivots = []
+    direction = 0
+    last_price, last_index = (highs[0] + lows[0]) / 2, 0
+    for i in range(1, len(highs)):
+        price = (highs[i] + lows[i]) / 2
+        if direction == 0:
+            if price > last_price * (1 + threshold) or price < last_price * (1 - threshold):
+                direction = 1 if price > last_price else -1
+                last_price, last_index = price, i
+        elif (price > last_price) if direction == 1 else (price < last_price):
+            last_price, last_index = price, i
+        elif (price < last_price * (1 - threshold)) if direction == 1 else (price > last_price * (1 + threshold)):
+            pivots.append((last_price, last_index))
+            direction = -direction
+            last_price, last_index = price, i
+    if last_index != len(highs) - 1:
+        pivots.append((last_price, last_index))
+    return pivots
+
+
+def synthetic_bars(bars: int, seed: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Random-walk highs, lows and closes."""
+    rng = np.random.default_rng(seed)
+    closes = 2500 * np.exp(np.cumsum(rng.normal(0, 0.002, bars)))
+    spread = closes * rng.uniform(0, 0.002, bars)
+    return closes + spread, closes - spread, closes
+
+
+def run(bars: int = 10_000, repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Return best-of-``repeat`` milliseconds per call for each indicator (``loop`` and ``vectorized``)."""
+    highs, lows, closes = synthetic_bars(bars)
+    cases: Dict[str, Tuple[Callable, Callable]] = {
+        "aroon": (lambda: loop_aroon(highs, lows, 25), lambda: realtime.aroon(highs, lows, 25)),
+        "get_pivots": (lambda: loop_get_pivots(highs, lows, 5), lambda: realtime.get_pivots(highs, lows, 5)),
+        "rank_correlation_index": (lambda: loop_rank_correlation_index(closes, 21),
+                                   lambda: realtime.rank_correlation_index(closes, 21)),
+        "parabolic_sar": (lambda: loop_parabolic_sar(highs, lows), lambda: realtime.parabolic_sar(highs, lows)),
+        "supertrend": (None, lambda: realtime.supertrend(highs, lows, closes, 10, 3.0)),
+        "zig_zag": (lambda: loop_zig_zag(highs, lows, 0.01), lambda: realtime.zig_zag(highs, lows, 0.01)),
+    }
+
+    def best_ms(fn: Callable) -> float:
+        elapsed = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            elapsed = min(elapsed, time.perf_counter() - started)
+        return elapsed * 1000
+
+    return {
+        name: {"loop": best_ms(loop) if loop is not None else float("nan"), "vectorized": best_ms(vectorized)}
+        for name, (loop, vectorized) in cases.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bars", type=int, default=10_000, help="Bars in the window")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'indicator':>24}  {'loop ms':>10}  {'vectorized ms':>14}  {'speedup':>8}")
+    for name, timing in run(bars=args.bars, repeat=args.repeat).items():
+        if np.isnan(timing["loop"]):
+            print(f"{name:>24}  {'-':>10}  {timing['vectorized']:>14.3f}  {'-':>8}")
+            continue
+        speedup = timing["loop"] / timing["vectorized"]
+        print(f"{name:>24}  {timing['loop']:>10.2f}  {timing['vectorized']:>14.3f}  {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+OHLCVStorage load benchmark.
+
+Writes a synthetic year of 1-minute NSE bars for one symbol and compares
+rows/second of the legacy per-day pandas reader against the Arrow dataset
+scan (``load_table`` / ``load_arrays``) and the ``load_candles`` shim.
+
+Usage:
+    python -m backtester.benchmarks.storage_load --days 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..ohlcv_storage import OHLCVStorage
+
+NSE_SESSION_MINUTES = 375  # 09:15-15:30 IST
+
+
+def write_synthetic_minute_data(storage: OHLCVStorage, symbol: str, days: int, seed: int = 42) -> int:
+    """Write ``days`` weekday partitions of 1-minute bars directly as Parquet; returns row count."""
+    rng = np.random.default_rng(seed)
+    storage._ensure_partition_dir(symbol, "1m")
+    day = date(2023, 1, 2)
+    written = 0
+    price = 1000.0
+    while written < days:
+        if day.weekday() < 5:
+            # 09:15 IST == 03:45 UTC
+            session_open = pd.Timestamp(day) + pd.Timedelta(hours=3, minutes=45)
+            timestamps = session_open + pd.to_timedelta(np.arange(NSE_SESSION_MINUTES), unit="min")
+            closes = price + np.cumsum(rng.normal(0, 0.5, NSE_SESSION_MINUTES))
+            price = float(closes[-1])
+            table = pa.table({
+                "symbol": [symbol] * NSE_SESSION_MINUTES,
+                "timestamp": timestamps.values,
+                "open": closes - 0.1,
+                "high": closes + 0.5,
+                "low": closes - 0.5,
+                "close": closes,
+                "volume": rng.integers(100, 10_000, NSE_SESSION_MINUTES).astype(float),
+                "timeframe": ["1m"] * NSE_SESSION_MINUTES,
+                "source": ["synthetic"] * NSE_SESSION_MINUTES,
+            }, schema=storage.schema)
+            pq.write_table(table, storage._get_partition_path(symbol, day, "1m"), compression="snappy")
+            written += 1
+        day += timedelta(days=1)
+    return written * NSE_SESSION_MINUTES
+
+
+def legacy_load_frame(storage: OHLCVStorage, symbol: str, timeframe: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """The pre-Arrow reader: probe one file per calendar day, pandas concat, filter again."""
+    start = pd.to_datetime(start_date).date()
+    end = pd.to_datetime(end_date).date()
+    frames = []
+    current = start
+    while current <= end:
+        path = storage._get_partition_path(symbol, current, timeframe)
+        if path.exists():
+            frames.append(pd.read_parquet(path))
+        current = current + pd.Timedelta(days=1)
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    mask = (df["timestamp"].dt.date >= start) & (df["timestamp"].dt.date <= end)
+    return df[mask].sort_values("timestamp").reset_index(drop=True)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(days: int = 250, repeat: int = 3, candle_days: int = 20) -> Dict[str, float]:
+    """Return rows/second for each load path."""
+    workdir = tempfile.mkdtemp(prefix="ohlcv_bench_")
+    try:
+        storage = OHLCVStorage(workdir)
+        rows = write_synthetic_minute_data(storage, "BENCH", days)
+        start, end = "2023-01-01", "2025-12-31"
+
+        results = {
+            "legacy_pandas_frame": rows / _time(lambda: legacy_load_frame(storage, "BENCH", "1m", start, end), repeat),
+            "arrow_load_table": rows / _time(lambda: storage.load_table("BENCH", "1m", start, end), repeat),
+            "arrow_load_arrays": rows / _time(lambda: storage.load_arrays("BENCH", "1m", start, end), repeat),
+        }
+
+        # Object construction dominates both Candle paths, so time them on a shorter range
+        candle_end = (pd.Timestamp("2023-01-02") + pd.Timedelta(days=candle_days * 7 // 5)).strftime("%Y-%m-%d")
+        candle_rows = storage.load_table("BENCH", "1m", start, candle_end).num_rows
+        results["legacy_iterrows_candles"] = candle_rows / _time(lambda: list(_legacy_candles(storage, start, candle_end)), 1)
+        results["arrow_load_candles"] = candle_rows / _time(lambda: storage.load_candles("BENCH", "1m", start, candle_end), 1)
+        return results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _legacy_candles(storage: OHLCVStorage, start: str, end: str):
+    from common.market_data import Candle
+
+    df = legacy_load_frame(storage, "BENCH", "1m", start, end)
+    for _, row in df.iterrows():
+        yield Candle(
+            symbol=row["symbol"],
+            timestamp=row["timestamp"].to_pydatetime(),
+            open=row["open"],
+            high=row["high"],
+            low=row["low"],
+            close=row["close"],
+            volume=row["volume"] if pd.notna(row["volume"]) else None,
+            timeframe=row["timeframe"],
+            source=row["source"],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=250, help="Trading days of 1m data to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (best is kept)")
+    args = parser.parse_args()
+
+    for name, rate in run(days=args.days, repeat=args.repeat).items():
+        print(f"{name:>26}: {rate:>14,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
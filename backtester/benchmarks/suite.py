@@ -0,0 +1,394 @@
+"""
+Backtester benchmark suite with regression gates.
+
+Generates synthetic NSE-session datasets (geometric random walks with
+per-symbol volatility and log-normal volumes) and measures throughput of
+the main hot paths:
+
+- ``event_backtester.<dataset>``: events/s through ``EventBacktester.run``
+- ``storage_save`` / ``storage_load_table`` / ``storage_load_arrays``:
+  rows/s through ``OHLCVStorage`` on the single-symbol dataset
+- ``walk_forward.<dataset>``: events/s through ``WalkForwardRunner``
+  (overlapping windows, each a full ``EventBacktester`` run)
+
+Datasets:
+
+- ``single_10y_1m``: 1 symbol x 10 years (2500 sessions) of 1-minute bars
+- ``universe_500_1y_1d``: 500 symbols x 1 year (250 sessions) of daily bars
+
+``--scale`` shrinks the number of sessions for quick runs. Results are
+written as JSON; ``compare`` flags every metric that dropped by more than
+``--threshold`` percent against a baseline and exits non-zero.
+
+Usage:
+    python -m backtester.benchmarks.suite run --output baseline.json
+    python -m backtester.benchmarks.suite run --scale 0.1 --output current.json --baseline baseline.json
+    python -m backtester.benchmarks.suite compare baseline.json current.json --threshold 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from common.market_data import Candle
+from trading_engine.phase4.models import Bar, Signal, SignalAction
+
+from ..config import BacktestConfig, WalkForwardConfig
+from ..engine import EventBacktester
+from ..ohlcv_storage import OHLCVStorage
+from ..walk_forward import WalkForwardRunner
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD_PCT = 10.0
+
+NSE_SESSION_MINUTES = 375  # 09:15-15:30 IST
+SESSION_OPEN_UTC = timedelta(hours=3, minutes=45)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Shape of a synthetic benchmark dataset."""
+    name: str
+    symbols: int
+    sessions: int
+    bars_per_session: int
+    timeframe: str
+
+    def scaled(self, scale: float) -> "DatasetSpec":
+        """Same dataset with ``scale`` times as many sessions (at least one)."""
+        return DatasetSpec(self.name, self.symbols, max(1, int(round(self.sessions * scale))),
+                           self.bars_per_session, self.timeframe)
+
+    @property
+    def rows(self) -> int:
+        return self.symbols * self.sessions * self.bars_per_session
+
+
+DATASETS: Dict[str, DatasetSpec] = {
+    "single_10y_1m": DatasetSpec("single_10y_1m", symbols=1, sessions=2500,
+                                 bars_per_session=NSE_SESSION_MINUTES, timeframe="1m"),
+    "universe_500_1y_1d": DatasetSpec("universe_500_1y_1d", symbols=500, sessions=250,
+                                      bars_per_session=1, timeframe="1d"),
+}
+
+
+def session_timestamps(sessions: int, bars_per_session: int) -> np.ndarray:
+    """Naive-UTC ``datetime64[ns]`` bar times over ``sessions`` weekdays from 2015-01-01."""
+    days = np.busday_offset(np.datetime64("2015-01-01", "D"), np.arange(sessions), roll="forward")
+    opens = days.astype("datetime64[ns]") + np.timedelta64(int(SESSION_OPEN_UTC.total_seconds()), "s")
+    minutes = np.arange(bars_per_session) * np.timedelta64(1, "m")
+    return (opens[:, None] + minutes[None, :]).ravel()
+
+
+def synthetic_dataset(spec: DatasetSpec, seed: int = 42) -> Dict[str, Dict[str, np.ndarray]]:
+    """symbol -> OHLCV column arrays for ``spec``."""
+    rng = np.random.default_rng(seed)
+    timestamps = session_timestamps(spec.sessions, spec.bars_per_session)
+    n = len(timestamps)
+    # Daily volatility of 1-3%, spread evenly across the session's bars
+    bar_vol = rng.uniform(0.01, 0.03, spec.symbols) / np.sqrt(spec.bars_per_session)
+    start_price = rng.uniform(50, 5000, spec.symbols)
+
+    data = {}
+    for i in range(spec.symbols):
+        close = start_price[i] * np.exp(np.cumsum(rng.normal(0, bar_vol[i], n)))
+        open_ = np.concatenate(([start_price[i]], close[:-1]))
+        wick = np.abs(rng.normal(0, bar_vol[i], (2, n))) * close
+        data[f"SYM{i:03d}"] = {
+            "timestamp": timestamps,
+            "open": open_,
+            "high": np.maximum(open_, close) + wick[0],
+            "low": np.minimum(open_, close) - wick[1],
+            "close": close,
+            "volume": np.round(rng.lognormal(8, 1, n)),
+        }
+    return data
+
+
+def to_bars(symbol: str, columns: Dict[str, np.ndarray]) -> List[Bar]:
+    stamps = columns["timestamp"].astype("datetime64[us]").tolist()
+    return [
+        Bar(symbol, ts, o, h, l, c, v)
+        for ts, o, h, l, c, v in zip(stamps, columns["open"].tolist(), columns["high"].tolist(),
+                                      columns["low"].tolist(), columns["close"].tolist(), columns["volume"].tolist())
+    ]
+
+
+def to_candles(symbol: str, timeframe: str, columns: Dict[str, np.ndarray]) -> List[Candle]:
+    stamps = columns["timestamp"].astype("datetime64[us]").tolist()
+    return [
+        Candle(symbol=symbol, timestamp=ts.replace(tzinfo=timezone.utc), open=o, high=h, low=l, close=c,
+               volume=v, timeframe=timeframe, source="benchmark")
+        for ts, o, h, l, c, v in zip(stamps, columns["open"].tolist(), columns["high"].tolist(),
+                                      columns["low"].tolist(), columns["close"].tolist(), columns["volume"].tolist())
+    ]
+
+
+class CycleStrategy:
+    """Buys every ``period`` bars per symbol and flattens halfway through the cycle."""
+
+    def __init__(self, name: str = "benchmark_cycle", period: int = 50):
+        self.name = name
+        self.period = period
+        self._counts: Dict[str, int] = {}
+
+    def on_bar(self, bar: Bar) -> Optional[List[Signal]]:
+        count = self._counts.get(bar.symbol, 0)
+        self._counts[bar.symbol] = count + 1
+        phase = count % self.period
+        if phase == 0:
+            return [Signal(bar.symbol, SignalAction.BUY, size=10.0, timestamp=bar.timestamp)]
+        if phase == self.period // 2:
+            return [Signal(bar.symbol, SignalAction.FLAT, timestamp=bar.timestamp)]
+        return None
+
+    def on_tick(self, tick) -> Optional[List[Signal]]:
+        return None
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _metric(value: float, unit: str, size: int) -> Dict[str, Any]:
+    return {"value": value, "unit": unit, "size": size, "higher_is_better": True}
+
+
+def _span_config(events: Sequence[Bar]) -> BacktestConfig:
+    return BacktestConfig(start=events[0].timestamp, end=events[-1].timestamp, initial_capital=10_000_000.0)
+
+
+def bench_event_backtester(spec: DatasetSpec, data, repeat: int) -> Dict[str, Any]:
+    events = {symbol: to_bars(symbol, columns) for symbol, columns in data.items()}
+    flat = sorted((bar for bars in events.values() for bar in bars), key=lambda b: b.timestamp)
+    config = _span_config(flat)
+    seconds = _best_of(lambda: EventBacktester(config, [CycleStrategy()]).run(events), repeat)
+    return _metric(len(flat) / seconds, "events/s", len(flat))
+
+
+def bench_walk_forward(spec: DatasetSpec, data, repeat: int, windows: int = 8) -> Dict[str, Any]:
+    events = sorted((bar for symbol, columns in data.items() for bar in to_bars(symbol, columns)),
+                    key=lambda b: b.timestamp)
+    window_size = max(2, len(events) // windows)
+    walk_config = WalkForwardConfig(window_size=window_size, step_size=max(1, window_size // 2))
+    runner = WalkForwardRunner(_span_config(events), walk_config, lambda: [CycleStrategy()])
+
+    processed = 0
+    for start in range(0, len(events), walk_config.effective_step()):
+        size = len(events[start:start + window_size])
+        if size < 2:
+            break
+        processed += size
+    seconds = _best_of(lambda: runner.run(events), repeat)
+    return _metric(processed / seconds, "events/s", processed)
+
+
+def bench_storage(spec: DatasetSpec, data, repeat: int) -> Dict[str, Dict[str, Any]]:
+    candles = [c for symbol, columns in data.items() for c in to_candles(symbol, spec.timeframe, columns)]
+    first, last = candles[0].timestamp.date().isoformat(), candles[-1].timestamp.date().isoformat()
+    rows = len(candles)
+    symbol = candles[0].symbol
+
+    def save() -> None:
+        workdir = tempfile.mkdtemp(prefix="bench_storage_")
+        try:
+            OHLCVStorage(workdir).save_candles(candles, append=False)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {"storage_save": _metric(rows / _best_of(save, repeat), "rows/s", rows)}
+
+    workdir = tempfile.mkdtemp(prefix="bench_storage_")
+    try:
+        storage = OHLCVStorage(workdir)
+        storage.save_candles(candles, append=False)
+        results["storage_load_table"] = _metric(
+            rows / _best_of(lambda: storage.load_table(symbol, spec.timeframe, first, last), repeat), "rows/s", rows)
+        results["storage_load_arrays"] = _metric(
+            rows / _best_of(lambda: storage.load_arrays(symbol, spec.timeframe, first, last), repeat), "rows/s", rows)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def run(scale: float = 1.0, repeat: int = 1, only: Optional[Sequence[str]] = None, seed: int = 42) -> Dict[str, Any]:
+    """
+    Run the suite.
+
+    Args:
+        scale: Fraction of each dataset's sessions to generate
+        repeat: Repetitions per measurement (best is kept)
+        only: Run only benchmarks whose name contains one of these substrings
+        seed: Dataset seed
+
+    Returns:
+        JSON-ready results document
+    """
+    def wanted(name: str) -> bool:
+        return not only or any(part in name for part in only)
+
+    single = DATASETS["single_10y_1m"].scaled(scale)
+    universe = DATASETS["universe_500_1y_1d"].scaled(scale)
+    plan = [
+        (f"event_backtester.{single.name}", single, bench_event_backtester),
+        (f"event_backtester.{universe.name}", universe, bench_event_backtester),
+        (f"walk_forward.{universe.name}", universe, bench_walk_forward),
+        ("storage", single, bench_storage),
+    ]
+
+    benchmarks: Dict[str, Dict[str, Any]] = {}
+    cache: Dict[str, Any] = {}
+    storage_names = ("storage_save", "storage_load_table", "storage_load_arrays")
+    for name, spec, bench in plan:
+        names = storage_names if name == "storage" else (name,)
+        if not any(wanted(n) for n in names):
+            continue
+        if spec.name not in cache:
+            cache[spec.name] = synthetic_dataset(spec, seed)
+        print(f"running {name} on {spec.rows:,} rows ...", file=sys.stderr)
+        result = bench(spec, cache[spec.name], repeat)
+        if name == "storage":
+            benchmarks.update({n: result[n] for n in names if wanted(n)})
+        else:
+            benchmarks[name] = result
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "scale": scale,
+        "repeat": repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "numpy": np.__version__,
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    results = json.loads(Path(path).read_text())
+    if results.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported benchmark results schema in {path}: {results.get('schema')}")
+    return results
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold_pct: float = DEFAULT_THRESHOLD_PCT) -> List[Dict[str, Any]]:
+    """
+    Compare two results documents.
+
+    Args:
+        baseline: Reference results
+        current: New results
+        threshold_pct: Slowdown (in percent) beyond which a metric is a regression
+
+    Returns:
+        One row per benchmark with ``status`` 'ok', 'improved', 'regression', 'new' or 'missing'
+    """
+    rows = []
+    base, cur = baseline["benchmarks"], current["benchmarks"]
+    for name in sorted(set(base) | set(cur)):
+        row = {"name": name, "baseline": base.get(name, {}).get("value"), "current": cur.get(name, {}).get("value"),
+               "unit": (cur.get(name) or base.get(name))["unit"], "change_pct": None}
+        if name not in base:
+            row["status"] = "new"
+        elif name not in cur:
+            row["status"] = "missing"
+        else:
+            change = (row["current"] - row["baseline"]) / row["baseline"] * 100 if row["baseline"] else 0.0
+            if not cur[name].get("higher_is_better", True):
+                change = -change
+            row["change_pct"] = change
+            if change < -threshold_pct:
+                row["status"] = "regression"
+            elif change > threshold_pct:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    def value(v: Optional[float]) -> str:
+        return f"{v:,.0f}" if v is not None else "-"
+
+    lines = [f"{'benchmark':<40} {'baseline':>14} {'current':>14} {'change':>9}  status"]
+    for row in rows:
+        change = f"{row['change_pct']:+.1f}%" if row["change_pct"] is not None else "-"
+        lines.append(f"{row['name']:<40} {value(row['baseline']):>14} {value(row['current']):>14} "
+                     f"{change:>9}  {row['status']}")
+    return "\n".join(lines)
+
+
+def _check(baseline_path: Path, current: Dict[str, Any], threshold_pct: float) -> int:
+    baseline = load_results(baseline_path)
+    if baseline.get("scale") != current.get("scale"):
+        print(f"warning: baseline scale {baseline.get('scale')} differs from current {current.get('scale')}",
+              file=sys.stderr)
+    rows = compare(baseline, current, threshold_pct)
+    print(format_comparison(rows))
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {threshold_pct:g}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the suite and write JSON results")
+    run_parser.add_argument("--output", type=Path, required=True, help="Results JSON path")
+    run_parser.add_argument("--scale", type=float, default=1.0, help="Fraction of each dataset's sessions")
+    run_parser.add_argument("--repeat", type=int, default=1, help="Repetitions per measurement (best is kept)")
+    run_parser.add_argument("--only", nargs="*", help="Run only benchmarks whose name contains these substrings")
+    run_parser.add_argument("--baseline", type=Path, help="Compare against this results file after running")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                            help="Regression threshold in percent")
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                                help="Regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(scale=args.scale, repeat=args.repeat, only=args.only)
+        save_results(results, args.output)
+        for name, metric in results["benchmarks"].items():
+            print(f"{name:>40}: {metric['value']:>14,.0f} {metric['unit']}")
+        return _check(args.baseline, results, args.threshold) if args.baseline else 0
+
+    return _check(args.baseline, load_results(args.current), args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Walk-forward window slicing benchmark.
+
+Builds three years of synthetic 1-minute bars and measures the cost of
+selecting train/test/out-of-sample events for every window of a
+1000-combination parameter grid, comparing the per-combination list
+comprehension filter against bisected slices computed once per window.
+Backtests themselves are not run; only event selection is timed.
+
+The filter path is O(params x windows x N), so it is timed on a few
+combinations and extrapolated to the full grid.
+
+Usage:
+    python -m backtester.benchmarks.walk_forward_slicing --years 3 --combinations 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from trading_engine.phase4.models import Bar
+
+from ..walk_forward import WalkForwardWindow, window_phase_slices
+
+NSE_SESSION_MINUTES = 375  # 09:15-15:30 IST
+
+
+def synthetic_minute_bars(years: int, symbol: str = "BENCH") -> List[Bar]:
+    """Weekday 1-minute bars over ``years`` * 250 sessions."""
+    bars = []
+    day = datetime(2021, 1, 4, 9, 15)
+    sessions = 0
+    while sessions < years * 250:
+        if day.weekday() < 5:
+            for minute in range(NSE_SESSION_MINUTES):
+                price = 100.0 + (sessions % 50) + minute * 0.001
+                bars.append(Bar(symbol, day + timedelta(minutes=minute), price, price + 0.5, price - 0.5, price, 1000.0))
+            sessions += 1
+        day += timedelta(days=1)
+    return bars
+
+
+def rolling_windows(start: datetime, end: datetime, train_days: int = 180, test_days: int = 60,
+                    oos_days: int = 30) -> List[WalkForwardWindow]:
+    windows = []
+    train_start = start
+    while True:
+        train_end = train_start + timedelta(days=train_days)
+        test_end = train_end + timedelta(days=test_days)
+        oos_end = test_end + timedelta(days=oos_days)
+        if oos_end > end:
+            return windows
+        windows.append(WalkForwardWindow(train_start, train_end, train_end, test_end, test_end, oos_end))
+        train_start += timedelta(days=test_days)
+
+
+def _filter_selection(events: List[Bar], windows: List[WalkForwardWindow]) -> int:
+    selected = 0
+    for window in windows:
+        selected += len([e for e in events if window.train_start <= e.timestamp <= window.train_end])
+        selected += len([e for e in events if window.test_start <= e.timestamp <= window.test_end])
+        selected += len([e for e in events if window.oos_start <= e.timestamp <= window.oos_end])
+    return selected
+
+
+def _slice_selection(events: List[Bar], window_slices) -> int:
+    selected = 0
+    for train_slice, test_slice, oos_slice in window_slices:
+        selected += len(events[train_slice])
+        selected += len(events[test_slice])
+        selected += len(events[oos_slice])
+    return selected
+
+
+def run(years: int = 3, combinations: int = 1000, sample: int = 2) -> Dict[str, float]:
+    """Return seconds to select events for the whole grid with each approach."""
+    events = synthetic_minute_bars(years)
+    windows = rolling_windows(events[0].timestamp, events[-1].timestamp)
+
+    started = time.perf_counter()
+    for _ in range(sample):
+        expected = _filter_selection(events, windows)
+    filter_seconds = (time.perf_counter() - started) / sample * combinations
+
+    started = time.perf_counter()
+    timestamps = [e.timestamp for e in events]
+    window_slices = [window_phase_slices(timestamps, window) for window in windows]
+    for _ in range(combinations):
+        selected = _slice_selection(events, window_slices)
+    slice_seconds = time.perf_counter() - started
+
+    assert selected == expected
+    return {
+        "events": float(len(events)),
+        "windows": float(len(windows)),
+        "filter_seconds_extrapolated": filter_seconds,
+        "slice_seconds": slice_seconds,
+        "speedup": filter_seconds / slice_seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=3, help="Years of 1m data to generate")
+    parser.add_argument("--combinations", type=int, default=1000, help="Parameter combinations in the grid")
+    parser.add_argument("--sample", type=int, default=2, help="Combinations actually timed on the filter path")
+    args = parser.parse_args()
+
+    for name, value in run(args.years, args.combinations, args.sample).items():
+        print(f"{name:>28}: {value:>14,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Checkpoint store and progress tracking for long optimization runs.
+
+Walk-forward and grid-search runs persist every completed evaluation
+(parameter set x window) as it finishes. Checkpoints live in
+``<directory>/<run_key>.jsonl``, where the run key hashes the strategy
+(name and source), a fingerprint of the market data and the run
+configuration; changing any of them starts a fresh checkpoint, while a
+restarted identical run skips everything already evaluated.
+
+The file is append-only, one JSON record per line with a pickled payload,
+and each record is flushed as it is written, so a killed process loses at
+most the evaluation in flight. A truncated last line is ignored on load.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import time
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from .reporting import datetimes_to_ns
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical(obj: Any) -> Any:
+    """JSON-ready structure with a stable representation (no memory addresses)."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _canonical(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    if isinstance(obj, type):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    if hasattr(obj, '__dict__'):
+        return {'__type__': f"{type(obj).__module__}.{type(obj).__qualname__}", **_canonical(vars(obj))}
+    return repr(obj)
+
+
+def strategy_identity(strategy: Any) -> str:
+    """Qualified name plus a hash of the source of a strategy class, instance, name or list of them."""
+    if isinstance(strategy, str):
+        return strategy
+    if isinstance(strategy, (list, tuple)):
+        return ",".join(strategy_identity(s) for s in strategy)
+    cls = strategy if isinstance(strategy, type) else type(strategy)
+    name = f"{cls.__module__}.{cls.__qualname__}"
+    try:
+        source = inspect.getsource(cls)
+    except (OSError, TypeError):
+        return name
+    return f"{name}:{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+
+
+def events_fingerprint(events: Sequence[Any]) -> str:
+    """Content hash of normalized market events (timestamps, symbols and prices)."""
+    digest = hashlib.sha256()
+    digest.update(str(len(events)).encode())
+    if not events:
+        return digest.hexdigest()
+
+    digest.update(datetimes_to_ns([e.timestamp for e in events]).tobytes())
+    digest.update("\n".join(e.symbol for e in events).encode())
+    for name in ("open", "high", "low", "close", "volume", "price", "size"):
+        column = np.fromiter((float(getattr(e, name, 0.0) or 0.0) for e in events), dtype=np.float64, count=len(events))
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+
+def run_key(strategy: Any, data_fingerprint: str, config: Any) -> str:
+    """Hash identifying an optimization run: strategy, data and configuration."""
+    payload = json.dumps(
+        {'strategy': strategy_identity(strategy), 'data': data_fingerprint, 'config': _canonical(config)},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def entry_key(*parts: Any) -> str:
+    """Stable key for one evaluation, e.g. ``entry_key(params, window)``."""
+    return hashlib.sha256(json.dumps(_canonical(parts), sort_keys=True).encode()).hexdigest()
+
+
+class CheckpointStore:
+    """Append-only store of completed evaluations for one run key."""
+
+    def __init__(self, directory: Union[str, Path], key: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.key = key
+        self.path = self.directory / f"{key}.jsonl"
+        self._entries: Dict[str, Any] = {}
+        self._load()
+        self._file = None
+
+    @classmethod
+    def for_run(cls, directory: Union[str, Path], strategy: Any, events: Sequence[Any],
+                config: Any) -> "CheckpointStore":
+        """Open the checkpoint for a strategy / data / config combination."""
+        return cls(directory, run_key(strategy, events_fingerprint(events), config))
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, 'r') as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                    self._entries[record['key']] = pickle.loads(base64.b64decode(record['data']))
+                except (ValueError, KeyError, pickle.UnpicklingError, EOFError) as e:
+                    # A process killed mid-write leaves a partial last line
+                    logger.warning(f"Skipping unreadable checkpoint record {self.path}:{line_no}: {e}")
+        if self._entries:
+            logger.info(f"Loaded {len(self._entries)} checkpointed evaluations from {self.path}")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._entries.get(key, default)
+
+    def put(self, key: str, value: Any) -> None:
+        """Persist one completed evaluation."""
+        if self._file is None:
+            self._file = open(self.path, 'a')
+            # Terminate a partial line left by a killed writer before appending
+            if self.path.stat().st_size > 0:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        self._file.write("\n")
+        record = {'key': key, 'data': base64.b64encode(pickle.dumps(value)).decode('ascii')}
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._entries[key] = value
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the parent process writes; workers get a read-only snapshot
+        state = self.__dict__.copy()
+        state['_file'] = None
+        return state
+
+
+@dataclasses.dataclass
+class ProgressState:
+    """Snapshot passed to progress callbacks."""
+    completed: int
+    total: int
+    skipped: int
+    elapsed_seconds: float
+    eta_seconds: Optional[float]
+
+    @property
+    def fraction(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+    def format(self) -> str:
+        eta = f"{self.eta_seconds:,.0f}s" if self.eta_seconds is not None else "?"
+        resumed = f", {self.skipped} from checkpoint" if self.skipped else ""
+        return (f"{self.completed}/{self.total} ({self.fraction:.1%}{resumed}) "
+                f"elapsed {self.elapsed_seconds:,.0f}s, ETA {eta}")
+
+
+class ProgressTracker:
+    """
+    Counts completed evaluations and estimates the time remaining.
+
+    The rate only counts evaluations run in this process, so work restored
+    from a checkpoint does not make the ETA optimistic.
+    """
+
+    def __init__(self, total: int, callback: Optional[Callable[[ProgressState], None]] = None,
+                 min_interval: float = 1.0):
+        self.total = total
+        self.callback = callback
+        self.min_interval = min_interval
+        self.completed = 0
+        self.skipped = 0
+        self._started = time.monotonic()
+        self._last_report = float('-inf')
+
+    def skip(self, n: int = 1) -> None:
+        """Record evaluations restored from a checkpoint."""
+        self.completed += n
+        self.skipped += n
+        self._report()
+
+    def advance(self, n: int = 1) -> None:
+        """Record freshly evaluated work."""
+        self.completed += n
+        self._report()
+
+    def state(self) -> ProgressState:
+        elapsed = time.monotonic() - self._started
+        done_here = self.completed - self.skipped
+        remaining = self.total - self.completed
+        eta = elapsed / done_here * remaining if done_here else None
+        return ProgressState(self.completed, self.total, self.skipped, elapsed, eta)
+
+    def _report(self) -> None:
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report >= self.min_interval or self.completed >= self.total:
+            self._last_report = now
+            self.callback(self.state())
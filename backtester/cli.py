@@ -5,63 +5,65 @@ Provides CLI commands for running backtests, managing data, and generating repor
 """
 
 import argparse
+import importlib
 import sys
 from pathlib import Path
-from datetime import date, datetime
+from dataclasses import asdict
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 import json
 import time
 import concurrent.futures
-import hashlib
 from functools import lru_cache
 
-from .performance import BatchBacktester, BatchJob
-from .walk_forward import WalkForwardAnalyzer, ParameterGridSearch, ValidationReport
+from .columnar_strategies import COLUMNAR_STRATEGIES
+from .config import BacktestConfig, WalkForwardConfig
+from .indicator_cache import IndicatorCache
+from .walk_forward import WalkForwardEngine
+from .downsampling import DEFAULT_CHART_POINTS
 from .reporting import BacktestReporter
 from .strategy_interface import create_strategy
 from .ohlcv_storage import OHLCVStorage
 from .instrument_master import InstrumentMaster
+from .checkpoint import ProgressState
+from .search import SEARCH_STRATEGIES, create_search
+from .monte_carlo import MONTE_CARLO_METHODS, MonteCarloAnalyzer
+from .batch_results import SUMMARY_DIR, BatchResultWriter, BatchSummary, summary_row, write_symbol_partitions
+from .vectorized import VectorizedBacktester
+
+# Walk-forward strategy name -> (phase 4 strategy class, config class) attribute names
+WALK_FORWARD_STRATEGIES = {
+    'ema_crossover': ('EMACrossoverStrategy', 'EMACrossoverConfig'),
+    'rsi': ('RSIStrategy', 'RSIConfig'),
+    'macd': ('MACDStrategy', 'MACDConfig'),
+    'bollinger_bands': ('BollingerBandsStrategy', 'BollingerConfig'),
+    'adaptive_rsi_macd_hybrid': ('AdaptiveRSIMACDHybridStrategy', 'AdaptiveHybridConfig'),
+}
+
+
+def resolve_walk_forward_strategy(name: str) -> type:
+    """
+    Strategy class for walk-forward runs, constructible as ``cls(**params)``.
 
+    ``module:Class`` names are imported as-is; registered phase 4 names get a
+    subclass that builds the strategy's config object from the parameters.
+    """
+    if ':' in name:
+        module_name, class_name = name.split(':', 1)
+        return getattr(importlib.import_module(module_name), class_name)
 
-class IndicatorCache:
-    """Cache for technical indicators to avoid redundant computation during grid searches."""
-
-    def __init__(self, maxsize: int = 10000):
-        self.cache = {}
-        self.maxsize = maxsize
-
-    def get_key(self, symbol: str, timeframe: str, indicator_name: str, parameters: Dict[str, Any]) -> str:
-        """Generate cache key for indicator."""
-        param_hash = hashlib.md5(str(sorted(parameters.items())).encode()).hexdigest()
-        return f"{symbol}_{timeframe}_{indicator_name}_{param_hash}"
-
-    def get_indicator(self, symbol: str, timeframe: str, indicator_name: str, parameters: Dict[str, Any], data):
-        """Get cached indicator or compute if not cached."""
-        key = self.get_key(symbol, timeframe, indicator_name, parameters)
-
-        if key in self.cache:
-            return self.cache[key]
-
-        # Compute indicator (placeholder - would call actual indicator function)
-        result = self._compute_indicator(indicator_name, data, **parameters)
-
-        # Cache with LRU eviction
-        if len(self.cache) >= self.maxsize:
-            # Simple LRU: remove oldest (in practice, use a proper LRU cache)
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
+    if name not in WALK_FORWARD_STRATEGIES:
+        raise ValueError(f"Unknown strategy: {name} (choose from {', '.join(WALK_FORWARD_STRATEGIES)})")
+    from trading_engine.phase4 import strategies
 
-        self.cache[key] = result
-        return result
+    class_name, config_name = WALK_FORWARD_STRATEGIES[name]
+    strategy_cls = getattr(strategies, class_name)
+    config_cls = getattr(strategies, config_name)
 
-    def _compute_indicator(self, name: str, data, **params):
-        """Placeholder for indicator computation."""
-        # This would call the actual indicator library
-        return f"computed_{name}_{hash(str(params))}"
+    def __init__(self, **params):
+        strategy_cls.__init__(self, config_cls(**params))
 
-    def clear(self):
-        """Clear the cache."""
-        self.cache.clear()
+    return type(class_name, (strategy_cls,), {'__init__': __init__})
 
 
 class BacktestCLI:
@@ -79,8 +81,6 @@ class BacktestCLI:
     def __init__(self):
         self.storage = OHLCVStorage()
         self.instrument_master = InstrumentMaster()
-        self.batch_backtester = BatchBacktester(self._run_single_backtest)
-        self.indicator_cache = IndicatorCache()
 
     def run(self, args: Optional[List[str]] = None) -> None:
         """Main CLI entry point."""
@@ -96,7 +96,7 @@ class BacktestCLI:
             return
 
         # Execute the appropriate command
-        command_method = getattr(self, f"_cmd_{parsed_args.command}", None)
+        command_method = getattr(self, f"_cmd_{parsed_args.command.replace('-', '_')}", None)
         if command_method:
             try:
                 command_method(parsed_args)
@@ -125,6 +125,11 @@ class BacktestCLI:
         run_parser.add_argument('--parameters', type=json.loads, default={}, help='Strategy parameters as JSON')
         run_parser.add_argument('--output', help='Output directory for reports')
         run_parser.add_argument('--config', help='Configuration file')
+        run_parser.add_argument('--chart-points', type=int, default=DEFAULT_CHART_POINTS,
+                                help='Equity points embedded in the JSON/HTML reports')
+        run_parser.add_argument('--monte-carlo', type=int, default=0, metavar='N',
+                                help='Run N trade-shuffle and bootstrap simulations (0 disables)')
+        run_parser.add_argument('--mc-seed', type=int, help='Random seed for Monte Carlo simulations')
 
         # Batch command
         batch_parser = subparsers.add_parser('batch', help='Run batch backtests')
@@ -136,18 +141,36 @@ class BacktestCLI:
         batch_parser.add_argument('--workers', type=int, default=4, help='Number of parallel workers')
         batch_parser.add_argument('--output', help='Output directory for reports')
         batch_parser.add_argument('--batch-size', type=int, default=10, help='Symbols per batch')
+        batch_parser.add_argument('--flush-rows', type=int, default=256,
+                                  help='Summary rows buffered before a Parquet part is written')
+        batch_parser.add_argument('--resume', action='store_true',
+                                  help='Skip symbols already recorded in the output directory')
+        batch_parser.add_argument('--indicator-cache-dir', default='data/indicator_cache',
+                                  help='On-disk indicator cache shared by the worker processes')
+        batch_parser.add_argument('--indicator-cache-mb', type=int, default=256,
+                                  help='In-memory indicator cache budget per worker (MB)')
 
         # Walk-forward command
         wf_parser = subparsers.add_parser('walk-forward', help='Run walk-forward analysis')
-        wf_parser.add_argument('--strategy', required=True, help='Strategy name')
+        wf_parser.add_argument('--strategy', required=True,
+                               help='Phase 4 strategy name or module:Class taking parameters as keywords')
         wf_parser.add_argument('--symbols', required=True, nargs='+', help='Trading symbols')
         wf_parser.add_argument('--from-date', required=True, help='Start date (YYYY-MM-DD)')
         wf_parser.add_argument('--to-date', required=True, help='End date (YYYY-MM-DD)')
         wf_parser.add_argument('--param-ranges', type=json.loads, required=True, help='Parameter ranges as JSON')
+        wf_parser.add_argument('--timeframe', default='1d', help='Candle timeframe')
         wf_parser.add_argument('--train-days', type=int, default=252, help='Training period days')
         wf_parser.add_argument('--test-days', type=int, default=63, help='Test period days')
         wf_parser.add_argument('--step-days', type=int, default=21, help='Step size days')
         wf_parser.add_argument('--output', help='Output directory for reports')
+        wf_parser.add_argument('--checkpoint-dir', default='data/checkpoints',
+                               help='Checkpoint store; rerunning the same analysis resumes from it')
+        wf_parser.add_argument('--no-checkpoint', action='store_true', help='Disable checkpointing')
+        wf_parser.add_argument('--search', choices=SEARCH_STRATEGIES, default='grid',
+                               help='Parameter search strategy')
+        wf_parser.add_argument('--search-candidates', type=int, default=729,
+                               help='Candidates sampled by random/halving/model search')
+        wf_parser.add_argument('--seed', type=int, help='Random seed for the parameter search')
 
         # Data commands
         data_parser = subparsers.add_parser('data', help='Data management commands')
@@ -171,6 +194,15 @@ class BacktestCLI:
         validate_parser.add_argument('--from-date', help='Start date')
         validate_parser.add_argument('--to-date', help='End date')
 
+        # Data compact
+        compact_parser = data_subparsers.add_parser('compact', help='Merge appended delta files into daily partitions')
+        compact_parser.add_argument('--symbol', help='Only compact this symbol')
+        compact_parser.add_argument('--timeframe', help='Only compact this timeframe')
+        compact_parser.add_argument('--min-deltas', type=int, default=1,
+                                    help='Skip partitions with fewer pending deltas')
+        compact_parser.add_argument('--interval', type=float,
+                                    help='Keep running, compacting every N seconds')
+
         return parser
 
     def _cmd_run(self, args: argparse.Namespace) -> None:
@@ -197,7 +229,7 @@ class BacktestCLI:
         )
 
         # Generate reports
-        reporter = BacktestReporter(report.portfolio_accounting)
+        reporter = BacktestReporter(report.portfolio_accounting, max_chart_points=args.chart_points)
         backtest_report = reporter.generate_report(
             run_id=f"cli_run_{int(time.time())}",
             strategy_name=args.strategy,
@@ -224,8 +256,26 @@ class BacktestCLI:
         print(f"Sharpe Ratio: {backtest_report.metrics.sharpe_ratio:.2f}")
         print(f"Win Rate: {backtest_report.metrics.win_rate_pct:.1f}%")
         print(f"Total Trades: {backtest_report.metrics.total_trades}")
+
+        if args.monte_carlo > 0:
+            self._run_monte_carlo(backtest_report, args.monte_carlo, args.mc_seed, output_dir / "monte_carlo.json")
+
         print(f"\nReports saved to: {output_dir}")
 
+    @staticmethod
+    def _run_monte_carlo(report, n_simulations: int, seed: Optional[int], filepath: Path) -> None:
+        """Run shuffle and bootstrap simulations and save their summaries."""
+        analyzer = MonteCarloAnalyzer(n_simulations=n_simulations, seed=seed)
+        summaries = {}
+        for method in MONTE_CARLO_METHODS:
+            result = analyzer.run(report, method)
+            summaries[method] = result.summary()
+            drawdown = summaries[method]['max_drawdown_pct']
+            print(f"Monte Carlo {method}: median max drawdown {drawdown.get('p50', 0.0):.2f}%, "
+                  f"95th percentile {drawdown.get('p95', 0.0):.2f}%, ruin probability {result.ruin_probability:.2%}")
+        with open(filepath, 'w') as f:
+            json.dump(summaries, f, indent=2)
+
     def _cmd_batch(self, args: argparse.Namespace) -> None:
         """Run batch backtests with multiprocessing."""
         print(f"Running batch backtest for strategy: {args.strategy}")
@@ -247,73 +297,81 @@ class BacktestCLI:
         # Run parallel batch processing
         start_time = time.time()
 
-        # Use ProcessPoolExecutor for symbol-level parallelism
-        with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
-            # Submit jobs for each symbol
-            future_to_symbol = {
-                executor.submit(self._run_single_backtest_parallel,
-                              args.strategy, args.parameters, [symbol], start_date, end_date): symbol
-                for symbol in symbols
-            }
-
-            results = []
-            for future in concurrent.futures.as_completed(future_to_symbol):
-                symbol = future_to_symbol[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as exc:
-                    results.append({
-                        'symbol': symbol,
-                        'error': str(exc),
-                        'report': None
-                    })
+        writer = BatchResultWriter(output_dir, flush_rows=args.flush_rows)
+        # Workers get a copy with an empty memory tier and share results through the disk tier
+        indicator_cache = IndicatorCache(max_bytes=args.indicator_cache_mb * 1024 * 1024,
+                                         cache_dir=args.indicator_cache_dir)
+        if args.resume:
+            done = writer.resume()
+            symbols = [s for s in symbols if s not in done]
+            print(f"Resuming: {len(done)} symbols already recorded, {len(symbols)} remaining")
+
+        # Use ProcessPoolExecutor for symbol-level parallelism. Workers write
+        # trades/equity partitions themselves and return only a summary row;
+        # at most max_pending futures are in flight so parent memory stays
+        # bounded regardless of universe size.
+        max_pending = max(1, args.workers * 2)
+        pending_symbols = iter(symbols)
+        with writer, concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+            pending: Dict[concurrent.futures.Future, str] = {}
+            while True:
+                for symbol in pending_symbols:
+                    future = executor.submit(self._run_single_backtest_parallel, args.strategy, args.parameters,
+                                             [symbol], start_date, end_date, str(output_dir), indicator_cache)
+                    pending[future] = symbol
+                    if len(pending) >= max_pending:
+                        break
+                if not pending:
+                    break
+
+                done_futures, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done_futures:
+                    symbol = pending.pop(future)
+                    try:
+                        writer.add(future.result())
+                    except Exception as exc:
+                        writer.add(summary_row(symbol, error=str(exc)))
 
         total_time = time.time() - start_time
-
-        # Process results
-        successful = [r for r in results if not r.get('error')]
-        failed = [r for r in results if r.get('error')]
+        summary = writer.summary
 
         print(f"\nBatch completed in {total_time:.2f} seconds")
-        print(f"Successful: {len(successful)}/{len(results)}")
+        print(f"Successful: {summary.successful}/{summary.total}")
 
-        if failed:
-            print(f"Failed: {len(failed)}")
-            for failure in failed[:5]:  # Show first 5 failures
-                print(f"  - {failure['symbol']}: {failure['error']}")
+        if summary.failed:
+            print(f"Failed: {summary.failed}")
+            for symbol, error in summary.failures[:5]:  # Show first 5 failures
+                print(f"  - {symbol}: {error}")
 
         # Generate summary report
-        self._generate_batch_summary(results, output_dir, args)
+        self._generate_batch_summary(summary, output_dir, args)
 
         print(f"\nResults saved to: {output_dir}")
 
     def _run_single_backtest_parallel(self, strategy_name: str, parameters: Dict[str, Any],
-                                    symbols: List[str], start_date: date, end_date: date) -> Dict[str, Any]:
+                                    symbols: List[str], start_date: date, end_date: date,
+                                    output_dir: str, indicator_cache: Optional[IndicatorCache] = None) -> Dict[str, Any]:
         """
         Run a single backtest in a separate process.
 
-        This ensures RiskEngine state isolation per process.
+        This ensures RiskEngine state isolation per process. Trades and the
+        equity curve are written to the symbol's partitions under
+        ``output_dir``; only the summary row is returned to the parent.
         """
+        started = time.time()
         try:
             # Create isolated risk engine instance per process
             from core.risk.risk_engine import RiskEngine
             risk_engine = RiskEngine(capital=100000.0)
 
             # Run backtest logic here (placeholder)
-            report = self._run_single_backtest(strategy_name, parameters, symbols, start_date, end_date)
+            report = self._run_single_backtest(strategy_name, parameters, symbols, start_date, end_date,
+                                               indicator_cache=indicator_cache)
+            write_symbol_partitions(output_dir, symbols[0], report)
 
-            return {
-                'symbol': symbols[0],
-                'error': None,
-                'report': report
-            }
+            return summary_row(symbols[0], report, execution_time_seconds=time.time() - started)
         except Exception as e:
-            return {
-                'symbol': symbols[0],
-                'error': str(e),
-                'report': None
-            }
+            return summary_row(symbols[0], error=str(e), execution_time_seconds=time.time() - started)
 
     def _cmd_walk_forward(self, args: argparse.Namespace) -> None:
         """Run walk-forward analysis."""
@@ -322,55 +380,66 @@ class BacktestCLI:
         # Parse dates
         start_date = date.fromisoformat(args.from_date)
         end_date = date.fromisoformat(args.to_date)
+        strategy_class = resolve_walk_forward_strategy(args.strategy)
 
-        # Create parameter grid
-        grid_search = ParameterGridSearch(args.param_ranges)
-        parameter_sets = grid_search.generate_parameter_sets()
-
-        print(f"Testing {len(parameter_sets)} parameter combinations")
+        # Parameter combinations are decoded by index; the grid is never enumerated up front
+        search = create_search(args.search, args.param_ranges, args.search_candidates, args.seed)
+        print(f"Testing {search.planned_evaluations()} of {search.space.size} parameter combinations "
+              f"({args.search} search)")
 
         # Create output directory
         output_dir = Path(args.output) if args.output else Path(f"wf_results_{int(time.time())}")
         output_dir.mkdir(exist_ok=True)
 
-        # Create walk-forward analyzer
-        analyzer = WalkForwardAnalyzer(
-            strategy_runner=self._run_single_backtest,
-            initial_train_days=args.train_days,
-            test_days=args.test_days,
-            step_days=args.step_days
+        # Stored candles carry UTC timestamps; keep the bounds comparable with them
+        base_config = BacktestConfig(
+            start=datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc),
+            end=datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc)
+        )
+        walk_config = WalkForwardConfig(
+            train_period=timedelta(days=args.train_days),
+            test_period=timedelta(days=args.test_days),
+            step=timedelta(days=args.step_days)
         )
+        events = {
+            symbol: self.storage.iter_candles(symbol, args.timeframe, args.from_date, args.to_date)
+            for symbol in args.symbols
+        }
 
         # Run analysis
-        report = analyzer.run_walk_forward(
-            parameter_sets,
-            args.symbols,
-            start_date,
-            end_date,
-            analysis_name=f"wf_{args.strategy}_{int(time.time())}"
+        engine = WalkForwardEngine(
+            base_config,
+            walk_config,
+            checkpoint_dir=None if args.no_checkpoint else args.checkpoint_dir,
+            progress=self._print_progress
         )
+        result = engine.run_walk_forward(strategy_class, events, param_ranges=args.param_ranges, search=search)
 
         # Export results
-        from .walk_forward import export_validation_report
-        json_file = output_dir / "validation_report.json"
-        export_validation_report(report, str(json_file))
+        json_file = output_dir / "walk_forward_result.json"
+        with open(json_file, 'w') as f:
+            json.dump(asdict(result), f, indent=2, default=str)
 
         # Print summary
         print("\nWalk-forward analysis completed!")
-        print(f"Total parameter sets: {len(report.parameter_sets)}")
-        print(f"Total windows: {report.total_windows}")
-        print(f"Average OOS performance: {report.avg_oos_performance:.3f}")
-        print(f"Average overfitting score: {report.avg_overfitting_score:.3f}")
-
-        if report.best_parameter_set:
-            best = report.best_parameter_set
-            print(f"\nBest parameter set: {best.parameter_set.name}")
-            print(f"Robustness score: {best.robustness_score:.3f}")
-            print(f"Avg OOS return: {best.avg_test_return:.2f}%")
-            print(f"Avg IS return: {best.avg_train_return:.2f}%")
+        print(f"Total parameter sets: {len(result.parameter_sets)}")
+        print(f"Total windows: {len(result.windows)}")
+        if result.oos_metrics:
+            print(f"Average OOS performance: {result.oos_metrics.get('avg_oos_performance', 0.0):.3f}")
+            print(f"Overfitting ratio: {result.oos_metrics['overfitting_ratio']:.3f}")
+
+        if result.best_params:
+            print(f"\nBest parameters: {result.best_params}")
+            print(f"Robustness score: {result.robustness_score:.3f}")
 
         print(f"\nResults saved to: {output_dir}")
 
+    @staticmethod
+    def _print_progress(state: ProgressState) -> None:
+        """Overwrite a single progress/ETA line on the terminal."""
+        end = "\n" if state.completed >= state.total else ""
+        print(f"\rProgress: {state.format()}", end=end, flush=True)
+
     def _cmd_data(self, args: argparse.Namespace) -> None:
         """Handle data management commands."""
         if args.data_command == 'ingest':
@@ -379,6 +448,8 @@ class BacktestCLI:
             self._cmd_data_list(args)
         elif args.data_command == 'validate':
             self._cmd_data_validate(args)
+        elif args.data_command == 'compact':
+            self._cmd_data_compact(args)
         else:
             print(f"Unknown data command: {args.data_command}")
 
@@ -409,19 +480,50 @@ class BacktestCLI:
         print(f"Validating data for {args.symbol}")
         print("(Data validation not yet implemented)")
 
+    def _cmd_data_compact(self, args: argparse.Namespace) -> None:
+        """Compact delta files, once or periodically with --interval."""
+        while True:
+            compacted = self.storage.compact(args.symbol, args.timeframe, min_deltas=args.min_deltas)
+            print(f"Compacted {compacted} partitions")
+            if not args.interval:
+                return
+            try:
+                time.sleep(args.interval)
+            except KeyboardInterrupt:
+                print("Compaction stopped")
+                return
+
     def _run_single_backtest(self, strategy_name: str, parameters: Dict[str, Any],
-                           symbols: List[str], start_date: date, end_date: date) -> Any:
+                           symbols: List[str], start_date: date, end_date: date,
+                           indicator_cache: Optional[IndicatorCache] = None) -> Any:
         """
         Run a single backtest.
 
-        This is a placeholder - in the real implementation, this would:
+        Columnar strategies (``COLUMNAR_STRATEGIES``) run on stored daily
+        candles with ``VectorizedBacktester``, looking indicators up through
+        ``indicator_cache``.
+
+        Other strategies still get a placeholder; the real implementation would:
         1. Load market data for the symbols and date range
         2. Create and initialize the strategy
         3. Run the backtest engine
         4. Return the results
 
-        For now, returns a mock result.
+        For now, those return a mock result.
         """
+        strategy_class = COLUMNAR_STRATEGIES.get(strategy_name)
+        if strategy_class is not None:
+            config = BacktestConfig(
+                start=datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc),
+                end=datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc)
+            )
+            data = {
+                symbol: self.storage.load_arrays(symbol, '1d', start_date.isoformat(), end_date.isoformat())
+                for symbol in symbols
+            }
+            backtester = VectorizedBacktester(config, [strategy_class(**parameters)], indicator_cache=indicator_cache)
+            return backtester.run(data).to_report(strategy_name=strategy_name, parameters=parameters)
+
         # Mock implementation - replace with actual backtest logic
         from .portfolio_accounting import PortfolioAccounting
         from .reporting import BacktestReport, PerformanceMetrics
@@ -431,7 +533,6 @@ class BacktestCLI:
         # Mock some trades
         for i in range(10):
             from .portfolio_accounting import TradeRecord
-            from datetime import datetime
             trade = TradeRecord(
                 symbol=symbols[0],
                 side="BUY",
@@ -467,46 +568,24 @@ class BacktestCLI:
 
         return report
 
-    def _generate_batch_summary(self, results: List, output_dir: Path, job: BatchJob) -> None:
-        """Generate batch summary report."""
-        successful = [r for r in results if not r.error]
-        failed = [r for r in results if r.error]
-
-        summary = {
+    def _generate_batch_summary(self, summary: BatchSummary, output_dir: Path, args: argparse.Namespace) -> None:
+        """Generate batch summary report (per-symbol rows are in ``summary/*.parquet``)."""
+        report = {
             'batch_id': f"batch_{int(time.time())}",
             'strategy': args.strategy,
-            'total_symbols': len(results),
-            'successful': len(successful),
-            'failed': len(failed),
             'parameters': args.parameters,
             'date_range': {
                 'start': args.from_date,
                 'end': args.to_date
             },
-            'results': []
+            'results_dir': SUMMARY_DIR,
+            **summary.to_dict()
         }
 
-        # Add individual results
-        for result in successful:
-            if result.report:
-                summary['results'].append({
-                    'symbol': result.symbol,
-                    'total_return_pct': result.report.metrics.total_return_pct,
-                    'sharpe_ratio': result.report.metrics.sharpe_ratio,
-                    'win_rate_pct': result.report.metrics.win_rate_pct,
-                    'total_trades': result.report.metrics.total_trades,
-                    'execution_time_seconds': result.performance.execution_time_seconds
-                })
-
-        # Add failures
-        summary['failures'] = [
-            {'symbol': r.symbol, 'error': r.error} for r in failed
-        ]
-
         # Save summary
         summary_file = output_dir / "batch_summary.json"
         with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+            json.dump(report, f, indent=2)
 
 
 def main():
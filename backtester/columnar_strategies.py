@@ -0,0 +1,41 @@
+"""
+Columnar strategies for ``VectorizedBacktester``.
+
+Indicators are looked up with ``ColumnarBars.indicator`` so runs sharing an
+``IndicatorCache`` (grid searches, batch workers) compute each one once.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .vectorized import ColumnarBars
+
+
+class MovingAverageCrossover:
+    """Hold ``quantity`` while the fast SMA is above the slow SMA, flat otherwise."""
+
+    name = "sma_crossover"
+
+    def __init__(self, fast: int = 20, slow: int = 50, quantity: float = 100.0):
+        if fast >= slow:
+            raise ValueError(f"fast period ({fast}) must be shorter than slow period ({slow})")
+        self.fast = fast
+        self.slow = slow
+        self.quantity = quantity
+
+    def generate_positions(self, bars: ColumnarBars) -> np.ndarray:
+        target = np.zeros(len(bars))
+        slow = bars.indicator("sma", period=self.slow)
+        if len(slow) == 0:
+            return target
+        # realtime indicators drop the warm-up bars; align both on the last len(slow) bars
+        fast = bars.indicator("sma", period=self.fast)[-len(slow):]
+        target[-len(slow):] = np.where(fast > slow, self.quantity, 0.0)
+        return target
+
+
+# Strategy registry for the batch/run commands
+COLUMNAR_STRATEGIES = {
+    MovingAverageCrossover.name: MovingAverageCrossover,
+}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 from trading_engine.phase4.position_sizing import PositionSizer
@@ -43,10 +43,19 @@ class BacktestConfig:
 
 @dataclass
 class WalkForwardConfig:
-    """Parameters for walk-forward backtesting."""
+    """Parameters for walk-forward backtesting.
 
-    window_size: int
+    ``window_size``/``step_size`` count events for ``WalkForwardRunner``,
+    which rejects the unset ``window_size`` of 0; the ``*_period`` fields and ``step`` are calendar spans used by
+    ``WalkForwardAnalyzer.generate_windows``.
+    """
+
+    window_size: int = 0
     step_size: Optional[int] = None
+    train_period: timedelta = timedelta(days=252)
+    test_period: timedelta = timedelta(days=63)
+    oos_period: Optional[timedelta] = None
+    step: Optional[timedelta] = None
 
     def effective_step(self) -> int:
         if self.step_size is not None and self.step_size > 0:
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Any, Sequence, Tuple, Union
 from enum import Enum
 
+import numpy as np
+
 from trading_engine.phase4.models import OrderSide
 
+# Per-order brokerage cap (INR)
+BROKERAGE_CAP = 20.0
+
 
 class InstrumentType(Enum):
     CASH = "cash"
@@ -84,6 +90,11 @@ class CostModel:
     # India-specific configuration
     india_fees: IndiaFeeConfig = None
 
+    # (instrument_type, is_delivery) -> (linear rate, brokerage rate); see _india_fee_rates
+    _india_rate_cache: Dict[Tuple[str, bool], Tuple[float, float]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         if self.india_fees is None:
             self.india_fees = IndiaFeeConfig()
@@ -109,55 +120,58 @@ class CostModel:
             is_intraday: Whether it's intraday (for STT calculation)
 
         Returns:
-            Dict of fee components
+            Dict of fee components (Decimal values for a Decimal ``trade_value``)
         """
         fees = {}
+        # Decimal trade values are priced with exact Decimal rates; this is the
+        # reference path that the float fast paths are validated against
+        rate = (lambda r: Decimal(str(r))) if isinstance(trade_value, Decimal) else float
 
         # 1. Brokerage
         if instrument_type == "cash":
-            fees['brokerage'] = min(trade_value * self.india_fees.brokerage["equity_cash"], 20.0)
+            fees['brokerage'] = min(trade_value * rate(self.india_fees.brokerage["equity_cash"]), rate(BROKERAGE_CAP))
         elif instrument_type == "futures":
-            fees['brokerage'] = min(trade_value * self.india_fees.brokerage["equity_futures"], 20.0)
+            fees['brokerage'] = min(trade_value * rate(self.india_fees.brokerage["equity_futures"]), rate(BROKERAGE_CAP))
         elif instrument_type == "options":
-            fees['brokerage'] = min(trade_value * self.india_fees.brokerage["equity_options"], 20.0)
+            fees['brokerage'] = min(trade_value * rate(self.india_fees.brokerage["equity_options"]), rate(BROKERAGE_CAP))
         else:
-            fees['brokerage'] = 0.0
+            fees['brokerage'] = rate(0.0)
 
         # 2. STT (Securities Transaction Tax)
         if instrument_type == "cash":
             if is_delivery:
-                fees['stt'] = trade_value * self.india_fees.stt["equity_delivery"]
+                fees['stt'] = trade_value * rate(self.india_fees.stt["equity_delivery"])
             else:
-                fees['stt'] = trade_value * self.india_fees.stt["equity_intraday"]
+                fees['stt'] = trade_value * rate(self.india_fees.stt["equity_intraday"])
         elif instrument_type in ["futures", "options"]:
             if instrument_type == "futures":
-                fees['stt'] = trade_value * self.india_fees.stt["futures"]
+                fees['stt'] = trade_value * rate(self.india_fees.stt["futures"])
             else:
-                fees['stt'] = trade_value * self.india_fees.stt["options"]
+                fees['stt'] = trade_value * rate(self.india_fees.stt["options"])
 
         # 3. Exchange Transaction Charge
         if instrument_type == "cash":
-            fees['exchange_tx'] = trade_value * self.india_fees.exchange_tx_charge["equity"]
+            fees['exchange_tx'] = trade_value * rate(self.india_fees.exchange_tx_charge["equity"])
         elif instrument_type == "futures":
-            fees['exchange_tx'] = trade_value * self.india_fees.exchange_tx_charge["futures"]
+            fees['exchange_tx'] = trade_value * rate(self.india_fees.exchange_tx_charge["futures"])
         elif instrument_type == "options":
-            fees['exchange_tx'] = trade_value * self.india_fees.exchange_tx_charge["options"]
+            fees['exchange_tx'] = trade_value * rate(self.india_fees.exchange_tx_charge["options"])
 
         # 4. GST on (brokerage + exchange_tx)
-        gst_base = fees['brokerage'] + fees.get('exchange_tx', 0)
-        fees['gst'] = gst_base * self.india_fees.gst
+        gst_base = fees['brokerage'] + fees.get('exchange_tx', rate(0.0))
+        fees['gst'] = gst_base * rate(self.india_fees.gst)
 
         # 5. Stamp Duty
         if instrument_type == "cash":
             if is_delivery:
-                fees['stamp_duty'] = trade_value * self.india_fees.stamp_duty["equity_delivery"]
+                fees['stamp_duty'] = trade_value * rate(self.india_fees.stamp_duty["equity_delivery"])
             else:
-                fees['stamp_duty'] = trade_value * self.india_fees.stamp_duty["equity_intraday"]
+                fees['stamp_duty'] = trade_value * rate(self.india_fees.stamp_duty["equity_intraday"])
         elif instrument_type in ["futures", "options"]:
-            fees['stamp_duty'] = trade_value * self.india_fees.stamp_duty["futures_options"]
+            fees['stamp_duty'] = trade_value * rate(self.india_fees.stamp_duty["futures_options"])
 
         # 6. SEBI Turnover Fee
-        fees['sebi_fee'] = trade_value * self.india_fees.sebi_fee
+        fees['sebi_fee'] = trade_value * rate(self.india_fees.sebi_fee)
 
         return fees
 
@@ -167,6 +181,71 @@ class CostModel:
         fee_components = self.calculate_india_fees(instrument_type, trade_value, is_delivery, is_intraday)
         return sum(fee_components.values())
 
+    def _india_fee_rates(self, instrument_type: str, is_delivery: bool = False) -> Tuple[float, float]:
+        """
+        Collapse the India fee schedule into two rates for the float fast paths.
+
+        Every component except brokerage is proportional to trade value, so
+        ``total = value * linear + min(value * brokerage, cap) * (1 + gst)``.
+        Rates are cached per (instrument_type, is_delivery); call
+        ``clear_rate_cache`` after mutating ``india_fees``.
+
+        Returns:
+            (linear rate, brokerage rate)
+        """
+        key = (instrument_type, is_delivery)
+        cached = self._india_rate_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # The dict path is linear in trade value apart from the brokerage cap,
+        # so evaluating it at a value of 1 (below the cap) recovers the rates
+        unit = self.calculate_india_fees(instrument_type, 1.0, is_delivery)
+        brokerage = unit['brokerage']
+        linear = sum(unit.values()) - brokerage * (1 + self.india_fees.gst)
+        self._india_rate_cache[key] = (linear, brokerage)
+        return linear, brokerage
+
+    def clear_rate_cache(self) -> None:
+        """Drop cached fee rates after changing ``india_fees``."""
+        self._india_rate_cache.clear()
+
+    def total_fees_india_fast(self, instrument_type: str, trade_value: float, is_delivery: bool = False) -> float:
+        """Float fast path for ``total_fees_india`` without building the component dict."""
+        linear, brokerage = self._india_fee_rates(instrument_type, is_delivery)
+        return trade_value * linear + min(trade_value * brokerage, BROKERAGE_CAP) * (1 + self.india_fees.gst)
+
+    def total_fees_india_batch(self, values: Union[Sequence[float], np.ndarray],
+                               types: Union[str, Sequence[str], np.ndarray] = "cash",
+                               is_delivery: bool = False) -> np.ndarray:
+        """
+        Vectorized ``total_fees_india`` over arrays of trade values.
+
+        Agrees with the Decimal reference path to within 1e-9 relative error.
+
+        Args:
+            values: Absolute trade values
+            types: One instrument type for all values, or one per value
+            is_delivery: Whether the trades are delivery trades (equity)
+
+        Returns:
+            float64 array of total fees
+        """
+        values = np.asarray(values, dtype=np.float64)
+        gst_factor = 1 + self.india_fees.gst
+
+        if isinstance(types, str):
+            linear, brokerage = self._india_fee_rates(types, is_delivery)
+            return values * linear + np.minimum(values * brokerage, BROKERAGE_CAP) * gst_factor
+
+        types = np.asarray(types)
+        linear = np.empty_like(values)
+        brokerage = np.empty_like(values)
+        for instrument_type in np.unique(types):
+            mask = types == instrument_type
+            linear[mask], brokerage[mask] = self._india_fee_rates(str(instrument_type), is_delivery)
+        return values * linear + np.minimum(values * brokerage, BROKERAGE_CAP) * gst_factor
+
     # Legacy methods for backward compatibility
     def commission(self, price: float, quantity: float) -> float:
         """Legacy commission calculation."""
@@ -0,0 +1,105 @@
+"""
+Equity curve downsampling for charts.
+
+Reduces long curves to a fixed point budget while keeping their visual
+shape. Both methods return sorted indices into the original arrays, always
+including the first and last points:
+
+- ``minmax``: splits the curve into equal-count buckets and keeps the
+  lowest and highest point of each, so every peak and trough (and with it
+  the maximum drawdown) survives
+- ``lttb``: Largest-Triangle-Three-Buckets keeps the point in each bucket
+  that forms the largest triangle with its neighbours; smoother lines,
+  but extremes between selected points can be dropped
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+DEFAULT_CHART_POINTS = 2000
+DOWNSAMPLE_METHODS = ("minmax", "lttb")
+
+
+def _bucket_bounds(n: int, buckets: int) -> np.ndarray:
+    """Start offsets of ``buckets`` equal-count buckets over points ``1 .. n-2``, plus the end offset."""
+    return np.floor(np.linspace(1, n - 1, buckets + 1)).astype(np.int64)
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """Indices of the min and max point of each bucket, plus the endpoints."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points or max_points < 4:
+        return np.arange(n) if n <= max_points else np.array([0, n - 1])
+
+    bounds = _bucket_bounds(n, (max_points - 2) // 2)
+    starts = bounds[:-1]
+    sizes = np.diff(bounds)
+    bucket = np.repeat(np.arange(len(starts)), sizes)
+    inner = y[1:n - 1]
+    offsets = starts - 1  # positions of bucket starts within ``inner``
+
+    # First occurrence of each bucket's min and max
+    lows = inner == np.repeat(np.minimum.reduceat(inner, offsets), sizes)
+    highs = inner == np.repeat(np.maximum.reduceat(inner, offsets), sizes)
+    low_pos = np.flatnonzero(lows)
+    high_pos = np.flatnonzero(highs)
+    low_pos = low_pos[np.unique(bucket[low_pos], return_index=True)[1]]
+    high_pos = high_pos[np.unique(bucket[high_pos], return_index=True)[1]]
+
+    return np.unique(np.concatenate(([0], low_pos + 1, high_pos + 1, [n - 1])))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets selection of at most ``max_points`` indices."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return np.arange(n) if n <= max_points else np.array([0, n - 1])
+
+    # Shift x so nanosecond timestamps keep their precision in the area products
+    x = x - x[0]
+    bounds = _bucket_bounds(n, max_points - 2)
+
+    # Mean of every bucket (the last "next bucket" is the final point itself)
+    sums_x = np.add.reduceat(x[:n - 1], bounds[:-1])
+    sums_y = np.add.reduceat(y[:n - 1], bounds[:-1])
+    sizes = np.diff(bounds)
+    avg_x = np.append(sums_x / sizes, x[-1])
+    avg_y = np.append(sums_y / sizes, y[-1])
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    # Each choice depends on the previous one, so only the bucket scan is vectorized
+    for i in range(max_points - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, max_points: int = DEFAULT_CHART_POINTS,
+                       method: str = "minmax") -> np.ndarray:
+    """
+    Pick the points to draw for a chart.
+
+    Args:
+        x: Point positions (e.g. int64 ns timestamps), ascending
+        y: Values
+        max_points: Point budget; curves at or under it are returned whole
+        method: 'minmax' or 'lttb'
+
+    Returns:
+        Sorted indices into ``x``/``y``
+    """
+    if method == "minmax":
+        return minmax_indices(y, max_points)
+    if method == "lttb":
+        return lttb_indices(x, y, max_points)
+    raise ValueError(f"Unknown downsampling method: {method} (expected one of {DOWNSAMPLE_METHODS})")
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import csv
+import heapq
 import json
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Union
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union
 
 from common.market_data import Candle
 from trading_engine.phase4.models import (
@@ -15,7 +17,6 @@ from trading_engine.phase4.models import (
     OrderSide,
     OrderType,
     PortfolioState,
-    RiskDecisionType,
     Signal,
     SignalAction,
     Tick,
@@ -27,8 +28,8 @@ from trading_engine.phase4.strategy import Strategy
 from risk.risk_engine import RiskEngine
 from .config import BacktestConfig
 from .costs import CostModel
-from .reporting import BacktestReport, build_performance_report, plot_equity_curve
-from .risk_manager import BacktestRiskManager, RiskLimits
+from .reporting import BacktestReport, BacktestReporter, TradeArrays, datetimes_to_ns
+from .risk_manager import BacktestRiskManager, RiskDecisionType, RiskLimits
 from .simulator import TradeSimulator
 
 MarketEvent = Union[Bar, Tick]
@@ -281,39 +282,73 @@ class EventBacktester:
 
     def run(
         self,
-        events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]],
+        events: Union[Dict[str, Iterable[MarketEvent]], Iterable[MarketEvent]],
         plot_path: str | None = None,
     ) -> BacktestReport:
-        normalized_events = self._normalize_events(events)
-        for event in normalized_events:
+        symbols = set()
+        for event in self._iter_events(events):
             if event.timestamp < self.config.start or event.timestamp > self.config.end:
                 continue
+            symbols.add(event.symbol)
             if isinstance(event, Bar):
                 fills = self._on_bar(event)
-            else:
+            elif isinstance(event, Tick):
                 fills = self._on_tick(event)
+            else:
+                fills = self._on_bar(self._candle_to_bar(event))
             if fills:
                 self.trades.extend(fills)
             self.equity_curve.append((event.timestamp, self.simulator.portfolio.equity))
 
-        performance = build_performance_report(
-            equity_curve=self.equity_curve,
-            trades=self.trades,
-            start=self.config.start,
-            end=self.config.end,
-            fees_paid=self.simulator.fees_paid,
-            risk_free_rate=self.config.risk_free_rate,
-        )
+        return self._build_report(sorted(symbols), plot_path)
 
+    def _build_report(self, symbols: List[str], plot_path: str | None = None) -> BacktestReport:
+        """Report over the equity curve and closed (sell) fills; the HTML report goes to ``plot_path``."""
+        closed = [fill for fill in self.trades if fill.order.side == OrderSide.SELL]
+        trades = TradeArrays(
+            symbols=[fill.order.symbol for fill in closed],
+            exit_times=datetimes_to_ns([fill.timestamp for fill in closed]),
+            realized_pnl=[fill.pnl for fill in closed],
+        )
+        reporter = BacktestReporter.from_arrays(
+            datetimes_to_ns([ts for ts, _ in self.equity_curve]),
+            [equity for _, equity in self.equity_curve],
+            trades=trades,
+            initial_capital=self.config.initial_capital,
+        )
+        strategy_name = ",".join(self.strategies)
+        report = reporter.generate_report(
+            run_id=f"event_{strategy_name}",
+            strategy_name=strategy_name,
+            symbols=symbols,
+            start_date=self.config.start.date(),
+            end_date=self.config.end.date(),
+        )
         if plot_path:
-            plot_equity_curve(self.equity_curve, plot_path)
+            reporter.generate_html_report(report, plot_path)
+        return report
 
-        return BacktestReport(
-            performance=performance,
-            trades=self.trades,
-            equity_curve=self.equity_curve,
-            plot_path=plot_path,
-        )
+    def run_columnar(
+        self,
+        data: Dict[str, Any],
+        plot_path: str | None = None,
+    ) -> BacktestReport:
+        """
+        Opt-in columnar mode: run array-emitting strategies over per-symbol OHLCV columns.
+
+        Strategies must implement ``generate_positions(bars) -> np.ndarray``; see
+        ``backtester.vectorized`` for the supported inputs and fill semantics.
+        The report is built from the result arrays by ``BacktestReporter``;
+        ``trades``, ``equity_curve`` and ``simulator.fees_paid`` are filled in as after ``run``.
+        """
+        from .vectorized import VectorizedBacktester
+
+        vectorized = VectorizedBacktester(self.config, list(self.strategies.values()), cost_model=self.cost_model)
+        result = vectorized.run(data)
+        self.trades = result.order_fills()
+        self.equity_curve = result.equity_curve_tuples()
+        self.simulator.fees_paid = result.fees_paid
+        return result.to_report(strategy_name=",".join(self.strategies), plot_path=plot_path)
 
     def _on_bar(self, bar: Bar) -> List[OrderFill]:
         fills = self.simulator.mark_to_market(bar)
@@ -435,10 +470,65 @@ class EventBacktester:
         )
 
     @staticmethod
-    def _normalize_events(events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]]) -> List[MarketEvent]:
+    def _candle_to_bar(candle) -> Bar:
+        return Bar(
+            symbol=candle.symbol,
+            timestamp=candle.timestamp,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            volume=candle.volume or 0.0,
+        )
+
+    @staticmethod
+    def _iter_events(events: Union[Dict[str, Iterable[MarketEvent]], Iterable[MarketEvent]]) -> Iterator[MarketEvent]:
+        """Yield events in timestamp order without materialising the full stream.
+
+        Per-symbol series (lists or generators such as ``OHLCVStorage.iter_candles``)
+        are k-way merged lazily with O(symbols) memory. Flat iterables of mixed
+        symbols carry no ordering guarantee and are sorted as before.
+        """
         if isinstance(events, dict):
-            flattened: List[MarketEvent] = []
-            for series in events.values():
-                flattened.extend(series)
-            events = flattened
-        return sorted(list(events), key=lambda e: e.timestamp)
+            return merge_event_streams(events.values())
+        return iter(sorted(events, key=_event_timestamp))
+
+    @staticmethod
+    def _normalize_events(events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]]) -> List[MarketEvent]:
+        return list(EventBacktester._iter_events(events))
+
+
+def _event_timestamp(event) -> datetime:
+    return event.timestamp
+
+
+def _ordered_series(series: Iterable[MarketEvent]) -> Iterable[MarketEvent]:
+    """Guarantee a single series is time-ordered before it enters the merge."""
+    if isinstance(series, Sequence):
+        if all(series[i - 1].timestamp <= series[i].timestamp for i in range(1, len(series))):
+            return series
+        return sorted(series, key=_event_timestamp)
+    return _checked_stream(series)
+
+
+def _checked_stream(series: Iterable[MarketEvent]) -> Iterator[MarketEvent]:
+    previous = None
+    for event in series:
+        if previous is not None and event.timestamp < previous:
+            raise ValueError(
+                f"Event stream for {getattr(event, 'symbol', '?')} is not time-ordered: "
+                f"{event.timestamp} after {previous}"
+            )
+        previous = event.timestamp
+        yield event
+
+
+def merge_event_streams(series: Iterable[Iterable[MarketEvent]]) -> Iterator[MarketEvent]:
+    """
+    Lazily merge time-ordered per-symbol series into a single ordered stream.
+
+    Uses a heap holding one pending event per series, so memory is O(series)
+    and time is O(N log k). Ties keep the input series order, matching a
+    stable sort of the flattened series.
+    """
+    return heapq.merge(*(_ordered_series(s) for s in series), key=_event_timestamp)
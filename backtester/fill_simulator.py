@@ -10,7 +10,7 @@ from __future__ import annotations
 import numpy as np
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -95,10 +95,35 @@ class LatencySimulator:
             std_dev_ms: Standard deviation of latency
             seed: Random seed for reproducibility
         """
-        self.mean_latency_ms = mean_latency_ms
-        self.std_dev_ms = std_dev_ms
+        self._mean_latency_ms = mean_latency_ms
+        self._std_dev_ms = std_dev_ms
+        self._update_lognormal_params()
         self.rng = np.random.RandomState(seed)
 
+    @property
+    def mean_latency_ms(self) -> float:
+        return self._mean_latency_ms
+
+    @mean_latency_ms.setter
+    def mean_latency_ms(self, value: float) -> None:
+        self._mean_latency_ms = value
+        self._update_lognormal_params()
+
+    @property
+    def std_dev_ms(self) -> float:
+        return self._std_dev_ms
+
+    @std_dev_ms.setter
+    def std_dev_ms(self, value: float) -> None:
+        self._std_dev_ms = value
+        self._update_lognormal_params()
+
+    def _update_lognormal_params(self) -> None:
+        """Derive log-normal (mu, sigma) once instead of on every draw."""
+        mean, std = self._mean_latency_ms, self._std_dev_ms
+        self._mu = np.log(mean**2 / np.sqrt(mean**2 + std**2))
+        self._sigma = np.sqrt(np.log(1 + (std / mean)**2))
+
     def simulate_latency(self) -> float:
         """
         Simulate execution latency using log-normal distribution.
@@ -107,10 +132,16 @@ class LatencySimulator:
             Latency in milliseconds
         """
         # Log-normal distribution for fat-tail delays
-        mu = np.log(self.mean_latency_ms**2 / np.sqrt(self.mean_latency_ms**2 + self.std_dev_ms**2))
-        sigma = np.sqrt(np.log(1 + (self.std_dev_ms / self.mean_latency_ms)**2))
+        return self.rng.lognormal(self._mu, self._sigma)
 
-        return self.rng.lognormal(mu, sigma)
+    def simulate_latencies(self, n: int) -> np.ndarray:
+        """
+        Draw ``n`` latencies at once.
+
+        Consumes the random stream exactly like ``n`` calls to
+        ``simulate_latency``, so seeded runs match the per-order path.
+        """
+        return self.rng.lognormal(self._mu, self._sigma, size=n)
 
     def get_time_to_fill(self, atr: Optional[float] = None, base_latency: Optional[float] = None) -> float:
         """
@@ -132,6 +163,48 @@ class LatencySimulator:
 
         return base
 
+    def get_times_to_fill(self, n: int, atr: Optional[np.ndarray] = None) -> np.ndarray:
+        """Vectorized ``get_time_to_fill`` for ``n`` orders (``atr`` may be None or per-order)."""
+        times = self.simulate_latencies(n)
+        if atr is not None:
+            atr = np.nan_to_num(np.asarray(atr, dtype=np.float64))
+            times = np.where(atr > 0, times * (1 + np.minimum(atr / 10.0, 5.0) * 0.1), times)
+        return times
+
+
+@dataclass
+class FillBatch:
+    """Float64 results of ``FillSimulator.process_market_orders``, one entry per order."""
+    order_ids: List[str]
+    symbols: List[str]
+    sides: List[OrderSide]
+    quantities: np.ndarray
+    base_prices: np.ndarray
+    fill_prices: np.ndarray
+    slippage: np.ndarray
+    fees: np.ndarray
+    time_to_fill_ms: np.ndarray
+    timestamps: List[datetime]
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def to_fill_results(self) -> List[FillResult]:
+        """Materialize ``FillResult`` objects (with float prices) for order-level consumers."""
+        return [
+            FillResult(
+                order_id=self.order_ids[i],
+                symbol=self.symbols[i],
+                side=self.sides[i],
+                filled_quantity=int(self.quantities[i]),
+                fill_price=float(self.fill_prices[i]),
+                slippage=float(self.slippage[i]),
+                fees=float(self.fees[i]),
+                timestamp=self.timestamps[i],
+            )
+            for i in range(len(self))
+        ]
+
 
 class FillSimulator:
     """
@@ -209,6 +282,71 @@ class FillSimulator:
             timestamp=fill_timestamp
         )
 
+    def process_market_orders(self, orders: Sequence[BacktestOrder], candles: Sequence[Candle],
+                              previous_candles: Optional[Sequence[Optional[Candle]]] = None,
+                              atrs: Optional[Sequence[float]] = None) -> FillBatch:
+        """
+        Float64 batch version of ``process_market_order``.
+
+        ``orders[i]`` is filled against ``candles[i]`` (and ``previous_candles[i]``
+        for the next_bar_open model). Latencies are drawn in order from the same
+        random stream, so with a seeded ``LatencySimulator`` the results agree
+        with the Decimal per-order path to within 1e-9 relative error.
+
+        Args:
+            orders: Market orders
+            candles: Current candle per order
+            previous_candles: Optional previous candle per order (None entries allowed)
+            atrs: Optional ATR per order
+
+        Returns:
+            FillBatch of per-order arrays
+        """
+        n = len(orders)
+        if len(candles) != n:
+            raise ValueError("orders and candles must have the same length")
+
+        close = np.fromiter((c.close for c in candles), dtype=np.float64, count=n)
+        if self.fill_model == "next_bar_open":
+            base = close.copy()
+            if previous_candles is not None:
+                for i, prev in enumerate(previous_candles):
+                    if prev is not None:
+                        base[i] = prev.open
+        elif self.fill_model == "mid_price":
+            high = np.fromiter((c.high for c in candles), dtype=np.float64, count=n)
+            low = np.fromiter((c.low for c in candles), dtype=np.float64, count=n)
+            base = (high + low) / 2
+        else:  # next_tick and unknown models fill at the close
+            base = close
+
+        atr = None if atrs is None else np.nan_to_num(np.asarray(atrs, dtype=np.float64))
+        time_to_fill_ms = self.latency_simulator.get_times_to_fill(n, atr)
+
+        slippage_bps = np.minimum(time_to_fill_ms / 100.0, 50.0)
+        if atr is not None:
+            slippage_bps = np.where(atr > 0, slippage_bps * (1 + np.minimum(atr / 10.0, 2.0)), slippage_bps)
+
+        sign = np.fromiter((1.0 if o.side == OrderSide.BUY else -1.0 for o in orders), dtype=np.float64, count=n)
+        quantity = np.fromiter((abs(o.quantity) for o in orders), dtype=np.float64, count=n)
+        fill_price = base * (1 + sign * slippage_bps / 10000.0)
+
+        types = [o.instrument.instrument_type if o.instrument else "cash" for o in orders]
+        fees = self.cost_model.total_fees_india_batch(fill_price * quantity, types)
+
+        return FillBatch(
+            order_ids=[o.order_id for o in orders],
+            symbols=[o.symbol for o in orders],
+            sides=[o.side for o in orders],
+            quantities=np.fromiter((o.quantity for o in orders), dtype=np.float64, count=n),
+            base_prices=base,
+            fill_prices=fill_price,
+            slippage=np.abs(fill_price - base) * quantity,
+            fees=fees,
+            time_to_fill_ms=time_to_fill_ms,
+            timestamps=[c.timestamp + timedelta(milliseconds=float(ms)) for c, ms in zip(candles, time_to_fill_ms)],
+        )
+
     def _calculate_volatility_slippage(self, time_to_fill_ms: float, atr: float) -> float:
         """
         Calculate slippage in basis points based on time-to-fill and volatility.
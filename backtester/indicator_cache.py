@@ -0,0 +1,250 @@
+"""
+Indicator cache for grid searches and batch backtests.
+
+Indicator results are keyed by a content fingerprint of the input columns
+plus the indicator name and parameters, so identical (data, indicator,
+params) combinations are computed once. The in-memory tier is a true LRU
+bounded by a byte budget; an optional on-disk tier stores ``.npy``/``.npz``
+files named by key, which lets worker processes pointed at the same
+directory reuse each other's results.
+
+Columnar strategies look indicators up through ``ColumnarBars.indicator``;
+the ``batch`` command hands every worker a copy of one cache whose disk
+tier is ``--indicator-cache-dir``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Short names used by strategies and grid configs -> indicators.realtime functions
+INDICATOR_ALIASES: Dict[str, str] = {
+    "sma": "moving_average_simple",
+    "ema": "moving_average_exponential",
+    "wma": "moving_average_weighted",
+    "rsi": "relative_strength_index",
+    "atr": "average_true_range",
+    "adx": "average_directional_index",
+    "macd": "moving_average_convergence_divergence",
+    "bollinger": "bollinger_bands",
+    "stochastic": "stochastic_oscillator",
+    "cci": "commodity_channel_index",
+    "mfi": "money_flow_index",
+    "obv": "on_balance_volume",
+    "vwap": "volume_weighted_average_price",
+}
+
+# Indicator function argument name -> OHLCV column
+_INPUT_COLUMNS: Dict[str, str] = {
+    "opens": "open",
+    "highs": "high",
+    "lows": "low",
+    "closes": "close",
+    "prices": "close",
+    "volumes": "volume",
+}
+
+IndicatorData = Union[np.ndarray, Mapping[str, np.ndarray]]
+
+
+def resolve_indicator(name: str) -> Callable[..., Any]:
+    """Look up an indicator function in ``indicators.realtime`` by name or alias."""
+    from indicators import realtime
+
+    func = getattr(realtime, INDICATOR_ALIASES.get(name, name), None)
+    if not callable(func):
+        raise ValueError(f"Unknown indicator: {name}")
+    return func
+
+
+def compute_indicator(name: str, data: IndicatorData, **params) -> Any:
+    """Call an indicator function, binding OHLCV columns by argument name."""
+    func = resolve_indicator(name)
+    columns = {"close": np.asarray(data)} if isinstance(data, np.ndarray) else data
+
+    kwargs = {}
+    for arg in inspect.signature(func).parameters:
+        column = _INPUT_COLUMNS.get(arg)
+        if column is None:
+            continue
+        if column not in columns:
+            raise ValueError(f"Indicator {name} needs '{column}' data")
+        kwargs[arg] = np.asarray(columns[column], dtype=float)
+    kwargs.update(params)
+    return func(**kwargs)
+
+
+def data_fingerprint(data: IndicatorData) -> str:
+    """Content hash of the input columns (names, dtypes, shapes and bytes)."""
+    columns = {"close": data} if isinstance(data, np.ndarray) else data
+    digest = hashlib.sha256()
+    for name in sorted(columns):
+        column = np.ascontiguousarray(columns[name])
+        digest.update(f"{name}:{column.dtype.str}:{column.shape};".encode())
+        digest.update(column.data)
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """Bounded LRU cache of indicator results with an optional shared disk tier."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, cache_dir: Optional[Union[str, Path]] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes share results through the disk tier; don't pickle the memory tier
+        state = self.__dict__.copy()
+        state.update(cache=OrderedDict(), current_bytes=0, hits=0, disk_hits=0, misses=0)
+        return state
+
+    def get_key(self, indicator_name: str, parameters: Dict[str, Any], fingerprint: str = "") -> str:
+        """Generate a content-addressed cache key (identical inputs share entries across symbols)."""
+        payload = json.dumps(
+            {"indicator": INDICATOR_ALIASES.get(indicator_name, indicator_name), "params": parameters, "data": fingerprint},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get_indicator(self, indicator_name: str, parameters: Dict[str, Any], data: IndicatorData,
+                      fingerprint: Optional[str] = None):
+        """
+        Get a cached indicator or compute and cache it.
+
+        Args:
+            indicator_name: ``indicators.realtime`` function name or alias (e.g. 'sma')
+            parameters: Keyword arguments for the indicator (e.g. {'period': 20})
+            data: Close array, or mapping of OHLCV columns ('open', 'high', ...)
+            fingerprint: Precomputed ``data_fingerprint(data)``; pass it when
+                requesting many indicators over the same data
+
+        Returns:
+            The indicator result (cached arrays are read-only)
+        """
+        if fingerprint is None:
+            fingerprint = data_fingerprint(data)
+        key = self.get_key(indicator_name, parameters, fingerprint)
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+
+        result = self._load_from_disk(key)
+        if result is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            result = self._freeze(compute_indicator(indicator_name, data, **parameters))
+            self._save_to_disk(key, result)
+
+        self._store(key, result)
+        return result
+
+    def _store(self, key: str, result: Any) -> None:
+        size = self._nbytes(result)
+        if size > self.max_bytes:
+            return
+        self.cache[key] = result
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self.cache.popitem(last=False)
+            self.current_bytes -= self._nbytes(evicted)
+
+    def _disk_path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _load_from_disk(self, key: str):
+        if not self.cache_dir:
+            return None
+        try:
+            path = self._disk_path(key, ".npy")
+            if path.exists():
+                return np.load(path, mmap_mode="r")
+            path = self._disk_path(key, ".npz")
+            if path.exists():
+                with np.load(path) as archive:
+                    return self._freeze(tuple(archive[f"arr_{i}"] for i in range(len(archive.files))))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable indicator cache entry {key}: {e}")
+        return None
+
+    def _save_to_disk(self, key: str, result: Any) -> None:
+        if not self.cache_dir:
+            return
+        if isinstance(result, np.ndarray):
+            suffix = ".npy"
+        elif isinstance(result, tuple) and all(isinstance(r, np.ndarray) for r in result):
+            suffix = ".npz"
+        else:
+            return  # only array results are shared across processes
+
+        path = self._disk_path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write under a unique temp name and rename so concurrent workers never read partial files
+        tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp{suffix}")
+        try:
+            if suffix == ".npy":
+                np.save(tmp_path, result)
+            else:
+                np.savez(tmp_path, *result)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write indicator cache entry {key}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _freeze(result: Any) -> Any:
+        """Mark array results read-only so cached values cannot be mutated by callers."""
+        arrays = result if isinstance(result, tuple) else (result,)
+        for array in arrays:
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+        return result
+
+    @staticmethod
+    def _nbytes(result: Any) -> int:
+        if isinstance(result, np.ndarray):
+            return result.nbytes
+        if isinstance(result, tuple):
+            return sum(IndicatorCache._nbytes(r) for r in result)
+        return sys.getsizeof(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self.cache),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        """Clear the in-memory tier (the disk tier is left in place)."""
+        self.cache.clear()
+        self.current_bytes = 0
@@ -0,0 +1,230 @@
+"""
+Streaming indicator state for ``BaseStrategy``.
+
+``IndicatorState`` holds the running state behind the indicator set that
+``BaseStrategy.calculate_indicators`` exposes (SMA-20/50, EMA-12/26, RSI,
+MACD, ATR, Bollinger Bands, VWAP and stochastics) for one symbol and
+advances it one candle at a time: rolling sums over fixed windows, EMA
+recursions, monotonic deques for window highs/lows and cumulative VWAP
+sums. The cost of a new candle depends on the indicator periods, never on
+the length of the history.
+
+Values are computed with the same ``Decimal`` operations, in the same
+order, as the ``IndicatorLibrary`` functions over the full history, so the
+two agree exactly.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from common.market_data import Candle
+
+_ZERO = Decimal('0')
+_HUNDRED = Decimal('100')
+
+
+class RollingSum:
+    """Sum of the last ``period`` values."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values: Deque[Decimal] = deque()
+        self.total: Decimal = _ZERO
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    def push(self, value: Decimal) -> None:
+        self.values.append(value)
+        self.total += value
+        if len(self.values) > self.period:
+            self.total -= self.values.popleft()
+
+    def mean(self) -> Optional[Decimal]:
+        return self.total / self.period if self.full else None
+
+
+class EMAState:
+    """EMA seeded with the mean of the first ``period`` values (``IndicatorLibrary.ema``)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.multiplier = Decimal(2) / Decimal(period + 1)
+        self.count = 0
+        self.seed_total: Decimal = _ZERO
+        self.value: Optional[Decimal] = None
+
+    def push(self, value: Decimal) -> Optional[Decimal]:
+        self.count += 1
+        if self.count <= self.period:
+            self.seed_total += value
+            if self.count == self.period:
+                self.value = self.seed_total / self.period
+        else:
+            self.value = (value * self.multiplier) + (self.value * (1 - self.multiplier))
+        return self.value
+
+
+class WindowExtreme:
+    """Maximum (or minimum) of the last ``period`` values via a monotonic deque."""
+
+    def __init__(self, period: int, maximum: bool = True):
+        self.period = period
+        self.maximum = maximum
+        self.count = 0
+        self._window: Deque[Tuple[int, Decimal]] = deque()
+
+    def push(self, value: Decimal) -> Decimal:
+        window = self._window
+        while window and (window[-1][1] <= value if self.maximum else window[-1][1] >= value):
+            window.pop()
+        window.append((self.count, value))
+        self.count += 1
+        if window[0][0] <= self.count - 1 - self.period:
+            window.popleft()
+        return window[0][1]
+
+
+class IndicatorState:
+    """Incrementally updated ``BaseStrategy`` indicator set for one symbol."""
+
+    def __init__(self, sma_periods: Tuple[int, ...] = (20, 50), ema_periods: Tuple[int, ...] = (12, 26),
+                 rsi_period: int = 14, macd_periods: Tuple[int, int, int] = (12, 26, 9), atr_period: int = 14,
+                 bollinger_period: int = 20, bollinger_std: float = 2.0, stoch_periods: Tuple[int, int] = (14, 3)):
+        self.count = 0
+        self.last_timestamp: Optional[datetime] = None
+        self._prev_close: Optional[Decimal] = None
+
+        self._sma = {period: RollingSum(period) for period in sma_periods}
+        self._ema = {period: EMAState(period) for period in ema_periods}
+
+        self._rsi_period = rsi_period
+        self._rsi_gains = RollingSum(rsi_period)
+        self._rsi_losses = RollingSum(rsi_period)
+
+        fast, slow, signal = macd_periods
+        self._macd_fast, self._macd_slow = EMAState(fast), EMAState(slow)
+        self._macd_slow_period = slow
+        self._macd_signal = EMAState(signal)
+        self._macd_line: Optional[Decimal] = None
+
+        self._atr_period = atr_period
+        self._true_ranges = RollingSum(atr_period)
+
+        self._bollinger = RollingSum(bollinger_period)
+        self._bollinger_std = bollinger_std
+
+        self._vwap_pv: Decimal = _ZERO
+        self._vwap_volume: Decimal = _ZERO
+
+        k_period, d_period = stoch_periods
+        self._stoch_k_period, self._stoch_d_period = k_period, d_period
+        self._highest = WindowExtreme(k_period, maximum=True)
+        self._lowest = WindowExtreme(k_period, maximum=False)
+        self._stoch_k: Optional[Decimal] = None
+        self._raw_k: Deque[Optional[Decimal]] = deque(maxlen=d_period)  # None where the window had no range
+
+    def update(self, candle: Candle) -> None:
+        """Advance every indicator by one candle."""
+        close = Decimal(str(candle.close))
+        high = Decimal(str(candle.high))
+        low = Decimal(str(candle.low))
+        index = self.count
+        self.count += 1
+        self.last_timestamp = candle.timestamp
+
+        for state in self._sma.values():
+            state.push(close)
+        for state in self._ema.values():
+            state.push(close)
+        self._bollinger.push(close)
+
+        fast = self._macd_fast.push(close)
+        slow = self._macd_slow.push(close)
+        if slow is not None:
+            self._macd_line = fast - slow
+            # IndicatorLibrary.macd starts its signal series one bar after the slow EMA exists
+            if index >= self._macd_slow_period:
+                self._macd_signal.push(self._macd_line)
+
+        prev_close = self._prev_close
+        if prev_close is not None:
+            change = close - prev_close
+            if change > 0:
+                self._rsi_gains.push(change)
+                self._rsi_losses.push(_ZERO)
+            else:
+                self._rsi_gains.push(_ZERO)
+                self._rsi_losses.push(abs(change))
+            self._true_ranges.push(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        self._prev_close = close
+
+        volume = Decimal(str(candle.volume)) if candle.volume is not None else _ZERO
+        self._vwap_volume += volume
+        self._vwap_pv += ((high + low + close) / 3) * volume
+
+        highest = self._highest.push(high)
+        lowest = self._lowest.push(low)
+        if self.count >= self._stoch_k_period:
+            if highest == lowest:
+                self._stoch_k = Decimal('50')  # Neutral when no range
+                self._raw_k.append(None)
+            else:
+                self._stoch_k = ((close - lowest) / (highest - lowest)) * 100
+                self._raw_k.append(self._stoch_k)
+
+    def values(self) -> Dict[str, Any]:
+        """Current values under the ``calculate_indicators`` keys (None until enough history)."""
+        result: Dict[str, Any] = {}
+        for period, state in self._sma.items():
+            result[f'sma_{period}'] = state.mean()
+        for period, state in self._ema.items():
+            result[f'ema_{period}'] = state.value
+
+        result[f'rsi_{self._rsi_period}'] = self._rsi()
+
+        signal = self._macd_signal.value
+        result['macd'] = self._macd_line
+        result['macd_signal'] = signal
+        result['macd_hist'] = self._macd_line - signal if signal is not None else None
+
+        result[f'atr_{self._atr_period}'] = self._true_ranges.mean()
+
+        result['bb_middle'], result['bb_upper'], result['bb_lower'] = self._bands()
+
+        result['vwap'] = self._vwap_pv / self._vwap_volume if self._vwap_volume else None
+
+        result['stoch_k'] = self._stoch_k
+        result['stoch_d'] = self._stoch_d()
+        return result
+
+    def _rsi(self) -> Optional[Decimal]:
+        if not self._rsi_gains.full:
+            return None
+        avg_gain = self._rsi_gains.mean()
+        avg_loss = self._rsi_losses.mean()
+        if avg_loss == 0:
+            return _HUNDRED
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    def _bands(self) -> Tuple[Optional[Decimal], Optional[Decimal], Optional[Decimal]]:
+        # O(period) over the window, only when read; keeps the variance exact
+        middle = self._bollinger.mean()
+        if middle is None:
+            return None, None, None
+        variance = sum((price - middle) ** 2 for price in self._bollinger.values) / self._bollinger.period
+        width = variance.sqrt() * Decimal(str(self._bollinger_std))
+        return middle, middle + width, middle - width
+
+    def _stoch_d(self) -> Optional[Decimal]:
+        if self.count < self._stoch_k_period + self._stoch_d_period - 1:
+            return None
+        if len(self._raw_k) < self._stoch_d_period or any(k is None for k in self._raw_k):
+            return None
+        return sum(self._raw_k) / self._stoch_d_period
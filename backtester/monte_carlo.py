@@ -0,0 +1,221 @@
+"""
+Monte Carlo robustness analysis of backtest trade lists.
+
+Resamples the closed trades of a finished ``BacktestReport`` to show how
+much of its result depends on the particular order and selection of trades:
+
+- ``shuffle``: every simulation replays the same trades in a random order.
+  Final equity is unchanged; drawdown and ruin vary with the path.
+- ``bootstrap``: every simulation draws as many trades as the report has,
+  with replacement, so final equity and CAGR vary as well.
+
+Simulations are built as (simulations x trades) matrices: one index draw,
+one gather and a cumulative sum (or product, when compounding) along the
+trade axis, processed in row chunks to bound memory. Results are
+reproducible for a given seed.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .reporting import BacktestReport, TradeArrays
+
+logger = logging.getLogger(__name__)
+
+MONTE_CARLO_METHODS = ("shuffle", "bootstrap")
+SUMMARY_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _distribution(values: np.ndarray, percentiles: Sequence[float] = SUMMARY_PERCENTILES) -> Dict[str, float]:
+    """Mean, standard deviation and percentiles of a simulated metric."""
+    if values.size == 0:
+        return {}
+    summary = {'mean': float(values.mean()), 'std': float(values.std())}
+    for q, value in zip(percentiles, np.percentile(values, percentiles)):
+        summary[f"p{q:g}"] = float(value)
+    return summary
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-simulation outcomes of a Monte Carlo run."""
+    method: str
+    n_simulations: int
+    n_trades: int
+    initial_capital: float
+    years: float
+    ruin_threshold_pct: float
+    seed: Optional[int]
+
+    final_equity: np.ndarray
+    max_drawdown_pct: np.ndarray
+    cagr_pct: np.ndarray
+    ruined: np.ndarray  # bool, equity fell to the ruin threshold at some point
+
+    # The report's own trade sequence, for comparison
+    observed_max_drawdown_pct: float = 0.0
+    observed_cagr_pct: float = 0.0
+
+    @property
+    def ruin_probability(self) -> float:
+        return float(self.ruined.mean()) if self.ruined.size else 0.0
+
+    def drawdown_percentile_of_observed(self) -> float:
+        """Share of simulations with a drawdown no worse than the observed one (%)."""
+        if self.max_drawdown_pct.size == 0:
+            return 0.0
+        return float((self.max_drawdown_pct <= self.observed_max_drawdown_pct).mean() * 100)
+
+    def summary(self, percentiles: Sequence[float] = SUMMARY_PERCENTILES) -> Dict[str, Any]:
+        """JSON-ready summary of the simulated distributions."""
+        return {
+            'method': self.method,
+            'n_simulations': self.n_simulations,
+            'n_trades': self.n_trades,
+            'seed': self.seed,
+            'ruin_threshold_pct': self.ruin_threshold_pct,
+            'ruin_probability': self.ruin_probability,
+            'observed': {
+                'max_drawdown_pct': self.observed_max_drawdown_pct,
+                'cagr_pct': self.observed_cagr_pct,
+            },
+            'max_drawdown_pct': _distribution(self.max_drawdown_pct, percentiles),
+            'cagr_pct': _distribution(self.cagr_pct, percentiles),
+            'final_equity': _distribution(self.final_equity, percentiles),
+        }
+
+
+class MonteCarloAnalyzer:
+    """Vectorized trade-resampling simulations."""
+
+    def __init__(self, n_simulations: int = 10_000, seed: Optional[int] = None,
+                 ruin_threshold_pct: float = 50.0, compound: bool = False, chunk_size: int = 1024):
+        """
+        Args:
+            n_simulations: Number of resampled trade sequences
+            seed: Random seed; identical seeds give identical results
+            ruin_threshold_pct: Drawdown from initial capital that counts as ruin
+            compound: Replay trades as returns on the equity at entry (position
+                sizes scale with equity) instead of fixed P&L amounts
+            chunk_size: Simulations per matrix block
+        """
+        if n_simulations <= 0:
+            raise ValueError("n_simulations must be positive")
+        if not 0 < ruin_threshold_pct <= 100:
+            raise ValueError("ruin_threshold_pct must be in (0, 100]")
+        self.n_simulations = n_simulations
+        self.seed = seed
+        self.ruin_threshold_pct = ruin_threshold_pct
+        self.compound = compound
+        self.chunk_size = chunk_size
+
+    def run(self, report: BacktestReport, method: str = "shuffle") -> MonteCarloResult:
+        """
+        Simulate resampled trade sequences of a finished backtest.
+
+        Args:
+            report: Backtest report with a trade log
+            method: 'shuffle' or 'bootstrap'
+
+        Returns:
+            MonteCarloResult with one entry per simulation
+        """
+        trades = TradeArrays.from_records(report.trade_log)
+        # Replay in the order trades closed
+        pnl = trades.realized_pnl[np.argsort(trades.exit_times, kind='stable')]
+        return self.run_pnl(pnl, report.initial_capital, report.start_date, report.end_date, method)
+
+    def run_pnl(self, pnl: np.ndarray, initial_capital: float, start: date, end: date,
+                method: str = "shuffle") -> MonteCarloResult:
+        """Simulate from a chronological array of per-trade P&L."""
+        if method not in MONTE_CARLO_METHODS:
+            raise ValueError(f"Unknown Monte Carlo method: {method} (expected one of {MONTE_CARLO_METHODS})")
+
+        pnl = np.asarray(pnl, dtype=np.float64)
+        initial_capital = float(initial_capital)
+        years = (end - start).days / 365.0
+        n, n_trades = self.n_simulations, len(pnl)
+
+        # Fixed P&L amounts add up; compounding replays each trade's return on equity at entry
+        if self.compound:
+            equity_before = initial_capital + np.concatenate(([0.0], np.cumsum(pnl)[:-1]))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                returns = np.where(equity_before > 0, pnl / equity_before, -1.0)
+                steps = np.log1p(np.maximum(returns, -1.0))
+        else:
+            steps = pnl
+
+        observed_drawdown, observed_final, _ = self._paths(steps[None, :], initial_capital)
+        result = MonteCarloResult(
+            method=method,
+            n_simulations=n,
+            n_trades=n_trades,
+            initial_capital=initial_capital,
+            years=years,
+            ruin_threshold_pct=self.ruin_threshold_pct,
+            seed=self.seed,
+            final_equity=np.empty(n),
+            max_drawdown_pct=np.empty(n),
+            cagr_pct=np.empty(n),
+            ruined=np.empty(n, dtype=bool),
+            observed_max_drawdown_pct=float(observed_drawdown[0]),
+            observed_cagr_pct=float(self._cagr(observed_final, initial_capital, years)[0]),
+        )
+        if n_trades == 0:
+            result.final_equity[:] = initial_capital
+            result.max_drawdown_pct[:] = 0.0
+            result.cagr_pct[:] = 0.0
+            result.ruined[:] = False
+            return result
+
+        rng = np.random.default_rng(self.seed)
+        for start_row in range(0, n, self.chunk_size):
+            rows = slice(start_row, min(start_row + self.chunk_size, n))
+            size = rows.stop - rows.start
+            if method == "shuffle":
+                indices = rng.permuted(np.broadcast_to(np.arange(n_trades), (size, n_trades)), axis=1)
+            else:
+                indices = rng.integers(0, n_trades, size=(size, n_trades))
+
+            drawdown, final, ruined = self._paths(steps[indices], initial_capital)
+            result.max_drawdown_pct[rows] = drawdown
+            result.final_equity[rows] = final
+            result.ruined[rows] = ruined
+
+        result.cagr_pct[:] = self._cagr(result.final_equity, initial_capital, years)
+        logger.info(f"Monte Carlo ({method}): {n} simulations of {n_trades} trades, "
+                    f"ruin probability {result.ruin_probability:.2%}")
+        return result
+
+    def _paths(self, steps: np.ndarray, initial_capital: float):
+        """Max drawdown (%), final equity and ruin flag for each row of trade steps."""
+        if self.compound:
+            equity = initial_capital * np.exp(np.cumsum(steps, axis=1))
+        else:
+            equity = initial_capital + np.cumsum(steps, axis=1)
+        if equity.shape[1] == 0:
+            rows = equity.shape[0]
+            return np.zeros(rows), np.full(rows, initial_capital), np.zeros(rows, dtype=bool)
+
+        # The starting capital is the first peak of every path
+        peak = np.maximum(np.maximum.accumulate(equity, axis=1), initial_capital)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdown = np.where(peak > 0, (peak - equity) / peak * 100, 0.0).max(axis=1)
+        ruin_level = initial_capital * (1 - self.ruin_threshold_pct / 100)
+        ruined = equity.min(axis=1) <= ruin_level
+        return drawdown, equity[:, -1], ruined
+
+    @staticmethod
+    def _cagr(final_equity: np.ndarray, initial_capital: float, years: float) -> np.ndarray:
+        """CAGR (%) over the report's period; total loss is -100%."""
+        final_equity = np.asarray(final_equity, dtype=np.float64)
+        if years <= 0 or initial_capital <= 0:
+            return np.zeros_like(final_equity)
+        growth = np.maximum(final_equity / initial_capital, 0.0)
+        return (growth ** (1 / years) - 1) * 100
@@ -0,0 +1,291 @@
+"""
+Data-availability manifest for OHLCV partitions.
+
+``OHLCVStorage`` records every Parquet file it writes (canonical daily
+partitions and pending delta files) in a SQLite database at
+``<base_path>/_manifest.sqlite``: row count, min/max timestamp, file size
+and a SHA-256 checksum. Symbol, timeframe, date-range and coverage queries
+are answered with indexed SQL instead of walking directories and opening
+Parquet files; a per-(symbol, timeframe) summary table keeps symbol lists
+and coverage independent of the number of partitions.
+
+The manifest is maintained incrementally on write, delete and compaction.
+A tree written before the manifest existed is scanned once when the
+manifest is first opened; ``rebuild`` re-syncs it after files are changed
+outside ``OHLCVStorage`` and ``verify`` reports files whose size or
+checksum no longer match.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "_manifest.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    path TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    day TEXT NOT NULL,
+    is_delta INTEGER NOT NULL,
+    num_rows INTEGER NOT NULL,
+    min_ts INTEGER,
+    max_ts INTEGER,
+    size_bytes INTEGER NOT NULL,
+    checksum TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS partitions_by_day ON partitions (symbol, timeframe, day);
+CREATE TABLE IF NOT EXISTS series (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    first_day TEXT NOT NULL,
+    last_day TEXT NOT NULL,
+    PRIMARY KEY (symbol, timeframe)
+);
+"""
+
+
+@dataclass
+class PartitionInfo:
+    """Manifest entry for one Parquet file."""
+    path: str  # relative to the storage base path
+    symbol: str
+    timeframe: str
+    day: str  # YYYY-MM-DD
+    is_delta: bool
+    num_rows: int
+    min_ts: Optional[int]  # ns since the epoch (UTC)
+    max_ts: Optional[int]
+    size_bytes: int
+    checksum: str
+
+
+def file_checksum(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class OHLCVManifest:
+    """SQLite-backed index of the Parquet files under an ``OHLCVStorage`` base path."""
+
+    def __init__(self, base_path: Path, delta_dir: str, filename: str = MANIFEST_FILE):
+        self.base_path = Path(base_path)
+        self.delta_dir = delta_dir
+        self.path = self.base_path / filename
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        is_new = not self.path.exists()
+        self._connection()
+        if is_new and any(p.is_dir() for p in self.base_path.iterdir()):
+            self.rebuild()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork; reopen in child processes
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_pid'] = None
+        return state
+
+    def _locate(self, path: Path) -> Tuple[str, str, str, str, bool]:
+        """(relative path, symbol, timeframe, day, is_delta) for a partition or delta file."""
+        rel = Path(path).relative_to(self.base_path)
+        parts = rel.parts
+        if len(parts) == 5 and parts[2] == self.delta_dir:
+            return rel.as_posix(), parts[0], parts[1], parts[3], True
+        if len(parts) == 3:
+            return rel.as_posix(), parts[0], parts[1], rel.stem, False
+        raise ValueError(f"Not an OHLCV partition path: {path}")
+
+    def record(self, path: Path, table: Optional[pa.Table] = None) -> None:
+        """
+        Record (or replace) the entry for a file just written.
+
+        Args:
+            path: Partition or delta file under the base path
+            table: The table written to ``path``; read back from the file if omitted
+        """
+        rel, symbol, timeframe, day, is_delta = self._locate(path)
+        if table is None:
+            table = pq.read_table(path, columns=['timestamp'])
+        timestamps = table.column('timestamp').cast(pa.timestamp('ns')).cast(pa.int64()).to_numpy()
+        min_ts = int(timestamps.min()) if len(timestamps) else None
+        max_ts = int(timestamps.max()) if len(timestamps) else None
+
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO partitions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (rel, symbol, timeframe, day, int(is_delta), table.num_rows, min_ts, max_ts,
+             Path(path).stat().st_size, file_checksum(path)),
+        )
+        conn.execute(
+            "INSERT INTO series VALUES (?, ?, ?, ?) ON CONFLICT (symbol, timeframe) DO UPDATE SET "
+            "first_day = MIN(first_day, excluded.first_day), last_day = MAX(last_day, excluded.last_day)",
+            (symbol, timeframe, day, day),
+        )
+
+    def _refresh_series(self, symbol: str, timeframe: str) -> None:
+        """Recompute one summary row after entries were removed."""
+        conn = self._connection()
+        first, last = conn.execute(
+            "SELECT MIN(day), MAX(day) FROM partitions WHERE symbol = ? AND timeframe = ?", (symbol, timeframe),
+        ).fetchone()
+        if first is None:
+            conn.execute("DELETE FROM series WHERE symbol = ? AND timeframe = ?", (symbol, timeframe))
+        else:
+            conn.execute("UPDATE series SET first_day = ?, last_day = ? WHERE symbol = ? AND timeframe = ?",
+                         (first, last, symbol, timeframe))
+
+    def remove(self, paths: Iterable[Path]) -> None:
+        """Drop entries for deleted files."""
+        located = [self._locate(p) for p in paths]
+        self._connection().executemany("DELETE FROM partitions WHERE path = ?", [(loc[0],) for loc in located])
+        for symbol, timeframe in {(loc[1], loc[2]) for loc in located}:
+            self._refresh_series(symbol, timeframe)
+
+    def remove_deltas(self, symbol: str, timeframe: str, day: str) -> None:
+        """Drop every delta entry for one daily partition."""
+        self._connection().execute(
+            "DELETE FROM partitions WHERE symbol = ? AND timeframe = ? AND day = ? AND is_delta = 1",
+            (symbol, timeframe, day),
+        )
+        self._refresh_series(symbol, timeframe)
+
+    def rebuild(self) -> int:
+        """
+        Re-scan the whole tree and replace the manifest contents.
+
+        Returns:
+            Number of files recorded
+        """
+        conn = self._connection()
+        count = 0
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM partitions")
+            conn.execute("DELETE FROM series")
+            for path in self.base_path.glob("*/*/*.parquet"):
+                self.record(path)
+                count += 1
+            for path in self.base_path.glob(f"*/*/{self.delta_dir}/*/*.parquet"):
+                self.record(path)
+                count += 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(f"Rebuilt OHLCV manifest with {count} files")
+        return count
+
+    def symbols(self) -> List[str]:
+        rows = self._connection().execute("SELECT DISTINCT symbol FROM series ORDER BY symbol")
+        return [r[0] for r in rows]
+
+    def timeframes(self, symbol: str) -> List[str]:
+        rows = self._connection().execute(
+            "SELECT timeframe FROM series WHERE symbol = ? ORDER BY timeframe", (symbol,))
+        return [r[0] for r in rows]
+
+    def date_range(self, symbol: str, timeframe: str) -> Optional[Tuple[date, date]]:
+        """First and last day with data (partitions or pending deltas)."""
+        row = self._connection().execute(
+            "SELECT first_day, last_day FROM series WHERE symbol = ? AND timeframe = ?", (symbol, timeframe),
+        ).fetchone()
+        if row is None:
+            return None
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1])
+
+    def days(self, symbol: str, timeframe: str, start: Optional[date] = None,
+             end: Optional[date] = None) -> List[str]:
+        """Days with data within [start, end], ascending."""
+        rows = self._connection().execute(
+            "SELECT DISTINCT day FROM partitions WHERE symbol = ? AND timeframe = ? AND day BETWEEN ? AND ? "
+            "ORDER BY day",
+            (symbol, timeframe, start.isoformat() if start else "", end.isoformat() if end else "9999-12-31"),
+        )
+        return [r[0] for r in rows]
+
+    def coverage(self) -> Dict[str, Dict[str, Tuple[date, date]]]:
+        """symbol -> timeframe -> (first day, last day) in one query."""
+        result: Dict[str, Dict[str, Tuple[date, date]]] = {}
+        rows = self._connection().execute(
+            "SELECT symbol, timeframe, first_day, last_day FROM series")
+        for symbol, timeframe, first, last in rows:
+            result.setdefault(symbol, {})[timeframe] = (date.fromisoformat(first), date.fromisoformat(last))
+        return result
+
+    def stats(self, symbol: str, timeframe: str, start: Optional[date] = None,
+              end: Optional[date] = None) -> Dict[str, object]:
+        """
+        Aggregate file statistics for a symbol/timeframe over [start, end].
+
+        ``rows`` counts every stored row; until ``compact`` runs, rows in a
+        delta that rewrite an existing timestamp are counted twice, so it is
+        an upper bound on the candles a load returns.
+        """
+        days, rows, min_ts, max_ts, size, files = self._connection().execute(
+            "SELECT COUNT(DISTINCT day), COALESCE(SUM(num_rows), 0), MIN(min_ts), MAX(max_ts), "
+            "COALESCE(SUM(size_bytes), 0), COUNT(*) FROM partitions "
+            "WHERE symbol = ? AND timeframe = ? AND day BETWEEN ? AND ?",
+            (symbol, timeframe, start.isoformat() if start else "", end.isoformat() if end else "9999-12-31"),
+        ).fetchone()
+        return {'days': days, 'rows': rows, 'min_ts': min_ts, 'max_ts': max_ts, 'size_bytes': size, 'files': files}
+
+    def partitions(self, symbol: Optional[str] = None, timeframe: Optional[str] = None,
+                   day: Optional[str] = None) -> List[PartitionInfo]:
+        """Manifest entries, optionally filtered, ordered by symbol, timeframe and day."""
+        query = "SELECT * FROM partitions"
+        clauses, params = [], []
+        for name, value in (("symbol", symbol), ("timeframe", timeframe), ("day", day)):
+            if value is not None:
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY symbol, timeframe, day, path"
+        return [
+            PartitionInfo(path, sym, tf, day, bool(is_delta), num_rows, min_ts, max_ts, size, checksum)
+            for path, sym, tf, day, is_delta, num_rows, min_ts, max_ts, size, checksum
+            in self._connection().execute(query, params)
+        ]
+
+    def verify(self) -> List[str]:
+        """Relative paths of recorded files that are missing or whose size or checksum changed."""
+        mismatched = []
+        for info in self.partitions():
+            path = self.base_path / info.path
+            try:
+                if path.stat().st_size != info.size_bytes or file_checksum(path) != info.checksum:
+                    mismatched.append(info.path)
+            except FileNotFoundError:
+                mismatched.append(info.path)
+        return mismatched
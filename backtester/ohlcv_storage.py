@@ -2,21 +2,44 @@
 OHLCV Data Storage for Backtesting
 
 Handles storage and retrieval of OHLCV candle data in Parquet format,
-optimized for backtesting workloads.
+optimized for backtesting workloads. Availability and coverage queries are
+answered from a manifest maintained on write (see ``ohlcv_manifest``).
+
+Coarser timeframes that were never ingested (e.g. 5m/15m/1h/1d when only
+1m is stored) are rolled up on the fly from the finest stored timeframe
+that divides them (see ``rollups``). Each rolled-up day is cached under
+``_derived/`` together with a fingerprint of its source day and rebuilt
+when that day is rewritten, appended to or compacted.
 """
 
+import hashlib
 import logging
+import os
+import shutil
+import time
+import uuid
 from pathlib import Path
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from common.market_data import Candle
 
+from .ohlcv_manifest import OHLCVManifest
+from .rollups import rollup_table, timeframe_minutes
+
 logger = logging.getLogger(__name__)
 
+# Sub-directory (per symbol/timeframe) holding append-only delta files
+DELTA_DIR = "_deltas"
+
+# Top-level directory holding cached rollups of timeframes that are not stored
+DERIVED_DIR = "_derived"
+
 
 class OHLCVStorage:
     """
@@ -25,7 +48,13 @@ class OHLCVStorage:
     Partitioned by symbol and date for optimal query performance.
     """
 
-    def __init__(self, base_path: str = "data/ohlcv"):
+    def __init__(self, base_path: str = "data/ohlcv", use_manifest: bool = True):
+        """
+        Args:
+            base_path: Root directory of the partition tree
+            use_manifest: Keep a data-availability manifest and answer
+                availability queries from it (otherwise scan directories)
+        """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
 
@@ -42,6 +71,8 @@ class OHLCVStorage:
             ('source', pa.string()),
         ])
 
+        self.manifest = OHLCVManifest(self.base_path, DELTA_DIR) if use_manifest else None
+
     def _get_partition_path(self, symbol: str, date_obj: date, timeframe: str) -> Path:
         """Get partition path for symbol, date, and timeframe."""
         date_str = date_obj.strftime("%Y-%m-%d")
@@ -55,9 +86,12 @@ class OHLCVStorage:
         """
         Save OHLCV candles to partitioned Parquet files.
 
+        Appends to an existing day are written as small immutable delta files
+        instead of rewriting the partition; see ``compact``.
+
         Args:
             candles: List of Candle objects
-            append: Whether to append to existing data
+            append: Whether to append to existing data (False overwrites the day)
         """
         if not candles:
             logger.warning("No candles provided")
@@ -89,118 +123,400 @@ class OHLCVStorage:
                 'source': c.source or 'unknown'
             } for c in candle_list])
 
-            if append and partition_path.exists():
-                # Read existing and append
-                try:
-                    existing_df = pd.read_parquet(partition_path)
-                    combined_df = pd.concat([existing_df, df], ignore_index=True)
-
-                    # Remove duplicates based on timestamp
-                    combined_df = combined_df.drop_duplicates(subset=['timestamp'], keep='last')
-                    combined_df = combined_df.sort_values('timestamp')
-
-                except Exception as e:
-                    logger.error(f"Error reading existing partition {partition_path}: {e}")
-                    combined_df = df
-            else:
-                combined_df = df
-
-            # Save to Parquet
-            table = pa.Table.from_pandas(combined_df, schema=self.schema)
-            pq.write_table(
-                table,
-                partition_path,
-                compression='snappy',
-                use_dictionary=True,
-                row_group_size=50000
-            )
+            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+
+            if append and (partition_path.exists() or self._delta_files_for_day(symbol, timeframe, date_obj)):
+                # Land the append as an immutable delta; readers merge it and
+                # ``compact`` folds it into the canonical file later.
+                delta_dir = self._get_delta_dir(symbol, date_obj, timeframe)
+                delta_dir.mkdir(parents=True, exist_ok=True)
+                delta_path = delta_dir / f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+                self._write_partition(table, delta_path)
+                logger.info(f"Appended {len(candle_list)} candles for {symbol} {timeframe} on {date_obj} as delta")
+                continue
+
+            self._write_partition(table.sort_by('timestamp'), partition_path)
+            if not append:
+                # An overwrite supersedes any pending deltas for the day
+                shutil.rmtree(self._get_delta_dir(symbol, date_obj, timeframe), ignore_errors=True)
+                if self.manifest is not None:
+                    self.manifest.remove_deltas(symbol, timeframe, date_obj.isoformat())
 
             logger.info(f"Saved {len(candle_list)} candles for {symbol} {timeframe} on {date_obj}")
 
-    def load_candles(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> List[Candle]:
+    def _get_delta_dir(self, symbol: str, date_obj: date, timeframe: str) -> Path:
+        """Get the delta directory holding pending appends for one daily partition."""
+        return self.base_path / symbol / timeframe / DELTA_DIR / date_obj.strftime("%Y-%m-%d")
+
+    def _delta_files_for_day(self, symbol: str, timeframe: str, date_obj: date) -> List[Path]:
+        """List pending delta files for one day in write order."""
+        delta_dir = self._get_delta_dir(symbol, date_obj, timeframe)
+        if not delta_dir.exists():
+            return []
+        return sorted(delta_dir.glob("*.parquet"))
+
+    def _delta_files(self, symbol: str, timeframe: str, start: Optional[date] = None,
+                     end: Optional[date] = None) -> Dict[str, List[Path]]:
+        """Map date string -> pending delta files (in write order) within [start, end]."""
+        delta_root = self.base_path / symbol / timeframe / DELTA_DIR
+        if not delta_root.exists():
+            return {}
+
+        start_str = start.isoformat() if start else ""
+        end_str = end.isoformat() if end else "9999-12-31"
+        deltas = {}
+        for day_dir in sorted(delta_root.iterdir()):
+            if day_dir.is_dir() and start_str <= day_dir.name <= end_str:
+                files = sorted(day_dir.glob("*.parquet"))
+                if files:
+                    deltas[day_dir.name] = files
+        return deltas
+
+    def _write_partition(self, table: pa.Table, path: Path) -> None:
+        """Write a Parquet file atomically so concurrent readers never see a partial file."""
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        pq.write_table(
+            table,
+            tmp_path,
+            compression='snappy',
+            use_dictionary=True,
+            row_group_size=50000
+        )
+        os.replace(tmp_path, path)
+        if self.manifest is not None:
+            self.manifest.record(path, table)
+
+    @staticmethod
+    def _dedupe_keep_last(table: pa.Table) -> pa.Table:
         """
-        Load OHLCV candles for a date range.
+        Sort rows by timestamp, keeping the last row written for each timestamp.
+
+        Rows must be in write order (canonical file first, then deltas oldest
+        to newest), which matches the old read-concat-dedupe semantics.
+        """
+        if table.num_rows == 0:
+            return table
+        ts = table.column('timestamp').to_numpy().astype('int64')
+        order = np.lexsort((-np.arange(len(ts)), ts))
+        sorted_ts = ts[order]
+        keep = np.ones(len(ts), dtype=bool)
+        keep[1:] = sorted_ts[1:] != sorted_ts[:-1]
+        return table.take(order[keep])
+
+    def compact(self, symbol: Optional[str] = None, timeframe: Optional[str] = None, min_deltas: int = 1) -> int:
+        """
+        Merge pending delta files into their canonical daily partitions.
+
+        Safe to run while readers and writers are active: the canonical file is
+        replaced atomically before the merged deltas are removed, and deltas
+        that land during compaction are left for the next run.
+
+        Args:
+            symbol: Restrict to one symbol (default: all)
+            timeframe: Restrict to one timeframe (default: all)
+            min_deltas: Skip partitions with fewer pending deltas than this
+
+        Returns:
+            Number of daily partitions compacted
+        """
+        symbols = [symbol] if symbol else self.get_available_symbols()
+        compacted = 0
+
+        for sym in symbols:
+            timeframes = [timeframe] if timeframe else self.get_available_timeframes(sym)
+            for tf in timeframes:
+                for date_str, deltas in self._delta_files(sym, tf).items():
+                    if len(deltas) < min_deltas:
+                        continue
+                    try:
+                        self._compact_partition(sym, tf, pd.to_datetime(date_str).date(), deltas)
+                        compacted += 1
+                    except Exception as e:
+                        logger.error(f"Error compacting {sym} {tf} {date_str}: {e}")
+
+        logger.info(f"Compacted {compacted} partitions")
+        return compacted
+
+    def _compact_partition(self, symbol: str, timeframe: str, date_obj: date, deltas: List[Path]) -> None:
+        """Fold the given deltas into the canonical file for one day."""
+        partition_path = self._get_partition_path(symbol, date_obj, timeframe)
+        sources = ([partition_path] if partition_path.exists() else []) + deltas
+        merged = self._dedupe_keep_last(pa.concat_tables([self._read_file(path) for path in sources]))
+
+        self._write_partition(merged, partition_path)
+        for delta_path in deltas:
+            delta_path.unlink(missing_ok=True)
+        if self.manifest is not None:
+            self.manifest.remove(deltas)
+        try:
+            deltas[0].parent.rmdir()
+        except OSError:
+            pass  # new deltas arrived meanwhile
+
+        logger.debug(f"Compacted {len(deltas)} deltas into {partition_path}")
+
+    def _read_file(self, path: Path, columns: Optional[List[str]] = None, row_filter=None) -> pa.Table:
+        """Read one Parquet file with the storage schema."""
+        return ds.dataset(str(path), schema=self.schema, format='parquet').to_table(columns=columns, filter=row_filter)
+
+    def _partition_files(self, symbol: str, timeframe: str, start: date, end: date) -> List[Path]:
+        """List daily partition files within [start, end] from a single directory scan."""
+        symbol_path = self.base_path / symbol / timeframe
+        if not symbol_path.exists():
+            return []
+
+        # ISO dates sort lexicographically, so file stems can be compared as strings
+        start_str = start.strftime("%Y-%m-%d")
+        end_str = end.strftime("%Y-%m-%d")
+        return sorted(
+            path for path in symbol_path.glob("*.parquet")
+            if start_str <= path.stem <= end_str
+        )
+
+    @staticmethod
+    def _timestamp_filter(start: date, end: date):
+        """Row-group level predicate for start <= timestamp < end + 1 day."""
+        lower = pa.scalar(pd.Timestamp(start).as_unit('ns').value, type=pa.timestamp('ns'))
+        upper = pa.scalar((pd.Timestamp(end) + pd.Timedelta(days=1)).as_unit('ns').value, type=pa.timestamp('ns'))
+        return (ds.field('timestamp') >= lower) & (ds.field('timestamp') < upper)
+
+    def load_table(self, symbol: str, timeframe: str, start_date: str, end_date: str,
+                   columns: Optional[List[str]] = None) -> pa.Table:
+        """
+        Load OHLCV rows for a date range as an Arrow table.
+
+        Partitions are selected from file names, and the timestamp range is
+        pushed down to Parquet row-group statistics by a ``pyarrow.dataset``
+        scan. Pending delta files are merged in, keeping the last write for
+        each timestamp. Nothing is converted to Python objects.
+
+        A timeframe with no stored data is rolled up from a finer stored
+        one and cached per day (see ``_load_rollup``).
 
         Args:
             symbol: Stock symbol
             timeframe: Timeframe (e.g., '1m', '1d')
             start_date: Start date YYYY-MM-DD
             end_date: End date YYYY-MM-DD
+            columns: Optional column projection ('timestamp' is always included)
 
         Returns:
-            List of Candle objects
+            Arrow table sorted by timestamp
         """
         start = pd.to_datetime(start_date).date()
         end = pd.to_datetime(end_date).date()
 
-        symbol_path = self.base_path / symbol / timeframe
-        if not symbol_path.exists():
-            logger.warning(f"No data found for {symbol} {timeframe}")
-            return []
+        if columns is not None and 'timestamp' not in columns:
+            columns = ['timestamp'] + list(columns)
+
+        source = self._rollup_source(symbol, timeframe)
+        if source is not None:
+            table = self._load_rollup(symbol, timeframe, source, start, end)
+            return table.select(columns) if columns else table
+
+        row_filter = self._timestamp_filter(start, end)
+        for attempt in range(3):
+            files = self._partition_files(symbol, timeframe, start, end)
+            deltas = self._delta_files(symbol, timeframe, start, end)
+            if not files and not deltas:
+                logger.info(f"No data found for {symbol} {timeframe} between {start_date} and {end_date}")
+                empty = self.schema.empty_table()
+                return empty.select(columns) if columns else empty
+            try:
+                table = self._scan(files, deltas, columns, row_filter)
+                break
+            except FileNotFoundError:
+                # A concurrent compaction removed deltas after listing; the
+                # canonical file already holds their rows, so list again.
+                if attempt == 2:
+                    raise
+
+        logger.debug(f"Loaded {table.num_rows} rows for {symbol} {timeframe} from {len(files)} partitions "
+                     f"and {sum(len(d) for d in deltas.values())} deltas")
+        return table
+
+    def _scan(self, files: List[Path], deltas: Dict[str, List[Path]], columns: Optional[List[str]],
+              row_filter) -> pa.Table:
+        """Scan canonical partitions plus pending deltas and merge them keep-last."""
+        parts = []
+        if files:
+            dataset = ds.dataset([str(f) for f in files], schema=self.schema, format='parquet')
+            parts.append(dataset.to_table(columns=columns, filter=row_filter))
+        for date_str in sorted(deltas):
+            parts.extend(self._read_file(path, columns, row_filter) for path in deltas[date_str])
+
+        table = pa.concat_tables(parts)
+        if not deltas:
+            return table.sort_by('timestamp')
+        return self._dedupe_keep_last(table)
+
+    def _rollup_source(self, symbol: str, timeframe: str) -> Optional[str]:
+        """Finest stored timeframe that ``timeframe`` can be rolled up from (None when it is stored)."""
+        target = timeframe_minutes(timeframe)
+        available = self.get_available_timeframes(symbol)
+        if target is None or timeframe in available:
+            return None
+        candidates = []
+        for tf in available:
+            minutes = timeframe_minutes(tf)
+            if minutes and minutes < target and target % minutes == 0:
+                candidates.append((minutes, tf))
+        return min(candidates)[1] if candidates else None
+
+    def _source_days(self, symbol: str, timeframe: str, start: date, end: date) -> List[str]:
+        """Days with stored data (partitions or deltas) within [start, end]."""
+        if self.manifest is not None:
+            return self.manifest.days(symbol, timeframe, start, end)
+        days = {path.stem for path in self._partition_files(symbol, timeframe, start, end)}
+        days.update(self._delta_files(symbol, timeframe, start, end))
+        return sorted(days)
+
+    def _source_fingerprint(self, symbol: str, timeframe: str, day: str) -> str:
+        """Hash identifying the current contents of one stored day (partition plus deltas)."""
+        if self.manifest is not None:
+            parts = [f"{e.path}:{e.checksum}" for e in self.manifest.partitions(symbol, timeframe, day)]
+        else:
+            date_obj = date.fromisoformat(day)
+            parts = []
+            for path in [self._get_partition_path(symbol, date_obj, timeframe)] + \
+                    self._delta_files_for_day(symbol, timeframe, date_obj):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
 
-        all_data = []
-        current_date = start
+    def _derived_path(self, symbol: str, timeframe: str, day: str) -> Path:
+        return self.base_path / DERIVED_DIR / symbol / timeframe / f"{day}.parquet"
 
-        while current_date <= end:
-            partition_path = self._get_partition_path(symbol, current_date, timeframe)
+    def _load_rollup(self, symbol: str, timeframe: str, source: str, start: date, end: date) -> pa.Table:
+        """
+        Roll ``source`` bars up to ``timeframe`` one day at a time.
 
-            if partition_path.exists():
-                try:
-                    df = pd.read_parquet(partition_path)
-                    all_data.append(df)
-                    logger.debug(f"Loaded {len(df)} candles for {symbol} {timeframe} on {current_date}")
-                except Exception as e:
-                    logger.error(f"Error reading partition {partition_path}: {e}")
+        Each day is served from its cached derived partition when the
+        fingerprint stored with it matches the source day, and recomputed
+        (and re-cached) otherwise.
+        """
+        parts = []
+        for day in self._source_days(symbol, source, start, end):
+            path = self._derived_path(symbol, timeframe, day)
+            fingerprint = self._source_fingerprint(symbol, source, day)
+            cached = self._read_derived(path, fingerprint)
+            if cached is not None:
+                parts.append(cached)
+                continue
+
+            table = rollup_table(self.load_table(symbol, source, day, day), timeframe)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            metadata = {b'source_timeframe': source.encode(), b'source_fingerprint': fingerprint.encode()}
+            pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression='snappy')
+            os.replace(tmp_path, path)
+            parts.append(table)
+
+        logger.debug(f"Rolled up {len(parts)} days of {symbol} {source} to {timeframe}")
+        if not parts:
+            return self.schema.empty_table()
+        return pa.concat_tables(parts)
+
+    def _read_derived(self, path: Path, fingerprint: str) -> Optional[pa.Table]:
+        """Cached rollup for one day, or None when missing or stale."""
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+            if metadata.get(b'source_fingerprint') != fingerprint.encode():
+                return None
+            return pq.read_table(path).replace_schema_metadata(None)
+        except (OSError, pa.ArrowInvalid):
+            return None
 
-            current_date = current_date + pd.Timedelta(days=1)
+    def load_arrays(self, symbol: str, timeframe: str, start_date: str, end_date: str,
+                    columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Load OHLCV rows for a date range as a dict of NumPy columns.
 
-        if not all_data:
-            logger.info(f"No data found for {symbol} {timeframe} between {start_date} and {end_date}")
-            return []
+        Numeric columns are zero-copy views when the scan yields a single
+        chunk; ``timestamp`` is returned as ``datetime64[ns]`` (UTC).
+        """
+        table = self.load_table(symbol, timeframe, start_date, end_date, columns).combine_chunks()
+        return {
+            name: table.column(name).to_numpy(zero_copy_only=False)
+            for name in table.column_names
+        }
 
-        # Combine all data
-        result_df = pd.concat(all_data, ignore_index=True)
-
-        # Filter by exact date range
-        result_df['timestamp'] = pd.to_datetime(result_df['timestamp'])
-        mask = (result_df['timestamp'].dt.date >= start) & (result_df['timestamp'].dt.date <= end)
-        result_df = result_df[mask]
-
-        # Sort by timestamp
-        result_df = result_df.sort_values('timestamp').reset_index(drop=True)
-
-        # Convert back to Candle objects
-        candles = []
-        for _, row in result_df.iterrows():
-            candles.append(Candle(
-                symbol=row['symbol'],
-                timestamp=row['timestamp'].to_pydatetime(),
-                open=row['open'],
-                high=row['high'],
-                low=row['low'],
-                close=row['close'],
-                volume=row['volume'] if pd.notna(row['volume']) else None,
-                timeframe=row['timeframe'],
-                source=row['source']
-            ))
+    def load_candles(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> List[Candle]:
+        """
+        Load OHLCV candles for a date range.
+
+        Compatibility shim over ``load_table``; prefer ``load_table`` or
+        ``load_arrays`` for large ranges.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Timeframe (e.g., '1m', '1d')
+            start_date: Start date YYYY-MM-DD
+            end_date: End date YYYY-MM-DD
+
+        Returns:
+            List of Candle objects
+        """
+        table = self.load_table(symbol, timeframe, start_date, end_date)
+        candles = self._table_to_candles(table)
 
         logger.info(f"Loaded {len(candles)} total candles for {symbol} {timeframe} from {start_date} to {end_date}")
         return candles
 
+    def iter_candles(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> Iterator[Candle]:
+        """
+        Lazily yield candles one daily partition at a time, in timestamp order.
+
+        Only a single day is held in memory, so the generator can feed
+        ``EventBacktester.run({symbol: storage.iter_candles(...)})`` for runs
+        larger than RAM.
+        """
+        start = pd.to_datetime(start_date).date()
+        end = pd.to_datetime(end_date).date()
+
+        days = self._source_days(symbol, self._rollup_source(symbol, timeframe) or timeframe, start, end)
+        if not days:
+            logger.warning(f"No data found for {symbol} {timeframe}")
+            return
+
+        for date_str in days:
+            try:
+                table = self.load_table(symbol, timeframe, date_str, date_str)
+            except Exception as e:
+                logger.error(f"Error reading partition {symbol} {timeframe} {date_str}: {e}")
+                continue
+            yield from self._table_to_candles(table)
+
+    @staticmethod
+    def _table_to_candles(table: pa.Table) -> List[Candle]:
+        """Convert Arrow OHLCV rows into Candle objects."""
+        if table.num_rows == 0:
+            return []
+        ts = table.column('timestamp').cast(pa.timestamp('us', tz='UTC'))
+        table = table.set_column(table.column_names.index('timestamp'), 'timestamp', ts)
+        return [Candle(**row) for row in table.to_pylist()]
+
     def get_available_symbols(self) -> List[str]:
         """Get list of symbols with available data."""
+        if self.manifest is not None:
+            return self.manifest.symbols()
         if not self.base_path.exists():
             return []
 
         symbols = []
         for item in self.base_path.iterdir():
-            if item.is_dir():
+            if item.is_dir() and item.name != DERIVED_DIR:
                 symbols.append(item.name)
 
         return sorted(symbols)
 
     def get_available_timeframes(self, symbol: str) -> List[str]:
         """Get available timeframes for a symbol."""
+        if self.manifest is not None:
+            return self.manifest.timeframes(symbol)
         symbol_path = self.base_path / symbol
         if not symbol_path.exists():
             return []
@@ -214,18 +530,21 @@ class OHLCVStorage:
 
     def get_date_range(self, symbol: str, timeframe: str) -> Optional[tuple]:
         """Get available date range for a symbol and timeframe."""
+        if self.manifest is not None:
+            return self.manifest.date_range(symbol, timeframe)
         symbol_tf_path = self.base_path / symbol / timeframe
         if not symbol_tf_path.exists():
             return None
 
         dates = []
-        for file_path in symbol_tf_path.glob("*.parquet"):
+        date_strs = [file_path.stem for file_path in symbol_tf_path.glob("*.parquet")]
+        date_strs.extend(self._delta_files(symbol, timeframe))
+        for date_str in date_strs:
             try:
-                date_str = file_path.stem
                 date_obj = pd.to_datetime(date_str).date()
                 dates.append(date_obj)
             except Exception as e:
-                logger.warning(f"Invalid date format in filename {file_path}: {e}")
+                logger.warning(f"Invalid date format in partition name {date_str}: {e}")
 
         if not dates:
             return None
@@ -236,44 +555,47 @@ class OHLCVStorage:
         """
         Perform data quality checks on stored data.
 
+        Ranges with no data are answered from the manifest without opening
+        any file; otherwise only the timestamp and close columns are read.
+
         Returns dict with quality metrics.
         """
-        candles = self.load_candles(symbol, timeframe, start_date, end_date)
+        start = pd.to_datetime(start_date).date()
+        end = pd.to_datetime(end_date).date()
+        if self.manifest is not None and not self.manifest.days(symbol, timeframe, start, end):
+            return {"status": "no_data"}
 
-        if not candles:
+        arrays = self.load_arrays(symbol, timeframe, start_date, end_date, columns=['close'])
+        timestamps = arrays['timestamp']
+        if len(timestamps) == 0:
             return {"status": "no_data"}
 
         issues = []
-        timestamps = [c.timestamp for c in candles]
 
         # Check for duplicates
-        if len(timestamps) != len(set(timestamps)):
+        if len(np.unique(timestamps)) != len(timestamps):
             issues.append("duplicate_timestamps")
 
         # Check for missing candles (basic check for daily data)
         if timeframe == '1d':
-            expected_days = (pd.to_datetime(end_date) - pd.to_datetime(start_date)).days + 1
-            actual_days = len(set(c.timestamp.date() for c in candles))
+            expected_days = (end - start).days + 1
+            actual_days = len(np.unique(timestamps.astype('datetime64[D]')))
             if actual_days < expected_days * 0.9:  # Allow 10% missing
                 issues.append("missing_candles")
 
         # Check for outliers (price jumps > 20%)
-        prices = [c.close for c in candles]
+        prices = arrays['close']
         if len(prices) > 1:
-            returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, len(prices))]
-            if any(abs(r) > 0.2 for r in returns):
+            returns = np.diff(prices) / prices[:-1]
+            if np.any(np.abs(returns) > 0.2):
                 issues.append("price_outliers")
 
-        # Check timezone alignment (should all be UTC)
-        non_utc = [c for c in candles if c.timestamp.tzinfo != pd.Timestamp('2024-01-01').tz]
-        if non_utc:
-            issues.append("timezone_misalignment")
-
+        first, last = (pd.Timestamp(ts, tz='UTC').to_pydatetime() for ts in (timestamps.min(), timestamps.max()))
         return {
             "status": "ok" if not issues else "issues_found",
             "issues": issues,
-            "candle_count": len(candles),
-            "date_range": (min(timestamps), max(timestamps)) if timestamps else None
+            "candle_count": len(timestamps),
+            "date_range": (first, last)
         }
 
 
@@ -287,6 +609,11 @@ class DataAvailabilityIndex:
 
     def build_index(self) -> None:
         """Build the availability index."""
+        if self.storage.manifest is not None:
+            self.index = self.storage.manifest.coverage()
+            logger.info(f"Built data availability index for {len(self.index)} symbols")
+            return
+
         symbols = self.storage.get_available_symbols()
 
         for symbol in symbols:
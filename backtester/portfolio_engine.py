@@ -0,0 +1,272 @@
+"""
+Multi-symbol portfolio backtester with array state.
+
+Runs a cross-sectional strategy over hundreds of symbols on one clock.
+Positions, average entry prices, last prices, marks, realized P&L and fees
+live in NumPy arrays indexed by symbol id, so each timestamp costs
+O(symbols that printed) instead of re-marking every open position:
+
+- a price update adds ``quantity * (price - mark)`` for the symbols that
+  moved to a running market value
+- a fill adjusts cash and market value for the traded symbols only
+
+Equity is ``cash + market_value`` at every step; ``ArrayPortfolio.revalue``
+recomputes the market value from scratch.
+
+The strategy sees the whole cross-section at each timestamp and returns
+target quantities per symbol id. Targets persist: a symbol moves to its
+target on its next bar, at that bar's close. Fill and cost semantics follow
+``VectorizedBacktester`` (slippage, commission, per-order and per-unit fees,
+positions marked at their fill price on the fill bar); positions are
+long-only unless ``allow_short`` is set.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Protocol, Sequence
+
+import numpy as np
+
+from .config import BacktestConfig
+from .costs import CostModel
+from .vectorized import ColumnarInput, VectorizedResult, _concat_fills, coerce_bars, to_datetime64
+
+logger = logging.getLogger(__name__)
+
+
+class ArrayPortfolio:
+    """Portfolio state held in per-symbol arrays indexed by symbol id."""
+
+    def __init__(self, symbols: Sequence[str], initial_capital: float):
+        self.symbols = list(symbols)
+        self.symbol_ids: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        n = len(self.symbols)
+
+        self.quantity = np.zeros(n)
+        self.average_price = np.zeros(n)
+        self.last_price = np.full(n, np.nan)  # latest close; NaN until a symbol's first bar
+        self.realized_pnl = np.zeros(n)  # gross of fees
+        self.fees = np.zeros(n)
+        self.cash = float(initial_capital)
+        self.market_value = 0.0
+
+        # Price each position is currently valued at (the fill price on a fill bar)
+        self._mark = np.zeros(n)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def equity(self) -> float:
+        return self.cash + self.market_value
+
+    def unrealized_pnl(self) -> np.ndarray:
+        return self.quantity * (self._mark - self.average_price)
+
+    def update_prices(self, ids: np.ndarray, prices: np.ndarray) -> None:
+        """Apply new closes for ``ids`` (unique) and move the market value by the change in marks."""
+        self.market_value += float(self.quantity[ids] @ (prices - self._mark[ids]))
+        self._mark[ids] = prices
+        self.last_price[ids] = prices
+
+    def execute(self, ids: np.ndarray, trade: np.ndarray, fill_price: np.ndarray,
+                commission: np.ndarray, extra_fees: np.ndarray) -> np.ndarray:
+        """
+        Apply fills for ``ids`` (unique).
+
+        Args:
+            ids: Symbol ids
+            trade: Signed quantity per fill
+            fill_price: Fill price per fill
+            commission: Commission per fill
+            extra_fees: Per-order and per-unit fees per fill
+
+        Returns:
+            Realized P&L of each fill (gross of fees)
+        """
+        held = self.quantity[ids]
+        average = self.average_price[ids]
+        new = held + trade
+
+        # Fills in the direction of the position (or from flat) re-average the entry price;
+        # fills against it realize P&L on the closed quantity, and a flip re-enters at the fill
+        adding = (held == 0) | (np.sign(held) == np.sign(trade))
+        closed = np.where(adding, 0.0, np.minimum(np.abs(trade), np.abs(held)))
+        realized = (fill_price - average) * closed * np.sign(held)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averaged = (average * np.abs(held) + fill_price * np.abs(trade)) / np.abs(new)
+        flipped = ~adding & (np.abs(trade) > np.abs(held))
+        self.average_price[ids] = np.where(
+            new == 0, 0.0, np.where(adding, averaged, np.where(flipped, fill_price, average)))
+
+        self.cash -= float(trade @ fill_price + commission.sum() + extra_fees.sum())
+        self.market_value += float(new @ fill_price - held @ self._mark[ids])
+        self.quantity[ids] = new
+        self._mark[ids] = fill_price
+        self.realized_pnl[ids] += realized
+        self.fees[ids] += np.maximum(commission, 0.0) + extra_fees
+        return realized
+
+    def revalue(self) -> float:
+        """Recompute the market value over every position (drift check for the running total)."""
+        self.market_value = float(self.quantity @ self._mark)
+        return self.market_value
+
+
+class CrossSectionalStrategy(Protocol):
+    """Strategy that sets target quantities across all symbols at each timestamp."""
+
+    name: str
+
+    def on_prices(self, timestamp: np.datetime64, updated: np.ndarray,
+                  portfolio: ArrayPortfolio) -> Optional[np.ndarray]:
+        """
+        React to the bars of one timestamp.
+
+        Args:
+            timestamp: Current clock time (``datetime64[ns]``)
+            updated: Ids of the symbols with a bar at this timestamp
+            portfolio: Current state; ``portfolio.last_price`` holds the latest closes
+
+        Returns:
+            Target quantity per symbol id (NaN keeps the current target), or None for no change
+        """
+
+
+@dataclass
+class PortfolioResult(VectorizedResult):
+    """``VectorizedResult`` with one equity point per clock step and final per-symbol state."""
+
+    symbols: List[str] = field(default_factory=list)
+    final_quantity: np.ndarray = field(default_factory=lambda: np.array([]))
+    realized_pnl: np.ndarray = field(default_factory=lambda: np.array([]))
+    symbol_fees: np.ndarray = field(default_factory=lambda: np.array([]))
+
+
+class PortfolioBacktester:
+    """Event-driven multi-symbol backtester on a shared clock with array-based portfolio state."""
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        strategy: CrossSectionalStrategy,
+        cost_model: CostModel | None = None,
+        allow_short: bool = False,
+    ):
+        self.config = config
+        self.strategy = strategy
+        self.allow_short = allow_short
+        self.cost_model = cost_model or CostModel(
+            slippage_bps=config.slippage_bps,
+            commission_rate=config.commission_rate,
+            fee_per_order=config.fee_per_order,
+            fee_per_unit=config.fee_per_unit,
+        )
+
+    def run(self, data: Mapping[str, ColumnarInput]) -> PortfolioResult:
+        """
+        Run the strategy over per-symbol columnar data.
+
+        Args:
+            data: Mapping of symbol -> ``ColumnarBars``, dict of NumPy arrays, or Arrow table.
+                Its order assigns symbol ids.
+
+        Returns:
+            PortfolioResult with equity and cash after every clock step.
+        """
+        start = to_datetime64(self.config.start)
+        end = to_datetime64(self.config.end)
+
+        symbols = list(data)
+        stamps, ids, closes = [], [], []
+        for symbol_id, symbol in enumerate(symbols):
+            bars = coerce_bars(symbol, data[symbol]).window(start, end)
+            valid = ~np.isnan(bars.close)
+            stamps.append(bars.timestamp[valid])
+            closes.append(bars.close[valid])
+            ids.append(np.full(int(valid.sum()), symbol_id, dtype=np.int64))
+
+        portfolio = ArrayPortfolio(symbols, self.config.initial_capital)
+        if not symbols or not sum(len(s) for s in stamps):
+            return self._result(portfolio, np.array([], dtype="datetime64[ns]"), np.array([]), np.array([]), [])
+
+        # One merged event stream; the stable sort keeps symbol order within a timestamp
+        all_stamps = np.concatenate(stamps)
+        order = np.argsort(all_stamps, kind="stable")
+        all_stamps, all_ids, all_closes = all_stamps[order], np.concatenate(ids)[order], np.concatenate(closes)[order]
+        bounds = np.flatnonzero(np.concatenate(([True], all_stamps[1:] != all_stamps[:-1], [True])))
+
+        steps = len(bounds) - 1
+        clock = all_stamps[bounds[:-1]]
+        equity = np.empty(steps)
+        cash = np.empty(steps)
+        target = np.zeros(len(symbols))
+        fill_parts: List[Dict[str, np.ndarray]] = []
+
+        for step in range(steps):
+            lo, hi = bounds[step], bounds[step + 1]
+            updated, prices = all_ids[lo:hi], all_closes[lo:hi]
+            portfolio.update_prices(updated, prices)
+
+            requested = self.strategy.on_prices(clock[step], updated, portfolio)
+            if requested is not None:
+                requested = np.asarray(requested, dtype=np.float64)
+                if requested.shape != target.shape:
+                    raise ValueError(
+                        f"Strategy {self.strategy.name} returned shape {requested.shape}, expected {target.shape}"
+                    )
+                target = np.where(np.isnan(requested), target, requested)
+                if not self.allow_short:
+                    target = np.maximum(target, 0.0)
+
+            trade = target[updated] - portfolio.quantity[updated]
+            traded = np.flatnonzero(trade)
+            if traded.size:
+                fill_parts.append(self._fill(portfolio, clock[step], updated[traded], prices[traded], trade[traded]))
+
+            equity[step] = portfolio.equity
+            cash[step] = portfolio.cash
+
+        return self._result(portfolio, clock, equity, cash, fill_parts)
+
+    def _fill(self, portfolio: ArrayPortfolio, timestamp: np.datetime64, ids: np.ndarray,
+              close: np.ndarray, trade: np.ndarray) -> Dict[str, np.ndarray]:
+        """Price and apply one timestamp's fills; returns their fill records."""
+        cm = self.cost_model
+        quantity = np.abs(trade)
+        fill_price = close + np.sign(trade) * (cm.slippage_bps / 10_000) * close
+        commission = fill_price * quantity * cm.commission_rate
+        extra = np.maximum(cm.fee_per_order + cm.fee_per_unit * quantity, 0.0)
+
+        realized = portfolio.execute(ids, trade, fill_price, commission, extra)
+        fees = np.maximum(commission, 0.0) + extra
+        return {
+            "timestamp": np.full(len(ids), timestamp, dtype="datetime64[ns]"),
+            "symbol": np.array([portfolio.symbols[i] for i in ids.tolist()], dtype=object),
+            "quantity": trade,
+            "base_price": close,
+            "fill_price": fill_price,
+            "fees": fees,
+            "pnl": realized - fees,
+        }
+
+    def _result(self, portfolio: ArrayPortfolio, clock: np.ndarray, equity: np.ndarray,
+                cash: np.ndarray, fill_parts: List[Dict[str, np.ndarray]]) -> PortfolioResult:
+        logger.info(f"Portfolio backtest: {len(portfolio)} symbols, {len(clock)} clock steps, "
+                    f"{sum(len(p['quantity']) for p in fill_parts)} fills")
+        return PortfolioResult(
+            timestamps=clock,
+            equity=equity,
+            cash=cash,
+            fills=_concat_fills(fill_parts),
+            fees_paid=float(portfolio.fees.sum()),
+            initial_capital=self.config.initial_capital,
+            start=self.config.start,
+            end=self.config.end,
+            symbols=portfolio.symbols,
+            final_quantity=portfolio.quantity.copy(),
+            realized_pnl=portfolio.realized_pnl.copy(),
+            symbol_fees=portfolio.fees.copy(),
+        )
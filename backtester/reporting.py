@@ -2,22 +2,211 @@
 Reporting and Analytics for Backtesting
 
 Comprehensive performance metrics, breakdowns, and export functionality.
+
+Metrics are computed over columnar arrays: the equity curve is held as
+int64 nanosecond timestamps plus float64 values (``EquityArrays``) and the
+trade log as parallel columns (``TradeArrays``). The equity curve is
+resampled to daily closes once per reporter and that series is shared by
+every return-based metric and breakdown, so minute-level curves with
+millions of points cost a few array passes rather than Python loops.
+
+JSON and HTML exports carry a downsampled equity curve (see
+``downsampling``); the full-resolution curve is written next to them as a
+``<name>.equity.parquet`` sidecar.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, date
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+from datetime import datetime, date, timezone
 from decimal import Decimal, ROUND_HALF_UP
 import json
 import csv
 from pathlib import Path
-import statistics
-from collections import defaultdict
 
+import numpy as np
+
+from .downsampling import DEFAULT_CHART_POINTS, downsample_indices
 from .portfolio_accounting import PortfolioAccounting, TradeRecord, EquityPoint
 
+NS_PER_DAY = 86_400 * 1_000_000_000
+TRADING_DAYS_PER_YEAR = 252
+
+
+def datetimes_to_ns(values: Sequence[datetime]) -> np.ndarray:
+    """Convert datetimes to int64 nanoseconds since the epoch (tz-aware values are taken as UTC)."""
+    naive = [
+        v.astimezone(timezone.utc).replace(tzinfo=None) if v.tzinfo is not None else v
+        for v in values
+    ]
+    return np.array(naive, dtype='datetime64[ns]').astype(np.int64)
+
+
+def drawdown_pct(equity: np.ndarray, peak: Optional[np.ndarray] = None) -> np.ndarray:
+    """Percentage drawdown of each point from the running equity peak."""
+    if peak is None:
+        peak = np.maximum.accumulate(equity)
+    return np.divide((peak - equity) * 100, peak, out=np.zeros_like(equity, dtype=np.float64), where=peak > 0)
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1), 0.0 for fewer than two values."""
+    return float(values.std(ddof=1)) if values.size > 1 else 0.0
+
+
+def _group_trades(keys: np.ndarray, pnl: np.ndarray, sort: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Aggregate trade P&L by key.
+
+    Args:
+        keys: Group key per trade (symbol, month, tag)
+        pnl: Realized P&L per trade
+        sort: Order groups by key; otherwise by first appearance
+
+    Returns:
+        Dict of per-group arrays: keys, trades, wins, pnl, wins_pnl, losses_pnl
+    """
+    keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n = len(keys)
+    groups = {
+        'keys': keys,
+        'trades': np.bincount(inverse, minlength=n),
+        'wins': np.bincount(inverse, weights=(pnl > 0).astype(np.float64), minlength=n),
+        'pnl': np.bincount(inverse, weights=pnl, minlength=n),
+        'wins_pnl': np.bincount(inverse, weights=np.where(pnl > 0, pnl, 0.0), minlength=n),
+        'losses_pnl': -np.bincount(inverse, weights=np.where(pnl < 0, pnl, 0.0), minlength=n),
+    }
+    if not sort:
+        order = np.argsort(first, kind='stable')
+        groups = {name: values[order] for name, values in groups.items()}
+    return groups
+
+
+@dataclass
+class EquityArrays:
+    """
+    Columnar equity curve.
+
+    ``timestamps`` are int64 nanoseconds since the epoch (UTC) in ascending
+    order; ``cash`` and ``fees`` are optional parallel columns.
+    """
+    timestamps: np.ndarray
+    equity: np.ndarray
+    cash: Optional[np.ndarray] = None
+    fees: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        self.timestamps = np.asarray(self.timestamps, dtype=np.int64)
+        self.equity = np.asarray(self.equity, dtype=np.float64)
+        for name in ('cash', 'fees'):
+            column = getattr(self, name)
+            if column is not None:
+                setattr(self, name, np.asarray(column, dtype=np.float64))
+        for column in (self.equity, self.cash, self.fees):
+            if column is not None and column.shape != self.timestamps.shape:
+                raise ValueError("Equity curve columns must have the same length as timestamps")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_points(cls, points: Sequence[EquityPoint]) -> "EquityArrays":
+        """Build arrays from ``EquityPoint`` objects (Decimal values are converted to float)."""
+        n = len(points)
+        has_cash = n > 0 and hasattr(points[0], 'cash')
+        return cls(
+            timestamps=datetimes_to_ns([p.timestamp for p in points]) if n else np.empty(0, dtype=np.int64),
+            equity=np.fromiter((float(p.equity) for p in points), dtype=np.float64, count=n),
+            cash=np.fromiter((float(p.cash) for p in points), dtype=np.float64, count=n) if has_cash else None,
+            fees=np.fromiter((float(p.fees) for p in points), dtype=np.float64, count=n) if has_cash else None,
+        )
+
+
+@dataclass
+class TradeArrays:
+    """Columnar trade log: one entry per closed trade."""
+    symbols: np.ndarray
+    exit_times: np.ndarray  # int64 ns since the epoch (UTC)
+    realized_pnl: np.ndarray
+    tags: List[Sequence[str]] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.symbols = np.asarray(self.symbols, dtype=str)
+        self.exit_times = np.asarray(self.exit_times, dtype=np.int64)
+        self.realized_pnl = np.asarray(self.realized_pnl, dtype=np.float64)
+        if not self.tags:
+            self.tags = [()] * len(self.realized_pnl)
+        if not len(self.symbols) == len(self.exit_times) == len(self.realized_pnl) == len(self.tags):
+            raise ValueError("Trade columns must all have the same length")
+
+    def __len__(self) -> int:
+        return len(self.realized_pnl)
+
+    @classmethod
+    def from_records(cls, trades: Sequence[TradeRecord]) -> "TradeArrays":
+        """Build arrays from ``TradeRecord`` objects."""
+        n = len(trades)
+        return cls(
+            symbols=np.array([t.symbol for t in trades], dtype=str),
+            exit_times=datetimes_to_ns([t.exit_time for t in trades]) if n else np.empty(0, dtype=np.int64),
+            realized_pnl=np.fromiter((float(t.realized_pnl) for t in trades), dtype=np.float64, count=n),
+            tags=[getattr(t, 'tags', None) or () for t in trades],
+        )
+
+
+@dataclass
+class DailyEquity:
+    """
+    Equity curve resampled to the last value of each UTC day.
+
+    ``returns`` are day-over-day close returns, with the first day measured
+    from the curve's starting equity. When the first day holds only the
+    starting point it carries no return and is left out, so ``returns``
+    lines up with ``return_days`` rather than ``days``.
+    """
+    days: np.ndarray  # datetime64[D]
+    close: np.ndarray
+    returns: np.ndarray
+
+    @property
+    def return_days(self) -> np.ndarray:
+        return self.days[len(self.days) - len(self.returns):]
+
+
+def resample_daily(curve: EquityArrays) -> DailyEquity:
+    """Resample an equity curve to daily closes in a single pass."""
+    if len(curve) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return DailyEquity(days=np.empty(0, dtype='datetime64[D]'), close=empty, returns=empty)
+
+    day_index = curve.timestamps // NS_PER_DAY
+    last = np.append(np.flatnonzero(day_index[1:] != day_index[:-1]), len(day_index) - 1)
+    close = curve.equity[last]
+    previous = np.concatenate((curve.equity[:1], close[:-1]))
+    returns = close / previous - 1.0
+    if last[0] == 0:
+        returns = returns[1:]
+    return DailyEquity(days=day_index[last].astype('datetime64[D]'), close=close, returns=returns)
+
+
+def write_equity_parquet(curve: EquityArrays, filepath: str) -> None:
+    """Write an equity curve (timestamp, equity, cash, fees, drawdown_pct) to Parquet."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = {
+        'timestamp': pa.array(curve.timestamps, type=pa.int64()).cast(pa.timestamp('ns', tz='UTC')),
+        'equity': curve.equity,
+    }
+    if curve.cash is not None:
+        columns['cash'] = curve.cash
+    if curve.fees is not None:
+        columns['fees'] = curve.fees
+    columns['drawdown_pct'] = drawdown_pct(curve.equity)
+    pq.write_table(pa.table(columns), filepath)
+
 
 @dataclass
 class PerformanceMetrics:
@@ -118,6 +307,7 @@ class BacktestReport:
     # Raw data
     equity_curve: List[EquityPoint] = field(default_factory=list)
     trade_log: List[TradeRecord] = field(default_factory=list)
+    equity_arrays: Optional[EquityArrays] = None
 
     # Metadata
     parameters: Dict[str, Any] = field(default_factory=dict)
@@ -130,10 +320,89 @@ class BacktestReporter:
     Generates comprehensive reports and analytics from backtest results.
 
     Calculates performance metrics, breakdowns, and provides export functionality.
+    Works either from a ``PortfolioAccounting`` (converted to arrays on first
+    use and again whenever its equity curve or trade log grows) or directly
+    from ``EquityArrays``/``TradeArrays``.
     """
 
-    def __init__(self, portfolio: PortfolioAccounting):
+    def __init__(self, portfolio: Optional[PortfolioAccounting] = None, equity: Optional[EquityArrays] = None,
+                 trades: Optional[TradeArrays] = None, initial_capital: Optional[float] = None,
+                 max_chart_points: int = DEFAULT_CHART_POINTS, downsample_method: str = "minmax"):
+        """
+        Args:
+            portfolio: Portfolio accounting of a finished run
+            equity: Columnar equity curve; used instead of ``portfolio.equity_curve``
+            trades: Columnar trade log; used instead of ``portfolio.trade_log``
+            initial_capital: Defaults to ``portfolio.initial_capital`` or the
+                first equity value
+            max_chart_points: Equity points embedded in JSON/HTML exports
+            downsample_method: 'minmax' (keeps every bucket's extremes) or 'lttb'
+        """
+        if portfolio is None and equity is None:
+            raise ValueError("BacktestReporter needs a portfolio or an equity curve")
         self.portfolio = portfolio
+        self._equity = equity
+        self._trades = trades
+        self._initial_capital = initial_capital
+        self._portfolio_sizes: Optional[Tuple[int, int]] = None
+        self._derived_equity: Optional[EquityArrays] = None
+        self._derived_trades: Optional[TradeArrays] = None
+        self._daily: Optional[DailyEquity] = None
+        self.max_chart_points = max_chart_points
+        self.downsample_method = downsample_method
+        self._written_sidecars: Dict[Path, int] = {}
+
+    @classmethod
+    def from_arrays(cls, timestamps: np.ndarray, equity: np.ndarray, trades: Optional[TradeArrays] = None,
+                    initial_capital: Optional[float] = None, cash: Optional[np.ndarray] = None,
+                    fees: Optional[np.ndarray] = None, **kwargs) -> "BacktestReporter":
+        """Create a reporter over an int64-ns timestamp / equity array pair (plus optional cash and fee columns)."""
+        return cls(equity=EquityArrays(timestamps, equity, cash=cash, fees=fees), trades=trades,
+                   initial_capital=initial_capital, **kwargs)
+
+    def _sync_portfolio(self) -> None:
+        """Rebuild arrays derived from the portfolio when it has grown since the last call."""
+        if self.portfolio is None:
+            return
+        sizes = (len(self.portfolio.equity_curve), len(self.portfolio.trade_log))
+        if sizes == self._portfolio_sizes:
+            return
+        self._portfolio_sizes = sizes
+        self._daily = None
+        self._derived_equity = EquityArrays.from_points(self.portfolio.equity_curve)
+        self._derived_trades = TradeArrays.from_records(self.portfolio.trade_log)
+
+    @property
+    def equity_arrays(self) -> EquityArrays:
+        if self._equity is not None:
+            return self._equity
+        self._sync_portfolio()
+        return self._derived_equity
+
+    @property
+    def trade_arrays(self) -> TradeArrays:
+        if self._trades is not None:
+            return self._trades
+        if self.portfolio is None:
+            return TradeArrays.from_records([])
+        self._sync_portfolio()
+        return self._derived_trades
+
+    @property
+    def daily_equity(self) -> DailyEquity:
+        """Daily closes and returns, computed once and shared by all metrics."""
+        self._sync_portfolio()
+        if self._daily is None:
+            self._daily = resample_daily(self.equity_arrays)
+        return self._daily
+
+    @property
+    def initial_capital(self) -> float:
+        if self._initial_capital is not None:
+            return float(self._initial_capital)
+        if self.portfolio is not None:
+            return float(self.portfolio.initial_capital)
+        return float(self.equity_arrays.equity[0]) if len(self.equity_arrays) else 0.0
 
     def generate_report(self, run_id: str, strategy_name: str, symbols: List[str],
                        start_date: date, end_date: date, parameters: Dict[str, Any] = None) -> BacktestReport:
@@ -167,34 +436,35 @@ class BacktestReporter:
             symbols=symbols,
             start_date=start_date,
             end_date=end_date,
-            initial_capital=float(self.portfolio.initial_capital),
+            initial_capital=self.initial_capital,
             metrics=metrics,
             symbol_breakdown=symbol_breakdown,
             monthly_breakdown=monthly_breakdown,
             tag_breakdown=tag_breakdown,
-            equity_curve=self.portfolio.equity_curve.copy(),
-            trade_log=self.portfolio.trade_log.copy(),
+            equity_curve=self.portfolio.equity_curve.copy() if self.portfolio is not None else [],
+            trade_log=self.portfolio.trade_log.copy() if self.portfolio is not None else [],
+            equity_arrays=self.equity_arrays,
             parameters=parameters
         )
 
     def _calculate_performance_metrics(self, risk_free_rate: float = 0.0) -> PerformanceMetrics:
         """Calculate comprehensive performance metrics."""
-        equity_curve = self.portfolio.equity_curve
-        trade_log = self.portfolio.trade_log
+        curve = self.equity_arrays
+        trade_metrics = self._calculate_trade_metrics()
+
+        if len(curve) == 0:
+            return PerformanceMetrics(**trade_metrics)
 
-        if not equity_curve:
-            return PerformanceMetrics()
+        daily = self.daily_equity
 
         # Basic return calculations
-        initial_equity = equity_curve[0].equity
-        final_equity = equity_curve[-1].equity
+        initial_equity = float(curve.equity[0])
+        final_equity = float(curve.equity[-1])
         total_return_pct = ((final_equity - initial_equity) / initial_equity) * 100
 
         # Time-based calculations
-        start_date = equity_curve[0].timestamp.date()
-        end_date = equity_curve[-1].timestamp.date()
-        total_days = (end_date - start_date).days
-        trading_days = len(set(ep.timestamp.date() for ep in equity_curve))
+        total_days = int((daily.days[-1] - daily.days[0]).astype(np.int64))
+        trading_days = len(daily.days)
 
         # CAGR calculation
         if total_days > 0:
@@ -205,37 +475,33 @@ class BacktestReporter:
             cagr = 0.0
             annualized_return_pct = 0.0
 
-        # Daily returns for volatility and risk metrics
-        daily_returns = []
-        prev_equity = initial_equity
-
-        for ep in equity_curve[1:]:
-            daily_return = (ep.equity - prev_equity) / prev_equity
-            daily_returns.append(daily_return)
-            prev_equity = ep.equity
-
-        # Volatility and risk metrics
-        if daily_returns:
-            volatility_pct = statistics.stdev(daily_returns) * (252 ** 0.5) * 100  # Annualized
-            avg_daily_return_pct = statistics.mean(daily_returns) * 100
+        # Volatility and risk metrics from daily returns
+        daily_returns = daily.returns
+        if daily_returns.size:
+            daily_risk_free = risk_free_rate / TRADING_DAYS_PER_YEAR
+            excess_returns = daily_returns - daily_risk_free
+            return_std = _sample_std(daily_returns)
+            volatility_pct = return_std * np.sqrt(TRADING_DAYS_PER_YEAR) * 100  # Annualized
+            avg_daily_return_pct = float(daily_returns.mean()) * 100
+            mean_excess = float(excess_returns.mean())
 
             # Sharpe ratio (using risk-free rate)
-            excess_returns = [r - risk_free_rate/252 for r in daily_returns]  # Daily risk-free rate
-            if volatility_pct > 0:
-                sharpe_ratio = statistics.mean(excess_returns) / statistics.stdev(excess_returns) * (252 ** 0.5)
+            excess_std = _sample_std(excess_returns)
+            if volatility_pct > 0 and excess_std > 0:
+                sharpe_ratio = mean_excess / excess_std * np.sqrt(TRADING_DAYS_PER_YEAR)
             else:
                 sharpe_ratio = 0.0
 
             # Sortino ratio (downside deviation only, using risk-free rate)
-            downside_returns = [r - risk_free_rate/252 for r in daily_returns if r < risk_free_rate/252]
-            if downside_returns:
-                downside_dev = statistics.stdev(downside_returns) * (252 ** 0.5)
-                sortino_ratio = statistics.mean(excess_returns) / downside_dev if downside_dev > 0 else 0.0
+            downside_returns = excess_returns[daily_returns < daily_risk_free]
+            if downside_returns.size:
+                downside_dev = _sample_std(downside_returns) * np.sqrt(TRADING_DAYS_PER_YEAR)
+                sortino_ratio = mean_excess / downside_dev if downside_dev > 0 else 0.0
             else:
-                sortino_ratio = float('inf') if statistics.mean(excess_returns) > 0 else 0.0
+                sortino_ratio = float('inf') if mean_excess > 0 else 0.0
 
-            best_day_pct = max(daily_returns) * 100
-            worst_day_pct = min(daily_returns) * 100
+            best_day_pct = float(daily_returns.max()) * 100
+            worst_day_pct = float(daily_returns.min()) * 100
         else:
             volatility_pct = 0.0
             sharpe_ratio = 0.0
@@ -244,199 +510,202 @@ class BacktestReporter:
             best_day_pct = 0.0
             worst_day_pct = 0.0
 
-        # Max drawdown
-        max_drawdown_pct = self.portfolio.max_drawdown_pct
+        # Max drawdown (the portfolio's own tracking wins when there is one)
+        if self.portfolio is not None:
+            max_drawdown_pct = float(self.portfolio.max_drawdown_pct)
+            max_drawdown = float(self.portfolio.max_drawdown)
+        else:
+            peak = np.maximum.accumulate(curve.equity)
+            max_drawdown_pct = float(drawdown_pct(curve.equity, peak).max())
+            max_drawdown = float((peak - curve.equity).max())
 
         # Calmar ratio
         calmar_ratio = annualized_return_pct / max_drawdown_pct if max_drawdown_pct > 0 else 0.0
 
-        # Trading metrics
-        total_trades = len(trade_log)
-        winning_trades = sum(1 for trade in trade_log if trade.realized_pnl > 0)
-        losing_trades = sum(1 for trade in trade_log if trade.realized_pnl < 0)
-
-        win_rate_pct = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
-
-        # P&L metrics
-        if trade_log:
-            winning_pnls = [trade.realized_pnl for trade in trade_log if trade.realized_pnl > 0]
-            losing_pnls = [trade.realized_pnl for trade in trade_log if trade.realized_pnl < 0]
-
-            total_wins = sum(winning_pnls)
-            total_losses = abs(sum(losing_pnls))
-
-            profit_factor = total_wins / total_losses if total_losses > 0 else float('inf')
-
-            avg_win = total_wins / len(winning_pnls) if winning_pnls else 0.0
-            avg_loss = total_losses / len(losing_pnls) if losing_pnls else 0.0
-
-            largest_win = max(winning_pnls) if winning_pnls else 0.0
-            largest_loss = min(losing_pnls) if losing_pnls else 0.0
-
-            # Expectancy (average win/loss per trade)
-            win_prob = len(winning_pnls) / total_trades if total_trades > 0 else 0
-            loss_prob = len(losing_pnls) / total_trades if total_trades > 0 else 0
-            expectancy = (win_prob * avg_win) - (loss_prob * avg_loss)
-
-            # Payoff ratio
-            payoff_ratio = avg_win / abs(avg_loss) if avg_loss != 0 else float('inf')
-
-            # Kelly criterion
-            if win_prob > 0 and loss_prob > 0 and payoff_ratio > 0:
-                kelly_criterion = win_prob - (loss_prob / payoff_ratio)
-            else:
-                kelly_criterion = 0.0
-        else:
-            profit_factor = 0.0
-            avg_win = 0.0
-            avg_loss = 0.0
-            largest_win = 0.0
-            largest_loss = 0.0
-            expectancy = 0.0
-            payoff_ratio = 0.0
-            kelly_criterion = 0.0
-
         # Recovery factor
         total_return = final_equity - initial_equity
-        recovery_factor = total_return / self.portfolio.max_drawdown if self.portfolio.max_drawdown > 0 else 0.0
+        recovery_factor = total_return / max_drawdown if max_drawdown > 0 else 0.0
 
         return PerformanceMetrics(
             total_return_pct=total_return_pct,
             annualized_return_pct=annualized_return_pct,
             cagr=cagr,
-            volatility_pct=volatility_pct,
+            volatility_pct=float(volatility_pct),
             max_drawdown_pct=max_drawdown_pct,
-            sharpe_ratio=sharpe_ratio,
-            sortino_ratio=sortino_ratio,
+            sharpe_ratio=float(sharpe_ratio),
+            sortino_ratio=float(sortino_ratio),
             calmar_ratio=calmar_ratio,
-            total_trades=total_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            win_rate_pct=win_rate_pct,
-            profit_factor=profit_factor,
-            expectancy=expectancy,
-            avg_win=avg_win,
-            avg_loss=avg_loss,
-            largest_win=largest_win,
-            largest_loss=largest_loss,
             total_days=total_days,
             trading_days=trading_days,
             avg_daily_return_pct=avg_daily_return_pct,
             best_day_pct=best_day_pct,
             worst_day_pct=worst_day_pct,
             recovery_factor=recovery_factor,
-            payoff_ratio=payoff_ratio,
-            kelly_criterion=kelly_criterion
+            **trade_metrics
         )
 
+    def _calculate_trade_metrics(self) -> Dict[str, Any]:
+        """Calculate win/loss statistics over the trade log."""
+        pnl = self.trade_arrays.realized_pnl
+        total_trades = len(pnl)
+        if total_trades == 0:
+            return {}
+
+        winning_pnls = pnl[pnl > 0]
+        losing_pnls = pnl[pnl < 0]
+
+        total_wins = float(winning_pnls.sum())
+        total_losses = abs(float(losing_pnls.sum()))
+
+        profit_factor = total_wins / total_losses if total_losses > 0 else float('inf')
+
+        avg_win = total_wins / len(winning_pnls) if winning_pnls.size else 0.0
+        avg_loss = total_losses / len(losing_pnls) if losing_pnls.size else 0.0
+
+        largest_win = float(winning_pnls.max()) if winning_pnls.size else 0.0
+        largest_loss = float(losing_pnls.min()) if losing_pnls.size else 0.0
+
+        # Expectancy (average win/loss per trade)
+        win_prob = len(winning_pnls) / total_trades
+        loss_prob = len(losing_pnls) / total_trades
+        expectancy = (win_prob * avg_win) - (loss_prob * avg_loss)
+
+        # Payoff ratio
+        payoff_ratio = avg_win / abs(avg_loss) if avg_loss != 0 else float('inf')
+
+        # Kelly criterion
+        if win_prob > 0 and loss_prob > 0 and payoff_ratio > 0:
+            kelly_criterion = win_prob - (loss_prob / payoff_ratio)
+        else:
+            kelly_criterion = 0.0
+
+        return {
+            'total_trades': total_trades,
+            'winning_trades': len(winning_pnls),
+            'losing_trades': len(losing_pnls),
+            'win_rate_pct': len(winning_pnls) / total_trades * 100,
+            'profit_factor': profit_factor,
+            'expectancy': expectancy,
+            'avg_win': avg_win,
+            'avg_loss': avg_loss,
+            'largest_win': largest_win,
+            'largest_loss': largest_loss,
+            'payoff_ratio': payoff_ratio,
+            'kelly_criterion': kelly_criterion,
+        }
+
     def _calculate_symbol_breakdown(self) -> List[BreakdownMetrics]:
         """Calculate performance breakdown by symbol."""
-        symbol_stats = defaultdict(lambda: {
-            'trades': [], 'pnl': 0.0, 'realized_pnl': 0.0, 'unrealized_pnl': 0.0,
-            'wins': 0, 'losses': 0, 'max_dd': 0.0, 'returns': []
-        })
-
-        # Aggregate trade data by symbol
-        for trade in self.portfolio.trade_log:
-            stats = symbol_stats[trade.symbol]
-            stats['trades'].append(trade)
-            stats['pnl'] += trade.realized_pnl
-            stats['realized_pnl'] += trade.realized_pnl
-
-            if trade.realized_pnl > 0:
-                stats['wins'] += 1
-            elif trade.realized_pnl < 0:
-                stats['losses'] += 1
-
-        # Calculate metrics for each symbol
-        breakdowns = []
-        for symbol, stats in symbol_stats.items():
-            total_trades = len(stats['trades'])
-            win_rate = (stats['wins'] / total_trades * 100) if total_trades > 0 else 0.0
-
-            # Calculate profit factor
-            wins_pnl = sum(t.realized_pnl for t in stats['trades'] if t.realized_pnl > 0)
-            losses_pnl = abs(sum(t.realized_pnl for t in stats['trades'] if t.realized_pnl < 0))
-            profit_factor = wins_pnl / losses_pnl if losses_pnl > 0 else float('inf')
+        trades = self.trade_arrays
+        groups = _group_trades(trades.symbols, trades.realized_pnl)
 
-            # Simplified return calculation (would need more sophisticated calculation for accuracy)
-            total_return_pct = (stats['pnl'] / self.portfolio.initial_capital) * 100
+        breakdowns = []
+        for i, symbol in enumerate(groups['keys']):
+            losses_pnl = groups['losses_pnl'][i]
+            profit_factor = groups['wins_pnl'][i] / losses_pnl if losses_pnl > 0 else float('inf')
+            pnl = float(groups['pnl'][i])
 
             breakdowns.append(BreakdownMetrics(
-                symbol=symbol,
-                total_return_pct=total_return_pct,
-                total_trades=total_trades,
-                win_rate_pct=win_rate,
-                profit_factor=profit_factor,
-                total_pnl=stats['pnl'],
-                realized_pnl=stats['realized_pnl'],
-                unrealized_pnl=stats['unrealized_pnl']
+                symbol=str(symbol),
+                total_return_pct=(pnl / self.initial_capital) * 100,
+                total_trades=int(groups['trades'][i]),
+                win_rate_pct=float(groups['wins'][i] / groups['trades'][i] * 100),
+                profit_factor=float(profit_factor),
+                total_pnl=pnl,
+                realized_pnl=pnl,
+                unrealized_pnl=0.0
             ))
 
         return breakdowns
 
     def _calculate_monthly_breakdown(self) -> List[BreakdownMetrics]:
-        """Calculate performance breakdown by month."""
-        monthly_stats = defaultdict(lambda: {
-            'trades': [], 'pnl': 0.0, 'returns': []
-        })
-
-        # Aggregate by month
-        for trade in self.portfolio.trade_log:
-            month_key = f"{trade.exit_time.year}-{trade.exit_time.month:02d}"
-            monthly_stats[month_key]['trades'].append(trade)
-            monthly_stats[month_key]['pnl'] += trade.realized_pnl
-
-        # Calculate metrics for each month
+        """
+        Calculate performance breakdown by month.
+
+        Trade statistics are grouped by exit month; volatility and drawdown
+        come from the shared daily equity series for the same month.
+        """
+        trades = self.trade_arrays
+        months = trades.exit_times.view('datetime64[ns]').astype('datetime64[M]')
+        groups = _group_trades(months, trades.realized_pnl, sort=True)
+        month_risk = self._monthly_risk()
+
         breakdowns = []
-        for period, stats in monthly_stats.items():
-            total_trades = len(stats['trades'])
-            wins = sum(1 for t in stats['trades'] if t.realized_pnl > 0)
-            win_rate = (wins / total_trades * 100) if total_trades > 0 else 0.0
+        for i, month in enumerate(groups['keys']):
+            pnl = float(groups['pnl'][i])
+            volatility_pct, max_drawdown_pct = month_risk.get(month, (0.0, 0.0))
 
             breakdowns.append(BreakdownMetrics(
                 symbol="",  # Not applicable for monthly
-                period=period,
-                total_return_pct=(stats['pnl'] / self.portfolio.initial_capital) * 100,
-                total_trades=total_trades,
-                win_rate_pct=win_rate,
-                total_pnl=stats['pnl']
+                period=str(month),
+                total_return_pct=(pnl / self.initial_capital) * 100,
+                total_trades=int(groups['trades'][i]),
+                win_rate_pct=float(groups['wins'][i] / groups['trades'][i] * 100),
+                total_pnl=pnl,
+                volatility_pct=volatility_pct,
+                max_drawdown_pct=max_drawdown_pct
             ))
 
-        return sorted(breakdowns, key=lambda x: x.period or "")
+        return breakdowns
+
+    def _monthly_risk(self) -> Dict[np.datetime64, Tuple[float, float]]:
+        """Annualized volatility and max drawdown of the daily equity series per month."""
+        if len(self.equity_arrays) == 0:
+            return {}
+        daily = self.daily_equity
+
+        # Volatility from daily returns grouped by month (two-pass sample variance)
+        return_months, inverse = np.unique(daily.return_days.astype('datetime64[M]'), return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(return_months))
+        means = np.bincount(inverse, weights=daily.returns, minlength=len(return_months)) / np.maximum(counts, 1)
+        squares = np.bincount(inverse, weights=(daily.returns - means[inverse]) ** 2, minlength=len(return_months))
+        variance = np.divide(squares, counts - 1, out=np.zeros_like(squares), where=counts > 1)
+        volatility = np.sqrt(variance) * np.sqrt(TRADING_DAYS_PER_YEAR) * 100
+
+        # Drawdown within each month; daily closes are sorted, so months are contiguous runs
+        close_months = daily.days.astype('datetime64[M]')
+        bounds = np.flatnonzero(close_months[1:] != close_months[:-1]) + 1
+        risk = {}
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(close_months)]):
+            closes = daily.close[lo:hi]
+            risk[close_months[lo]] = (0.0, float(drawdown_pct(closes).max()))
+        for month, vol in zip(return_months, volatility):
+            risk[month] = (float(vol), risk.get(month, (0.0, 0.0))[1])
+        return risk
 
     def _calculate_tag_breakdown(self) -> List[BreakdownMetrics]:
         """Calculate performance breakdown by trade tags."""
-        tag_stats = defaultdict(lambda: {
-            'trades': [], 'pnl': 0.0
-        })
+        trades = self.trade_arrays
+        counts = np.fromiter((len(tags) for tags in trades.tags), dtype=np.int64, count=len(trades.tags))
+        flat_tags = np.array([tag for tags in trades.tags for tag in tags], dtype=object)
+        if flat_tags.size == 0:
+            return []
 
-        # Aggregate by tag
-        for trade in self.portfolio.trade_log:
-            for tag in trade.tags:
-                tag_stats[tag]['trades'].append(trade)
-                tag_stats[tag]['pnl'] += trade.realized_pnl
+        # One row per (trade, tag) pair
+        groups = _group_trades(flat_tags.astype(str), np.repeat(trades.realized_pnl, counts))
 
-        # Calculate metrics for each tag
         breakdowns = []
-        for tag, stats in tag_stats.items():
-            total_trades = len(stats['trades'])
-            wins = sum(1 for t in stats['trades'] if t.realized_pnl > 0)
-            win_rate = (wins / total_trades * 100) if total_trades > 0 else 0.0
+        for i, tag in enumerate(groups['keys']):
+            pnl = float(groups['pnl'][i])
 
             breakdowns.append(BreakdownMetrics(
                 symbol="",  # Not applicable for tags
-                tag=tag,
-                total_return_pct=(stats['pnl'] / self.portfolio.initial_capital) * 100,
-                total_trades=total_trades,
-                win_rate_pct=win_rate,
-                total_pnl=stats['pnl']
+                tag=str(tag),
+                total_return_pct=(pnl / self.initial_capital) * 100,
+                total_trades=int(groups['trades'][i]),
+                win_rate_pct=float(groups['wins'][i] / groups['trades'][i] * 100),
+                total_pnl=pnl
             ))
 
         return breakdowns
 
     def export_json(self, report: BacktestReport, filepath: str) -> None:
-        """Export report to JSON format."""
+        """
+        Export report to JSON format.
+
+        The equity curve is downsampled to ``max_chart_points``; the full
+        curve goes to the Parquet sidecar named in ``equity_curve_file``.
+        """
         def serialize_obj(obj):
             if hasattr(obj, '__dict__'):
                 return {k: serialize_obj(v) for k, v in obj.__dict__.items()}
@@ -448,14 +717,84 @@ class BacktestReporter:
                 return obj.isoformat()
             elif isinstance(obj, Decimal):
                 return float(obj)
+            elif isinstance(obj, np.ndarray):
+                return obj.tolist()
             else:
                 return obj
 
-        data = serialize_obj(report)
+        curve = self._report_curve(report)
+        data = {
+            k: serialize_obj(v) for k, v in report.__dict__.items()
+            if k not in ('equity_curve', 'equity_arrays')
+        }
+        data['equity_curve'] = self._chart_rows(curve)
+        data['equity_curve_points'] = len(curve)
+        sidecar = self._write_equity_sidecar(report, curve, filepath)
+        data['equity_curve_file'] = sidecar.name if sidecar else None
 
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=2)
 
+    @staticmethod
+    def equity_sidecar_path(filepath: str) -> Path:
+        """Path of the full-resolution equity Parquet written next to ``filepath``."""
+        return Path(filepath).with_suffix('.equity.parquet')
+
+    def export_equity_parquet(self, report: BacktestReport, filepath: str) -> None:
+        """Write the full-resolution equity curve to Parquet."""
+        write_equity_parquet(self._report_curve(report), filepath)
+
+    def _write_equity_sidecar(self, report: BacktestReport, curve: EquityArrays, filepath: str) -> Optional[Path]:
+        if len(curve) == 0:
+            return None
+        path = self.equity_sidecar_path(filepath)
+        # JSON and HTML exports of the same report share one sidecar
+        if self._written_sidecars.get(path) != id(report):
+            write_equity_parquet(curve, str(path))
+            self._written_sidecars[path] = id(report)
+        return path
+
+    @staticmethod
+    def _report_curve(report: BacktestReport) -> EquityArrays:
+        if report.equity_arrays is not None:
+            return report.equity_arrays
+        return EquityArrays.from_points(report.equity_curve)
+
+    def _chart_indices(self, curve: EquityArrays) -> np.ndarray:
+        return downsample_indices(curve.timestamps, curve.equity, self.max_chart_points, self.downsample_method)
+
+    def _chart_rows(self, curve: EquityArrays) -> List[Dict[str, Any]]:
+        """Downsampled equity points; drawdowns are taken from the full curve."""
+        if len(curve) == 0:
+            return []
+        indices = self._chart_indices(curve)
+        timestamps = curve.timestamps[indices].view('datetime64[ns]').astype('datetime64[us]').astype(str)
+        equity = curve.equity[indices].tolist()
+        drawdowns = drawdown_pct(curve.equity)[indices].tolist()
+        return [
+            {'timestamp': ts, 'equity': eq, 'drawdown_pct': dd}
+            for ts, eq, dd in zip(timestamps, equity, drawdowns)
+        ]
+
+    def _equity_chart_svg(self, curve: EquityArrays, width: int = 1000, height: int = 300) -> str:
+        """Inline SVG line chart of the downsampled equity curve."""
+        if len(curve) < 2:
+            return ""
+        indices = self._chart_indices(curve)
+        x = curve.timestamps[indices].astype(np.float64)
+        y = curve.equity[indices]
+        x_span = (x[-1] - x[0]) or 1.0
+        y_span = (y.max() - y.min()) or 1.0
+        px = (x - x[0]) / x_span * width
+        py = height - (y - y.min()) / y_span * height
+        points = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(px, py))
+        return (
+            f'<svg viewBox="0 0 {width} {height}" width="100%" preserveAspectRatio="none">'
+            f'<polyline fill="none" stroke="#1f77b4" stroke-width="1" points="{points}"/></svg>'
+            f'<p><em>Showing {len(indices):,} of {len(curve):,} points '
+            f'(min ₹{y.min():,.0f}, max ₹{y.max():,.0f})</em></p>'
+        )
+
     def export_csv_trades(self, report: BacktestReport, filepath: str) -> None:
         """Export trade log to CSV format."""
         if not report.trade_log:
@@ -487,6 +826,8 @@ class BacktestReporter:
     def export_csv_equity(self, report: BacktestReport, filepath: str) -> None:
         """Export equity curve to CSV format."""
         if not report.equity_curve:
+            if report.equity_arrays is not None and len(report.equity_arrays):
+                self._export_csv_equity_arrays(report.equity_arrays, filepath)
             return
 
         fieldnames = ['timestamp', 'equity', 'cash', 'fees', 'drawdown_pct']
@@ -504,8 +845,28 @@ class BacktestReporter:
                     'drawdown_pct': point.drawdown_pct
                 })
 
+    @staticmethod
+    def _export_csv_equity_arrays(curve: EquityArrays, filepath: str) -> None:
+        """Write an array equity curve with the same columns as ``export_csv_equity``."""
+        timestamps = curve.timestamps.view('datetime64[ns]').astype('datetime64[us]').astype(str)
+        zeros = np.zeros(len(curve))
+        columns = zip(
+            timestamps,
+            curve.equity.tolist(),
+            (curve.cash if curve.cash is not None else zeros).tolist(),
+            (curve.fees if curve.fees is not None else zeros).tolist(),
+            drawdown_pct(curve.equity).tolist(),
+        )
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['timestamp', 'equity', 'cash', 'fees', 'drawdown_pct'])
+            writer.writerows(columns)
+
     def generate_html_report(self, report: BacktestReport, filepath: str) -> None:
         """Generate HTML report with charts and tables."""
+        curve = self._report_curve(report)
+        sidecar = self._write_equity_sidecar(report, curve, filepath)
+        sidecar_link = f'<p>Full-resolution curve: <a href="{sidecar.name}">{sidecar.name}</a></p>' if sidecar else ""
         html_content = f"""
         <!DOCTYPE html>
         <html>
@@ -560,6 +921,12 @@ class BacktestReporter:
                 </div>
             </div>
 
+            <div class="metric">
+                <h3>Equity Curve</h3>
+                {self._equity_chart_svg(curve)}
+                {sidecar_link}
+            </div>
+
             <h3>Symbol Breakdown</h3>
             <table>
                 <tr>
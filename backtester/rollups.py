@@ -0,0 +1,131 @@
+"""
+Timeframe rollups for OHLCV bars.
+
+Aggregates finer bars (e.g. 1m) into coarser ones (5m, 15m, 1h, 1d) with
+buckets anchored at the NSE session open (09:15 IST) rather than at UTC
+midnight, so a 1h series reads 09:15, 10:15, ..., 15:15 (the last bar
+covering the closing 15 minutes) and 15m/5m bars line up with the
+exchange's own intervals. Bars are labelled with their bucket start; daily
+bars are labelled with the session open of their IST trading date.
+
+Timestamps are int64 nanoseconds in UTC (the ``OHLCVStorage`` layout); the
+aggregation is a single pass over sorted rows using ``reduceat`` at bucket
+boundaries.
+"""
+
+import re
+from datetime import datetime, time
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pyarrow as pa
+
+from .scope import NSE_MARKET_OPEN, NSE_TIMEZONE
+
+NS_PER_MINUTE = 60 * 1_000_000_000
+MINUTES_PER_DAY = 24 * 60
+
+_TIMEFRAME = re.compile(r"^(\d+)([mhd])$")
+
+
+def timeframe_minutes(timeframe: str) -> Optional[int]:
+    """
+    Bar length in minutes for '<n>m', '<n>h' and '1d' (a whole session, 1440).
+
+    Returns None for timeframes that cannot be rolled up to (e.g. '1w', '2d').
+    """
+    match = _TIMEFRAME.match(timeframe)
+    if not match:
+        return None
+    n, unit = int(match.group(1)), match.group(2)
+    if n <= 0:
+        return None
+    if unit == "m":
+        return n
+    if unit == "h":
+        return n * 60
+    return MINUTES_PER_DAY if n == 1 else None
+
+
+def _utc_offset_ns(tz: str) -> int:
+    # NSE has no daylight saving, so one offset serves every date
+    offset = ZoneInfo(tz).utcoffset(datetime(2024, 1, 1))
+    return int(offset.total_seconds()) * 1_000_000_000
+
+
+def _session_open_ns(session_open: str) -> int:
+    parsed = time.fromisoformat(session_open)
+    return (parsed.hour * 60 + parsed.minute) * NS_PER_MINUTE
+
+
+def bucket_labels(timestamps: np.ndarray, timeframe: str, session_open: str = NSE_MARKET_OPEN,
+                  tz: str = NSE_TIMEZONE) -> np.ndarray:
+    """
+    Bucket start (int64 ns UTC) for each timestamp.
+
+    Args:
+        timestamps: int64 ns UTC timestamps
+        timeframe: Target timeframe ('5m', '15m', '1h', '1d', ...)
+        session_open: Local session open that intraday buckets are anchored to
+        tz: Exchange timezone
+
+    Returns:
+        Label per timestamp
+    """
+    minutes = timeframe_minutes(timeframe)
+    if minutes is None:
+        raise ValueError(f"Unsupported rollup timeframe: {timeframe}")
+
+    offset = _utc_offset_ns(tz)
+    open_ns = _session_open_ns(session_open)
+    local = np.asarray(timestamps, dtype=np.int64) + offset
+    day_start = local - np.mod(local, MINUTES_PER_DAY * NS_PER_MINUTE)
+    if minutes == MINUTES_PER_DAY:
+        return day_start + open_ns - offset
+
+    width = minutes * NS_PER_MINUTE
+    bucket = np.floor_divide(local - day_start - open_ns, width) * width
+    return day_start + open_ns + bucket - offset
+
+
+def rollup_table(table: pa.Table, timeframe: str, session_open: str = NSE_MARKET_OPEN,
+                 tz: str = NSE_TIMEZONE) -> pa.Table:
+    """
+    Aggregate OHLCV rows (sorted by timestamp) into ``timeframe`` bars.
+
+    open = first, high = max, low = min, close = last, volume = sum; symbol
+    and source come from the first bar of each bucket.
+
+    Args:
+        table: Rows with the ``OHLCVStorage`` schema, sorted by timestamp
+        timeframe: Target timeframe
+
+    Returns:
+        Table with the same schema and ``timeframe`` set to the target
+    """
+    if table.num_rows == 0:
+        return table
+
+    ts_type = table.schema.field('timestamp').type
+    timestamps = table.column('timestamp').cast(pa.int64()).to_numpy()
+    labels = bucket_labels(timestamps, timeframe, session_open, tz)
+
+    starts = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1])))
+    ends = np.append(starts[1:], len(labels)) - 1
+
+    def column(name: str) -> np.ndarray:
+        return table.column(name).to_numpy(zero_copy_only=False)
+
+    columns = {
+        'symbol': table.column('symbol').take(pa.array(starts)),
+        'timestamp': pa.array(labels[starts]).cast(ts_type),
+        'open': column('open')[starts],
+        'high': np.maximum.reduceat(column('high'), starts),
+        'low': np.minimum.reduceat(column('low'), starts),
+        'close': column('close')[ends],
+        'volume': np.add.reduceat(np.nan_to_num(column('volume')), starts),
+        'timeframe': pa.array([timeframe] * len(starts), type=pa.string()),
+        'source': table.column('source').take(pa.array(starts)),
+    }
+    return pa.table({name: columns[name] for name in table.column_names}, schema=table.schema)
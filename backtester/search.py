@@ -0,0 +1,283 @@
+"""
+Adaptive parameter search strategies.
+
+A search strategy decides which parameter sets are backtested and with how
+much training data. It drives an evaluator callback::
+
+    scores = evaluate(batch_of_param_dicts, budget)
+
+where ``budget`` is the fraction of each training window to use (1.0 means
+a full train/test/OOS evaluation) and higher scores are better. Only
+full-budget evaluations become ``ParameterSet`` results; partial budgets are
+used to discard weak candidates cheaply.
+
+- ``GridSearch``: every combination (the ``ParameterGridSearch`` behaviour)
+- ``RandomSearch``: a fixed number of distinct random combinations
+- ``SuccessiveHalving``: many random candidates on a short training slice,
+  keeping the top ``1/eta`` at each rung while the budget grows by ``eta``
+- ``ModelBasedSearch``: random start, then candidates chosen by a random
+  forest surrogate's upper confidence bound (requires scikit-learn)
+
+Candidates are drawn by index from the Cartesian product without
+enumerating it, and every strategy is deterministic for a given seed.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Evaluator = Callable[[List[Dict[str, Any]], float], List[float]]
+
+FULL_BUDGET = 1.0
+
+
+class ParameterSpace:
+    """Indexable Cartesian product of parameter ranges (last parameter varies fastest)."""
+
+    def __init__(self, param_ranges: Dict[str, Sequence[Any]]):
+        self.names = list(param_ranges)
+        self.values = [list(v) for v in param_ranges.values()]
+        self.sizes = [len(v) for v in self.values]
+        self.size = math.prod(self.sizes) if self.sizes else 0
+
+    def decode(self, index: int) -> Dict[str, Any]:
+        """Parameter set at position ``index`` of ``itertools.product`` order."""
+        params = {}
+        for name, values, size in zip(reversed(self.names), reversed(self.values), reversed(self.sizes)):
+            index, position = divmod(int(index), size)
+            params[name] = values[position]
+        return {name: params[name] for name in self.names}
+
+    def positions(self, indices: np.ndarray) -> np.ndarray:
+        """Per-parameter value positions scaled to [0, 1], one row per index (model features)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        features = np.empty((len(indices), len(self.sizes)))
+        for column in range(len(self.sizes) - 1, -1, -1):
+            size = self.sizes[column]
+            indices, position = np.divmod(indices, size)
+            features[:, column] = position / max(size - 1, 1)
+        return features
+
+    def sample(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """``n`` distinct indices (all of them, shuffled, when ``n`` covers the space)."""
+        if n >= self.size:
+            return rng.permutation(self.size)
+        return rng.choice(self.size, size=n, replace=False)
+
+
+def _ranked(scores: Sequence[float]) -> np.ndarray:
+    """Indices by descending score; NaN ranks last and ties keep candidate order."""
+    scores = np.asarray(scores, dtype=np.float64)
+    scores = np.where(np.isfinite(scores), scores, -np.inf)
+    return np.lexsort((np.arange(len(scores)), -scores))
+
+
+class SearchStrategy:
+    """Base class for search strategies."""
+
+    def __init__(self, param_ranges: Dict[str, Sequence[Any]], seed: Optional[int] = None):
+        self.space = ParameterSpace(param_ranges)
+        self.seed = seed
+
+    def planned_evaluations(self) -> int:
+        """Parameter-set evaluations the search will request (for progress reporting)."""
+        raise NotImplementedError
+
+    def run(self, evaluate: Evaluator) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Run the search.
+
+        Args:
+            evaluate: Callback scoring a batch of parameter sets at a budget
+
+        Returns:
+            (params, score) for every full-budget evaluation, best first
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _full(evaluate: Evaluator, candidates: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], float]]:
+        scores = evaluate(candidates, FULL_BUDGET) if candidates else []
+        return [(candidates[i], float(scores[i])) for i in _ranked(scores)]
+
+
+class GridSearch(SearchStrategy):
+    """Exhaustive search over every combination, evaluated in bounded batches."""
+
+    def __init__(self, param_ranges: Dict[str, Sequence[Any]], batch_size: int = 1024):
+        super().__init__(param_ranges)
+        self.batch_size = batch_size
+
+    def planned_evaluations(self) -> int:
+        return self.space.size
+
+    def run(self, evaluate: Evaluator) -> List[Tuple[Dict[str, Any], float]]:
+        results = []
+        for start in range(0, self.space.size, self.batch_size):
+            batch = [self.space.decode(i) for i in range(start, min(start + self.batch_size, self.space.size))]
+            results.extend(zip(batch, evaluate(batch, FULL_BUDGET)))
+        return [results[i] for i in _ranked([score for _, score in results])]
+
+
+class RandomSearch(SearchStrategy):
+    """Evaluate ``n_samples`` distinct random combinations at full budget."""
+
+    def __init__(self, param_ranges: Dict[str, Sequence[Any]], n_samples: int = 100, seed: Optional[int] = None):
+        super().__init__(param_ranges, seed)
+        self.n_samples = n_samples
+
+    def planned_evaluations(self) -> int:
+        return min(self.n_samples, self.space.size)
+
+    def run(self, evaluate: Evaluator) -> List[Tuple[Dict[str, Any], float]]:
+        rng = np.random.default_rng(self.seed)
+        candidates = [self.space.decode(i) for i in self.space.sample(self.n_samples, rng)]
+        return self._full(evaluate, candidates)
+
+
+class SuccessiveHalving(SearchStrategy):
+    """
+    Successive halving over random candidates.
+
+    Rung ``k`` evaluates the survivors on ``min_budget * eta**k`` of each
+    training window and keeps the best ``1/eta`` of them; the last rung runs
+    at full budget. With the defaults, 729 candidates cost about as much as
+    108 full evaluations.
+    """
+
+    def __init__(self, param_ranges: Dict[str, Sequence[Any]], n_candidates: int = 729,
+                 min_budget: float = 1 / 27, eta: int = 3, seed: Optional[int] = None):
+        super().__init__(param_ranges, seed)
+        if not 0 < min_budget <= 1:
+            raise ValueError("min_budget must be in (0, 1]")
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        self.n_candidates = n_candidates
+        self.min_budget = min_budget
+        self.eta = eta
+
+    def rungs(self) -> List[Tuple[int, float]]:
+        """(candidates, budget) for each rung."""
+        rungs = []
+        n = min(self.n_candidates, self.space.size)
+        budget = self.min_budget
+        while True:
+            if budget >= FULL_BUDGET - 1e-9 or n <= 1:
+                rungs.append((n, FULL_BUDGET))
+                return rungs
+            rungs.append((n, budget))
+            n = max(1, n // self.eta)
+            budget *= self.eta
+
+    def planned_evaluations(self) -> int:
+        return sum(n for n, _ in self.rungs())
+
+    def budget_cost(self) -> float:
+        """Total cost in full-evaluation equivalents."""
+        return sum(n * budget for n, budget in self.rungs())
+
+    def run(self, evaluate: Evaluator) -> List[Tuple[Dict[str, Any], float]]:
+        rng = np.random.default_rng(self.seed)
+        candidates = [self.space.decode(i) for i in self.space.sample(self.n_candidates, rng)]
+
+        for n, budget in self.rungs():
+            candidates = candidates[:n]
+            if budget >= FULL_BUDGET:
+                return self._full(evaluate, candidates)
+            scores = evaluate(candidates, budget)
+            order = _ranked(scores)
+            logger.info(f"Successive halving rung: {len(candidates)} candidates at budget {budget:.3f}")
+            candidates = [candidates[i] for i in order]
+        return []
+
+
+class ModelBasedSearch(SearchStrategy):
+    """
+    Surrogate-model search.
+
+    Starts with ``n_initial`` random full evaluations, then repeatedly fits a
+    random forest to (parameter positions -> score) and evaluates the
+    ``batch_size`` unseen candidates from a random pool with the highest
+    mean + ``kappa`` * spread across trees.
+    """
+
+    def __init__(self, param_ranges: Dict[str, Sequence[Any]], n_initial: int = 20, n_iterations: int = 20,
+                 batch_size: int = 4, candidate_pool: int = 2048, kappa: float = 1.0, seed: Optional[int] = None):
+        super().__init__(param_ranges, seed)
+        try:
+            from sklearn.ensemble import RandomForestRegressor
+        except ImportError as e:
+            raise ImportError("ModelBasedSearch requires scikit-learn") from e
+        self._regressor = RandomForestRegressor
+        self.n_initial = n_initial
+        self.n_iterations = n_iterations
+        self.batch_size = batch_size
+        self.candidate_pool = candidate_pool
+        self.kappa = kappa
+
+    def planned_evaluations(self) -> int:
+        return min(self.n_initial + self.n_iterations * self.batch_size, self.space.size)
+
+    def run(self, evaluate: Evaluator) -> List[Tuple[Dict[str, Any], float]]:
+        rng = np.random.default_rng(self.seed)
+        seen = [int(i) for i in self.space.sample(self.n_initial, rng)]
+        scores = list(evaluate([self.space.decode(i) for i in seen], FULL_BUDGET))
+
+        for _ in range(self.n_iterations):
+            if len(seen) >= self.space.size:
+                break
+            features = self.space.positions(np.array(seen))
+            targets = np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=np.nanmin(scores + [0.0]))
+            model = self._regressor(n_estimators=50, min_samples_leaf=2, random_state=self.seed)
+            model.fit(features, targets)
+
+            pool = np.setdiff1d(self.space.sample(self.candidate_pool, rng), seen)
+            if pool.size == 0:
+                continue
+            pool_features = self.space.positions(pool)
+            per_tree = np.stack([tree.predict(pool_features) for tree in model.estimators_])
+            acquisition = per_tree.mean(axis=0) + self.kappa * per_tree.std(axis=0)
+            chosen = [int(pool[i]) for i in _ranked(acquisition)[:self.batch_size]]
+
+            seen.extend(chosen)
+            scores.extend(evaluate([self.space.decode(i) for i in chosen], FULL_BUDGET))
+
+        return [(self.space.decode(seen[i]), float(scores[i])) for i in _ranked(scores)]
+
+
+SEARCH_STRATEGIES = ("grid", "random", "halving", "model")
+
+
+def create_search(name: str, param_ranges: Dict[str, Sequence[Any]], n_candidates: int = 729,
+                  seed: Optional[int] = None) -> SearchStrategy:
+    """
+    Build a search strategy by name.
+
+    Args:
+        name: One of ``SEARCH_STRATEGIES``
+        param_ranges: Parameter ranges to search
+        n_candidates: Random samples ('random'), initial candidates
+            ('halving') or total evaluations ('model')
+        seed: Random seed
+
+    Returns:
+        SearchStrategy instance
+    """
+    if name == "grid":
+        return GridSearch(param_ranges)
+    if name == "random":
+        return RandomSearch(param_ranges, n_samples=n_candidates, seed=seed)
+    if name == "halving":
+        return SuccessiveHalving(param_ranges, n_candidates=n_candidates, seed=seed)
+    if name == "model":
+        # A quarter of the evaluations seed the model; the rest arrive in batches of 4
+        n_iterations = max(0, (n_candidates - max(1, n_candidates // 4)) // 4)
+        return ModelBasedSearch(param_ranges, n_initial=n_candidates - 4 * n_iterations,
+                                n_iterations=n_iterations, batch_size=4, seed=seed)
+    raise ValueError(f"Unknown search strategy: {name} (expected one of {SEARCH_STRATEGIES})")
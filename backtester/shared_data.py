@@ -0,0 +1,195 @@
+"""
+Shared-memory event store for parallel backtests.
+
+Normalized market events are published once into a single
+``multiprocessing.shared_memory`` block as fixed-width NumPy columns.
+Worker processes receive only a small picklable handle, attach to the block
+read-only by name and rebuild ``Bar``/``Tick`` objects for the time window
+they need, so per-worker memory does not grow with the size of the full
+event list or with ``max_workers``.
+
+Column layout (one int64/float64 slot per event, in timestamp order):
+
+- ``timestamp``: nanoseconds since the epoch (UTC for tz-aware input)
+- ``symbol``: index into ``SharedEventStoreHandle.symbols``
+- ``kind``: 0 for ``Bar``, 1 for ``Tick``
+- ``open``/``high``/``low``/``close``/``volume``: ticks store their price in
+  every price column and their size in ``volume``
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from trading_engine.phase4.models import Bar, Tick
+
+from .vectorized import to_datetime64
+
+logger = logging.getLogger(__name__)
+
+KIND_BAR = 0
+KIND_TICK = 1
+
+_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "int64"),
+    ("symbol", "int64"),
+    ("kind", "int64"),
+    ("open", "float64"),
+    ("high", "float64"),
+    ("low", "float64"),
+    ("close", "float64"),
+    ("volume", "float64"),
+)
+
+# Stores attached by this process, keyed by block name, so pool workers map
+# each block once rather than once per task.
+_ATTACHED: Dict[str, "SharedEventStore"] = {}
+
+
+@dataclass(frozen=True)
+class SharedEventStoreHandle:
+    """Picklable reference to a published event store."""
+
+    name: str
+    length: int
+    symbols: Tuple[str, ...]
+    tz_aware: bool
+
+
+class SharedEventStore:
+    """Read-only columnar view of market events backed by shared memory."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: SharedEventStoreHandle, owner: bool):
+        self._shm = shm
+        self.handle = handle
+        self._owner = owner
+        self.columns: Dict[str, np.ndarray] = {}
+        for i, (name, dtype) in enumerate(_COLUMNS):
+            column = np.ndarray((handle.length,), dtype=dtype, buffer=shm.buf, offset=i * handle.length * 8)
+            column.flags.writeable = False
+            self.columns[name] = column
+
+    @classmethod
+    def publish(cls, events: Iterable) -> "SharedEventStore":
+        """
+        Copy time-ordered events into a new shared memory block.
+
+        Args:
+            events: Time-ordered ``Bar``/``Tick`` (or candle-like) events,
+                e.g. the output of ``EventBacktester._normalize_events``
+
+        Returns:
+            Owning store; call ``close()`` (or use it as a context manager)
+            to release and unlink the block
+        """
+        events = list(events)
+        length = len(events)
+        symbols: Dict[str, int] = {}
+        tz_aware = bool(events) and events[0].timestamp.tzinfo is not None
+
+        # SharedMemory rejects size 0, so always reserve at least one slot
+        shm = shared_memory.SharedMemory(create=True, size=max(length, 1) * 8 * len(_COLUMNS))
+        columns = {
+            name: np.ndarray((length,), dtype=dtype, buffer=shm.buf, offset=i * length * 8)
+            for i, (name, dtype) in enumerate(_COLUMNS)
+        }
+
+        try:
+            for i, event in enumerate(events):
+                if (event.timestamp.tzinfo is not None) != tz_aware:
+                    raise ValueError("Cannot mix tz-aware and naive timestamps in one event store")
+                columns["timestamp"][i] = to_datetime64(event.timestamp).astype("int64")
+                columns["symbol"][i] = symbols.setdefault(event.symbol, len(symbols))
+                if isinstance(event, Tick):
+                    columns["kind"][i] = KIND_TICK
+                    for name in ("open", "high", "low", "close"):
+                        columns[name][i] = event.price
+                    columns["volume"][i] = event.size
+                else:
+                    columns["kind"][i] = KIND_BAR
+                    columns["open"][i] = event.open
+                    columns["high"][i] = event.high
+                    columns["low"][i] = event.low
+                    columns["close"][i] = event.close
+                    columns["volume"][i] = event.volume or 0.0
+        except Exception:
+            del columns
+            shm.close()
+            shm.unlink()
+            raise
+
+        del columns
+        handle = SharedEventStoreHandle(name=shm.name, length=length, symbols=tuple(symbols), tz_aware=tz_aware)
+        logger.debug(f"Published {length} events ({shm.size} bytes) to shared memory block {shm.name}")
+        return cls(shm, handle, owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedEventStoreHandle) -> "SharedEventStore":
+        """Attach to a published store by name, reusing this process's mapping."""
+        store = _ATTACHED.get(handle.name)
+        if store is None:
+            store = cls(shared_memory.SharedMemory(name=handle.name), handle, owner=False)
+            _ATTACHED[handle.name] = store
+        return store
+
+    def __len__(self) -> int:
+        return self.handle.length
+
+    def __enter__(self) -> "SharedEventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping; the owner also unlinks the block."""
+        if self._shm is None:
+            return
+        self.columns = {}
+        _ATTACHED.pop(self.handle.name, None)
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def index_range(self, start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+        """Return ``[lo, hi)`` indices of events with ``start <= timestamp <= end``."""
+        timestamps = self.columns["timestamp"]
+        lo = 0 if start is None else int(np.searchsorted(timestamps, self._to_ns(start), side="left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, self._to_ns(end), side="right"))
+        return lo, max(lo, hi)
+
+    def events(self, lo: int = 0, hi: Optional[int] = None) -> List:
+        """Materialize events ``[lo, hi)`` as ``Bar``/``Tick`` objects."""
+        hi = len(self) if hi is None else hi
+        timestamps = self.columns["timestamp"][lo:hi].view("datetime64[ns]").astype("datetime64[us]").astype(object)
+        if self.handle.tz_aware:
+            timestamps = [ts.replace(tzinfo=timezone.utc) for ts in timestamps]
+        symbol_ids, kinds, opens, highs, lows, closes, volumes = (
+            self.columns[name][lo:hi].tolist()
+            for name in ("symbol", "kind", "open", "high", "low", "close", "volume")
+        )
+
+        symbols = self.handle.symbols
+        events = []
+        for i, ts in enumerate(timestamps):
+            symbol = symbols[symbol_ids[i]]
+            if kinds[i] == KIND_TICK:
+                events.append(Tick(symbol=symbol, timestamp=ts, price=closes[i], size=volumes[i]))
+            else:
+                events.append(Bar(symbol, ts, opens[i], highs[i], lows[i], closes[i], volumes[i]))
+        return events
+
+    def events_between(self, start: Optional[datetime], end: Optional[datetime]) -> List:
+        """Materialize the events with ``start <= timestamp <= end``."""
+        return self.events(*self.index_range(start, end))
+
+    @staticmethod
+    def _to_ns(value: datetime) -> int:
+        return int(to_datetime64(value).astype("int64"))
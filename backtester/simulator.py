@@ -36,11 +36,14 @@ class TradeSimulator:
     def mark_to_market(self, bar: Bar) -> List[OrderFill]:
         fills = self.paper_engine.update_mark_to_market(bar)
         for fill in fills:
+            fill.timestamp = bar.timestamp
             self._apply_costs(fill)
         return fills
 
     def execute(self, order: OrderRequest, bar: Bar) -> OrderFill:
         fill = self.paper_engine.execute_order(order, bar)
+        # Fills happen at simulated time, not when the backtest runs
+        fill.timestamp = bar.timestamp
         self._apply_costs(fill)
         return fill
 
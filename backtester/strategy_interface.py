@@ -16,6 +16,7 @@ from enum import Enum
 
 from common.market_data import Candle
 from .fill_simulator import OrderSide, OrderType, BacktestOrder
+from .indicator_state import IndicatorState
 
 
 class SignalType(Enum):
@@ -79,7 +80,7 @@ class IndicatorLibrary:
             return sum(prices) / period
 
         # Calculate EMA
-        multiplier = 2 / (period + 1)
+        multiplier = Decimal(2) / Decimal(period + 1)
         ema_value = sum(prices[:period]) / period
 
         for price in prices[period:]:
@@ -178,7 +179,7 @@ class IndicatorLibrary:
         # Calculate standard deviation
         squared_diffs = [(price - sma) ** 2 for price in prices[-period:]]
         variance = sum(squared_diffs) / period
-        std = variance ** 0.5
+        std = variance.sqrt()
 
         upper_band = sma + (Decimal(str(std)) * Decimal(str(std_dev)))
         lower_band = sma - (Decimal(str(std)) * Decimal(str(std_dev)))
@@ -269,6 +270,7 @@ class BaseStrategy(ABC):
 
         # Indicator cache for performance
         self.indicator_cache: Dict[str, Dict[str, Any]] = {}
+        self.indicator_states: Dict[str, IndicatorState] = {}
 
     @abstractmethod
     def generate_signals(self, symbol: str, candles: List[Candle],
@@ -323,30 +325,32 @@ class BaseStrategy(ABC):
         return self.states[symbol]
 
     def calculate_indicators(self, symbol: str, candles: List[Candle]) -> Dict[str, Any]:
-        """Calculate and cache indicators for a symbol."""
+        """
+        Calculate and cache indicators for a symbol.
+
+        Indicators are kept as streaming per-symbol state: when ``candles``
+        extends the history seen on the previous call, only the new candles
+        are applied. Any other history (shorter, or a different series) is
+        replayed from the start. An empty list returns the cached values.
+        Results equal the ``IndicatorLibrary`` functions over ``candles``.
+        """
         if symbol not in self.indicator_cache:
             self.indicator_cache[symbol] = {}
 
         cache = self.indicator_cache[symbol]
+        if not candles:
+            return cache
+
+        state = self.indicator_states.get(symbol)
+        seen = state.count if state is not None else 0
+        if state is None or len(candles) < seen or (seen and candles[seen - 1].timestamp != state.last_timestamp):
+            state = self.indicator_states[symbol] = IndicatorState()
+            seen = 0
 
-        # Extract price data
-        closes = [Decimal(str(c.close)) for c in candles]
-        highs = [Decimal(str(c.high)) for c in candles]
-        lows = [Decimal(str(c.low)) for c in candles]
-        volumes = [c.volume for c in candles]
-
-        # Calculate common indicators
-        cache['sma_20'] = IndicatorLibrary.sma(closes, 20)
-        cache['sma_50'] = IndicatorLibrary.sma(closes, 50)
-        cache['ema_12'] = IndicatorLibrary.ema(closes, 12)
-        cache['ema_26'] = IndicatorLibrary.ema(closes, 26)
-        cache['rsi_14'] = IndicatorLibrary.rsi(closes, 14)
-        cache['macd'], cache['macd_signal'], cache['macd_hist'] = IndicatorLibrary.macd(closes)
-        cache['atr_14'] = IndicatorLibrary.atr(highs, lows, closes, 14)
-        cache['bb_middle'], cache['bb_upper'], cache['bb_lower'] = IndicatorLibrary.bollinger_bands(closes)
-        cache['vwap'] = IndicatorLibrary.vwap(highs, lows, closes, volumes)
-        cache['stoch_k'], cache['stoch_d'] = IndicatorLibrary.stochastic_oscillator(highs, lows, closes)
+        for candle in candles[seen:]:
+            state.update(candle)
 
+        cache.update(state.values())
         return cache
 
     def get_indicator(self, symbol: str, indicator_name: str, candles: List[Candle]) -> Any:
@@ -0,0 +1,41 @@
+"""Columnar bar and strategy fixtures shared by the vectorized and portfolio engine tests."""
+
+from datetime import datetime
+
+import numpy as np
+
+from ..vectorized import ColumnarBars, coerce_bars
+
+
+class ArrayStrategy:
+    """
+    Strategy returning precomputed targets per symbol.
+
+    ``targets[symbol]`` is aligned with the untrimmed bars in ``data``; the
+    engine may hand over only the bars inside the config window, so targets
+    are looked up by timestamp rather than by position.
+    """
+
+    def __init__(self, targets, data, name: str = "array"):
+        self.name = name
+        self.targets = targets
+        self.timestamps = {symbol: coerce_bars(symbol, raw).timestamp for symbol, raw in data.items()}
+
+    def generate_positions(self, bars: ColumnarBars) -> np.ndarray:
+        offsets = np.searchsorted(self.timestamps[bars.symbol], bars.timestamp)
+        return self.targets[bars.symbol][offsets]
+
+
+def make_bars(symbol: str, n: int, seed: int, start: datetime, step_minutes: int = 1) -> ColumnarBars:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    timestamps = np.datetime64(start, "ns") + np.arange(n) * np.timedelta64(step_minutes, "m")
+    return ColumnarBars(
+        symbol=symbol,
+        timestamp=timestamps,
+        open=close - 0.1,
+        high=close + 0.5,
+        low=close - 0.5,
+        close=close,
+        volume=np.full(n, 1000.0),
+    )
@@ -0,0 +1,138 @@
+"""
+Batch result streaming tests.
+
+Tests cover:
+- Summary rows flushed to chunked Parquet parts
+- Incremental summary matching a recomputation from the parts
+- Per-symbol trade and equity partitions
+- Resuming a partially written batch
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from ..batch_results import BatchResultWriter, BatchSummary, summary_row, write_symbol_partitions
+from ..portfolio_accounting import EquityPoint, TradeRecord
+from ..reporting import PerformanceMetrics
+
+
+class FakeReport:
+    """Report with metrics, trades and an equity curve."""
+
+    def __init__(self, symbol: str, total_return_pct: float, trades: int = 3, points: int = 50):
+        start = datetime(2024, 1, 1, 9, 15)
+        self.metrics = PerformanceMetrics(total_return_pct=total_return_pct, sharpe_ratio=1.0, total_trades=trades)
+        self.trade_log = [
+            TradeRecord(symbol, "BUY", 10, 100.0, 101.0, start, start + timedelta(hours=i), 10.0 * i, 1.0, ["t"])
+            for i in range(trades)
+        ]
+        self.equity_curve = [EquityPoint(start + timedelta(minutes=i), 100000.0 + i) for i in range(points)]
+
+
+def make_rows(n: int):
+    rows = []
+    for i in range(n):
+        symbol = f"SYM{i:04d}"
+        if i % 10 == 3:
+            rows.append(summary_row(symbol, error="no data"))
+        else:
+            rows.append(summary_row(symbol, FakeReport(symbol, float(i % 17 - 8))))
+    return rows
+
+
+class TestBatchResultWriter:
+    """Streaming summary rows to Parquet."""
+
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output = Path(self.tmpdir.name)
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_rows_are_flushed_in_parts(self):
+        with BatchResultWriter(self.output, flush_rows=40) as writer:
+            for row in make_rows(100):
+                writer.add(row)
+            assert len(list((self.output / "summary").glob("part-*.parquet"))) == 2
+
+        parts = sorted((self.output / "summary").glob("part-*.parquet"))
+        assert len(parts) == 3
+        assert sum(pq.read_metadata(p).num_rows for p in parts) == 100
+
+    def test_incremental_summary_matches_recomputation(self):
+        with BatchResultWriter(self.output, flush_rows=16) as writer:
+            for row in make_rows(100):
+                writer.add(row)
+
+        live = writer.summary
+        recomputed = BatchSummary.from_parquet(self.output, batch_size=7)
+
+        assert live.to_dict() == recomputed.to_dict()
+        assert (live.total, live.failed) == (100, 10)
+        returns = [r['total_return_pct'] for r in make_rows(100) if not r['error']]
+        assert live.mean_return_pct == pytest.approx(np.mean(returns))
+        assert live.best[1] == max(returns)
+
+    def test_failures_kept_in_summary_are_bounded(self):
+        summary = BatchSummary(max_failures=3)
+        for i in range(10):
+            summary.update(summary_row(f"S{i}", error="boom"))
+        assert summary.failed == 10
+        assert len(summary.failures) == 3
+
+    def test_resume_skips_recorded_symbols(self):
+        rows = make_rows(30)
+        with BatchResultWriter(self.output, flush_rows=10) as writer:
+            for row in rows[:25]:
+                writer.add(row)
+            writer.flush()
+            writer._buffer = []  # rows after the last flush are lost in a crash
+
+        resumed = BatchResultWriter(self.output, flush_rows=10)
+        done = resumed.resume()
+        assert done == {r['symbol'] for r in rows[:25]}
+        for row in rows[25:]:
+            resumed.add(row)
+        resumed.close()
+
+        expected = BatchSummary()
+        for row in rows:
+            expected.update(row)
+        assert BatchSummary.from_parquet(self.output).to_dict() == expected.to_dict()
+
+
+class TestSymbolPartitions:
+    """Worker-side trade and equity partitions."""
+
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output = Path(self.tmpdir.name)
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_trades_and_equity_partitions(self):
+        counts = write_symbol_partitions(self.output, "TCS", FakeReport("TCS", 5.0, trades=4, points=120))
+
+        assert counts == {'trades': 4, 'equity': 120}
+        trades = pq.read_table(self.output / "trades" / "symbol=TCS" / "part-0.parquet")
+        equity = pq.read_table(self.output / "equity" / "symbol=TCS" / "part-0.parquet")
+        assert trades.column('realized_pnl').to_pylist() == [0.0, 10.0, 20.0, 30.0]
+        assert trades.column('tags').to_pylist()[0] == ["t"]
+        assert equity.num_rows == 120
+
+    def test_partitions_read_as_one_dataset(self):
+        ds = pytest.importorskip("pyarrow.dataset")
+        for symbol in ("TCS", "INFY"):
+            write_symbol_partitions(self.output, symbol, FakeReport(symbol, 1.0, trades=2))
+
+        table = ds.dataset(self.output / "trades", format="parquet", partitioning="hive").to_table()
+        assert table.num_rows == 4
+        assert set(table.column('symbol').to_pylist()) == {"TCS", "INFY"}
@@ -0,0 +1,94 @@
+"""
+Benchmark suite tests.
+
+Tests cover:
+- Regression, improvement, new and missing statuses in baseline comparison
+- JSON round trip and schema checks for results files
+- Exit status of the compare command
+- Synthetic dataset shape and session timestamps
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from ..benchmarks.suite import (
+    DATASETS,
+    SCHEMA_VERSION,
+    compare,
+    load_results,
+    main,
+    save_results,
+    synthetic_dataset,
+)
+
+
+def results(**values):
+    return {
+        "schema": SCHEMA_VERSION,
+        "scale": 1.0,
+        "benchmarks": {name: {"value": value, "unit": "events/s", "higher_is_better": True}
+                       for name, value in values.items()},
+    }
+
+
+class TestCompare:
+    """Baseline comparison."""
+
+    def test_statuses(self):
+        baseline = results(slower=1000.0, faster=1000.0, steady=1000.0, dropped=1000.0)
+        current = results(slower=850.0, faster=1200.0, steady=950.0, added=10.0)
+        rows = {row["name"]: row for row in compare(baseline, current, threshold_pct=10)}
+
+        assert rows["slower"]["status"] == "regression"
+        assert rows["slower"]["change_pct"] == pytest.approx(-15.0)
+        assert rows["faster"]["status"] == "improved"
+        assert rows["steady"]["status"] == "ok"
+        assert rows["dropped"]["status"] == "missing"
+        assert rows["added"]["status"] == "new"
+
+    def test_lower_is_better_metrics(self):
+        baseline = results(latency=10.0)
+        current = results(latency=12.0)
+        for doc in (baseline, current):
+            doc["benchmarks"]["latency"]["higher_is_better"] = False
+        assert compare(baseline, current, threshold_pct=10)[0]["status"] == "regression"
+
+    def test_compare_command_exit_status(self, tmp_path):
+        save_results(results(a=1000.0), tmp_path / "base.json")
+        save_results(results(a=980.0), tmp_path / "ok.json")
+        save_results(results(a=500.0), tmp_path / "slow.json")
+
+        assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "ok.json")]) == 0
+        assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "slow.json"), "--threshold", "20"]) == 1
+
+    def test_rejects_unknown_schema(self, tmp_path):
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"schema": 0, "benchmarks": {}}))
+        with pytest.raises(ValueError):
+            load_results(path)
+
+
+class TestDatasets:
+    """Synthetic dataset generation."""
+
+    def test_shape_and_sessions(self):
+        spec = DATASETS["single_10y_1m"].scaled(0.002)
+        data = synthetic_dataset(spec, seed=1)
+        columns = data["SYM000"]
+
+        assert spec.sessions == 5
+        assert len(columns["timestamp"]) == spec.rows == 5 * 375
+        # Sessions open at 09:15 IST (03:45 UTC) on weekdays
+        opens = columns["timestamp"][::375]
+        assert (opens.astype("datetime64[m]") - opens.astype("datetime64[D]") == np.timedelta64(225, "m")).all()
+        assert (np.is_busday(opens.astype("datetime64[D]"))).all()
+        assert (columns["high"] >= np.maximum(columns["open"], columns["close"])).all()
+        assert (columns["low"] <= np.minimum(columns["open"], columns["close"])).all()
+
+    def test_deterministic(self):
+        spec = DATASETS["universe_500_1y_1d"].scaled(0.02)
+        first, second = synthetic_dataset(spec, seed=3), synthetic_dataset(spec, seed=3)
+        assert len(first) == 500
+        np.testing.assert_array_equal(first["SYM499"]["close"], second["SYM499"]["close"])
@@ -0,0 +1,199 @@
+"""
+Checkpoint and resume tests for optimization runs.
+
+Tests cover:
+- Persisting evaluations and reloading them in a new store
+- Recovery from a partially written last record
+- Run keys changing with strategy, data and configuration
+- Walk-forward grid search skipping checkpointed (params, window) pairs
+- Progress and ETA reporting
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from ..checkpoint import CheckpointStore, ProgressTracker, entry_key, events_fingerprint, run_key
+from ..config import BacktestConfig, WalkForwardConfig
+from ..walk_forward import WalkForwardAnalyzer, WalkForwardEngine, WalkForwardWindow, WindowPerformance
+
+
+class MockStrategy:
+    """Strategy stand-in; only its identity matters for checkpoint keys."""
+
+    def __init__(self, fast: int = 10, slow: int = 20):
+        self.fast = fast
+        self.slow = slow
+
+
+class OtherStrategy(MockStrategy):
+    """A different strategy with the same parameters."""
+
+
+class MockBar:
+    def __init__(self, symbol: str, timestamp: datetime, close: float):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.open = self.high = self.low = self.close = close
+        self.volume = 1000.0
+
+
+def make_events(n: int = 300):
+    start = datetime(2024, 1, 1, 9, 15)
+    return [MockBar("TCS", start + timedelta(hours=i), 100.0 + i % 7) for i in range(n)]
+
+
+def make_windows(events, count: int = 4):
+    start = events[0].timestamp
+    windows = []
+    for i in range(count):
+        train_start = start + timedelta(hours=60 * i)
+        windows.append(WalkForwardWindow(
+            train_start, train_start + timedelta(hours=40),
+            train_start + timedelta(hours=40), train_start + timedelta(hours=60),
+        ))
+    return windows
+
+
+class CountingAnalyzer(WalkForwardAnalyzer):
+    """Analyzer whose window evaluation is a cheap deterministic function of the inputs."""
+
+    def __init__(self, *args, fail_after=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.evaluated = []
+        self.fail_after = fail_after
+
+    def _evaluate_window(self, params, window, select_events, train_only=False):
+        if self.fail_after is not None and len(self.evaluated) >= self.fail_after:
+            raise KeyboardInterrupt("killed")
+        self.evaluated.append((params['fast'], window.train_start))
+        train = len(select_events(window.train_start, window.train_end))
+        return WindowPerformance(train=params['fast'] * 0.1 + train, test=params['slow'] * 0.01)
+
+
+class TestCheckpointStore:
+    """Append-only checkpoint persistence."""
+
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_entries_survive_reopen(self):
+        with CheckpointStore(self.tmpdir.name, "run") as store:
+            store.put(entry_key({'fast': 5}, 0), WindowPerformance(train=1.5))
+            store.put(entry_key({'fast': 6}, 0), None)
+
+        reopened = CheckpointStore(self.tmpdir.name, "run")
+        assert len(reopened) == 2
+        assert reopened.get(entry_key({'fast': 5}, 0)) == WindowPerformance(train=1.5)
+        assert entry_key({'fast': 6}, 0) in reopened
+
+    def test_partial_last_record_is_ignored(self):
+        with CheckpointStore(self.tmpdir.name, "run") as store:
+            store.put("a", 1)
+        with open(store.path, "a") as f:
+            f.write('{"key": "b", "data": "gASV')  # killed mid-write
+
+        store = CheckpointStore(self.tmpdir.name, "run")
+        assert len(store) == 1
+        store.put("c", 3)
+        store.close()
+        assert CheckpointStore(self.tmpdir.name, "run").get("c") == 3
+
+    def test_run_key_depends_on_strategy_data_and_config(self):
+        events = make_events(50)
+        config = BacktestConfig(start=datetime(2024, 1, 1), end=datetime(2024, 2, 1))
+        base = run_key(MockStrategy, events_fingerprint(events), config)
+
+        assert run_key(MockStrategy, events_fingerprint(make_events(50)), config) == base
+        assert run_key(OtherStrategy, events_fingerprint(events), config) != base
+        changed = make_events(50)
+        changed[10].close += 0.01
+        assert run_key(MockStrategy, events_fingerprint(changed), config) != base
+        other_config = BacktestConfig(start=datetime(2024, 1, 1), end=datetime(2024, 2, 1), slippage_bps=2.0)
+        assert run_key(MockStrategy, events_fingerprint(events), other_config) != base
+
+    def test_entry_key_ignores_dict_order(self):
+        assert entry_key({'a': 1, 'b': 2}, 3) == entry_key({'b': 2, 'a': 1}, 3)
+
+
+class TestResumableGridSearch:
+    """Walk-forward optimization resuming from a checkpoint."""
+
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.events = make_events()
+        self.windows = make_windows(self.events)
+        self.base_config = BacktestConfig(start=datetime(2024, 1, 1), end=datetime(2024, 2, 1))
+        self.param_ranges = {'fast': [5, 10, 15], 'slow': [20, 30]}
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def make_analyzer(self, **kwargs):
+        return CountingAnalyzer(MockStrategy, self.base_config, WalkForwardConfig(window_size=10), self.param_ranges,
+                                checkpoint_dir=self.tmpdir.name, **kwargs)
+
+    def test_interrupted_run_resumes_where_it_stopped(self):
+        interrupted = self.make_analyzer(fail_after=9)
+        with pytest.raises(KeyboardInterrupt):
+            interrupted.run_parameter_optimization(self.events, self.windows)
+
+        resumed = self.make_analyzer()
+        param_sets = resumed.run_parameter_optimization(self.events, self.windows)
+
+        total = 6 * len(self.windows)
+        assert len(resumed.evaluated) == total - 9
+        reference = CountingAnalyzer(MockStrategy, self.base_config, WalkForwardConfig(window_size=10),
+                                     self.param_ranges).run_parameter_optimization(self.events, self.windows)
+        assert param_sets == reference
+
+    def test_completed_run_is_not_reevaluated(self):
+        self.make_analyzer().run_parameter_optimization(self.events, self.windows)
+        rerun = self.make_analyzer()
+        rerun.run_parameter_optimization(self.events, self.windows)
+        assert rerun.evaluated == []
+
+    def test_changed_data_starts_fresh(self):
+        self.make_analyzer().run_parameter_optimization(self.events, self.windows)
+        self.events[5].close += 1
+        rerun = self.make_analyzer()
+        rerun.run_parameter_optimization(self.events, self.windows)
+        assert len(rerun.evaluated) == 6 * len(self.windows)
+
+    def test_parallel_run_writes_and_reuses_checkpoint(self):
+        engine = WalkForwardEngine(self.base_config, WalkForwardConfig(window_size=10), checkpoint_dir=self.tmpdir.name)
+        analyzer = self.make_analyzer()
+        param_sets = engine._run_parallel_optimization(analyzer, self.events, self.windows, max_workers=2)
+
+        reference = CountingAnalyzer(MockStrategy, self.base_config, WalkForwardConfig(window_size=10),
+                                     self.param_ranges).run_parameter_optimization(self.events, self.windows)
+        key = lambda ps: sorted(ps.params.items())
+        assert sorted(param_sets, key=key) == sorted(reference, key=key)
+        assert len(CheckpointStore.for_run(self.tmpdir.name, MockStrategy, self.events,
+                                           {'base_config': self.base_config,
+                                            'walk_config': WalkForwardConfig(window_size=10)})) == 24
+
+    def test_progress_reports_skipped_work(self):
+        self.make_analyzer().run_parameter_optimization(self.events, self.windows)
+        states = []
+        self.make_analyzer(progress=states.append).run_parameter_optimization(self.events, self.windows)
+        assert states[-1].completed == states[-1].total == 24
+        assert states[-1].skipped == 24
+
+
+class TestProgressTracker:
+    """Progress and ETA estimates."""
+
+    def test_eta_uses_fresh_work_only(self):
+        tracker = ProgressTracker(total=100)
+        tracker.skip(50)
+        assert tracker.state().eta_seconds is None
+        tracker._started -= 10.0  # pretend 10 seconds have passed
+        tracker.advance(10)
+        state = tracker.state()
+        assert state.eta_seconds == pytest.approx(40 * state.elapsed_seconds / 10)
+        assert "60/100" in state.format()
@@ -0,0 +1,237 @@
+"""
+Command line interface tests.
+
+Tests cover:
+- Walk-forward command driving the walk-forward engine end to end
+- Walk-forward backtests on tz-aware candles saved to OHLCVStorage
+- Parameter search without enumerating the full grid
+- Batch workers sharing indicator results through the on-disk cache
+- Strategy name resolution for walk-forward runs
+"""
+
+import json
+import pickle
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from common.market_data import Candle
+
+from ..cli import BacktestCLI, resolve_walk_forward_strategy
+from ..indicator_cache import IndicatorCache
+from ..walk_forward import ParameterGridSearch, WalkForwardAnalyzer, WindowPerformance
+
+
+class MockStrategy:
+    """Strategy stand-in taking its parameters as keywords."""
+
+    def __init__(self, fast: int = 10, slow: int = 20):
+        self.fast = fast
+        self.slow = slow
+
+
+class QuietStrategy:
+    """Bar strategy that never trades and records the bar timestamps it sees."""
+
+    seen = []
+
+    def __init__(self, fast: int = 1):
+        self.name = f"quiet_{fast}"
+
+    def on_bar(self, bar):
+        QuietStrategy.seen.append(bar.timestamp)
+        return None
+
+    def on_tick(self, tick):
+        return None
+
+
+def save_daily_candles(storage, symbol: str = "TCS", days: int = 120):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    storage.save_candles([
+        Candle(symbol=symbol, timestamp=start + timedelta(days=i), open=100.0 + i % 5, high=101.0 + i % 5,
+               low=99.0 + i % 5, close=100.5 + i % 5 + i * 0.1 * (-1) ** (i // 10), volume=1000.0, timeframe="1d")
+        for i in range(days)
+    ])
+
+
+class MockBar:
+    def __init__(self, symbol: str, timestamp: datetime, close: float):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.open = self.high = self.low = self.close = close
+        self.volume = 1000.0
+
+
+class MockStorage:
+    """Storage returning a daily series per symbol."""
+
+    def __init__(self, days: int = 120):
+        self.days = days
+        self.requests = []
+
+    def iter_candles(self, symbol, timeframe, start_date, end_date):
+        self.requests.append((symbol, timeframe, start_date, end_date))
+        start = datetime.fromisoformat(start_date)
+        for i in range(self.days):
+            yield MockBar(symbol, start + timedelta(days=i), 100.0 + i % 5)
+
+
+def score_window(self, params, window, select_events, train_only=False):
+    """Deterministic window evaluation in place of full backtests."""
+    if not select_events(window.train_start, window.train_end):
+        return None
+    return WindowPerformance(train=params['fast'] * 0.1, test=params['slow'] * 0.01, oos=params['fast'] * 0.01)
+
+
+class TestWalkForwardCommand:
+    """`walk-forward` command."""
+
+    @pytest.fixture
+    def cli(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(WalkForwardAnalyzer, '_evaluate_window', score_window)
+        cli = BacktestCLI()
+        cli.storage = MockStorage()
+        return cli
+
+    def run_command(self, cli, tmp_path, *extra):
+        cli.run([
+            'walk-forward',
+            '--strategy', f'{__name__}:MockStrategy',
+            '--symbols', 'TCS', 'INFY',
+            '--from-date', '2024-01-01',
+            '--to-date', '2024-04-30',
+            '--param-ranges', json.dumps({'fast': [5, 10], 'slow': [20, 30]}),
+            '--train-days', '30',
+            '--test-days', '15',
+            '--step-days', '15',
+            '--output', str(tmp_path / 'wf'),
+            '--checkpoint-dir', str(tmp_path / 'checkpoints'),
+            *extra,
+        ])
+        return json.loads((tmp_path / 'wf' / 'walk_forward_result.json').read_text())
+
+    def test_runs_engine_and_writes_result(self, cli, tmp_path, capsys):
+        result = self.run_command(cli, tmp_path)
+
+        assert [r[:2] for r in cli.storage.requests] == [('TCS', '1d'), ('INFY', '1d')]
+        assert len(result['parameter_sets']) == 4
+        assert result['best_params'] == {'fast': 10, 'slow': 20}
+        windows = result['windows']
+        assert len(windows) > 1
+        assert windows[1]['train_start'].startswith('2024-01-16')
+
+        output = capsys.readouterr().out
+        assert "Testing 4 of 4 parameter combinations (grid search)" in output
+        assert f"Progress: {4 * len(windows)}/{4 * len(windows)}" in output
+        assert "Total parameter sets: 4" in output
+
+    def test_search_runs_without_enumerating_grid(self, cli, tmp_path, capsys, monkeypatch):
+        def enumerate_grid(self):
+            raise AssertionError("full grid enumerated")
+        monkeypatch.setattr(ParameterGridSearch, 'generate_parameter_sets', enumerate_grid)
+
+        result = self.run_command(cli, tmp_path, '--search', 'random', '--search-candidates', '3', '--seed', '7')
+
+        assert len(result['parameter_sets']) == 3
+        assert "Testing 3 of 4 parameter combinations (random search)" in capsys.readouterr().out
+
+    def test_rerun_resumes_from_checkpoint(self, cli, tmp_path, capsys):
+        first = self.run_command(cli, tmp_path)
+        capsys.readouterr()
+
+        assert self.run_command(cli, tmp_path) == first
+        assert "from checkpoint" in capsys.readouterr().out
+
+    def test_unknown_strategy_exits(self, cli, capsys):
+        with pytest.raises(SystemExit):
+            cli.run(['walk-forward', '--strategy', 'missing', '--symbols', 'TCS', '--from-date', '2024-01-01',
+                     '--to-date', '2024-02-01', '--param-ranges', '{"fast": [5]}'])
+        assert "Unknown strategy: missing" in capsys.readouterr().err
+
+
+class TestWalkForwardOnStoredCandles:
+    """`walk-forward` command on candles read back from OHLCVStorage."""
+
+    def test_runs_backtests_on_utc_candles(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(QuietStrategy, 'seen', [])
+        cli = BacktestCLI()
+        save_daily_candles(cli.storage)
+
+        cli.run([
+            'walk-forward',
+            '--strategy', f'{__name__}:QuietStrategy',
+            '--symbols', 'TCS',
+            '--from-date', '2024-01-01',
+            '--to-date', '2024-04-29',
+            '--param-ranges', '{"fast": [1, 2]}',
+            '--train-days', '30',
+            '--test-days', '15',
+            '--step-days', '15',
+            '--output', str(tmp_path / 'wf'),
+            '--no-checkpoint',
+        ])
+
+        assert capsys.readouterr().err == ""
+        result = json.loads((tmp_path / 'wf' / 'walk_forward_result.json').read_text())
+        assert len(result['parameter_sets']) == 2
+        assert result['windows'][0]['train_start'] == '2024-01-01 00:00:00+00:00'
+        assert QuietStrategy.seen and all(ts.tzinfo is not None for ts in QuietStrategy.seen)
+
+
+class TestBatchIndicatorCache:
+    """Batch workers sharing indicator results through the on-disk cache tier."""
+
+    @pytest.fixture
+    def cli(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cli = BacktestCLI()
+        save_daily_candles(cli.storage)
+        return cli
+
+    def test_second_worker_reads_first_workers_indicators(self, cli, tmp_path):
+        cache = IndicatorCache(cache_dir=tmp_path / "indicators")
+        # Each worker process receives its own pickled copy of the cache
+        workers = [pickle.loads(pickle.dumps(cache)) for _ in range(2)]
+
+        reports = [
+            cli._run_single_backtest('sma_crossover', {'fast': 5, 'slow': 20}, ['TCS'],
+                                     date(2024, 1, 1), date(2024, 4, 29), indicator_cache=worker)
+            for worker in workers
+        ]
+
+        assert workers[0].stats()['misses'] == 2 and workers[0].disk_hits == 0
+        assert workers[1].disk_hits == 2 and workers[1].misses == 0
+        assert reports[0].metrics.total_trades > 0
+        assert reports[0].metrics == reports[1].metrics
+
+    def test_batch_command_fills_shared_cache(self, cli, tmp_path):
+        symbols_file = tmp_path / "symbols.txt"
+        symbols_file.write_text("TCS\n")
+
+        cli.run(['batch', '--strategy', 'sma_crossover', '--symbols-file', str(symbols_file),
+                 '--from-date', '2024-01-01', '--to-date', '2024-04-29',
+                 '--parameters', '{"fast": 5, "slow": 20}', '--workers', '2',
+                 '--output', str(tmp_path / 'batch'), '--indicator-cache-dir', str(tmp_path / 'indicators')])
+
+        summary = json.loads((tmp_path / 'batch' / 'batch_summary.json').read_text())
+        assert summary['successful'] == 1 and summary['total_trades'] > 0
+        assert len(list((tmp_path / 'indicators').rglob('*.npy'))) == 2
+        worker = IndicatorCache(cache_dir=tmp_path / 'indicators')
+        cli._run_single_backtest('sma_crossover', {'fast': 5, 'slow': 20}, ['TCS'],
+                                 date(2024, 1, 1), date(2024, 4, 29), indicator_cache=worker)
+        assert worker.disk_hits == 2 and worker.misses == 0
+
+
+class TestStrategyResolution:
+    """Walk-forward strategy names."""
+
+    def test_module_class_name(self):
+        assert resolve_walk_forward_strategy(f'{__name__}:MockStrategy').__name__ == 'MockStrategy'
+
+    def test_registered_strategy_takes_keyword_parameters(self):
+        strategy = resolve_walk_forward_strategy('ema_crossover')(short_period=5, long_period=15)
+        assert (strategy.config.short_period, strategy.config.long_period) == (5, 15)
+        assert strategy.name == 'ema_crossover'
@@ -0,0 +1,79 @@
+"""
+Equity curve downsampling tests.
+
+Tests cover:
+- Point budgets, endpoints and sorted indices for both methods
+- Min/max buckets keeping the global extremes
+- LTTB against a straightforward per-bucket reference
+"""
+
+import numpy as np
+import pytest
+
+from ..downsampling import downsample_indices, lttb_indices, minmax_indices
+
+
+def random_walk(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    x = np.int64(1_700_000_000) * 10**9 + np.arange(n, dtype=np.int64) * 60 * 10**9
+    return x, 100000 + np.cumsum(rng.normal(0, 50, n))
+
+
+def reference_lttb(x, y, threshold):
+    """Textbook LTTB with Python loops."""
+    x = [float(v - x[0]) for v in x]
+    y = list(map(float, y))
+    n = len(y)
+    every = (n - 2) / (threshold - 2)
+    bounds = [int(np.floor(1 + i * every)) for i in range(threshold - 1)]
+    bounds[-1] = n - 1
+    selected, a = [0], 0
+    for i in range(threshold - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        if i + 2 < len(bounds):
+            nxt = range(bounds[i + 1], bounds[i + 2])
+            avg_x = sum(x[j] for j in nxt) / len(nxt)
+            avg_y = sum(y[j] for j in nxt) / len(nxt)
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        areas = [abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])) for j in range(lo, hi)]
+        a = lo + int(np.argmax(areas))
+        selected.append(a)
+    return selected + [n - 1]
+
+
+class TestDownsampling:
+    """Index selection for chart downsampling."""
+
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_budget_and_endpoints(self, method):
+        x, y = random_walk(100_000)
+        indices = downsample_indices(x, y, 1000, method)
+
+        assert len(indices) <= 1000
+        assert indices[0] == 0 and indices[-1] == len(y) - 1
+        assert np.all(np.diff(indices) > 0)
+
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_short_curves_are_untouched(self, method):
+        x, y = random_walk(500)
+        np.testing.assert_array_equal(downsample_indices(x, y, 1000, method), np.arange(500))
+
+    def test_minmax_keeps_extremes(self):
+        x, y = random_walk(50_000, seed=4)
+        indices = minmax_indices(y, 200)
+
+        assert np.argmin(y) in indices
+        assert np.argmax(y) in indices
+        peak = np.maximum.accumulate(y)
+        sampled_peak = np.maximum.accumulate(y[indices])
+        assert ((sampled_peak - y[indices]) / sampled_peak).max() == pytest.approx(((peak - y) / peak).max())
+
+    def test_lttb_matches_reference(self):
+        x, y = random_walk(5_000, seed=2)
+        np.testing.assert_array_equal(lttb_indices(x, y, 300), reference_lttb(x, y, 300))
+
+    def test_unknown_method(self):
+        x, y = random_walk(10)
+        with pytest.raises(ValueError):
+            downsample_indices(x, y, 5, "median")
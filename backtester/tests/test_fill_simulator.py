@@ -0,0 +1,144 @@
+"""
+Fill simulator and cost model fast-path tests.
+
+Tests cover:
+- Float India fee paths (scalar and batch) against the Decimal reference
+- Batch market-order fills against the per-order Decimal path
+- Precomputed log-normal latency parameters and batched draws
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from common.market_data import Candle
+
+from ..costs import CostModel
+from ..fill_simulator import BacktestOrder, FillSimulator, LatencySimulator, OrderSide, OrderType
+from ..instrument_master import Instrument
+
+# Float64 fast paths must agree with Decimal arithmetic to this relative tolerance
+RTOL = 1e-9
+
+
+def make_candles(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 1000 + np.cumsum(rng.normal(0, 5, n))
+    start = datetime(2024, 1, 1, 3, 45, tzinfo=timezone.utc)
+    return [
+        Candle(
+            symbol=f"SYM{i % 7}",
+            timestamp=start + timedelta(minutes=i),
+            open=float(close[i] - 1),
+            high=float(close[i] + 3),
+            low=float(close[i] - 3),
+            close=float(close[i]),
+            volume=1000.0,
+            timeframe="1m",
+        )
+        for i in range(n)
+    ]
+
+
+def make_orders(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    types = ["cash", "futures", "options", "index"]
+    orders = []
+    for i in range(n):
+        instrument_type = types[i % len(types)]
+        instrument = None if instrument_type == "cash" else Instrument(
+            symbol=f"SYM{i % 7}", name="test", instrument_type=instrument_type
+        )
+        orders.append(BacktestOrder(
+            order_id=f"o{i}",
+            symbol=f"SYM{i % 7}",
+            side=OrderSide.BUY if i % 2 == 0 else OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            quantity=int(rng.integers(1, 5000)),
+            instrument=instrument,
+        ))
+    return orders
+
+
+class TestIndiaFeeFastPath:
+    """Float fee paths against Decimal arithmetic."""
+
+    def setup_method(self):
+        self.cost_model = CostModel()
+        # Spans values on both sides of the brokerage cap
+        self.values = np.geomspace(10.0, 5e7, 200)
+
+    @pytest.mark.parametrize("instrument_type", ["cash", "futures", "options", "index"])
+    @pytest.mark.parametrize("is_delivery", [False, True])
+    def test_batch_matches_decimal(self, instrument_type, is_delivery):
+        expected = [
+            float(self.cost_model.total_fees_india(instrument_type, Decimal(str(v)), is_delivery))
+            for v in self.values
+        ]
+        batch = self.cost_model.total_fees_india_batch(self.values, instrument_type, is_delivery)
+        scalar = [self.cost_model.total_fees_india_fast(instrument_type, v, is_delivery) for v in self.values]
+
+        np.testing.assert_allclose(batch, expected, rtol=RTOL)
+        np.testing.assert_allclose(scalar, expected, rtol=RTOL)
+
+    def test_batch_with_mixed_types(self):
+        types = np.array(["cash", "futures", "options", "index"] * 50)
+        batch = self.cost_model.total_fees_india_batch(self.values, types)
+        expected = [self.cost_model.total_fees_india(t, float(v)) for v, t in zip(self.values, types)]
+        np.testing.assert_allclose(batch, expected, rtol=RTOL)
+
+    def test_float_dict_path_unchanged(self):
+        fees = self.cost_model.calculate_india_fees("cash", 100_000.0)
+        assert fees["brokerage"] == 20.0
+        assert fees["stt"] == pytest.approx(25.0)
+        assert all(isinstance(v, float) for v in fees.values())
+
+
+class TestBatchMarketOrders:
+    """process_market_orders against the per-order Decimal path."""
+
+    @pytest.mark.parametrize("fill_model", ["next_bar_open", "next_tick", "mid_price"])
+    def test_matches_per_order_path(self, fill_model):
+        n = 120
+        candles = make_candles(n)
+        previous = [None] + candles[:-1]
+        orders = make_orders(n)
+        atrs = np.where(np.arange(n) % 3 == 0, 0.0, np.linspace(1, 30, n))
+
+        reference = FillSimulator(CostModel(), fill_model, LatencySimulator(seed=11))
+        expected = [
+            reference.process_market_order(o, c, p, atr=a or None)
+            for o, c, p, a in zip(orders, candles, previous, atrs)
+        ]
+
+        fast = FillSimulator(CostModel(), fill_model, LatencySimulator(seed=11))
+        batch = fast.process_market_orders(orders, candles, previous, atrs)
+
+        np.testing.assert_allclose(batch.fill_prices, [float(r.fill_price) for r in expected], rtol=RTOL)
+        np.testing.assert_allclose(batch.fees, [float(r.fees) for r in expected], rtol=RTOL)
+        np.testing.assert_allclose(batch.slippage, [float(r.slippage) for r in expected], rtol=1e-6, atol=1e-9)
+        assert batch.timestamps == [r.timestamp for r in expected]
+
+        results = batch.to_fill_results()
+        assert [r.order_id for r in results] == [r.order_id for r in expected]
+
+    def test_length_mismatch_raises(self):
+        simulator = FillSimulator(CostModel())
+        with pytest.raises(ValueError):
+            simulator.process_market_orders(make_orders(3), make_candles(2))
+
+
+class TestLatencySimulator:
+    """Precomputed latency parameters."""
+
+    def test_batched_draws_match_sequential(self):
+        sequential = LatencySimulator(seed=5)
+        batched = LatencySimulator(seed=5)
+        np.testing.assert_array_equal([sequential.simulate_latency() for _ in range(50)], batched.simulate_latencies(50))
+
+    def test_parameter_updates_take_effect(self):
+        simulator = LatencySimulator(mean_latency_ms=50.0, std_dev_ms=25.0, seed=1)
+        simulator.mean_latency_ms = 500.0
+        assert np.mean(simulator.simulate_latencies(5000)) == pytest.approx(500.0, rel=0.05)
@@ -0,0 +1,131 @@
+"""
+Indicator cache tests.
+
+Tests cover:
+- Results match direct indicator calls and OHLCV column binding
+- LRU eviction under a byte budget and hit/miss counters
+- On-disk content-addressed store shared between cache instances
+"""
+
+import pickle
+import tempfile
+
+import numpy as np
+import pytest
+
+from indicators.realtime import average_true_range, bollinger_bands, moving_average_simple
+
+from ..indicator_cache import IndicatorCache, data_fingerprint
+
+
+def make_ohlcv(n: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return {
+        "open": close - 0.2,
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": rng.integers(100, 1000, n).astype(float),
+    }
+
+
+class TestIndicatorCache:
+    """Test in-memory caching behaviour."""
+
+    def setup_method(self):
+        self.data = make_ohlcv()
+
+    def test_matches_direct_indicator_calls(self):
+        cache = IndicatorCache()
+
+        sma = cache.get_indicator("sma", {"period": 20}, self.data["close"])
+        atr = cache.get_indicator("atr", {"period": 14}, self.data)
+        bands = cache.get_indicator("bollinger_bands", {"period": 20}, self.data)
+
+        np.testing.assert_array_equal(sma, moving_average_simple(self.data["close"], 20))
+        np.testing.assert_array_equal(atr, average_true_range(self.data["high"], self.data["low"], self.data["close"], 14))
+        for actual, expected in zip(bands, bollinger_bands(self.data["close"], 20)):
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_hit_miss_counters(self):
+        cache = IndicatorCache()
+
+        first = cache.get_indicator("ema", {"period": 10}, self.data)
+        second = cache.get_indicator("ema", {"period": 10}, self.data)
+        cache.get_indicator("ema", {"period": 12}, self.data)
+
+        assert second is first
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert not first.flags.writeable
+
+    def test_identical_data_shares_entries(self):
+        cache = IndicatorCache()
+        cache.get_indicator("sma", {"period": 5}, self.data["close"])
+        cache.get_indicator("sma", {"period": 5}, self.data["close"].copy())
+        assert cache.stats()["hits"] == 1
+
+    def test_lru_eviction_respects_byte_budget(self):
+        entry_bytes = moving_average_simple(self.data["close"], 10).nbytes
+        cache = IndicatorCache(max_bytes=2 * entry_bytes)
+
+        cache.get_indicator("sma", {"period": 10}, self.data["close"])
+        cache.get_indicator("ema", {"period": 10}, self.data["close"])
+        cache.get_indicator("sma", {"period": 10}, self.data["close"])  # sma becomes most recent
+        cache.get_indicator("wma", {"period": 10}, self.data["close"])  # evicts ema
+
+        assert cache.current_bytes <= cache.max_bytes
+        assert len(cache.cache) == 2
+        cache.get_indicator("sma", {"period": 10}, self.data["close"])
+        assert cache.stats()["hits"] == 2
+        cache.get_indicator("ema", {"period": 10}, self.data["close"])
+        assert cache.stats()["misses"] == 4
+
+    def test_unknown_indicator_and_missing_columns(self):
+        cache = IndicatorCache()
+        with pytest.raises(ValueError):
+            cache.get_indicator("no_such_indicator", {}, self.data["close"])
+        with pytest.raises(ValueError):
+            cache.get_indicator("atr", {}, self.data["close"])
+
+
+class TestIndicatorDiskCache:
+    """Test the on-disk tier shared across processes."""
+
+    def setup_method(self):
+        self.data = make_ohlcv(seed=1)
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_second_instance_reads_from_disk(self):
+        writer = IndicatorCache(cache_dir=self.tmpdir.name)
+        expected = writer.get_indicator("sma", {"period": 20}, self.data)
+        writer.get_indicator("macd", {}, self.data)
+
+        reader = IndicatorCache(cache_dir=self.tmpdir.name)
+        actual = reader.get_indicator("sma", {"period": 20}, self.data)
+        macd = reader.get_indicator("macd", {}, self.data)
+
+        np.testing.assert_array_equal(actual, expected)
+        assert len(macd) == 3
+        assert reader.stats()["disk_hits"] == 2
+        assert reader.stats()["misses"] == 0
+
+    def test_pickled_copy_drops_memory_tier(self):
+        cache = IndicatorCache(cache_dir=self.tmpdir.name)
+        cache.get_indicator("rsi", {"period": 14}, self.data)
+
+        worker_copy = pickle.loads(pickle.dumps(cache))
+
+        assert len(worker_copy.cache) == 0
+        worker_copy.get_indicator("rsi", {"period": 14}, self.data)
+        assert worker_copy.stats()["disk_hits"] == 1
+
+    def test_fingerprint_changes_with_content(self):
+        changed = {k: v.copy() for k, v in self.data.items()}
+        changed["close"][-1] += 1
+        assert data_fingerprint(self.data) != data_fingerprint(changed)
+        assert data_fingerprint(self.data) == data_fingerprint({k: v.copy() for k, v in self.data.items()})
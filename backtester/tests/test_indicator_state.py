@@ -0,0 +1,112 @@
+"""
+Streaming indicator state tests.
+
+Tests cover:
+- Exact agreement with the IndicatorLibrary batch functions at every bar
+- Flat (no-range) windows in the stochastic oscillator
+- BaseStrategy.calculate_indicators applying only new candles
+- Replay on a different or shorter history, and cached values for an empty list
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from common.market_data import Candle
+
+from ..indicator_state import IndicatorState, WindowExtreme
+from ..strategy_interface import ExampleStrategy, IndicatorLibrary
+
+
+def make_candles(n: int, seed: int = 0, flat_from: int = None) -> list:
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1, 3, 45, tzinfo=timezone.utc)
+    close = np.round(2500 + np.cumsum(rng.normal(0, 2, n)), 2)
+    candles = []
+    for i in range(n):
+        c = float(close[i])
+        high, low = round(c + rng.uniform(0, 3), 2), round(c - rng.uniform(0, 3), 2)
+        if flat_from is not None and i >= flat_from:
+            c = high = low = 2500.0
+        candles.append(Candle(symbol="RELIANCE", timestamp=start + timedelta(minutes=i), open=c, high=high,
+                              low=low, close=c, volume=float(rng.integers(100, 5000))))
+    return candles
+
+
+def batch_indicators(candles) -> dict:
+    closes = [Decimal(str(c.close)) for c in candles]
+    highs = [Decimal(str(c.high)) for c in candles]
+    lows = [Decimal(str(c.low)) for c in candles]
+    volumes = [Decimal(str(c.volume)) for c in candles]
+    result = {
+        'sma_20': IndicatorLibrary.sma(closes, 20),
+        'sma_50': IndicatorLibrary.sma(closes, 50),
+        'ema_12': IndicatorLibrary.ema(closes, 12),
+        'ema_26': IndicatorLibrary.ema(closes, 26),
+        'rsi_14': IndicatorLibrary.rsi(closes, 14),
+        'atr_14': IndicatorLibrary.atr(highs, lows, closes, 14),
+        'vwap': IndicatorLibrary.vwap(highs, lows, closes, volumes),
+    }
+    result['macd'], result['macd_signal'], result['macd_hist'] = IndicatorLibrary.macd(closes)
+    result['bb_middle'], result['bb_upper'], result['bb_lower'] = IndicatorLibrary.bollinger_bands(closes)
+    result['stoch_k'], result['stoch_d'] = IndicatorLibrary.stochastic_oscillator(highs, lows, closes)
+    return result
+
+
+class TestIndicatorState:
+    """Streaming values must equal the batch library on the same history."""
+
+    def test_matches_batch_at_every_bar(self):
+        candles = make_candles(80, seed=1)
+        state = IndicatorState()
+        for n, candle in enumerate(candles, start=1):
+            state.update(candle)
+            assert state.values() == batch_indicators(candles[:n]), f"mismatch after {n} candles"
+
+    def test_flat_windows(self):
+        candles = make_candles(60, seed=2, flat_from=40)
+        state = IndicatorState()
+        for n, candle in enumerate(candles, start=1):
+            state.update(candle)
+            if n in (42, 53, 54, 55, 60):
+                assert state.values() == batch_indicators(candles[:n])
+        assert state.values()['stoch_k'] == Decimal('50')
+        assert state.values()['stoch_d'] is None
+
+    @pytest.mark.parametrize("maximum", [True, False])
+    def test_window_extreme(self, maximum):
+        values = np.random.default_rng(3).integers(0, 20, 200)
+        window = WindowExtreme(7, maximum=maximum)
+        for i, value in enumerate(values.tolist()):
+            recent = values[max(0, i - 6): i + 1]
+            assert window.push(value) == (recent.max() if maximum else recent.min())
+
+
+class TestStrategyIndicators:
+    """BaseStrategy wiring of the streaming state."""
+
+    def setup_method(self):
+        self.candles = make_candles(120, seed=4)
+        self.strategy = ExampleStrategy("test", ["RELIANCE"])
+
+    def test_growing_history_reads_only_new_candles(self):
+        history = list(self.candles[:60])
+        self.strategy.calculate_indicators("RELIANCE", history)
+        for candle in self.candles[60:]:
+            history.append(candle)
+            # Everything before the last seen candle is off limits
+            visible = [None] * (len(history) - 2) + history[-2:]
+            values = self.strategy.calculate_indicators("RELIANCE", visible)
+        assert values == batch_indicators(self.candles)
+
+    def test_replays_other_history_and_keeps_cache_on_empty(self):
+        self.strategy.calculate_indicators("RELIANCE", self.candles)
+        other = make_candles(70, seed=5)
+        values = dict(self.strategy.calculate_indicators("RELIANCE", other))
+        assert values == batch_indicators(other)
+
+        shorter = self.candles[:55]
+        assert self.strategy.calculate_indicators("RELIANCE", shorter) == batch_indicators(shorter)
+        assert self.strategy.get_indicator("RELIANCE", "atr_14", []) == batch_indicators(shorter)['atr_14']
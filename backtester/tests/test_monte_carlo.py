@@ -0,0 +1,146 @@
+"""
+Monte Carlo robustness tests.
+
+Tests cover:
+- Shuffle and bootstrap simulations against a per-simulation loop
+- Seed reproducibility
+- Invariants: shuffled final equity, ruin detection, empty trade lists
+- Compounded (return-based) replay
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from ..monte_carlo import MonteCarloAnalyzer
+from ..portfolio_accounting import EquityPoint, PortfolioAccounting, TradeRecord
+from ..reporting import BacktestReporter
+
+START = date(2024, 1, 1)
+END = date(2026, 1, 1)
+
+
+def make_pnl(n: int = 200, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(100, 2000, n).round(2)
+
+
+def loop_simulation(pnl, indices, initial_capital):
+    """Max drawdown (%) and final equity of one resampled sequence, point by point."""
+    equity = peak = initial_capital
+    max_drawdown = 0.0
+    for i in indices:
+        equity += pnl[i]
+        peak = max(peak, equity)
+        max_drawdown = max(max_drawdown, (peak - equity) / peak * 100)
+    return max_drawdown, equity
+
+
+class TestMonteCarloAnalyzer:
+    """Batched simulations."""
+
+    def setup_method(self):
+        self.pnl = make_pnl()
+        self.capital = 100_000.0
+
+    @pytest.mark.parametrize("method", ["shuffle", "bootstrap"])
+    def test_matches_loop_reference(self, method):
+        analyzer = MonteCarloAnalyzer(n_simulations=50, seed=3, chunk_size=50)
+        result = analyzer.run_pnl(self.pnl, self.capital, START, END, method)
+
+        rng = np.random.default_rng(3)
+        n = len(self.pnl)
+        if method == "shuffle":
+            indices = rng.permuted(np.tile(np.arange(n), (50, 1)), axis=1)
+        else:
+            indices = rng.integers(0, n, size=(50, n))
+        expected = np.array([loop_simulation(self.pnl, row, self.capital) for row in indices])
+
+        np.testing.assert_allclose(result.max_drawdown_pct, expected[:, 0], rtol=1e-9)
+        np.testing.assert_allclose(result.final_equity, expected[:, 1], rtol=1e-9)
+
+    @pytest.mark.parametrize("method", ["shuffle", "bootstrap"])
+    def test_seed_reproducibility(self, method):
+        def simulate(seed):
+            analyzer = MonteCarloAnalyzer(n_simulations=2000, seed=seed, chunk_size=256)
+            return analyzer.run_pnl(self.pnl, self.capital, START, END, method)
+
+        first, second, other = simulate(11), simulate(11), simulate(12)
+        np.testing.assert_array_equal(first.max_drawdown_pct, second.max_drawdown_pct)
+        np.testing.assert_array_equal(first.final_equity, second.final_equity)
+        assert not np.array_equal(first.max_drawdown_pct, other.max_drawdown_pct)
+
+    def test_shuffle_preserves_final_equity(self):
+        result = MonteCarloAnalyzer(n_simulations=500, seed=0).run_pnl(self.pnl, self.capital, START, END, "shuffle")
+        np.testing.assert_allclose(result.final_equity, self.capital + self.pnl.sum())
+        assert np.ptp(result.cagr_pct) < 1e-9
+        assert result.cagr_pct[0] == pytest.approx(result.observed_cagr_pct)
+        assert np.ptp(result.max_drawdown_pct) > 0
+
+    def test_bootstrap_varies_final_equity(self):
+        result = MonteCarloAnalyzer(n_simulations=5000, seed=0).run_pnl(self.pnl, self.capital, START, END, "bootstrap")
+        assert np.ptp(result.final_equity) > 0
+        # Expected final equity is the observed total
+        standard_error = self.pnl.std() * np.sqrt(len(self.pnl)) / np.sqrt(5000)
+        assert abs(result.final_equity.mean() - (self.capital + self.pnl.sum())) < 4 * standard_error
+
+    def test_ruin_probability(self):
+        losses = np.full(20, -3000.0)
+        result = MonteCarloAnalyzer(n_simulations=100, seed=0, ruin_threshold_pct=50).run_pnl(
+            losses, self.capital, START, END, "bootstrap")
+        assert result.ruin_probability == 1.0
+        safe = MonteCarloAnalyzer(n_simulations=100, seed=0, ruin_threshold_pct=80).run_pnl(
+            losses, self.capital, START, END, "bootstrap")
+        assert safe.ruin_probability == 0.0
+
+    def test_compounded_replay(self):
+        analyzer = MonteCarloAnalyzer(n_simulations=200, seed=1, compound=True)
+        result = analyzer.run_pnl(self.pnl, self.capital, START, END, "shuffle")
+        # The observed sequence reproduces the actual P&L; reordering returns keeps their product
+        np.testing.assert_allclose(result.final_equity, self.capital + self.pnl.sum(), rtol=1e-9)
+
+    def test_empty_trade_list(self):
+        result = MonteCarloAnalyzer(n_simulations=10).run_pnl(np.empty(0), self.capital, START, END)
+        np.testing.assert_array_equal(result.final_equity, self.capital)
+        assert result.ruin_probability == 0.0
+        assert result.summary()['max_drawdown_pct']['p95'] == 0.0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            MonteCarloAnalyzer(n_simulations=0)
+        with pytest.raises(ValueError):
+            MonteCarloAnalyzer().run_pnl(self.pnl, self.capital, START, END, "jackknife")
+
+
+class TestReportInput:
+    """Simulations driven by a finished BacktestReport."""
+
+    def test_run_from_report(self):
+        pnl = make_pnl(60, seed=4)
+        start = datetime(2024, 1, 1, 10, 0)
+        portfolio = PortfolioAccounting(Decimal('100000'))
+        portfolio.equity_curve = [EquityPoint(start, Decimal('100000')),
+                                  EquityPoint(start + timedelta(days=365), Decimal(str(100000 + pnl.sum())))]
+        # Trades listed out of exit order; the analyzer replays them chronologically
+        portfolio.trade_log = [
+            TradeRecord(
+                symbol="TCS", side="BUY", quantity=1, entry_price=Decimal('100'), exit_price=Decimal('101'),
+                entry_time=start + timedelta(days=i), exit_time=start + timedelta(days=i, hours=1),
+                realized_pnl=Decimal(str(pnl[i])), fees=Decimal('0'),
+            )
+            for i in reversed(range(len(pnl)))
+        ]
+        report = BacktestReporter(portfolio).generate_report(
+            run_id="mc", strategy_name="test", symbols=["TCS"],
+            start_date=date(2024, 1, 1), end_date=date(2025, 1, 1),
+        )
+
+        result = MonteCarloAnalyzer(n_simulations=100, seed=0).run(report, "shuffle")
+        expected_drawdown, expected_final = loop_simulation(pnl, range(len(pnl)), report.initial_capital)
+        assert result.n_trades == 60
+        assert result.observed_max_drawdown_pct == pytest.approx(expected_drawdown)
+        assert result.observed_cagr_pct == pytest.approx((expected_final / report.initial_capital - 1) * 100, rel=1e-2)
+        summary = result.summary()
+        assert summary['n_simulations'] == 100
+        assert set(summary['max_drawdown_pct']) == {'mean', 'std', 'p5', 'p25', 'p50', 'p75', 'p95'}
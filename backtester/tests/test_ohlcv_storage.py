@@ -0,0 +1,323 @@
+"""
+OHLCV storage tests.
+
+Tests cover:
+- Arrow table / NumPy column loading with timestamp pushdown
+- Candle compatibility shim and lazy per-day iteration
+- Append-only delta files, transparent keep-last merging and compaction
+- Data-availability manifest maintained on write, delete and compaction
+"""
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from common.market_data import Candle
+
+from ..ohlcv_manifest import MANIFEST_FILE, file_checksum
+from ..ohlcv_storage import DataAvailabilityIndex, OHLCVStorage
+
+
+def make_candles(symbol: str, start: datetime, count: int, step: timedelta, base: float = 100.0):
+    return [
+        Candle(
+            symbol=symbol,
+            timestamp=start + step * i,
+            open=base + i,
+            high=base + i + 1,
+            low=base + i - 1,
+            close=base + i + 0.5,
+            volume=1000 + i,
+            timeframe="1m",
+            source="test",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def storage():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield OHLCVStorage(tmpdir)
+
+
+class TestArrowLoading:
+    """Test Arrow-native loading paths."""
+
+    def test_load_table_filters_date_range(self, storage):
+        start = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+        storage.save_candles(make_candles("RELIANCE", start, 12, timedelta(hours=6)))
+
+        table = storage.load_table("RELIANCE", "1m", "2024-01-02", "2024-01-02")
+
+        assert table.num_rows == 4
+        days = {ts.date().isoformat() for ts in table.column("timestamp").to_pylist()}
+        assert days == {"2024-01-02"}
+
+    def test_load_arrays_returns_sorted_numpy_columns(self, storage):
+        start = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+        candles = make_candles("TCS", start, 10, timedelta(minutes=1))
+        storage.save_candles(list(reversed(candles)))
+
+        arrays = storage.load_arrays("TCS", "1m", "2024-01-01", "2024-01-01", columns=["close"])
+
+        assert set(arrays) == {"timestamp", "close"}
+        assert arrays["timestamp"].dtype == np.dtype("datetime64[ns]")
+        np.testing.assert_array_equal(arrays["close"], [c.close for c in candles])
+
+    def test_missing_symbol_returns_empty(self, storage):
+        assert storage.load_table("NONE", "1m", "2024-01-01", "2024-01-31").num_rows == 0
+        assert storage.load_candles("NONE", "1m", "2024-01-01", "2024-01-31") == []
+
+    def test_load_candles_shim_round_trips(self, storage):
+        start = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+        candles = make_candles("INFY", start, 5, timedelta(minutes=1))
+        storage.save_candles(candles)
+
+        loaded = storage.load_candles("INFY", "1m", "2024-01-01", "2024-01-01")
+
+        assert loaded == candles
+
+    def test_iter_candles_matches_load_candles(self, storage):
+        start = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+        storage.save_candles(make_candles("SBIN", start, 20, timedelta(hours=5)))
+
+        streamed = list(storage.iter_candles("SBIN", "1m", "2024-01-01", "2024-01-04"))
+
+        assert streamed == storage.load_candles("SBIN", "1m", "2024-01-01", "2024-01-04")
+
+
+class TestDeltaAppends:
+    """Test append-only deltas and compaction."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+
+    def _partition(self, storage, symbol):
+        return storage.base_path / symbol / "1m" / "2024-01-01.parquet"
+
+    def test_append_writes_delta_without_rewriting_partition(self, storage):
+        storage.save_candles(make_candles("RELIANCE", self.start, 5, timedelta(minutes=1)))
+        partition = self._partition(storage, "RELIANCE")
+        mtime = partition.stat().st_mtime_ns
+
+        storage.save_candles(make_candles("RELIANCE", self.start + timedelta(minutes=5), 5, timedelta(minutes=1)))
+
+        assert partition.stat().st_mtime_ns == mtime
+        assert len(storage._delta_files("RELIANCE", "1m")["2024-01-01"]) == 1
+        assert storage.load_table("RELIANCE", "1m", "2024-01-01", "2024-01-01").num_rows == 10
+
+    def test_readers_dedupe_keep_last(self, storage):
+        storage.save_candles(make_candles("TCS", self.start, 5, timedelta(minutes=1)))
+        storage.save_candles(make_candles("TCS", self.start + timedelta(minutes=3), 4, timedelta(minutes=1), base=200.0))
+        storage.save_candles(make_candles("TCS", self.start + timedelta(minutes=4), 1, timedelta(minutes=1), base=300.0))
+
+        candles = storage.load_candles("TCS", "1m", "2024-01-01", "2024-01-01")
+
+        assert [c.timestamp for c in candles] == [self.start + timedelta(minutes=i) for i in range(7)]
+        assert [c.open for c in candles] == [100.0, 101.0, 102.0, 200.0, 300.0, 202.0, 203.0]
+        assert list(storage.iter_candles("TCS", "1m", "2024-01-01", "2024-01-01")) == candles
+
+    def test_compact_merges_deltas_into_partition(self, storage):
+        storage.save_candles(make_candles("INFY", self.start, 5, timedelta(minutes=1)))
+        for i in range(3):
+            storage.save_candles(make_candles("INFY", self.start + timedelta(minutes=4 + i), 1, timedelta(minutes=1), base=500.0))
+        before = storage.load_table("INFY", "1m", "2024-01-01", "2024-01-01")
+
+        assert storage.compact() == 1
+
+        assert storage._delta_files("INFY", "1m") == {}
+        after = storage.load_table("INFY", "1m", "2024-01-01", "2024-01-01")
+        assert after.equals(before)
+        assert storage.compact() == 0
+
+    def test_overwrite_discards_pending_deltas(self, storage):
+        storage.save_candles(make_candles("SBIN", self.start, 5, timedelta(minutes=1)))
+        storage.save_candles(make_candles("SBIN", self.start, 5, timedelta(minutes=1), base=200.0))
+
+        storage.save_candles(make_candles("SBIN", self.start, 2, timedelta(minutes=1), base=300.0), append=False)
+
+        candles = storage.load_candles("SBIN", "1m", "2024-01-01", "2024-01-01")
+        assert [c.open for c in candles] == [300.0, 301.0]
+        assert storage._delta_files("SBIN", "1m") == {}
+
+    def test_delta_directory_is_not_a_partition(self, storage):
+        storage.save_candles(make_candles("HDFC", self.start, 2, timedelta(minutes=1)))
+        storage.save_candles(make_candles("HDFC", self.start + timedelta(minutes=2), 2, timedelta(minutes=1)))
+        storage.save_candles(make_candles("HDFC", self.start + timedelta(days=1), 2, timedelta(minutes=1)))
+
+        assert storage.get_available_timeframes("HDFC") == ["1m"]
+        assert storage.get_date_range("HDFC", "1m") == (self.start.date(), (self.start + timedelta(days=1)).date())
+        assert storage.load_table("HDFC", "1m", "2024-01-01", "2024-01-02").num_rows == 6
+
+
+class TestManifest:
+    """Test the data-availability manifest."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15, tzinfo=timezone.utc)
+
+    def _populate(self, storage):
+        storage.save_candles(make_candles("RELIANCE", self.start, 10, timedelta(hours=6)))
+        storage.save_candles(make_candles("RELIANCE", self.start + timedelta(hours=1), 2, timedelta(minutes=1)))
+        storage.save_candles(make_candles("TCS", self.start + timedelta(days=3), 5, timedelta(minutes=1)))
+
+    def test_writes_are_recorded(self, storage):
+        self._populate(storage)
+
+        entries = storage.manifest.partitions("RELIANCE", "1m")
+        assert [(e.day, e.is_delta, e.num_rows) for e in entries] == [
+            ("2024-01-01", False, 3), ("2024-01-01", True, 2), ("2024-01-02", False, 4), ("2024-01-03", False, 3),
+        ]
+        first = entries[0]
+        path = storage.base_path / first.path
+        assert first.size_bytes == path.stat().st_size
+        assert first.checksum == file_checksum(path)
+        assert first.min_ts == int(np.datetime64(self.start.replace(tzinfo=None), "ns").astype(np.int64))
+        assert storage.manifest.stats("RELIANCE", "1m")["rows"] == 12
+
+    def test_queries_match_directory_scan(self, storage):
+        self._populate(storage)
+        scanned = OHLCVStorage(str(storage.base_path), use_manifest=False)
+
+        assert storage.get_available_symbols() == scanned.get_available_symbols() == ["RELIANCE", "TCS"]
+        assert storage.get_available_timeframes("TCS") == scanned.get_available_timeframes("TCS") == ["1m"]
+        for symbol in ("RELIANCE", "TCS", "NONE"):
+            assert storage.get_date_range(symbol, "1m") == scanned.get_date_range(symbol, "1m")
+
+    def test_compaction_and_overwrite_update_manifest(self, storage):
+        self._populate(storage)
+
+        storage.compact()
+        entries = storage.manifest.partitions("RELIANCE", "1m")
+        assert not any(e.is_delta for e in entries)
+        assert entries[0].num_rows == 5
+
+        storage.save_candles(make_candles("TCS", self.start + timedelta(days=3), 5, timedelta(minutes=1)))
+        storage.save_candles(make_candles("TCS", self.start + timedelta(days=3), 1, timedelta(minutes=1)), append=False)
+        assert [(e.is_delta, e.num_rows) for e in storage.manifest.partitions("TCS")] == [(False, 1)]
+
+    def test_existing_tree_is_indexed_once(self, storage):
+        unindexed = OHLCVStorage(str(storage.base_path / "tree"), use_manifest=False)
+        self._populate(unindexed)
+        assert not (unindexed.base_path / MANIFEST_FILE).exists()
+
+        indexed = OHLCVStorage(str(unindexed.base_path))
+        assert len(indexed.manifest.partitions()) == 5
+        assert indexed.get_date_range("TCS", "1m") == ((self.start + timedelta(days=3)).date(),) * 2
+
+    def test_verify_reports_changed_files(self, storage):
+        self._populate(storage)
+        assert storage.manifest.verify() == []
+
+        entry = storage.manifest.partitions("TCS")[0]
+        (storage.base_path / entry.path).write_bytes(b"corrupt")
+        assert storage.manifest.verify() == [entry.path]
+
+        (storage.base_path / entry.path).unlink()
+        assert storage.manifest.verify() == [entry.path]
+
+    def test_availability_index_and_quality_check(self, storage):
+        self._populate(storage)
+        index = DataAvailabilityIndex(storage)
+        index.build_index()
+
+        assert index.is_available("RELIANCE", "1m", "2024-01-01", "2024-01-03")
+        assert not index.is_available("TCS", "1m", "2024-01-01", "2024-01-04")
+        assert index.get_coverage_report()["available_timeframes"] == ["1m"]
+
+        assert storage.data_quality_check("TCS", "1m", "2024-01-01", "2024-01-02") == {"status": "no_data"}
+        quality = storage.data_quality_check("TCS", "1m", "2024-01-04", "2024-01-04")
+        assert quality["status"] == "ok"
+        assert quality["candle_count"] == 5
+        assert quality["date_range"][0] == self.start + timedelta(days=3)
+
+
+class TestRollups:
+    """Test on-the-fly timeframe rollups and their cache."""
+
+    def setup_method(self):
+        # 09:15 IST; one full NSE session of 1m bars
+        self.open = datetime(2024, 1, 2, 3, 45, tzinfo=timezone.utc)
+
+    def _session(self, storage, day_offset=0, base=100.0):
+        storage.save_candles(make_candles("RELIANCE", self.open + timedelta(days=day_offset), 375,
+                                          timedelta(minutes=1), base=base))
+
+    @pytest.mark.parametrize("timeframe, bars", [("5m", 75), ("15m", 25), ("1h", 7), ("1d", 1)])
+    def test_rollup_aligns_to_session(self, storage, timeframe, bars):
+        self._session(storage)
+
+        candles = storage.load_candles("RELIANCE", timeframe, "2024-01-02", "2024-01-02")
+
+        assert len(candles) == bars
+        assert candles[0].timestamp == self.open
+        assert all(c.timeframe == timeframe for c in candles)
+        if timeframe == "1h":
+            assert candles[-1].timestamp == self.open + timedelta(hours=6)
+        minute = storage.load_arrays("RELIANCE", "1m", "2024-01-02", "2024-01-02")
+        assert sum(c.volume for c in candles) == pytest.approx(minute["volume"].sum())
+        assert candles[0].open == minute["open"][0]
+        assert candles[-1].close == minute["close"][-1]
+        assert max(c.high for c in candles) == minute["high"].max()
+
+    def test_rollup_matches_pandas_resample(self, storage):
+        self._session(storage)
+        minute = storage.load_table("RELIANCE", "1m", "2024-01-02", "2024-01-02").to_pandas().set_index("timestamp")
+        expected = minute.resample("15min", offset="3h45min").agg(
+            {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+
+        rolled = storage.load_table("RELIANCE", "15m", "2024-01-02", "2024-01-02").to_pandas().set_index("timestamp")
+
+        np.testing.assert_allclose(rolled[expected.columns].to_numpy(), expected.to_numpy())
+
+    def test_stored_timeframe_wins(self, storage):
+        self._session(storage)
+        stored = make_candles("RELIANCE", self.open, 3, timedelta(minutes=5), base=500.0)
+        for candle in stored:
+            candle.timeframe = "5m"
+        storage.save_candles(stored)
+
+        assert storage.load_candles("RELIANCE", "5m", "2024-01-02", "2024-01-02") == stored
+
+    def test_rollups_are_cached_and_invalidated(self, storage):
+        self._session(storage)
+        self._session(storage, day_offset=1)
+        storage.load_table("RELIANCE", "1h", "2024-01-02", "2024-01-03")
+        cached = storage.base_path / "_derived" / "RELIANCE" / "1h" / "2024-01-02.parquet"
+        untouched = cached.with_name("2024-01-03.parquet")
+        mtimes = cached.stat().st_mtime_ns, untouched.stat().st_mtime_ns
+
+        again = storage.load_table("RELIANCE", "1h", "2024-01-02", "2024-01-03")
+        assert (cached.stat().st_mtime_ns, untouched.stat().st_mtime_ns) == mtimes
+
+        # Appending to the source day rebuilds only that day's rollup
+        late = make_candles("RELIANCE", self.open + timedelta(minutes=374), 1, timedelta(minutes=1), base=900.0)
+        storage.save_candles(late)
+        updated = storage.load_table("RELIANCE", "1h", "2024-01-02", "2024-01-03")
+        assert untouched.stat().st_mtime_ns == mtimes[1]
+        assert updated.column("close")[6].as_py() == late[0].close
+        assert updated.num_rows == again.num_rows == 14
+
+        # Compaction changes the files but not the rows; the rollup is rebuilt and unchanged
+        storage.compact()
+        assert storage.load_table("RELIANCE", "1h", "2024-01-02", "2024-01-03").equals(updated)
+        assert storage.get_available_symbols() == ["RELIANCE"]
+        assert storage.get_available_timeframes("RELIANCE") == ["1m"]
+
+    def test_iter_candles_and_scan_mode(self, storage):
+        self._session(storage)
+        self._session(storage, day_offset=1)
+        expected = storage.load_candles("RELIANCE", "15m", "2024-01-01", "2024-01-05")
+
+        assert list(storage.iter_candles("RELIANCE", "15m", "2024-01-01", "2024-01-05")) == expected
+        scanned = OHLCVStorage(str(storage.base_path), use_manifest=False)
+        assert scanned.get_available_symbols() == ["RELIANCE"]
+        assert scanned.load_candles("RELIANCE", "15m", "2024-01-01", "2024-01-05") == expected
+
+    def test_unrollable_timeframe_returns_empty(self, storage):
+        self._session(storage)
+        assert storage.load_table("RELIANCE", "2d", "2024-01-02", "2024-01-02").num_rows == 0
+        assert storage.load_table("RELIANCE", "1w", "2024-01-02", "2024-01-02").num_rows == 0
@@ -6,6 +6,7 @@ Tests cover:
 - Walk-forward parallel optimization
 - Memory growth monitoring during parallel runs
 - Worker cleanup verification
+- Shared-memory event store publishing and read-only worker attachment
 """
 
 import pytest
@@ -27,10 +28,12 @@ from ..walk_forward import (
     ParameterGridSearch, 
     ParameterSet,
     WalkForwardWindow,
-    WalkForwardConfig
+    WalkForwardConfig,
+    window_phase_slices,
 )
 from ..config import BacktestConfig
 from ..engine import EventBacktester
+from ..shared_data import SharedEventStore, SharedEventStoreHandle
 
 
 class MockStrategy:
@@ -81,6 +84,12 @@ def worker_function(params: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def shared_window_worker(handle: SharedEventStoreHandle, start: datetime, end: datetime) -> List[float]:
+    """Worker attaching to a shared event store by name."""
+    store = SharedEventStore.attach(handle)
+    return [e.close for e in store.events_between(start, end)]
+
+
 class TestProcessPoolExecutorMemory:
     """Test ProcessPoolExecutor memory usage."""
 
@@ -276,6 +285,26 @@ class TestWalkForwardWindows:
             assert window.train_start < window.train_end
             assert window.test_start < window.test_end
 
+    def test_window_slices_match_timestamp_filter(self):
+        """Bisected window slices select the same events as a timestamp filter."""
+        events = generate_test_events(200)
+        timestamps = [e.timestamp for e in events]
+        base = events[0].timestamp
+        windows = [
+            WalkForwardWindow(base, base + timedelta(hours=3), base + timedelta(hours=3), base + timedelta(hours=5),
+                              base + timedelta(hours=5, minutes=1), base + timedelta(hours=7)),
+            WalkForwardWindow(base - timedelta(days=1), base, base + timedelta(days=30), base + timedelta(days=31)),
+        ]
+
+        for window in windows:
+            train, test, oos = window_phase_slices(timestamps, window)
+            assert events[train] == [e for e in events if window.train_start <= e.timestamp <= window.train_end]
+            assert events[test] == [e for e in events if window.test_start <= e.timestamp <= window.test_end]
+            if window.oos_start:
+                assert events[oos] == [e for e in events if window.oos_start <= e.timestamp <= window.oos_end]
+            else:
+                assert oos is None
+
 
 class TestParallelWorkerCleanup:
     """Test that parallel workers are properly cleaned up."""
@@ -387,5 +416,58 @@ class TestParallelErrorHandling:
             assert len(results) >= 1
 
 
+class TestSharedEventStore:
+    """Test the shared-memory event store used by parallel walk-forward."""
+
+    def setup_method(self):
+        self.events = generate_test_events(50)
+
+    def test_round_trip(self):
+        from trading_engine.phase4.models import Tick
+
+        tick = Tick("TCS", self.events[-1].timestamp + timedelta(minutes=1), price=101.5, size=7.0)
+        with SharedEventStore.publish(self.events + [tick]) as store:
+            events = store.events()
+
+        assert len(events) == 51
+        assert [(e.symbol, e.timestamp, e.close) for e in events[:-1]] == \
+            [(e.symbol, e.timestamp, e.close) for e in self.events]
+        assert (events[-1].symbol, events[-1].price, events[-1].size) == ("TCS", 101.5, 7.0)
+
+    def test_events_between_matches_filter(self):
+        start = self.events[10].timestamp + timedelta(seconds=1)
+        end = self.events[30].timestamp
+
+        with SharedEventStore.publish(self.events) as store:
+            selected = store.events_between(start, end)
+
+        expected = [e for e in self.events if start <= e.timestamp <= end]
+        assert [e.timestamp for e in selected] == [e.timestamp for e in expected]
+
+    def test_columns_are_read_only(self):
+        with SharedEventStore.publish(self.events) as store:
+            with pytest.raises(ValueError):
+                store.columns["close"][0] = 0.0
+
+    def test_workers_attach_by_name(self):
+        start, end = self.events[5].timestamp, self.events[14].timestamp
+
+        with SharedEventStore.publish(self.events) as store:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(shared_window_worker, store.handle, start, end) for _ in range(4)]
+                results = [f.result() for f in futures]
+
+        expected = [e.close for e in self.events[5:15]]
+        assert results == [expected] * 4
+
+    def test_close_unlinks_block(self):
+        store = SharedEventStore.publish(self.events)
+        handle = store.handle
+        store.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedEventStore.attach(handle)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
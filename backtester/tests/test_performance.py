@@ -22,7 +22,7 @@ import os
 from ..account import BacktestAccount
 from ..fill_simulator import BacktestOrder, OrderSide, OrderType
 from ..risk_manager import BacktestRiskManager, RiskLimits
-from ..engine import EventBacktester
+from ..engine import EventBacktester, merge_event_streams
 from ..config import BacktestConfig
 from ..simulator import TradeSimulator
 from ..costs import CostModel
@@ -290,6 +290,44 @@ class TestPerformanceBenchmarks:
         assert duration < 2, f"Position sizing too slow: {duration}s"
 
 
+class TestEventStreamMerge:
+    """Test lazy k-way merging of per-symbol event series."""
+
+    def test_merge_matches_flatten_and_sort(self):
+        """Merged order should equal a stable sort of the flattened series."""
+        per_symbol = {}
+        for candle in generate_large_dataset(num_candles=200, num_symbols=4):
+            per_symbol.setdefault(candle.symbol, []).append(candle)
+
+        flattened = [c for series in per_symbol.values() for c in series]
+        expected = sorted(flattened, key=lambda c: c.timestamp)
+        merged = EventBacktester._normalize_events(per_symbol)
+
+        assert [id(c) for c in merged] == [id(c) for c in expected]
+
+    def test_merge_is_lazy_over_generators(self):
+        """Generators are consumed on demand, never flattened up front."""
+        consumed = {"count": 0}
+
+        def stream(symbol_idx):
+            for candle in generate_large_dataset(num_candles=1000, num_symbols=1):
+                consumed["count"] += 1
+                candle.symbol = f"STOCK{symbol_idx}"
+                yield candle
+
+        merged = merge_event_streams([stream(i) for i in range(3)])
+        first = [next(merged) for _ in range(5)]
+
+        assert len(first) == 5
+        assert consumed["count"] < 20
+
+    def test_out_of_order_generator_raises(self):
+        """A non time-ordered generator is rejected instead of silently misordered."""
+        candles = generate_large_dataset(num_candles=10, num_symbols=1)
+        with pytest.raises(ValueError):
+            list(merge_event_streams([iter(reversed(candles))]))
+
+
 class TestMemoryCleanup:
     """Test proper memory cleanup."""
 
@@ -0,0 +1,244 @@
+"""
+Array-state portfolio backtester tests.
+
+Tests cover:
+- Equity, fills and fees parity with the columnar engine on per-symbol targets
+- Incremental equity against a dict-of-positions loop that re-marks every bar
+- Average price and realized P&L through adds, partial exits and flips
+- Persistent targets, NaN "keep" entries and long-only clamping
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from ..config import BacktestConfig
+from ..costs import CostModel
+from ..portfolio_engine import ArrayPortfolio, PortfolioBacktester
+from ..vectorized import VectorizedBacktester
+from .columnar_helpers import ArrayStrategy, make_bars
+
+
+class ReplayStrategy:
+    """Cross-sectional strategy replaying the same per-symbol target arrays bar by bar."""
+
+    name = "replay"
+
+    def __init__(self, targets, symbols):
+        self.targets = [targets[s] for s in symbols]
+        self.bar_index = np.zeros(len(symbols), dtype=np.int64)
+
+    def on_prices(self, timestamp, updated, portfolio):
+        target = np.full(len(portfolio), np.nan)
+        for i in updated.tolist():
+            target[i] = self.targets[i][self.bar_index[i]]
+        self.bar_index[updated] += 1
+        return target
+
+
+class MomentumStrategy:
+    """Long the best and short the worst performers since the first bar, rebalanced every ``every`` steps."""
+
+    name = "momentum"
+
+    def __init__(self, k: int = 2, every: int = 5):
+        self.k = k
+        self.every = every
+        self.first = None
+        self.step = 0
+
+    def on_prices(self, timestamp, updated, portfolio):
+        if self.first is None:
+            self.first = portfolio.last_price.copy()
+        self.step += 1
+        if self.step % self.every:
+            return None
+        score = np.nan_to_num(portfolio.last_price / self.first - 1, nan=0.0)
+        order = np.argsort(score)
+        target = np.zeros(len(portfolio))
+        target[order[-self.k:]] = 10 + self.step % 7
+        target[order[:self.k]] = -(5 + self.step % 3)
+        return target
+
+
+def dict_reference(config, cost_model, data, strategy):
+    """Dict-of-positions loop (shorts allowed) that re-marks every open position after each timestamp."""
+    symbols = list(data)
+    events = sorted(
+        ((bars.timestamp[i], sid, bars.close[i]) for sid, bars in enumerate(data.values()) for i in range(len(bars))),
+        key=lambda e: e[0],
+    )
+    portfolio = ArrayPortfolio(symbols, config.initial_capital)  # only handed to the strategy for prices
+    cash = config.initial_capital
+    positions = {}  # symbol id -> {"qty", "avg"}
+    marks = {}
+    target = np.zeros(len(symbols))
+    equity = []
+    i = 0
+    while i < len(events):
+        ts = events[i][0]
+        batch = []
+        while i < len(events) and events[i][0] == ts:
+            batch.append(events[i])
+            i += 1
+        updated = np.array([sid for _, sid, _ in batch])
+        for _, sid, close in batch:
+            marks[sid] = close
+            portfolio.last_price[sid] = close
+        requested = strategy.on_prices(ts, updated, portfolio)
+        if requested is not None:
+            target = np.where(np.isnan(requested), target, requested)
+        for _, sid, close in batch:
+            held = positions.get(sid, {"qty": 0.0, "avg": 0.0})
+            trade = target[sid] - held["qty"]
+            if trade == 0:
+                continue
+            price = close + np.sign(trade) * cost_model.slippage_bps / 10_000 * close
+            commission = price * abs(trade) * cost_model.commission_rate
+            cash -= trade * price + commission + cost_model.fee_per_order + cost_model.fee_per_unit * abs(trade)
+            new = held["qty"] + trade
+            if held["qty"] == 0 or np.sign(held["qty"]) == np.sign(trade):
+                avg = (held["avg"] * abs(held["qty"]) + price * abs(trade)) / abs(new)
+            elif abs(trade) > abs(held["qty"]):
+                avg = price
+            else:
+                avg = held["avg"]
+            positions[sid] = {"qty": new, "avg": avg if new else 0.0}
+            marks[sid] = price
+        equity.append(cash + sum(p["qty"] * marks[sid] for sid, p in positions.items()))
+    return np.array(equity)
+
+
+class TestPortfolioParity:
+    """Results must agree with the columnar engine and a full re-mark loop."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15)
+        self.config = BacktestConfig(start=self.start, end=self.start + timedelta(days=1), initial_capital=100_000.0)
+        self.cost_model = CostModel(slippage_bps=2.0, commission_rate=0.0005, fee_per_order=1.0, fee_per_unit=0.01)
+        self.data = {
+            "RELIANCE": make_bars("RELIANCE", 300, seed=1, start=self.start),
+            "TCS": make_bars("TCS", 150, seed=2, start=self.start, step_minutes=2),
+            "INFY": make_bars("INFY", 100, seed=3, start=self.start + timedelta(minutes=1), step_minutes=3),
+        }
+        rng = np.random.default_rng(7)
+        self.targets = {
+            symbol: np.repeat(rng.integers(0, 20, len(bars) // 10 + 1).astype(float), 10)[: len(bars)]
+            for symbol, bars in self.data.items()
+        }
+
+    def test_matches_columnar_engine(self):
+        columnar = VectorizedBacktester(self.config, [ArrayStrategy(self.targets, self.data)],
+                                      self.cost_model).run(self.data)
+        result = PortfolioBacktester(self.config, ReplayStrategy(self.targets, list(self.data)),
+                                     self.cost_model).run(self.data)
+
+        # The columnar curve has one point per event; compare at the last event of each timestamp
+        last_of_step = np.flatnonzero(np.append(columnar.timestamps[1:] != columnar.timestamps[:-1], True))
+        np.testing.assert_array_equal(result.timestamps, columnar.timestamps[last_of_step])
+        np.testing.assert_allclose(result.equity, columnar.equity[last_of_step], rtol=1e-9)
+        np.testing.assert_allclose(result.cash, columnar.cash[last_of_step], rtol=1e-9)
+        assert result.fees_paid == pytest.approx(columnar.fees_paid, rel=1e-9)
+
+        for name in ("quantity", "fill_price", "fees", "pnl"):
+            np.testing.assert_allclose(result.fills[name], columnar.fills[name], rtol=1e-9, atol=1e-9)
+        assert result.fills["symbol"].tolist() == columnar.fills["symbol"].tolist()
+
+    def test_incremental_equity_matches_full_remark(self):
+        strategy = MomentumStrategy()
+        result = PortfolioBacktester(self.config, strategy, self.cost_model, allow_short=True).run(self.data)
+        expected = dict_reference(self.config, self.cost_model, self.data, MomentumStrategy())
+
+        np.testing.assert_allclose(result.equity, expected, rtol=1e-9)
+        assert (result.fills["quantity"] < 0).any()
+        assert (result.final_quantity < 0).any()
+
+
+class TestArrayPortfolio:
+    """Per-symbol accounting on the array state."""
+
+    def setup_method(self):
+        self.portfolio = ArrayPortfolio(["A", "B"], 1_000.0)
+        self.ids = np.array([0])
+        self.no_fees = np.zeros(1)
+
+    def trade(self, quantity: float, price: float) -> float:
+        self.portfolio.update_prices(self.ids, np.array([price]))
+        return float(self.portfolio.execute(self.ids, np.array([quantity]), np.array([price]),
+                                            self.no_fees, self.no_fees)[0])
+
+    def test_adds_reaverage_and_exits_realize(self):
+        self.trade(10, 100.0)
+        self.trade(10, 110.0)
+        assert self.portfolio.average_price[0] == pytest.approx(105.0)
+        assert self.trade(-5, 120.0) == pytest.approx(75.0)
+        assert self.portfolio.average_price[0] == pytest.approx(105.0)
+        assert self.trade(-15, 100.0) == pytest.approx(-75.0)
+        assert self.portfolio.quantity[0] == 0.0
+        assert self.portfolio.average_price[0] == 0.0
+        assert self.portfolio.equity == pytest.approx(1_000.0)
+
+    def test_flip_realizes_and_reenters_at_fill(self):
+        self.trade(10, 100.0)
+        assert self.trade(-15, 90.0) == pytest.approx(-100.0)
+        assert self.portfolio.quantity[0] == -5.0
+        assert self.portfolio.average_price[0] == pytest.approx(90.0)
+
+        self.portfolio.update_prices(self.ids, np.array([80.0]))
+        assert self.portfolio.unrealized_pnl()[0] == pytest.approx(50.0)
+        assert self.portfolio.equity == pytest.approx(1_000.0 - 100.0 + 50.0)
+
+    def test_revalue_matches_running_market_value(self):
+        rng = np.random.default_rng(0)
+        ids = np.array([0, 1])
+        for _ in range(500):
+            prices = 100 + rng.normal(0, 5, 2)
+            self.portfolio.update_prices(ids, prices)
+            trade = rng.integers(-3, 4, 2).astype(float)
+            self.portfolio.execute(ids, trade, prices, np.zeros(2), np.zeros(2))
+        running = self.portfolio.market_value
+        assert self.portfolio.revalue() == pytest.approx(running, rel=1e-12, abs=1e-9)
+
+
+class TestPortfolioTargets:
+    """Target handling in the portfolio engine."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15)
+        self.config = BacktestConfig(start=self.start, end=self.start + timedelta(hours=1))
+        self.data = {
+            "A": make_bars("A", 10, seed=1, start=self.start),
+            "B": make_bars("B", 5, seed=2, start=self.start, step_minutes=2),
+        }
+
+    def run(self, targets_by_step, allow_short=False):
+        class Scripted:
+            name = "scripted"
+            step = 0
+
+            def on_prices(self, timestamp, updated, portfolio):
+                target = targets_by_step.get(self.step)
+                self.step += 1
+                return None if target is None else np.array(target, dtype=float)
+
+        return PortfolioBacktester(self.config, Scripted(), allow_short=allow_short).run(self.data)
+
+    def test_target_waits_for_symbols_next_bar(self):
+        # Step 1 (09:16) has no bar for B; its target fills at 09:17
+        result = self.run({1: [3, 4]})
+        assert result.fills["symbol"].tolist() == ["A", "B"]
+        expected = np.array([self.start + timedelta(minutes=1), self.start + timedelta(minutes=2)], dtype="datetime64[ns]")
+        np.testing.assert_array_equal(result.fills["timestamp"], expected)
+
+    def test_nan_keeps_target_and_shorts_clamp(self):
+        result = self.run({0: [5, 2], 3: [np.nan, -4]})
+        assert result.fills["quantity"].tolist() == [5.0, 2.0, -2.0]
+        assert result.final_quantity.tolist() == [5.0, 0.0]
+
+        short = self.run({0: [5, 2], 3: [np.nan, -4]}, allow_short=True)
+        assert short.final_quantity.tolist() == [5.0, -4.0]
+
+    def test_rejects_wrong_shape(self):
+        with pytest.raises(ValueError):
+            self.run({0: [1, 2, 3]})
@@ -0,0 +1,255 @@
+"""
+Reporting metric tests.
+
+Tests cover:
+- Array metrics against the per-point loop formulas on daily equity curves
+- Daily resampling of intraday (minute) equity curves
+- Symbol, monthly and tag breakdowns against dictionary aggregation
+- Array-built reporters matching portfolio-built reporters
+- Downsampled JSON/HTML exports with a full-resolution Parquet sidecar
+"""
+
+import json
+import statistics
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from ..portfolio_accounting import EquityPoint, PortfolioAccounting, TradeRecord
+from ..reporting import BacktestReporter, EquityArrays, TradeArrays, datetimes_to_ns, resample_daily
+
+
+def make_portfolio(days: int = 300, trades: int = 80, seed: int = 0) -> PortfolioAccounting:
+    rng = np.random.default_rng(seed)
+    portfolio = PortfolioAccounting(Decimal('100000'))
+    equity = 100000 * np.cumprod(1 + rng.normal(0.0005, 0.01, days))
+    start = datetime(2024, 1, 1, 10, 0)
+    portfolio.equity_curve = [
+        EquityPoint(start + timedelta(days=i), Decimal(str(round(value, 2)))) for i, value in enumerate(equity)
+    ]
+    portfolio.trade_log = [
+        TradeRecord(
+            symbol=["RELIANCE", "TCS", "INFY"][i % 3], side="BUY", quantity=10,
+            entry_price=Decimal('100'), exit_price=Decimal('101'),
+            entry_time=start + timedelta(days=i * 3), exit_time=start + timedelta(days=i * 3, hours=4),
+            realized_pnl=Decimal(str(round(float(rng.normal(50, 400)), 2))), fees=Decimal('20'),
+            tags=[["breakout"], ["breakout", "gap"], []][i % 3],
+        )
+        for i in range(trades)
+    ]
+    return portfolio
+
+
+def loop_return_metrics(equity_curve, risk_free_rate: float = 0.0):
+    """Per-point return metrics, computed the way the reporter used to."""
+    returns = []
+    prev = float(equity_curve[0].equity)
+    for ep in equity_curve[1:]:
+        returns.append((float(ep.equity) - prev) / prev)
+        prev = float(ep.equity)
+    excess = [r - risk_free_rate / 252 for r in returns]
+    downside = [r - risk_free_rate / 252 for r in returns if r < risk_free_rate / 252]
+    return {
+        'volatility_pct': statistics.stdev(returns) * (252 ** 0.5) * 100,
+        'avg_daily_return_pct': statistics.mean(returns) * 100,
+        'sharpe_ratio': statistics.mean(excess) / statistics.stdev(excess) * (252 ** 0.5),
+        'sortino_ratio': statistics.mean(excess) / (statistics.stdev(downside) * (252 ** 0.5)),
+        'best_day_pct': max(returns) * 100,
+        'worst_day_pct': min(returns) * 100,
+    }
+
+
+class TestPerformanceMetrics:
+    """Vectorized metrics against loop references."""
+
+    def setup_method(self):
+        self.portfolio = make_portfolio()
+
+    @pytest.mark.parametrize("risk_free_rate", [0.0, 0.06])
+    def test_daily_curve_matches_per_point_formulas(self, risk_free_rate):
+        metrics = BacktestReporter(self.portfolio)._calculate_performance_metrics(risk_free_rate)
+        expected = loop_return_metrics(self.portfolio.equity_curve, risk_free_rate)
+
+        for name, value in expected.items():
+            assert getattr(metrics, name) == pytest.approx(value, rel=1e-9), name
+        assert metrics.trading_days == len(self.portfolio.equity_curve)
+        assert metrics.total_days == len(self.portfolio.equity_curve) - 1
+
+    def test_trade_metrics(self):
+        metrics = BacktestReporter(self.portfolio)._calculate_performance_metrics()
+        pnls = [float(t.realized_pnl) for t in self.portfolio.trade_log]
+        wins = [p for p in pnls if p > 0]
+        losses = [p for p in pnls if p < 0]
+
+        assert metrics.total_trades == len(pnls)
+        assert metrics.winning_trades == len(wins)
+        assert metrics.profit_factor == pytest.approx(sum(wins) / abs(sum(losses)))
+        assert metrics.largest_loss == min(losses)
+        assert metrics.expectancy == pytest.approx(sum(pnls) / len(pnls))
+
+    def test_trade_metrics_without_equity_curve(self):
+        self.portfolio.equity_curve = []
+        metrics = BacktestReporter(self.portfolio)._calculate_performance_metrics()
+        assert metrics.total_trades == len(self.portfolio.trade_log)
+        assert metrics.volatility_pct == 0.0
+
+    def test_array_reporter_matches_portfolio_reporter(self):
+        curve = EquityArrays.from_points(self.portfolio.equity_curve)
+        trades = TradeArrays.from_records(self.portfolio.trade_log)
+        from_arrays = BacktestReporter.from_arrays(curve.timestamps, curve.equity, trades, initial_capital=100000)
+        from_portfolio = BacktestReporter(self.portfolio)
+
+        expected = from_portfolio._calculate_performance_metrics()
+        actual = from_arrays._calculate_performance_metrics()
+        for name in ("total_return_pct", "cagr", "sharpe_ratio", "sortino_ratio", "win_rate_pct", "trading_days"):
+            assert getattr(actual, name) == pytest.approx(getattr(expected, name), rel=1e-12), name
+
+        peak = np.maximum.accumulate(curve.equity)
+        assert actual.max_drawdown_pct == pytest.approx(((peak - curve.equity) / peak).max() * 100)
+        assert from_arrays._calculate_symbol_breakdown() == from_portfolio._calculate_symbol_breakdown()
+
+    def test_reporter_follows_portfolio_updates(self):
+        reporter = BacktestReporter(self.portfolio)
+        before = reporter._calculate_performance_metrics().total_trades
+        self.portfolio.trade_log.append(self.portfolio.trade_log[0])
+        assert reporter._calculate_performance_metrics().total_trades == before + 1
+
+
+class TestDailyResampling:
+    """Daily resampling of intraday equity curves."""
+
+    def test_minute_curve_uses_daily_closes(self):
+        start = datetime(2024, 3, 4, 3, 45, tzinfo=timezone.utc)
+        timestamps, equity = [], []
+        for day in range(5):
+            for minute in range(375):
+                timestamps.append(start + timedelta(days=day, minutes=minute))
+                equity.append(100000 + day * 1000 + minute)
+        curve = EquityArrays(datetimes_to_ns(timestamps), equity)
+
+        daily = resample_daily(curve)
+
+        assert len(daily.days) == 5
+        np.testing.assert_array_equal(daily.close, [100374 + d * 1000 for d in range(5)])
+        # First day runs from the starting equity to its close
+        assert daily.returns[0] == pytest.approx(100374 / 100000 - 1)
+        assert len(daily.returns) == 5
+        assert str(daily.days[0]) == "2024-03-04"
+
+        metrics = BacktestReporter(equity=curve)._calculate_performance_metrics()
+        assert metrics.trading_days == 5
+        assert metrics.best_day_pct == pytest.approx(max(daily.returns) * 100)
+
+    def test_single_point_first_day_has_no_return(self):
+        ts = datetimes_to_ns([datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)])
+        daily = resample_daily(EquityArrays(ts, [100.0, 110.0, 99.0]))
+        np.testing.assert_allclose(daily.returns, [0.1, -0.1])
+        assert [str(d) for d in daily.return_days] == ["2024-01-02", "2024-01-03"]
+
+
+class TestBreakdowns:
+    """Grouped breakdowns against dictionary aggregation."""
+
+    def setup_method(self):
+        self.portfolio = make_portfolio(seed=3)
+        self.reporter = BacktestReporter(self.portfolio)
+
+    def test_symbol_breakdown(self):
+        expected = defaultdict(list)
+        for trade in self.portfolio.trade_log:
+            expected[trade.symbol].append(float(trade.realized_pnl))
+
+        breakdown = self.reporter._calculate_symbol_breakdown()
+
+        assert [b.symbol for b in breakdown] == list(expected)
+        for b in breakdown:
+            pnls = expected[b.symbol]
+            assert b.total_trades == len(pnls)
+            assert b.total_pnl == pytest.approx(sum(pnls))
+            assert b.win_rate_pct == pytest.approx(sum(p > 0 for p in pnls) / len(pnls) * 100)
+            assert b.profit_factor == pytest.approx(
+                sum(p for p in pnls if p > 0) / abs(sum(p for p in pnls if p < 0))
+            )
+
+    def test_monthly_breakdown(self):
+        expected = defaultdict(list)
+        for trade in self.portfolio.trade_log:
+            expected[f"{trade.exit_time.year}-{trade.exit_time.month:02d}"].append(float(trade.realized_pnl))
+
+        breakdown = self.reporter._calculate_monthly_breakdown()
+
+        assert [b.period for b in breakdown] == sorted(expected)
+        for b in breakdown:
+            assert b.total_trades == len(expected[b.period])
+            assert b.total_pnl == pytest.approx(sum(expected[b.period]))
+
+        # Risk columns come from the daily equity series of that month
+        january = [float(ep.equity) for ep in self.portfolio.equity_curve if ep.timestamp.month == 1]
+        returns = [b / a - 1 for a, b in zip(january, january[1:])]
+        peak = np.maximum.accumulate(january)
+        assert breakdown[0].volatility_pct == pytest.approx(statistics.stdev(returns) * 252 ** 0.5 * 100)
+        assert breakdown[0].max_drawdown_pct == pytest.approx(((peak - january) / peak).max() * 100)
+
+    def test_tag_breakdown(self):
+        expected = defaultdict(list)
+        for trade in self.portfolio.trade_log:
+            for tag in trade.tags:
+                expected[tag].append(float(trade.realized_pnl))
+
+        breakdown = self.reporter._calculate_tag_breakdown()
+
+        assert [b.tag for b in breakdown] == list(expected)
+        for b in breakdown:
+            assert b.total_trades == len(expected[b.tag])
+            assert b.total_pnl == pytest.approx(sum(expected[b.tag]))
+
+    def test_empty_trade_log(self):
+        reporter = BacktestReporter(make_portfolio(trades=0))
+        assert reporter._calculate_symbol_breakdown() == []
+        assert reporter._calculate_monthly_breakdown() == []
+        assert reporter._calculate_tag_breakdown() == []
+
+
+class TestReportExports:
+    """Downsampled JSON/HTML exports with a full-resolution Parquet sidecar."""
+
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output = Path(self.tmpdir.name)
+        n = 50_000
+        timestamps = np.int64(1_704_000_000) * 10**9 + np.arange(n, dtype=np.int64) * 60 * 10**9
+        equity = 100000 * np.cumprod(1 + np.random.default_rng(7).normal(0, 1e-4, n))
+        self.reporter = BacktestReporter.from_arrays(timestamps, equity, max_chart_points=500)
+        self.report = self.reporter.generate_report("run", "test", ["TCS"], date(2024, 1, 1), date(2024, 2, 1))
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def test_json_is_downsampled_with_sidecar(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = self.output / "report.json"
+        self.reporter.export_json(self.report, str(path))
+
+        data = json.loads(path.read_text())
+        assert len(data['equity_curve']) <= 500
+        assert data['equity_curve_points'] == 50_000
+        assert max(p['drawdown_pct'] for p in data['equity_curve']) == pytest.approx(self.report.metrics.max_drawdown_pct)
+
+        table = pq.read_table(self.output / data['equity_curve_file'])
+        assert table.num_rows == 50_000
+        np.testing.assert_array_equal(table.column('equity').to_numpy(), self.report.equity_arrays.equity)
+
+    def test_html_embeds_chart_and_links_sidecar(self):
+        pytest.importorskip("pyarrow")
+        path = self.output / "report.html"
+        self.reporter.generate_html_report(self.report, str(path))
+
+        html = path.read_text()
+        assert "<polyline" in html
+        assert 'href="report.equity.parquet"' in html
+        assert (self.output / "report.equity.parquet").exists()
@@ -0,0 +1,219 @@
+"""
+Adaptive parameter search tests.
+
+Tests cover:
+- Indexed decoding of the parameter space in grid order
+- Determinism of random, halving and model-based search under a seed
+- Successive halving budget schedule and compute reduction
+- Walk-forward integration: budgeted training windows and checkpoint reuse
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from itertools import product
+
+import numpy as np
+import pytest
+
+from ..config import BacktestConfig, WalkForwardConfig
+from ..search import (
+    GridSearch,
+    ParameterSpace,
+    RandomSearch,
+    SuccessiveHalving,
+    create_search,
+)
+from ..walk_forward import ParameterGridSearch, WalkForwardAnalyzer, WalkForwardWindow, WindowPerformance, budget_window
+
+SIX_PARAMS = {f"p{i}": list(range(10)) for i in range(6)}
+
+
+def quadratic(params, budget=1.0):
+    """Smooth objective peaking at p_i == 7; partial budgets see a noisy version."""
+    score = -sum((v - 7) ** 2 for v in params.values())
+    return score + (1.0 - budget) * 0.5 * params.get("p0", 0)
+
+
+def batch_objective(calls=None):
+    def evaluate(candidates, budget):
+        if calls is not None:
+            calls.append((len(candidates), budget))
+        return [quadratic(p, budget) for p in candidates]
+    return evaluate
+
+
+class TestParameterSpace:
+    """Index-based access to the Cartesian product."""
+
+    def test_decode_matches_product_order(self):
+        ranges = {"a": [1, 2, 3], "b": ["x", "y"], "c": [0.1, 0.2]}
+        space = ParameterSpace(ranges)
+        expected = [dict(zip(ranges, combo)) for combo in product(*ranges.values())]
+        assert space.size == len(expected) == ParameterGridSearch(ranges).count()
+        assert [space.decode(i) for i in range(space.size)] == expected
+
+    def test_positions_scale_to_unit_interval(self):
+        space = ParameterSpace({"a": [1, 2, 3], "b": [5, 6]})
+        np.testing.assert_array_equal(space.positions([0, 5]), [[0.0, 0.0], [1.0, 1.0]])
+
+    def test_sampling_large_space_is_distinct(self):
+        space = ParameterSpace(SIX_PARAMS)
+        indices = space.sample(500, np.random.default_rng(0))
+        assert len(np.unique(indices)) == 500
+        assert indices.max() < 1_000_000
+
+
+class TestSearchStrategies:
+    """Strategy behaviour on a synthetic objective."""
+
+    def test_grid_search_evaluates_everything(self):
+        ranges = {"a": [1, 2, 3], "b": [4, 5]}
+        results = GridSearch(ranges, batch_size=4).run(batch_objective())
+        assert len(results) == 6
+        assert results[0][0] == {"a": 3, "b": 5}
+
+    @pytest.mark.parametrize("name", ["random", "halving"])
+    def test_deterministic_under_seed(self, name):
+        first = create_search(name, SIX_PARAMS, n_candidates=81, seed=42).run(batch_objective())
+        second = create_search(name, SIX_PARAMS, n_candidates=81, seed=42).run(batch_objective())
+        other = create_search(name, SIX_PARAMS, n_candidates=81, seed=7).run(batch_objective())
+        assert first == second
+        assert first != other
+
+    def test_random_search_caps_at_space_size(self):
+        search = RandomSearch({"a": [1, 2, 3]}, n_samples=10, seed=0)
+        assert search.planned_evaluations() == 3
+        assert sorted(p["a"] for p, _ in search.run(batch_objective())) == [1, 2, 3]
+
+    def test_halving_schedule(self):
+        calls = []
+        search = SuccessiveHalving(SIX_PARAMS, n_candidates=729, min_budget=1 / 27, eta=3, seed=1)
+        search.run(batch_objective(calls))
+        assert [n for n, _ in calls] == [729, 243, 81, 27]
+        np.testing.assert_allclose([b for _, b in calls], [1 / 27, 1 / 9, 1 / 3, 1.0])
+        assert search.planned_evaluations() == 1080
+
+    def test_halving_reduces_compute_by_orders_of_magnitude(self):
+        search = SuccessiveHalving(SIX_PARAMS, seed=3)
+        grid_cost = ParameterSpace(SIX_PARAMS).size
+        assert search.budget_cost() == pytest.approx(108.0)
+        assert grid_cost / search.budget_cost() > 9000
+
+        # Survivors of the cheap rungs should be near the optimum
+        results = search.run(batch_objective())
+        assert results[0][1] >= -10
+
+    def test_halving_keeps_nan_scores_last(self):
+        def evaluate(candidates, budget):
+            return [float("nan") if p["a"] == 2 else p["a"] for p in candidates]
+
+        results = SuccessiveHalving({"a": [0, 1, 2, 3]}, n_candidates=4, min_budget=0.5, eta=2, seed=0).run(evaluate)
+        assert [p["a"] for p, _ in results] == [3, 1]
+
+    def test_invalid_settings_raise(self):
+        with pytest.raises(ValueError):
+            SuccessiveHalving(SIX_PARAMS, min_budget=0)
+        with pytest.raises(ValueError):
+            create_search("annealing", SIX_PARAMS)
+
+    def test_model_based_search_is_deterministic(self):
+        pytest.importorskip("sklearn")
+        ranges = {"a": list(range(10)), "b": list(range(10))}
+        first = create_search("model", ranges, n_candidates=24, seed=5).run(batch_objective())
+        second = create_search("model", ranges, n_candidates=24, seed=5).run(batch_objective())
+        assert first == second
+        assert len(first) == 24
+        assert len({tuple(p.values()) for p, _ in first}) == 24
+        assert first[0][1] >= -2
+
+
+class MockStrategy:
+    def __init__(self, fast: int = 10, slow: int = 20):
+        self.fast = fast
+        self.slow = slow
+
+
+class MockBar:
+    def __init__(self, symbol: str, timestamp: datetime, close: float):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.open = self.high = self.low = self.close = close
+        self.volume = 1000.0
+
+
+class ScoringAnalyzer(WalkForwardAnalyzer):
+    """Analyzer scoring each window from its parameters and training-slice length."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def _evaluate_window(self, params, window, select_events, train_only=False):
+        train = len(select_events(window.train_start, window.train_end))
+        self.calls.append((params['fast'], train, train_only))
+        result = WindowPerformance(train=-abs(params['fast'] - 6) + 0.001 * train)
+        if not train_only:
+            result.test = params['slow'] * 0.01
+        return result
+
+
+class TestWalkForwardSearch:
+    """Search strategies driving WalkForwardAnalyzer."""
+
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        start = datetime(2024, 1, 1, 9, 15)
+        self.events = [MockBar("TCS", start + timedelta(hours=i), 100.0) for i in range(200)]
+        self.windows = [
+            WalkForwardWindow(start + timedelta(hours=100 * i), start + timedelta(hours=100 * i + 80),
+                              start + timedelta(hours=100 * i + 80), start + timedelta(hours=100 * i + 99))
+            for i in range(2)
+        ]
+        self.ranges = {"fast": list(range(9)), "slow": [20, 30, 40]}
+        self.base_config = BacktestConfig(start=start, end=start + timedelta(hours=200))
+
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+
+    def make_analyzer(self, search, checkpoint_dir=None):
+        return ScoringAnalyzer(MockStrategy, self.base_config, WalkForwardConfig(window_size=10), self.ranges,
+                               checkpoint_dir=checkpoint_dir, search=search)
+
+    def test_budget_window_shortens_training_from_the_start(self):
+        window = self.windows[0]
+        short = budget_window(window, 0.25)
+        assert short.train_end == window.train_end
+        assert short.train_start == window.train_end - (window.train_end - window.train_start) * 0.25
+        assert short.test_start == window.test_start
+        assert budget_window(window, 1.0) is window
+
+    def test_halving_promotes_only_survivors_to_full_windows(self):
+        search = SuccessiveHalving(self.ranges, n_candidates=27, min_budget=1 / 9, eta=3, seed=0)
+        analyzer = self.make_analyzer(search)
+        param_sets = analyzer.run_parameter_optimization(self.events, self.windows)
+
+        assert len(param_sets) == 3
+        assert {ps.params['fast'] for ps in param_sets} == {6}
+        assert all(ps.test_performance > 0 for ps in param_sets)
+
+        partial = [c for c in analyzer.calls if c[2]]
+        full = [c for c in analyzer.calls if not c[2]]
+        assert len(partial) == (27 + 9) * len(self.windows)
+        assert len(full) == 3 * len(self.windows)
+        # Budgeted windows see a fraction of the training bars
+        assert max(c[1] for c in partial) < min(c[1] for c in full)
+
+    def test_search_resumes_from_checkpoint(self):
+        search = SuccessiveHalving(self.ranges, n_candidates=27, min_budget=1 / 9, eta=3, seed=0)
+        first = self.make_analyzer(search, self.tmpdir.name)
+        expected = first.run_parameter_optimization(self.events, self.windows)
+
+        second = self.make_analyzer(search, self.tmpdir.name)
+        assert second.run_parameter_optimization(self.events, self.windows) == expected
+        assert second.calls == []
+
+    def test_default_remains_full_grid(self):
+        analyzer = self.make_analyzer(None)
+        param_sets = analyzer.run_parameter_optimization(self.events, self.windows)
+        assert len(param_sets) == 27
+        assert not any(c[2] for c in analyzer.calls)
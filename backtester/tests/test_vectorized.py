@@ -0,0 +1,286 @@
+"""
+Columnar execution mode tests.
+
+Tests cover:
+- Equity curve parity with the bar-by-bar TradeSimulator loop
+- Fees, fills and realized P&L parity
+- Equity, fees and fills parity between EventBacktester.run and run_columnar
+- Reports built from the result arrays
+- NaN forward-fill and long-only clamping of target positions
+- Date-window filtering and Arrow/dict inputs
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from trading_engine.phase4.models import (
+    Bar,
+    OrderRequest,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    PortfolioState,
+    Signal,
+    SignalAction,
+)
+
+from ..config import BacktestConfig
+from ..costs import CostModel
+from ..engine import EventBacktester
+from ..risk_manager import RiskDecision, RiskDecisionType
+from ..simulator import TradeSimulator
+from ..vectorized import VectorizedBacktester
+from .columnar_helpers import ArrayStrategy, make_bars
+
+
+class TargetBarStrategy:
+    """Bar strategy emitting sized BUY/SELL signals that move each symbol to its precomputed target."""
+
+    def __init__(self, targets, name: str = "array"):
+        self.name = name
+        self.targets = targets
+        self.bar_index = {symbol: 0 for symbol in targets}
+        self.held = {symbol: 0.0 for symbol in targets}
+
+    def on_bar(self, bar: Bar):
+        i = self.bar_index[bar.symbol]
+        self.bar_index[bar.symbol] = i + 1
+        target = float(self.targets[bar.symbol][i])
+        delta = target - self.held[bar.symbol]
+        if delta == 0:
+            return None
+        self.held[bar.symbol] = target
+        action = SignalAction.BUY if delta > 0 else SignalAction.SELL
+        return [Signal(bar.symbol, action, size=abs(delta), timestamp=bar.timestamp)]
+
+    def on_tick(self, tick):
+        return None
+
+
+class ApproveAllRiskManager:
+    """Approves every order unchanged so fills depend only on the strategy's sizes."""
+
+    def evaluate_order(self, order, portfolio, timestamp, price, atr=None):
+        request = OrderRequest(
+            symbol=order.symbol,
+            side=OrderSide[order.side.name],
+            quantity=float(order.quantity),
+            order_type=OrderType.MARKET,
+            limit_price=float(price),
+        )
+        return RiskDecision(RiskDecisionType.ALLOW, request)
+
+
+def to_event_bars(data):
+    """Per-symbol ``Bar`` lists carrying the same values as the columnar data."""
+    return {
+        symbol: [
+            Bar(symbol, ts, o, h, l, c, v)
+            for ts, o, h, l, c, v in zip(bars.timestamp.astype("datetime64[us]").tolist(), bars.open.tolist(),
+                                          bars.high.tolist(), bars.low.tolist(), bars.close.tolist(),
+                                          bars.volume.tolist())
+        ]
+        for symbol, bars in data.items()
+    }
+
+
+def reference_loop(config: BacktestConfig, cost_model: CostModel, data, targets):
+    """Bar-by-bar reference using the same TradeSimulator the event loop uses."""
+    portfolio = PortfolioState(cash=config.initial_capital, daily_start_equity=config.initial_capital)
+    simulator = TradeSimulator(cost_model, portfolio=portfolio)
+    events = []
+    for symbol, bars in data.items():
+        for i in range(len(bars)):
+            ts = bars.timestamp[i].astype("datetime64[us]").astype(datetime)
+            events.append((ts, symbol, i, Bar(symbol, ts, bars.open[i], bars.high[i], bars.low[i], bars.close[i], bars.volume[i])))
+    events.sort(key=lambda e: e[0])
+
+    held = {symbol: 0.0 for symbol in data}
+    equity = [config.initial_capital]
+    fills = []
+    for ts, symbol, i, bar in events:
+        simulator.mark_to_market(bar)
+        delta = targets[symbol][i] - held[symbol]
+        if delta != 0:
+            order = OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY if delta > 0 else OrderSide.SELL,
+                quantity=abs(delta),
+                order_type=OrderType.MARKET,
+                limit_price=bar.close,
+            )
+            fill = simulator.execute(order, bar)
+            assert fill.status == OrderStatus.FILLED
+            fills.append(fill)
+            held[symbol] = targets[symbol][i]
+        equity.append(simulator.portfolio.equity)
+    return np.array(equity), fills, simulator.fees_paid
+
+
+class TestVectorizedParity:
+    """Columnar results must match the bar-by-bar simulator."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15)
+        self.config = BacktestConfig(
+            start=self.start,
+            end=self.start + timedelta(days=1),
+            initial_capital=100_000.0,
+            slippage_bps=2.0,
+            commission_rate=0.0005,
+            fee_per_order=1.0,
+            fee_per_unit=0.01,
+        )
+        self.cost_model = CostModel(slippage_bps=2.0, commission_rate=0.0005, fee_per_order=1.0, fee_per_unit=0.01)
+        self.data = {
+            "RELIANCE": make_bars("RELIANCE", 300, seed=1, start=self.start),
+            "TCS": make_bars("TCS", 150, seed=2, start=self.start, step_minutes=2),
+        }
+        rng = np.random.default_rng(7)
+        self.targets = {
+            symbol: np.repeat(rng.integers(0, 20, len(bars) // 10 + 1).astype(float), 10)[: len(bars)]
+            for symbol, bars in self.data.items()
+        }
+
+    def test_equity_curve_matches_reference(self):
+        result = VectorizedBacktester(self.config, [ArrayStrategy(self.targets, self.data)],
+                                      self.cost_model).run(self.data)
+        expected_equity, _, expected_fees = reference_loop(self.config, self.cost_model, self.data, self.targets)
+
+        actual = np.concatenate(([self.config.initial_capital], result.equity))
+        np.testing.assert_allclose(actual, expected_equity, rtol=1e-9)
+        assert result.fees_paid == pytest.approx(expected_fees, rel=1e-9)
+
+    def test_fills_match_reference(self):
+        result = VectorizedBacktester(self.config, [ArrayStrategy(self.targets, self.data)],
+                                      self.cost_model).run(self.data)
+        _, expected_fills, _ = reference_loop(self.config, self.cost_model, self.data, self.targets)
+
+        fills = result.order_fills()
+        assert len(fills) == len(expected_fills)
+        for actual, expected in zip(fills, expected_fills):
+            assert actual.order.symbol == expected.order.symbol
+            assert actual.order.side == expected.order.side
+            assert actual.filled_quantity == pytest.approx(expected.filled_quantity)
+            assert actual.fill_price == pytest.approx(expected.fill_price, rel=1e-12)
+            assert actual.pnl == pytest.approx(expected.pnl, rel=1e-9, abs=1e-9)
+
+
+class TestEventLoopParity:
+    """run_columnar must reproduce EventBacktester.run on the same bars and targets."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15)
+        self.config = BacktestConfig(
+            start=self.start,
+            end=self.start + timedelta(days=1),
+            initial_capital=100_000.0,
+            slippage_bps=2.0,
+            commission_rate=0.0005,
+            fee_per_order=1.0,
+            fee_per_unit=0.01,
+        )
+        self.cost_model = CostModel(slippage_bps=2.0, commission_rate=0.0005, fee_per_order=1.0, fee_per_unit=0.01)
+        self.data = {
+            "RELIANCE": make_bars("RELIANCE", 300, seed=1, start=self.start),
+            "TCS": make_bars("TCS", 150, seed=2, start=self.start, step_minutes=2),
+        }
+        rng = np.random.default_rng(11)
+        self.targets = {
+            symbol: np.repeat(rng.integers(0, 20, len(bars) // 10 + 1).astype(float), 10)[: len(bars)]
+            for symbol, bars in self.data.items()
+        }
+
+    def run_both(self):
+        event = EventBacktester(self.config, [TargetBarStrategy(self.targets)], cost_model=self.cost_model,
+                                risk_manager=ApproveAllRiskManager())
+        event.run(to_event_bars(self.data))
+        columnar = EventBacktester(self.config, [ArrayStrategy(self.targets, self.data)], cost_model=self.cost_model)
+        report = columnar.run_columnar(self.data)
+        return event, columnar, report
+
+    def test_equity_and_fees_match_event_loop(self):
+        event, columnar, report = self.run_both()
+
+        event_equity = np.array([equity for _, equity in event.equity_curve])
+        columnar_equity = np.array([equity for _, equity in columnar.equity_curve])
+        np.testing.assert_allclose(columnar_equity, event_equity, rtol=1e-9)
+        np.testing.assert_allclose(report.equity_arrays.equity, event_equity, rtol=1e-9)
+        assert [ts for ts, _ in columnar.equity_curve] == [ts for ts, _ in event.equity_curve]
+
+        assert columnar.simulator.fees_paid == pytest.approx(event.simulator.fees_paid, rel=1e-9)
+        assert report.equity_arrays.fees[-1] == pytest.approx(event.simulator.fees_paid, rel=1e-9)
+
+    def test_fills_match_event_loop(self):
+        event, columnar, _ = self.run_both()
+
+        assert len(columnar.trades) == len(event.trades)
+        for actual, expected in zip(columnar.trades, event.trades):
+            assert actual.timestamp == expected.timestamp
+            assert actual.order.symbol == expected.order.symbol
+            assert actual.order.side == expected.order.side
+            assert actual.filled_quantity == pytest.approx(expected.filled_quantity)
+            assert actual.fill_price == pytest.approx(expected.fill_price, rel=1e-12)
+            assert actual.pnl == pytest.approx(expected.pnl, rel=1e-9, abs=1e-9)
+
+    def test_report_built_from_arrays(self):
+        _, columnar, report = self.run_both()
+
+        closed = [fill for fill in columnar.trades if fill.order.side == OrderSide.SELL]
+        assert report.strategy_name == "array"
+        assert report.symbols == ["RELIANCE", "TCS"]
+        assert report.metrics.total_trades == len(closed)
+        assert len(report.equity_arrays) == len(columnar.equity_curve)
+        expected_return = (columnar.equity_curve[-1][1] / self.config.initial_capital - 1) * 100
+        assert report.metrics.total_return_pct == pytest.approx(expected_return)
+
+
+class TestVectorizedInputs:
+    """Input handling for the columnar engine."""
+
+    def setup_method(self):
+        self.start = datetime(2024, 1, 1, 9, 15)
+        self.bars = make_bars("INFY", 20, seed=3, start=self.start)
+
+    def test_nan_targets_forward_fill_and_clamp(self):
+        targets = np.full(20, np.nan)
+        targets[2] = 5
+        targets[10] = -3  # long-only: clamped to flat
+        config = BacktestConfig(start=self.start, end=self.start + timedelta(hours=1))
+        strategy = ArrayStrategy({"INFY": targets}, {"INFY": self.bars})
+        result = VectorizedBacktester(config, [strategy]).run({"INFY": self.bars})
+
+        positions = result.positions["INFY"]
+        assert positions[:2].tolist() == [0.0, 0.0]
+        assert positions[2:10].tolist() == [5.0] * 8
+        assert positions[10:].tolist() == [0.0] * 10
+        assert result.fills["quantity"].tolist() == [5.0, -5.0]
+
+    def test_window_filters_by_config_dates(self):
+        config = BacktestConfig(start=self.start + timedelta(minutes=5), end=self.start + timedelta(minutes=9))
+        targets = np.arange(20, dtype=float)
+        strategy = ArrayStrategy({"INFY": targets}, {"INFY": self.bars})
+        result = VectorizedBacktester(config, [strategy]).run({"INFY": self.bars})
+        assert len(result.equity) == 5
+        # Bars 5-9 keep their own targets rather than the first five
+        assert result.positions["INFY"].tolist() == [5.0, 6.0, 7.0, 8.0, 9.0]
+        assert result.fills["quantity"].tolist() == [5.0, 1.0, 1.0, 1.0, 1.0]
+
+    def test_dict_and_arrow_inputs(self):
+        pa = pytest.importorskip("pyarrow")
+        columns = {
+            "timestamp": self.bars.timestamp,
+            "open": self.bars.open,
+            "high": self.bars.high,
+            "low": self.bars.low,
+            "close": self.bars.close,
+            "volume": self.bars.volume,
+        }
+        config = BacktestConfig(start=self.start, end=self.start + timedelta(hours=1))
+        strategy = ArrayStrategy({"INFY": np.arange(20, dtype=float)}, {"INFY": self.bars})
+
+        from_dict = VectorizedBacktester(config, [strategy]).run({"INFY": columns})
+        from_arrow = VectorizedBacktester(config, [strategy]).run({"INFY": pa.table(columns)})
+        np.testing.assert_array_equal(from_dict.equity, from_arrow.equity)
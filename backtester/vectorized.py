@@ -0,0 +1,458 @@
+"""
+Columnar (vectorized) execution mode for backtesting.
+
+Runs strategies that emit whole position arrays over per-symbol OHLCV columns
+and computes fills, costs and the equity curve with NumPy array operations
+instead of walking one ``Bar`` object at a time.
+
+Fill and cost semantics mirror ``EventBacktester`` + ``TradeSimulator``:
+
+- orders fill on the signalling bar's close, adjusted by ``slippage_bps``
+- commission is ``fill_price * quantity * commission_rate``
+- extra fees are ``fee_per_order + fee_per_unit * quantity``
+- positions are long-only (sells are capped at the open quantity)
+- a position is marked at its fill price on the fill bar and at the close
+  on every other bar
+
+Risk-manager checks, position sizing and stop-loss / take-profit exits are
+not applied in columnar mode; strategies are expected to emit final target
+quantities.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+from trading_engine.phase4.models import (
+    OrderFill,
+    OrderRequest,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+
+from .config import BacktestConfig
+from .costs import CostModel
+from .indicator_cache import IndicatorCache, compute_indicator, data_fingerprint
+from .reporting import BacktestReport, BacktestReporter, TradeArrays
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def to_datetime64(value: datetime) -> np.datetime64:
+    """Convert a (possibly tz-aware) datetime into a naive UTC ``datetime64[ns]``."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "ns")
+
+
+@dataclass
+class ColumnarBars:
+    """OHLCV columns for a single symbol, sorted by timestamp."""
+
+    symbol: str
+    timestamp: np.ndarray  # datetime64[ns], naive UTC
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    # Shared across parameter sets and batch workers; see ``indicator``
+    indicator_cache: Optional[IndicatorCache] = field(default=None, repr=False, compare=False)
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.timestamp = np.asarray(self.timestamp, dtype="datetime64[ns]")
+        for name in OHLCV_COLUMNS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        lengths = {len(self.timestamp)} | {len(getattr(self, name)) for name in OHLCV_COLUMNS}
+        if len(lengths) != 1:
+            raise ValueError(f"Column lengths differ for {self.symbol}: {sorted(lengths)}")
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def indicator(self, name: str, **params) -> Any:
+        """
+        ``indicators.realtime`` result over these columns (e.g. ``bars.indicator('sma', period=20)``).
+
+        Goes through ``indicator_cache`` when one is attached, so every
+        strategy and parameter set run over the same bars computes each
+        (indicator, params) pair once.
+        """
+        columns = {column: getattr(self, column) for column in OHLCV_COLUMNS}
+        if self.indicator_cache is None:
+            return compute_indicator(name, columns, **params)
+        if self._fingerprint is None:
+            self._fingerprint = data_fingerprint(columns)
+        return self.indicator_cache.get_indicator(name, params, columns, fingerprint=self._fingerprint)
+
+    @classmethod
+    def from_columns(cls, symbol: str, columns: Mapping[str, Any]) -> "ColumnarBars":
+        """Build from a mapping of column name -> array (e.g. a dict of NumPy arrays)."""
+        timestamps = np.asarray(columns["timestamp"])
+        if timestamps.dtype.kind == "M":
+            # Drop any timezone by normalising through int64 nanoseconds
+            timestamps = timestamps.astype("datetime64[ns]")
+        volume = columns.get("volume")
+        return cls(
+            symbol=symbol,
+            timestamp=timestamps,
+            open=columns["open"],
+            high=columns["high"],
+            low=columns["low"],
+            close=columns["close"],
+            volume=np.zeros(len(timestamps)) if volume is None else np.nan_to_num(np.asarray(volume, dtype=np.float64)),
+        )
+
+    @classmethod
+    def from_arrow(cls, symbol: str, table) -> "ColumnarBars":
+        """Build from a ``pyarrow.Table`` with OHLCV columns."""
+        import pyarrow as pa
+
+        ts = table.column("timestamp")
+        if pa.types.is_timestamp(ts.type) and ts.type.tz is not None:
+            ts = ts.cast(pa.timestamp(ts.type.unit))
+        columns = {"timestamp": ts.to_numpy()}
+        for name in OHLCV_COLUMNS:
+            if name in table.column_names:
+                columns[name] = table.column(name).to_numpy(zero_copy_only=False)
+        return cls.from_columns(symbol, columns)
+
+    def window(self, start: np.datetime64, end: np.datetime64) -> "ColumnarBars":
+        """Return a view restricted to ``start <= timestamp <= end``."""
+        lo = int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = int(np.searchsorted(self.timestamp, end, side="right"))
+        return ColumnarBars(
+            symbol=self.symbol,
+            timestamp=self.timestamp[lo:hi],
+            open=self.open[lo:hi],
+            high=self.high[lo:hi],
+            low=self.low[lo:hi],
+            close=self.close[lo:hi],
+            volume=self.volume[lo:hi],
+            indicator_cache=self.indicator_cache,
+        )
+
+
+ColumnarInput = Union[ColumnarBars, Mapping[str, Any], Any]
+
+
+def coerce_bars(symbol: str, raw: ColumnarInput) -> ColumnarBars:
+    """Accept ``ColumnarBars``, a dict of arrays or an Arrow table."""
+    if isinstance(raw, ColumnarBars):
+        return raw
+    if isinstance(raw, Mapping):
+        return ColumnarBars.from_columns(symbol, raw)
+    if hasattr(raw, "column_names"):
+        return ColumnarBars.from_arrow(symbol, raw)
+    raise TypeError(f"Unsupported columnar input for {symbol}: {type(raw)!r}")
+
+
+class VectorizedStrategy(Protocol):
+    """Strategy that emits a whole array of target positions per symbol."""
+
+    name: str
+
+    def generate_positions(self, bars: ColumnarBars) -> np.ndarray:
+        """
+        Return target position quantities aligned with ``bars``.
+
+        NaN entries mean "keep the previous target".
+        """
+
+
+@dataclass
+class VectorizedResult:
+    """Array-based result of a columnar backtest run."""
+
+    timestamps: np.ndarray  # datetime64[ns], one per processed event
+    equity: np.ndarray
+    cash: np.ndarray
+    fills: Dict[str, np.ndarray]
+    fees_paid: float
+    positions: Dict[str, np.ndarray] = field(default_factory=dict)
+    fees: np.ndarray = field(default_factory=lambda: np.array([]))  # cumulative fees per event
+    initial_capital: float = 0.0
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @property
+    def final_equity(self) -> float:
+        return float(self.equity[-1]) if len(self.equity) else self.initial_capital
+
+    def equity_curve_tuples(self) -> List[tuple]:
+        """Equity curve in the ``EventBacktester`` tuple format, including the starting point."""
+        curve = [(self.start, self.initial_capital)]
+        stamps = self.timestamps.astype("datetime64[us]").astype(datetime)
+        curve.extend(zip(stamps.tolist(), self.equity.tolist()))
+        return curve
+
+    def order_fills(self) -> List[OrderFill]:
+        """Materialise fills as ``OrderFill`` objects (one per non-zero trade)."""
+        fills: List[OrderFill] = []
+        stamps = self.fills["timestamp"].astype("datetime64[us]").astype(datetime).tolist()
+        for i, symbol in enumerate(self.fills["symbol"].tolist()):
+            quantity = float(self.fills["quantity"][i])
+            order = OrderRequest(
+                symbol=symbol,
+                side=OrderSide.BUY if quantity > 0 else OrderSide.SELL,
+                quantity=abs(quantity),
+                order_type=OrderType.MARKET,
+                limit_price=float(self.fills["base_price"][i]),
+                strategy_name="vectorized",
+            )
+            fills.append(
+                OrderFill(
+                    order=order,
+                    filled_quantity=abs(quantity),
+                    fill_price=float(self.fills["fill_price"][i]),
+                    status=OrderStatus.FILLED,
+                    pnl=float(self.fills["pnl"][i]),
+                    timestamp=stamps[i],
+                )
+            )
+        return fills
+
+    def trade_arrays(self) -> TradeArrays:
+        """Closed trades (sells) as columns; each carries its realized P&L net of its own fees."""
+        closed = self.fills["quantity"] < 0
+        return TradeArrays(
+            symbols=self.fills["symbol"][closed].astype(str),
+            exit_times=self.fills["timestamp"][closed].astype("datetime64[ns]").astype(np.int64),
+            realized_pnl=self.fills["pnl"][closed],
+        )
+
+    def to_report(self, strategy_name: str = "vectorized", run_id: Optional[str] = None,
+                  parameters: Optional[Dict[str, Any]] = None, plot_path: str | None = None) -> BacktestReport:
+        """
+        Build a ``BacktestReport`` straight from the result arrays.
+
+        The equity curve starts with the initial capital at ``start`` and
+        carries cash and cumulative fee columns. When ``plot_path`` is given,
+        the HTML report with the equity chart is written there.
+        """
+        start_ns = to_datetime64(self.start).astype(np.int64) if self.start else None
+        timestamps = self.timestamps.astype("datetime64[ns]").astype(np.int64)
+        equity, cash, fees = self.equity, self.cash, self.fees
+        if start_ns is not None:
+            timestamps = np.concatenate(([start_ns], timestamps))
+            equity = np.concatenate(([self.initial_capital], equity))
+            cash = np.concatenate(([self.initial_capital], cash))
+            fees = np.concatenate(([0.0], fees))
+
+        reporter = BacktestReporter.from_arrays(
+            timestamps, equity, trades=self.trade_arrays(), initial_capital=self.initial_capital,
+            cash=cash, fees=fees,
+        )
+        report = reporter.generate_report(
+            run_id=run_id or f"columnar_{strategy_name}",
+            strategy_name=strategy_name,
+            symbols=sorted(self.positions),
+            start_date=self.start.date() if self.start else None,
+            end_date=self.end.date() if self.end else None,
+            parameters=parameters,
+        )
+        if plot_path:
+            reporter.generate_html_report(report, plot_path)
+        return report
+
+
+class VectorizedBacktester:
+    """Columnar backtester computing positions, fills, costs and equity with array operations."""
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        strategies: Sequence[VectorizedStrategy],
+        cost_model: CostModel | None = None,
+        indicator_cache: IndicatorCache | None = None,
+    ):
+        self.config = config
+        self.strategies = list(strategies)
+        self.indicator_cache = indicator_cache
+        self.cost_model = cost_model or CostModel(
+            slippage_bps=config.slippage_bps,
+            commission_rate=config.commission_rate,
+            fee_per_order=config.fee_per_order,
+            fee_per_unit=config.fee_per_unit,
+        )
+
+    def run(self, data: Mapping[str, ColumnarInput]) -> VectorizedResult:
+        """
+        Run all strategies over per-symbol columnar data.
+
+        Args:
+            data: Mapping of symbol -> ``ColumnarBars``, dict of NumPy arrays, or Arrow table.
+                Iteration order breaks timestamp ties, exactly like the event loop.
+
+        Returns:
+            VectorizedResult with per-event equity, cash and fill arrays.
+        """
+        start = to_datetime64(self.config.start)
+        end = to_datetime64(self.config.end)
+
+        stamps: List[np.ndarray] = []
+        cash_deltas: List[np.ndarray] = []
+        fee_deltas: List[np.ndarray] = []
+        value_deltas: List[np.ndarray] = []
+        fill_parts: List[Dict[str, np.ndarray]] = []
+        positions: Dict[str, np.ndarray] = {}
+        fees_paid = 0.0
+
+        for symbol, raw in data.items():
+            bars = coerce_bars(symbol, raw).window(start, end)
+            if len(bars) == 0:
+                continue
+            if self.indicator_cache is not None:
+                bars.indicator_cache = self.indicator_cache
+
+            target = self._target_positions(bars)
+            trade = np.diff(target, prepend=0.0)
+            cash_delta, fees, fill_price, pnl = self._simulate_fills(bars.close, trade, target)
+            fees_paid += float(fees.sum())
+
+            mark = np.where(trade != 0, fill_price, bars.close)
+            value = target * mark
+
+            stamps.append(bars.timestamp)
+            cash_deltas.append(cash_delta)
+            fee_deltas.append(fees)
+            value_deltas.append(np.diff(value, prepend=0.0))
+            positions[symbol] = target
+
+            traded = np.flatnonzero(trade)
+            fill_parts.append({
+                "timestamp": bars.timestamp[traded],
+                "symbol": np.full(len(traded), symbol, dtype=object),
+                "quantity": trade[traded],
+                "base_price": bars.close[traded],
+                "fill_price": fill_price[traded],
+                "fees": fees[traded],
+                "pnl": pnl[traded],
+            })
+
+        return self._assemble(stamps, cash_deltas, fee_deltas, value_deltas, fill_parts, positions, fees_paid)
+
+    def _target_positions(self, bars: ColumnarBars) -> np.ndarray:
+        """Sum strategy targets, forward-fill NaNs and clamp to long-only."""
+        total = np.zeros(len(bars))
+        for strategy in self.strategies:
+            raw = np.asarray(strategy.generate_positions(bars), dtype=np.float64)
+            if raw.shape != (len(bars),):
+                raise ValueError(
+                    f"Strategy {strategy.name} returned shape {raw.shape}, expected ({len(bars)},)"
+                )
+            total += _ffill(raw)
+        return np.maximum(total, 0.0)
+
+    def _simulate_fills(self, close: np.ndarray, trade: np.ndarray, target: np.ndarray):
+        """Return per-bar (cash_delta, fees, fill_price, realized_pnl) arrays."""
+        cm = self.cost_model
+        quantity = np.abs(trade)
+        slip = (cm.slippage_bps / 10_000) * close
+        fill_price = np.where(trade > 0, close + slip, np.where(trade < 0, close - slip, close))
+
+        notional = fill_price * quantity
+        commission = notional * cm.commission_rate
+        extra = np.where(quantity > 0, cm.fee_per_order + cm.fee_per_unit * quantity, 0.0)
+        extra = np.maximum(extra, 0.0)
+
+        # Paper engine debits commission from cash; TradeSimulator debits extra fees on top.
+        cash_delta = -np.sign(trade) * notional - commission - extra
+        fees = np.maximum(commission, 0.0) + extra
+
+        realized = _realized_pnl(fill_price, trade, target) - fees
+        return cash_delta, fees, fill_price, realized
+
+    def _assemble(self, stamps, cash_deltas, fee_deltas, value_deltas, fill_parts, positions,
+                  fees_paid) -> VectorizedResult:
+        initial = self.config.initial_capital
+        if not stamps:
+            empty = np.array([], dtype="datetime64[ns]")
+            return VectorizedResult(
+                timestamps=empty,
+                equity=np.array([]),
+                cash=np.array([]),
+                fills=_concat_fills([]),
+                fees_paid=0.0,
+                positions=positions,
+                fees=np.array([]),
+                initial_capital=initial,
+                start=self.config.start,
+                end=self.config.end,
+            )
+
+        all_stamps = np.concatenate(stamps)
+        # Stable sort keeps symbol order for equal timestamps, matching sorted() in the event loop
+        order = np.argsort(all_stamps, kind="stable")
+        cash = initial + np.cumsum(np.concatenate(cash_deltas)[order])
+        market_value = np.cumsum(np.concatenate(value_deltas)[order])
+
+        fills = _concat_fills(fill_parts)
+        fill_order = np.argsort(fills["timestamp"], kind="stable")
+        fills = {name: column[fill_order] for name, column in fills.items()}
+
+        return VectorizedResult(
+            timestamps=all_stamps[order],
+            equity=cash + market_value,
+            cash=cash,
+            fills=fills,
+            fees_paid=fees_paid,
+            positions=positions,
+            fees=np.cumsum(np.concatenate(fee_deltas)[order]),
+            initial_capital=initial,
+            start=self.config.start,
+            end=self.config.end,
+        )
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs; leading NaNs become 0 (flat)."""
+    mask = np.isnan(values)
+    if not mask.any():
+        return values
+    idx = np.where(~mask, np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    filled = values[idx]
+    filled[np.isnan(filled)] = 0.0
+    return filled
+
+
+def _realized_pnl(fill_price: np.ndarray, trade: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """
+    Realized P&L of each sell against the running average entry price.
+
+    Only bars with a trade are visited, so the loop is O(trades) rather than
+    O(bars); the average-price recurrence is the paper engine's.
+    """
+    pnl = np.zeros(len(trade))
+    average_price = 0.0
+    for i in np.flatnonzero(trade).tolist():
+        qty = trade[i]
+        if qty > 0:
+            held = target[i] - qty
+            average_price = (average_price * held + fill_price[i] * qty) / target[i]
+        else:
+            pnl[i] = (fill_price[i] - average_price) * -qty
+            if target[i] == 0:
+                average_price = 0.0
+    return pnl
+
+
+def _concat_fills(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    if not parts:
+        return {
+            "timestamp": np.array([], dtype="datetime64[ns]"),
+            "symbol": np.array([], dtype=object),
+            "quantity": np.array([]),
+            "base_price": np.array([]),
+            "fill_price": np.array([]),
+            "fees": np.array([]),
+            "pnl": np.array([]),
+        }
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
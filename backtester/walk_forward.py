@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from typing import Callable, Iterable, List, Sequence, Union, Dict, Any
-from datetime import datetime, date
-from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple, Union, Dict, Any
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, tzinfo
+from dataclasses import dataclass, replace
 from itertools import product
 import statistics
 import multiprocessing as mp
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
 from trading_engine.phase4.strategy import Strategy
 
+from .checkpoint import CheckpointStore, ProgressState, ProgressTracker, entry_key
 from .config import BacktestConfig, WalkForwardConfig
 from .engine import EventBacktester, MarketEvent
 from .reporting import BacktestReport
+from .search import FULL_BUDGET, SearchStrategy
+from .shared_data import SharedEventStore, SharedEventStoreHandle
 
 
 @dataclass
@@ -36,6 +41,14 @@ class WalkForwardWindow:
     window_type: str = "rolling"  # "anchored" or "rolling"
 
 
+@dataclass
+class WindowPerformance:
+    """Performance of one parameter set on one walk-forward window."""
+    train: Optional[float] = None
+    test: Optional[float] = None
+    oos: Optional[float] = None
+
+
 @dataclass
 class WalkForwardResult:
     """Complete walk-forward analysis result."""
@@ -46,6 +59,32 @@ class WalkForwardResult:
     robustness_score: float
 
 
+def window_slice(timestamps: Sequence[datetime], start: datetime, end: datetime) -> slice:
+    """Slice of a sorted timestamp sequence covering ``start <= ts <= end``."""
+    return slice(bisect_left(timestamps, start), bisect_right(timestamps, end))
+
+
+def window_phase_slices(timestamps: Sequence[datetime],
+                        window: WalkForwardWindow) -> Tuple[slice, slice, Optional[slice]]:
+    """Train, test and (optional) out-of-sample slices for one window."""
+    oos = None
+    if window.oos_start and window.oos_end:
+        oos = window_slice(timestamps, window.oos_start, window.oos_end)
+    return (
+        window_slice(timestamps, window.train_start, window.train_end),
+        window_slice(timestamps, window.test_start, window.test_end),
+        oos,
+    )
+
+
+def budget_window(window: WalkForwardWindow, budget: float) -> WalkForwardWindow:
+    """Window whose training period is the most recent ``budget`` fraction of the original."""
+    if budget >= FULL_BUDGET:
+        return window
+    span = window.train_end - window.train_start
+    return replace(window, train_start=window.train_end - span * budget)
+
+
 class ParameterGridSearch:
     """Grid search for parameter optimization with multiprocessing support."""
 
@@ -60,6 +99,13 @@ class ParameterGridSearch:
         combinations = product(*param_values)
         return [dict(zip(param_names, combo)) for combo in combinations]
 
+    def count(self) -> int:
+        """Number of parameter combinations in the grid."""
+        total = 1
+        for values in self.param_ranges.values():
+            total *= len(values)
+        return total
+
     def generate_parameter_sets_generator(self):
         """Generate parameter sets as a generator for memory efficiency."""
         param_names = list(self.param_ranges.keys())
@@ -73,15 +119,111 @@ class WalkForwardAnalyzer:
     """Advanced walk-forward analysis with parameter optimization."""
 
     def __init__(self, strategy_class: type, base_config: BacktestConfig,
-                 walk_config: WalkForwardConfig, param_ranges: Dict[str, List[Any]] = None):
+                 walk_config: WalkForwardConfig, param_ranges: Dict[str, List[Any]] = None,
+                 checkpoint_dir: Optional[Union[str, Path]] = None,
+                 progress: Optional[Callable[[ProgressState], None]] = None,
+                 search: Optional[SearchStrategy] = None):
+        """
+        Args:
+            strategy_class: Strategy class to optimize
+            base_config: Backtest configuration (dates are replaced per window)
+            walk_config: Walk-forward configuration
+            param_ranges: Parameter ranges for grid search
+            checkpoint_dir: Persist every (params, window) evaluation here and
+                skip evaluations already recorded for the same strategy, data
+                and configuration
+            progress: Called with a ``ProgressState`` as evaluations complete
+            search: Search strategy choosing which parameter sets to evaluate
+                (see ``backtester.search``); defaults to the full grid
+        """
         self.strategy_class = strategy_class
         self.base_config = base_config
         self.walk_config = walk_config
         self.param_ranges = param_ranges or {}
         self.parameter_search = ParameterGridSearch(self.param_ranges) if self.param_ranges else None
+        self.checkpoint_dir = checkpoint_dir
+        self.progress = progress
+        self.search = search
+
+    def open_checkpoint(self, events: Sequence[MarketEvent]) -> Optional[CheckpointStore]:
+        """Open the checkpoint for this strategy, data and configuration (None if disabled)."""
+        if self.checkpoint_dir is None:
+            return None
+        config = {'base_config': self.base_config, 'walk_config': self.walk_config}
+        return CheckpointStore.for_run(self.checkpoint_dir, self.strategy_class, events, config)
+
+    def _evaluate_window(self, params: Dict[str, Any], window: WalkForwardWindow,
+                         select_events: Callable[[datetime, datetime], Sequence[MarketEvent]],
+                         train_only: bool = False) -> Optional[WindowPerformance]:
+        """Run train/test/OOS backtests of one parameter set on one window (None if it has no training data)."""
+        # Training phase
+        train_events = select_events(window.train_start, window.train_end)
+        if not train_events:
+            return None
+
+        result = WindowPerformance()
+        train_config = self.base_config.copy_with(
+            start=window.train_start,
+            end=window.train_end
+        )
 
-    def generate_windows(self, start_date: date, end_date: date, window_type: str = "rolling") -> List[WalkForwardWindow]:
-        """Generate walk-forward windows with support for anchored/rolling types."""
+        strategy = self.strategy_class(**params)
+        backtester = EventBacktester(train_config, strategies=[strategy])
+        train_report = backtester.run(train_events)
+        result.train = self._calculate_performance_metric(train_report)
+        if train_only:
+            return result
+
+        # Testing phase (in-sample)
+        test_events = select_events(window.test_start, window.test_end)
+        if test_events:
+            test_config = self.base_config.copy_with(
+                start=window.test_start,
+                end=window.test_end
+            )
+            backtester = EventBacktester(test_config, strategies=[strategy])
+            test_report = backtester.run(test_events)
+            result.test = self._calculate_performance_metric(test_report)
+
+        # Out-of-sample phase
+        if window.oos_start and window.oos_end:
+            oos_events = select_events(window.oos_start, window.oos_end)
+            if oos_events:
+                oos_config = self.base_config.copy_with(
+                    start=window.oos_start,
+                    end=window.oos_end
+                )
+                backtester = EventBacktester(oos_config, strategies=[strategy])
+                oos_report = backtester.run(oos_events)
+                result.oos = self._calculate_performance_metric(oos_report)
+
+        return result
+
+    @staticmethod
+    def _aggregate(params: Dict[str, Any], results: Iterable[Optional[WindowPerformance]]) -> ParameterSet:
+        """Average per-window performances into a ``ParameterSet``."""
+        results = [r for r in results if r is not None]
+        train_performances = [r.train for r in results if r.train is not None]
+        test_performances = [r.test for r in results if r.test is not None]
+        oos_performances = [r.oos for r in results if r.oos is not None]
+
+        return ParameterSet(
+            params=params,
+            train_performance=statistics.mean(train_performances) if train_performances else 0,
+            test_performance=statistics.mean(test_performances) if test_performances else 0,
+            oos_performance=statistics.mean(oos_performances) if oos_performances else 0
+        )
+
+    def generate_windows(self, start_date: date, end_date: date, window_type: str = "rolling",
+                         tz: Optional[tzinfo] = None) -> List[WalkForwardWindow]:
+        """
+        Generate walk-forward windows with support for anchored/rolling types.
+
+        Window bounds take ``tz`` (the event timestamps' timezone) so they
+        compare with tz-aware events such as candles from ``OHLCVStorage``.
+        """
+        start_of_day = time.min.replace(tzinfo=tz)
+        end_of_day = time.max.replace(tzinfo=tz)
         windows = []
         current_train_end = start_date
 
@@ -99,98 +241,119 @@ class WalkForwardAnalyzer:
                 test_start = train_end
                 test_end = min(test_start + self.walk_config.test_period, end_date)
 
+            if test_start >= end_date:
+                break  # no data left to test on
+
             # Out-of-sample period (optional)
             oos_start = test_end if self.walk_config.oos_period else None
             oos_end = min(oos_start + self.walk_config.oos_period, end_date) if oos_start else None
 
             if test_end > start_date:  # Ensure we have at least a test period
                 windows.append(WalkForwardWindow(
-                    train_start=datetime.combine(train_start, datetime.min.time()),
-                    train_end=datetime.combine(train_end, datetime.max.time()),
-                    test_start=datetime.combine(test_start, datetime.min.time()),
-                    test_end=datetime.combine(test_end, datetime.max.time()),
-                    oos_start=datetime.combine(oos_start, datetime.min.time()) if oos_start else None,
-                    oos_end=datetime.combine(oos_end, datetime.max.time()) if oos_end else None,
+                    train_start=datetime.combine(train_start, start_of_day),
+                    train_end=datetime.combine(train_end, end_of_day),
+                    test_start=datetime.combine(test_start, start_of_day),
+                    test_end=datetime.combine(test_end, end_of_day),
+                    oos_start=datetime.combine(oos_start, start_of_day) if oos_start else None,
+                    oos_end=datetime.combine(oos_end, end_of_day) if oos_end else None,
                     window_type=window_type
                 ))
 
-            # Move to next window
-            current_train_end = test_end
+            # Move to next window (by ``step`` when set, otherwise past this test period)
+            current_train_end = current_train_end + self.walk_config.step if self.walk_config.step else test_end
 
         return windows
 
     def run_parameter_optimization(self, events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]],
                                   windows: List[WalkForwardWindow]) -> List[ParameterSet]:
         """Run parameter optimization across walk-forward windows."""
-        if not self.parameter_search:
+        if not self.parameter_search and self.search is None:
             return []
 
-        param_sets = []
         normalized_events = EventBacktester._normalize_events(events)
 
-        # Use generator for memory efficiency with large parameter spaces
-        for params in self.parameter_search.generate_parameter_sets_generator():
-            train_performances = []
-            test_performances = []
-            oos_performances = []
-
-            for window in windows:
-                # Training phase
-                train_events = [e for e in normalized_events
-                              if window.train_start <= e.timestamp <= window.train_end]
-                if not train_events:
-                    continue
+        # Window boundaries depend only on the data, so bisect them once and
+        # hand each backtest a slice instead of re-filtering per parameter set
+        timestamps = [e.timestamp for e in normalized_events]
+        phase_slices: Dict[Tuple[datetime, datetime], slice] = {}
+        for window in windows:
+            bounds = [(window.train_start, window.train_end), (window.test_start, window.test_end),
+                      (window.oos_start, window.oos_end)]
+            for bound, phase_slice in zip(bounds, window_phase_slices(timestamps, window)):
+                if phase_slice is not None:
+                    phase_slices[bound] = phase_slice
+
+        def select_events(start: datetime, end: datetime) -> List[MarketEvent]:
+            # Shortened (budgeted) training periods are not precomputed
+            phase_slice = phase_slices.get((start, end))
+            if phase_slice is None:
+                phase_slice = window_slice(timestamps, start, end)
+            return normalized_events[phase_slice]
+
+        if self.search is not None:
+            total = self.search.planned_evaluations()
+        else:
+            total = self.parameter_search.count()
+        checkpoint = self.open_checkpoint(normalized_events)
+        progress = ProgressTracker(total * len(windows), self.progress)
+        try:
+            if self.search is not None:
+                return self._run_search(windows, select_events, checkpoint, progress)
+            # Use generator for memory efficiency with large parameter spaces
+            return [
+                self._evaluate_params(params, windows, select_events, checkpoint, progress)
+                for params in self.parameter_search.generate_parameter_sets_generator()
+            ]
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def _evaluate_params(self, params: Dict[str, Any], windows: List[WalkForwardWindow],
+                         select_events: Callable[[datetime, datetime], Sequence[MarketEvent]],
+                         checkpoint: Optional[CheckpointStore], progress: ProgressTracker,
+                         budget: float = FULL_BUDGET) -> ParameterSet:
+        """
+        Evaluate one parameter set on every window, reusing checkpointed results.
 
-                train_config = self.base_config.copy_with(
-                    start=window.train_start,
-                    end=window.train_end
-                )
+        Below full budget only the most recent ``budget`` fraction of each
+        training period is backtested and test/OOS phases are skipped.
+        """
+        results = []
+        for window in windows:
+            if budget < FULL_BUDGET:
+                window = budget_window(window, budget)
+                key = entry_key(params, window, 'train')
+            else:
+                key = entry_key(params, window)
+            if checkpoint is not None and key in checkpoint:
+                results.append(checkpoint.get(key))
+                progress.skip()
+                continue
 
-                strategy = self.strategy_class(**params)
-                backtester = EventBacktester(train_config, strategies=[strategy])
-                train_report = backtester.run(train_events)
-                train_perf = self._calculate_performance_metric(train_report)
-                train_performances.append(train_perf)
-
-                # Testing phase (in-sample)
-                test_events = [e for e in normalized_events
-                             if window.test_start <= e.timestamp <= window.test_end]
-                if test_events:
-                    test_config = self.base_config.copy_with(
-                        start=window.test_start,
-                        end=window.test_end
-                    )
-                    backtester = EventBacktester(test_config, strategies=[strategy])
-                    test_report = backtester.run(test_events)
-                    test_perf = self._calculate_performance_metric(test_report)
-                    test_performances.append(test_perf)
-
-                # Out-of-sample phase
-                if window.oos_start and window.oos_end:
-                    oos_events = [e for e in normalized_events
-                                if window.oos_start <= e.timestamp <= window.oos_end]
-                    if oos_events:
-                        oos_config = self.base_config.copy_with(
-                            start=window.oos_start,
-                            end=window.oos_end
-                        )
-                        backtester = EventBacktester(oos_config, strategies=[strategy])
-                        oos_report = backtester.run(oos_events)
-                        oos_perf = self._calculate_performance_metric(oos_report)
-                        oos_performances.append(oos_perf)
-
-            # Aggregate performances
-            avg_train = statistics.mean(train_performances) if train_performances else 0
-            avg_test = statistics.mean(test_performances) if test_performances else 0
-            avg_oos = statistics.mean(oos_performances) if oos_performances else 0
-
-            param_sets.append(ParameterSet(
-                params=params,
-                train_performance=avg_train,
-                test_performance=avg_test,
-                oos_performance=avg_oos
-            ))
+            result = self._evaluate_window(params, window, select_events, train_only=budget < FULL_BUDGET)
+            if checkpoint is not None:
+                checkpoint.put(key, result)
+            results.append(result)
+            progress.advance()
+
+        return self._aggregate(params, results)
+
+    def _run_search(self, windows: List[WalkForwardWindow],
+                    select_events: Callable[[datetime, datetime], Sequence[MarketEvent]],
+                    checkpoint: Optional[CheckpointStore], progress: ProgressTracker) -> List[ParameterSet]:
+        """Drive ``self.search``; candidates are scored on training performance only."""
+        param_sets: List[ParameterSet] = []
+
+        def evaluate(candidates: List[Dict[str, Any]], budget: float) -> List[float]:
+            scores = []
+            for params in candidates:
+                param_set = self._evaluate_params(params, windows, select_events, checkpoint, progress, budget)
+                if budget >= FULL_BUDGET:
+                    param_sets.append(param_set)
+                scores.append(param_set.train_performance)
+            return scores
 
+        self.search.run(evaluate)
         return param_sets
 
     def _calculate_performance_metric(self, report: BacktestReport) -> float:
@@ -243,8 +406,10 @@ class WalkForwardAnalyzer:
     def run_full_analysis(self, events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]],
                          start_date: date, end_date: date) -> WalkForwardResult:
         """Run complete walk-forward analysis with parameter optimization."""
-        windows = self.generate_windows(start_date, end_date)
-        param_sets = self.run_parameter_optimization(events, windows)
+        normalized_events = EventBacktester._normalize_events(events)
+        tz = normalized_events[0].timestamp.tzinfo if normalized_events else None
+        windows = self.generate_windows(start_date, end_date, tz=tz)
+        param_sets = self.run_parameter_optimization(normalized_events, windows)
 
         # Find best parameters based on OOS performance
         best_param_set = max(param_sets, key=lambda ps: ps.oos_performance) if param_sets else None
@@ -265,12 +430,17 @@ class WalkForwardAnalyzer:
 class WalkForwardEngine:
     """Walk-forward engine supporting chronological train/test splits."""
 
-    def __init__(self, base_config: BacktestConfig, walk_config: WalkForwardConfig):
+    def __init__(self, base_config: BacktestConfig, walk_config: WalkForwardConfig,
+                 checkpoint_dir: Optional[Union[str, Path]] = None,
+                 progress: Optional[Callable[[ProgressState], None]] = None):
         self.base_config = base_config
         self.walk_config = walk_config
+        self.checkpoint_dir = checkpoint_dir
+        self.progress = progress
 
     def run_walk_forward(self, strategy_class: type, events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]],
-                        param_ranges: Dict[str, List[Any]] = None, max_workers: int = None) -> WalkForwardResult:
+                        param_ranges: Dict[str, List[Any]] = None, max_workers: int = None,
+                        search: Optional[SearchStrategy] = None) -> WalkForwardResult:
         """
         Run walk-forward analysis with chronological splits.
 
@@ -279,11 +449,14 @@ class WalkForwardEngine:
             events: Market events for backtesting
             param_ranges: Parameter ranges for grid search
             max_workers: Number of parallel workers for grid search
+            search: Adaptive search strategy; searches run sequentially because
+                each rung depends on the previous one's scores
 
         Returns:
             WalkForwardResult with optimization results
         """
-        analyzer = WalkForwardAnalyzer(strategy_class, self.base_config, self.walk_config, param_ranges)
+        analyzer = WalkForwardAnalyzer(strategy_class, self.base_config, self.walk_config, param_ranges,
+                                       checkpoint_dir=self.checkpoint_dir, progress=self.progress, search=search)
 
         # Generate windows
         normalized_events = EventBacktester._normalize_events(events)
@@ -293,13 +466,14 @@ class WalkForwardEngine:
         start_date = normalized_events[0].timestamp.date()
         end_date = normalized_events[-1].timestamp.date()
 
-        windows = analyzer.generate_windows(start_date, end_date)
+        windows = analyzer.generate_windows(start_date, end_date, tz=normalized_events[0].timestamp.tzinfo)
 
         # Run parameter optimization (potentially parallel)
-        if max_workers and max_workers > 1 and param_ranges:
-            param_sets = self._run_parallel_optimization(analyzer, events, windows, max_workers)
+        # Reuse the merged list: generator inputs can only be consumed once
+        if max_workers and max_workers > 1 and param_ranges and search is None:
+            param_sets = self._run_parallel_optimization(analyzer, normalized_events, windows, max_workers)
         else:
-            param_sets = analyzer.run_parameter_optimization(events, windows)
+            param_sets = analyzer.run_parameter_optimization(normalized_events, windows)
 
         # Find best parameters and analyze robustness
         best_param_set = max(param_sets, key=lambda ps: ps.oos_performance) if param_sets else None
@@ -322,95 +496,81 @@ class WalkForwardEngine:
             return []
 
         param_sets = []
-
-        # Use ProcessPoolExecutor with chunksize for memory efficiency
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all parameter combinations
+        normalized_events = EventBacktester._normalize_events(events)
+        checkpoint = analyzer.open_checkpoint(normalized_events)
+        progress = ProgressTracker(analyzer.parameter_search.count() * len(windows), analyzer.progress)
+
+        # Publish the events once; tasks carry only the shared memory handle
+        # instead of pickling the full event list per parameter set
+        with SharedEventStore.publish(normalized_events) as store, \
+                ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Submit the parameter combinations that still have windows to evaluate
             future_to_params = {}
             for params in analyzer.parameter_search.generate_parameter_sets_generator():
-                future = executor.submit(self._evaluate_param_set, analyzer, params, events, windows)
-                future_to_params[future] = params
+                keys = [entry_key(params, window) for window in windows]
+                done = {i for i, key in enumerate(keys) if checkpoint is not None and key in checkpoint}
+                progress.skip(len(done))
+                if len(done) == len(windows):
+                    param_sets.append(analyzer._aggregate(params, (checkpoint.get(key) for key in keys)))
+                    continue
+                future = executor.submit(self._evaluate_windows, analyzer, params, store.handle, windows, done)
+                future_to_params[future] = (params, keys)
 
             # Collect results as they complete (memory efficient)
-            for future in as_completed(future_to_params):
-                try:
-                    param_set = future.result()
-                    param_sets.append(param_set)
-                except Exception as exc:
-                    params = future_to_params[future]
-                    print(f'Parameter set {params} generated an exception: {exc}')
-                    # Add failed parameter set with zero performance
-                    param_sets.append(ParameterSet(params=params, train_performance=0, test_performance=0, oos_performance=0))
+            try:
+                for future in as_completed(future_to_params):
+                    params, keys = future_to_params.pop(future)
+                    try:
+                        new_results = future.result()
+                    except Exception as exc:
+                        print(f'Parameter set {params} generated an exception: {exc}')
+                        # Add failed parameter set with zero performance
+                        param_sets.append(ParameterSet(params=params, train_performance=0, test_performance=0, oos_performance=0))
+                        continue
+
+                    if checkpoint is not None:
+                        for i, result in new_results.items():
+                            checkpoint.put(keys[i], result)
+                    progress.advance(len(new_results))
+                    results = [new_results[i] if i in new_results else checkpoint.get(key) for i, key in enumerate(keys)]
+                    param_sets.append(analyzer._aggregate(params, results))
+            finally:
+                if checkpoint is not None:
+                    checkpoint.close()
 
         return param_sets
 
     @staticmethod
-    def _evaluate_param_set(analyzer: WalkForwardAnalyzer, params: Dict[str, Any],
-                           events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent]],
-                           windows: List[WalkForwardWindow]) -> ParameterSet:
-        """Evaluate a single parameter set across all windows."""
-        train_performances = []
-        test_performances = []
-        oos_performances = []
-
-        normalized_events = EventBacktester._normalize_events(events)
-
-        for window in windows:
-            # Training phase
-            train_events = [e for e in normalized_events
-                          if window.train_start <= e.timestamp <= window.train_end]
-            if not train_events:
-                continue
+    def _evaluate_windows(analyzer: WalkForwardAnalyzer, params: Dict[str, Any],
+                          events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent], SharedEventStoreHandle],
+                          windows: List[WalkForwardWindow], skip: Set[int] = frozenset()
+                          ) -> Dict[int, Optional[WindowPerformance]]:
+        """Evaluate a parameter set on every window not in ``skip``, keyed by window index.
+
+        ``events`` may be a ``SharedEventStoreHandle``, in which case the worker
+        attaches to the published store and materializes one window at a time.
+        """
+        if isinstance(events, SharedEventStoreHandle):
+            select_events = SharedEventStore.attach(events).events_between
+        else:
+            normalized_events = EventBacktester._normalize_events(events)
+            timestamps = [e.timestamp for e in normalized_events]
 
-            train_config = analyzer.base_config.copy_with(
-                start=window.train_start,
-                end=window.train_end
-            )
+            def select_events(start: datetime, end: datetime) -> List[MarketEvent]:
+                return normalized_events[window_slice(timestamps, start, end)]
 
-            strategy = analyzer.strategy_class(**params)
-            backtester = EventBacktester(train_config, strategies=[strategy])
-            train_report = backtester.run(train_events)
-            train_perf = analyzer._calculate_performance_metric(train_report)
-            train_performances.append(train_perf)
-
-            # Testing phase (in-sample)
-            test_events = [e for e in normalized_events
-                         if window.test_start <= e.timestamp <= window.test_end]
-            if test_events:
-                test_config = analyzer.base_config.copy_with(
-                    start=window.test_start,
-                    end=window.test_end
-                )
-                backtester = EventBacktester(test_config, strategies=[strategy])
-                test_report = backtester.run(test_events)
-                test_perf = analyzer._calculate_performance_metric(test_report)
-                test_performances.append(test_perf)
-
-            # Out-of-sample phase
-            if window.oos_start and window.oos_end:
-                oos_events = [e for e in normalized_events
-                            if window.oos_start <= e.timestamp <= window.oos_end]
-                if oos_events:
-                    oos_config = analyzer.base_config.copy_with(
-                        start=window.oos_start,
-                        end=window.oos_end
-                    )
-                    backtester = EventBacktester(oos_config, strategies=[strategy])
-                    oos_report = backtester.run(oos_events)
-                    oos_perf = analyzer._calculate_performance_metric(oos_report)
-                    oos_performances.append(oos_perf)
-
-        # Aggregate performances
-        avg_train = statistics.mean(train_performances) if train_performances else 0
-        avg_test = statistics.mean(test_performances) if test_performances else 0
-        avg_oos = statistics.mean(oos_performances) if oos_performances else 0
+        return {
+            i: analyzer._evaluate_window(params, window, select_events)
+            for i, window in enumerate(windows) if i not in skip
+        }
 
-        return ParameterSet(
-            params=params,
-            train_performance=avg_train,
-            test_performance=avg_test,
-            oos_performance=avg_oos
-        )
+    @staticmethod
+    def _evaluate_param_set(analyzer: WalkForwardAnalyzer, params: Dict[str, Any],
+                           events: Union[Dict[str, Sequence[MarketEvent]], Iterable[MarketEvent], SharedEventStoreHandle],
+                           windows: List[WalkForwardWindow]) -> ParameterSet:
+        """Evaluate a single parameter set across all windows."""
+        results = WalkForwardEngine._evaluate_windows(analyzer, params, events, windows)
+        return analyzer._aggregate(params, results.values())
 
 
 class WalkForwardRunner:
@@ -421,10 +581,16 @@ class WalkForwardRunner:
         base_config: BacktestConfig,
         walk_config: WalkForwardConfig,
         strategies_factory: Callable[[], Sequence[Strategy]],
+        checkpoint_dir: Optional[Union[str, Path]] = None,
+        progress: Optional[Callable[[ProgressState], None]] = None,
     ):
+        if walk_config.window_size <= 0:
+            raise ValueError(f"WalkForwardRunner needs a positive window_size, got {walk_config.window_size}")
         self.base_config = base_config
         self.walk_config = walk_config
         self.strategies_factory = strategies_factory
+        self.checkpoint_dir = checkpoint_dir
+        self.progress = progress
 
     def run(self, events: Union[dict, Iterable[MarketEvent]]) -> List[BacktestReport]:
         normalized = EventBacktester._normalize_events(events)
@@ -433,19 +599,40 @@ class WalkForwardRunner:
         window = self.walk_config.window_size
         step = self.walk_config.effective_step()
 
-        start_idx = 0
-        while start_idx < len(normalized):
-            window_events = normalized[start_idx : start_idx + window]
-            if len(window_events) < 2:
-                break
-
-            window_config = self.base_config.copy_with(
-                start=window_events[0].timestamp,
-                end=window_events[-1].timestamp,
-            )
-            backtester = EventBacktester(window_config, strategies=self.strategies_factory())
-            results.append(backtester.run(window_events))
+        checkpoint = None
+        if self.checkpoint_dir is not None:
+            config = {'base_config': self.base_config, 'walk_config': self.walk_config}
+            checkpoint = CheckpointStore.for_run(self.checkpoint_dir, list(self.strategies_factory()), normalized, config)
+        progress = ProgressTracker(len(range(0, max(len(normalized) - 1, 0), step)), self.progress)
+
+        try:
+            start_idx = 0
+            while start_idx < len(normalized):
+                window_events = normalized[start_idx : start_idx + window]
+                if len(window_events) < 2:
+                    break
+
+                key = entry_key(start_idx, window_events[0].timestamp, window_events[-1].timestamp)
+                if checkpoint is not None and key in checkpoint:
+                    results.append(checkpoint.get(key))
+                    progress.skip()
+                    start_idx += step
+                    continue
 
-            start_idx += step
+                window_config = self.base_config.copy_with(
+                    start=window_events[0].timestamp,
+                    end=window_events[-1].timestamp,
+                )
+                backtester = EventBacktester(window_config, strategies=self.strategies_factory())
+                report = backtester.run(window_events)
+                if checkpoint is not None:
+                    checkpoint.put(key, report)
+                results.append(report)
+                progress.advance()
+
+                start_idx += step
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
 
         return results
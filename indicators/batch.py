@@ -0,0 +1,313 @@
+"""
+Multi-Symbol Batch Indicators Module for FINBOT
+
+This module computes indicators for a whole universe at once from
+(time x symbol) matrices of closes, highs and lows, instead of one pandas
+call per symbol. Every function accepts 2-D NumPy arrays or DataFrames
+(index = time, columns = symbols) and returns results of the same shape
+and kind, aligned to the input rows.
+
+Values follow the per-symbol functions in ``indicators.realtime``: for a
+column that starts trading at row ``s`` and has no gaps, the values from
+row ``s`` on equal the 1-D function applied to that column's history, with
+the warm-up rows (which the 1-D functions drop) left as NaN.
+
+NaN handling:
+    - Leading NaNs (symbols listed later than the panel start) are skipped;
+      each column warms up from its own first bar.
+    - A bar is missing when any of its inputs is NaN. Outputs are NaN on
+      missing bars, and rolling windows that include one are NaN, as in
+      pandas with ``min_periods=window``.
+    - EMAs use pandas' ``ewm(span=period)`` rules and decay across gaps.
+
+Rolling sums use block-wise cumulative sums along the time axis, so the
+cost does not depend on the window length and rounding stays bounded by
+the block size rather than the panel length.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+PanelLike = Union[np.ndarray, pd.DataFrame]
+
+_BLOCK_ROWS = 512
+_ROW_LOOP_MIN_COLUMNS = 256
+
+
+def _as_panel(values: PanelLike) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim != 2:
+        raise ValueError("expected a 2-D (time x symbol) panel")
+    return array
+
+
+def _like(result: np.ndarray, template: PanelLike) -> PanelLike:
+    if isinstance(template, pd.DataFrame):
+        return pd.DataFrame(result, index=template.index, columns=template.columns)
+    return result
+
+
+def _align(*panels: PanelLike) -> Tuple[np.ndarray, ...]:
+    """Convert panels to arrays with NaN on every bar where any input is NaN."""
+    arrays = [_as_panel(p) for p in panels]
+    shape = arrays[0].shape
+    if any(a.shape != shape for a in arrays):
+        raise ValueError("input panels must have the same shape")
+    missing = np.zeros(shape, dtype=bool)
+    for array in arrays:
+        missing |= np.isnan(array)
+    if not missing.any():
+        return tuple(arrays)
+    return tuple(np.where(missing, np.nan, a) for a in arrays)
+
+
+def _rolling_sum(values: np.ndarray, period: int, center: bool = False,
+                 squares: bool = False) -> Tuple[np.ndarray, ...]:
+    """
+    Rolling sums over ``period`` rows, NaN where the window is incomplete or holds a NaN.
+
+    Cumulative sums restart every ``_BLOCK_ROWS`` rows (with ``period - 1``
+    rows of overlap). With ``center`` the values are shifted by the block's
+    column means first, which keeps the sums of squares well conditioned.
+    Returns ``(sums, anchors)`` or ``(sums, sums_of_squares, anchors)``;
+    anchors are per-row offsets to add back to a window mean.
+    """
+    if period <= 0:
+        raise ValueError("period must be positive")
+    rows = values.shape[0]
+    sums = np.full(values.shape, np.nan)
+    sq_sums = np.full(values.shape, np.nan) if squares else None
+    anchors = np.zeros(values.shape) if center else None
+
+    for start in range(0, rows, _BLOCK_ROWS):
+        lo = max(start - period + 1, 0)
+        stop = min(start + _BLOCK_ROWS, rows)
+        first = max(period - 1, start - lo)
+        if first >= stop - lo:
+            continue
+        chunk = values[lo:stop]
+        missing = np.isnan(chunk)
+        gaps = missing.any()
+        if center:
+            counts = len(chunk) - missing.sum(axis=0) if gaps else len(chunk)
+            anchor = np.nansum(chunk, axis=0) / np.maximum(counts, 1) if gaps else chunk.mean(axis=0)
+            anchors[start:stop] = anchor
+            chunk = chunk - anchor
+        if gaps:
+            chunk = np.where(missing, 0.0, chunk)
+
+        block = slice(lo + first, stop)
+        _window_sums(chunk, period, first, sums[block])
+        if squares:
+            _window_sums(chunk * chunk, period, first, sq_sums[block])
+        if gaps:
+            in_window = np.empty((stop - lo - first, values.shape[1]), dtype=np.int64)
+            _window_sums(missing.astype(np.int64), period, first, in_window)
+            sums[block][in_window > 0] = np.nan
+            if squares:
+                sq_sums[block][in_window > 0] = np.nan
+
+    if squares:
+        return sums, sq_sums, anchors
+    return sums, anchors
+
+
+def _cumsum_rows(chunk: np.ndarray) -> np.ndarray:
+    """Cumulative sum down the time axis (same additions, in the same order, as ``np.cumsum(axis=0)``)."""
+    if chunk.shape[1] < _ROW_LOOP_MIN_COLUMNS:
+        return np.cumsum(chunk, axis=0)
+    # For wide panels, adding whole contiguous rows beats numpy's strided axis-0 scan
+    cumulative = np.empty_like(chunk)
+    cumulative[0] = chunk[0]
+    for row in range(1, len(chunk)):
+        np.add(cumulative[row - 1], chunk[row], out=cumulative[row])
+    return cumulative
+
+
+def _window_sums(chunk: np.ndarray, period: int, first: int, out: np.ndarray) -> None:
+    """Write the sums of the ``period`` rows ending at each row ``first..`` of ``chunk`` into ``out``."""
+    cumulative = _cumsum_rows(chunk)
+    out[:] = cumulative[first:]
+    skip = max(period - first, 0)
+    out[skip:] -= cumulative[first + skip - period:len(chunk) - period]
+
+
+def _rolling_mean(values: np.ndarray, period: int, center: bool = False) -> np.ndarray:
+    """Rolling mean; ``center`` suits price levels, while non-negative series keep all-zero windows at exactly 0."""
+    sums, anchors = _rolling_sum(values, period, center=center)
+    return sums / period + anchors if center else sums / period
+
+
+def _rolling_extreme(values: np.ndarray, period: int, maximum: bool) -> np.ndarray:
+    """
+    Rolling max/min over ``period`` rows (van Herk/Gil-Werman); NaN in the window propagates.
+
+    Rows are cut into blocks of ``period``; every window is the suffix of one
+    block joined with the prefix of the next, so each row costs O(1).
+    """
+    if period <= 0:
+        raise ValueError("period must be positive")
+    rows, cols = values.shape
+    result = np.full(values.shape, np.nan)
+    if rows < period:
+        return result
+    padded = np.full((-(-rows // period) * period, cols), np.nan)
+    padded[:rows] = values
+    combine = np.maximum if maximum else np.minimum
+    # Running extremes within each block, one block offset at a time (contiguous rows)
+    blocks = padded.reshape(-1, period, cols)
+    prefix, suffix = blocks.copy(), blocks.copy()
+    for offset in range(1, period):
+        combine(prefix[:, offset - 1], blocks[:, offset], out=prefix[:, offset])
+        combine(suffix[:, period - offset], blocks[:, period - offset - 1], out=suffix[:, period - offset - 1])
+    prefix, suffix = prefix.reshape(padded.shape), suffix.reshape(padded.shape)
+    combine(suffix[:rows - period + 1], prefix[period - 1:rows], out=result[period - 1:])
+    return result
+
+
+def _ewm_mean(values: np.ndarray, period: int, min_periods: int) -> np.ndarray:
+    return pd.DataFrame(values).ewm(span=period, min_periods=min_periods).mean().to_numpy(copy=True)
+
+
+def _diff(values: np.ndarray) -> np.ndarray:
+    """Row-to-row change with a NaN first row."""
+    result = np.full(values.shape, np.nan)
+    result[1:] = values[1:] - values[:-1]
+    return result
+
+
+def _true_range(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    prev_close = np.full(closes.shape, np.nan)
+    prev_close[1:] = closes[:-1]
+    return np.maximum(highs - lows, np.maximum(np.abs(highs - prev_close), np.abs(lows - prev_close)))
+
+
+def moving_average_simple(closes: PanelLike, period: int) -> PanelLike:
+    """
+    Calculate Simple Moving Average (SMA) for every column.
+
+    Formula: SMA = sum(closes[-period:]) / period
+    """
+    return _like(_rolling_mean(_as_panel(closes), period, center=True), closes)
+
+
+def moving_average_exponential(closes: PanelLike, period: int) -> PanelLike:
+    """
+    Calculate Exponential Moving Average (EMA) for every column.
+
+    Formula: pandas ``ewm(span=period).mean()``, NaN for each column's first ``period - 1`` bars
+    """
+    values = _as_panel(closes)
+    ema = _ewm_mean(values, period, period)
+    ema[np.isnan(values)] = np.nan
+    return _like(ema, closes)
+
+
+def relative_strength_index(closes: PanelLike, period: int = 14) -> PanelLike:
+    """
+    Calculate Relative Strength Index (RSI) for every column.
+
+    Formula: RSI = 100 - (100 / (1 + RS)), RS = Average Gain / Average Loss (simple means)
+    """
+    change = _diff(_as_panel(closes))
+    avg_gain = _rolling_mean(np.clip(change, 0, None), period)
+    avg_loss = _rolling_mean(np.clip(-change, 0, None), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    return _like(rsi, closes)
+
+
+def average_true_range(highs: PanelLike, lows: PanelLike, closes: PanelLike, period: int = 14) -> PanelLike:
+    """
+    Calculate Average True Range (ATR) for every column.
+
+    Formula: ATR = SMA of True Range, where TR = max(high-low, |high-prev_close|, |low-prev_close|)
+    """
+    high, low, close = _align(highs, lows, closes)
+    return _like(_rolling_mean(_true_range(high, low, close), period), closes)
+
+
+def bollinger_bands(closes: PanelLike, period: int = 20,
+                    std_dev: float = 2.0) -> Tuple[PanelLike, PanelLike, PanelLike]:
+    """
+    Calculate Bollinger Bands for every column.
+
+    Formula: Middle = SMA(close), Upper = Middle + std_dev * Std, Lower = Middle - std_dev * Std
+    (sample standard deviation, ddof=1)
+    Returns: (upper, middle, lower)
+    """
+    values = _as_panel(closes)
+    sums, sq_sums, anchors = _rolling_sum(values, period, center=True, squares=True)
+    middle = sums / period + anchors
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = np.maximum(sq_sums - sums * sums / period, 0.0) / (period - 1)
+    if period > 1:
+        # Constant windows have exactly zero spread, as in pandas
+        unchanged = np.zeros(values.shape)
+        unchanged[1:] = values[1:] == values[:-1]
+        run, _ = _rolling_sum(unchanged, period - 1)
+        variance[run == period - 1] = 0.0
+    width = std_dev * np.sqrt(variance)
+    return _like(middle + width, closes), _like(middle, closes), _like(middle - width, closes)
+
+
+def moving_average_convergence_divergence(closes: PanelLike, fast_period: int = 12, slow_period: int = 26,
+                                          signal_period: int = 9) -> Tuple[PanelLike, PanelLike, PanelLike]:
+    """
+    Calculate MACD for every column.
+
+    Formula: MACD = EMA(fast) - EMA(slow), Signal = EMA(MACD), Histogram = MACD - Signal
+    Returns: (macd, signal, histogram)
+    """
+    values = _as_panel(closes)
+    missing = np.isnan(values)
+    line = _ewm_mean(values, fast_period, 1) - _ewm_mean(values, slow_period, 1)
+    # The signal EMA runs over the whole MACD line, warm-up bars included
+    signal = _ewm_mean(line, signal_period, slow_period + signal_period - 1)
+    count = np.cumsum(~missing, axis=0)
+    line[missing | (count < slow_period)] = np.nan
+    signal[missing] = np.nan
+    histogram = line - signal
+    return _like(line, closes), _like(signal, closes), _like(histogram, closes)
+
+
+def average_directional_index(highs: PanelLike, lows: PanelLike, closes: PanelLike, period: int = 14) -> PanelLike:
+    """
+    Calculate Average Directional Index (ADX) for every column.
+
+    Formula: ADX = SMA of DX, where DX = 100 * |DI+ - DI-| / (DI+ + DI-)
+    DI+ = 100 * SMA(+DM) / ATR, DI- = 100 * SMA(-DM) / ATR
+    Undefined DX values inside a column's history count as 0, as in the 1-D function.
+    """
+    high, low, close = _align(highs, lows, closes)
+    up_move, down_move = _diff(high), -_diff(low)
+    moved = ~np.isnan(up_move) & ~np.isnan(down_move)
+    dm_plus = np.where(up_move > down_move, up_move, np.where(moved, 0.0, np.nan))
+    dm_minus = np.where(down_move > up_move, down_move, np.where(moved, 0.0, np.nan))
+
+    atr = _rolling_mean(_true_range(high, low, close), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        di_plus = 100 * _rolling_mean(dm_plus, period) / atr
+        di_minus = 100 * _rolling_mean(dm_minus, period) / atr
+        dx = 100 * np.abs(di_plus - di_minus) / (di_plus + di_minus)
+    dx = np.where(moved, np.nan_to_num(dx, nan=0), np.nan)
+    return _like(_rolling_mean(dx, period), closes)
+
+
+def stochastic_oscillator(highs: PanelLike, lows: PanelLike, closes: PanelLike, k_period: int = 14,
+                          d_period: int = 3) -> Tuple[PanelLike, PanelLike]:
+    """
+    Calculate Stochastic Oscillator for every column.
+
+    Formula: %K = 100 * ((C - L14) / (H14 - L14)), %D = SMA(%K, d_period)
+    Returns: (%K, %D)
+    """
+    high, low, close = _align(highs, lows, closes)
+    lowest_low = _rolling_extreme(low, k_period, maximum=False)
+    highest_high = _rolling_extreme(high, k_period, maximum=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = 100 * ((close - lowest_low) / (highest_high - lowest_low))
+    d = _rolling_mean(k, d_period)
+    return _like(k, closes), _like(d, closes)
@@ -0,0 +1,396 @@
+"""
+Indicator Dependency Graph Module for FINBOT
+
+This module resolves a declarative set of indicator requests into a DAG of
+computation nodes, so intermediates that several indicators need (true
+range, EMA-n, rolling mean/std over n, window highs/lows, ...) are computed
+once per evaluation and shared. For example MACD, Bollinger Bands, Keltner
+Channels, ATR, ADX and Supertrend together need one true-range series, and
+ATR-14 is computed once for both ATR and ADX.
+
+Nodes are immutable and compare by operation, parameters and inputs, so
+identical sub-expressions from different requests collapse into one node.
+Inputs are the OHLCV columns of one symbol (1-D) or a (time x symbol)
+panel (2-D); outputs are full-length arrays aligned to the input bars, with
+NaN where the matching ``indicators.realtime`` function has no value yet.
+
+Rolling means, true range and bar-to-bar changes use the ``indicators.batch``
+primitives, with a single symbol treated as a one-column panel, so the graph
+and the batch functions share the block-wise rolling sums (rounding bounded
+by the block length, not the series length) and all-zero windows of
+non-negative series stay exactly zero.
+
+Example:
+    graph = IndicatorGraph(['macd', request('atr', period=14), request('adx', period=14)])
+    values = graph.evaluate({'high': highs, 'low': lows, 'close': closes})
+    macd_line, signal, histogram = values['macd']
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .batch import _diff, _rolling_mean, _true_range
+from .realtime import RollingWindow
+
+Frame = Union[pd.Series, pd.DataFrame]
+GraphData = Union[np.ndarray, Mapping[str, np.ndarray], RollingWindow]
+
+
+@dataclass(frozen=True)
+class Node:
+    """One computation: ``op`` applied to the values of ``inputs`` with scalar ``params``."""
+    op: str
+    inputs: Tuple['Node', ...] = ()
+    params: Tuple[Any, ...] = ()
+
+
+@dataclass(frozen=True)
+class IndicatorRequest:
+    """A named indicator with keyword parameters, e.g. ``request('bollinger_bands', period=20)``."""
+    name: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+    label: str = ''
+
+    @property
+    def key(self) -> str:
+        if self.label:
+            return self.label
+        return '_'.join([self.name] + [str(value) for _, value in self.params])
+
+
+def request(name: str, label: str = '', **params: Any) -> IndicatorRequest:
+    """Build an ``IndicatorRequest``; the result key defaults to the name plus parameter values."""
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator: {name}")
+    return IndicatorRequest(name, tuple(params.items()), label)
+
+
+# Intermediate nodes
+
+def source(field: str) -> Node:
+    return Node('source', params=(field,))
+
+
+def change(x: Node) -> Node:
+    return Node('change', (x,))
+
+
+def sma(x: Node, period: int, center: bool = False) -> Node:
+    """Rolling mean of ``x``; ``center`` for price levels, as in ``indicators.batch``."""
+    return Node('window_mean', (x,), (period, center))
+
+
+def ema(x: Node, period: int) -> Node:
+    return Node('ema', (x,), (period,))
+
+
+def rolling_std(x: Node, period: int) -> Node:
+    return Node('std', (x,), (period,))
+
+
+def rolling_max(x: Node, period: int) -> Node:
+    return Node('max', (x,), (period,))
+
+
+def rolling_min(x: Node, period: int) -> Node:
+    return Node('min', (x,), (period,))
+
+
+def true_range() -> Node:
+    return Node('true_range', (source('high'), source('low'), source('close')))
+
+
+def atr(period: int) -> Node:
+    return sma(true_range(), period)
+
+
+def typical_price() -> Node:
+    return Node('typical_price', (source('high'), source('low'), source('close')))
+
+
+def median_price() -> Node:
+    return Node('median_price', (source('high'), source('low')))
+
+
+def offset(base: Node, x: Node, multiplier: float) -> Node:
+    """``base + multiplier * x``."""
+    return Node('offset', (base, x), (multiplier,))
+
+
+def difference(a: Node, b: Node) -> Node:
+    return Node('difference', (a, b))
+
+
+def warmup(x: Node, rows: int) -> Node:
+    """``x`` with its first ``rows`` bars set to NaN."""
+    return Node('warmup', (x,), (rows,)) if rows > 0 else x
+
+
+# Indicator definitions: parameters -> output node (or tuple of nodes)
+
+def _sma(period: int, source_field: str = 'close') -> Node:
+    return sma(source(source_field), period, center=True)
+
+
+def _ema(period: int, source_field: str = 'close') -> Node:
+    return warmup(ema(source(source_field), period), period - 1)
+
+
+def _rsi(period: int = 14) -> Node:
+    moves = change(source('close'))
+    return Node('rsi', (sma(Node('gain', (moves,)), period), sma(Node('loss', (moves,)), period)))
+
+
+def _atr(period: int = 14) -> Node:
+    return atr(period)
+
+
+def _bollinger_bands(period: int = 20, std_dev: float = 2.0) -> Tuple[Node, Node, Node]:
+    middle = sma(source('close'), period, center=True)
+    std = rolling_std(source('close'), period)
+    return offset(middle, std, std_dev), middle, offset(middle, std, -std_dev)
+
+
+def _macd(fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Tuple[Node, Node, Node]:
+    line = difference(ema(source('close'), fast_period), ema(source('close'), slow_period))
+    signal = ema(line, signal_period)
+    histogram = difference(line, signal)
+    signal_rows = slow_period + signal_period - 2
+    return warmup(line, slow_period - 1), warmup(signal, signal_rows), warmup(histogram, signal_rows)
+
+
+def _keltner_channels(period: int = 20, multiplier: float = 2.0) -> Tuple[Node, Node, Node]:
+    middle = ema(typical_price(), period)
+    width = atr(period)
+    # Bands exist once the ATR does; the middle line follows the EMA warm-up
+    return offset(middle, width, multiplier), warmup(middle, period - 1), offset(middle, width, -multiplier)
+
+
+def _adx(period: int = 14) -> Node:
+    moves = (change(source('high')), change(source('low')))
+    dm_plus = sma(Node('dm_plus', moves), period)
+    dm_minus = sma(Node('dm_minus', moves), period)
+    return sma(Node('dx', (dm_plus, dm_minus, atr(period))), period)
+
+
+def _supertrend(period: int = 7, multiplier: float = 3.0) -> Node:
+    return Node('supertrend', (source('close'), median_price(), atr(period)), (multiplier,))
+
+
+def _stochastic(k_period: int = 14, d_period: int = 3) -> Tuple[Node, Node]:
+    k = Node('stochastic_k', (source('close'), rolling_max(source('high'), k_period),
+                              rolling_min(source('low'), k_period)))
+    return k, sma(k, d_period)
+
+
+INDICATORS: Dict[str, Callable[..., Union[Node, Tuple[Node, ...]]]] = {
+    'sma': _sma,
+    'ema': _ema,
+    'rsi': _rsi,
+    'atr': _atr,
+    'bollinger_bands': _bollinger_bands,
+    'macd': _macd,
+    'keltner_channels': _keltner_channels,
+    'adx': _adx,
+    'supertrend': _supertrend,
+    'stochastic': _stochastic,
+}
+
+
+# Node evaluation: values are NumPy arrays (1-D for one symbol, 2-D for a panel);
+# EMAs and rolling std/max/min go through pandas, as in indicators.realtime
+
+def _frame(x: np.ndarray) -> Frame:
+    return pd.Series(x, copy=False) if x.ndim == 1 else pd.DataFrame(x, copy=False)
+
+
+def _shift(x: np.ndarray) -> np.ndarray:
+    result = np.full(x.shape, np.nan)
+    result[1:] = x[:-1]
+    return result
+
+
+def _window_mean(x: np.ndarray, period: int, center: bool) -> np.ndarray:
+    """``batch._rolling_mean`` with a single symbol as a one-column panel."""
+    panel = x.reshape(len(x), -1)
+    return _rolling_mean(panel, period, center=center).reshape(x.shape)
+
+
+def _directional_movement(high_change: np.ndarray, low_change: np.ndarray, plus: bool) -> np.ndarray:
+    up, down = high_change, -low_change
+    move, other = (up, down) if plus else (down, up)
+    return np.where(np.isnan(move), np.nan, np.where(move > other, move, 0.0))
+
+
+def _dx(dm_plus: np.ndarray, dm_minus: np.ndarray, atr_values: np.ndarray) -> np.ndarray:
+    di_plus = 100 * dm_plus / atr_values
+    di_minus = 100 * dm_minus / atr_values
+    dx = np.nan_to_num(100 * np.abs(di_plus - di_minus) / (di_plus + di_minus), nan=0)
+    # Undefined DX counts as 0, as in realtime.average_directional_index, but the first bar has no move
+    dx[0] = np.nan
+    return dx
+
+
+def _supertrend_bands(close: np.ndarray, hl2: np.ndarray, atr_values: np.ndarray,
+                      multiplier: float) -> Tuple[np.ndarray, np.ndarray]:
+    upperband = hl2 + (multiplier * atr_values)
+    lowerband = hl2 - (multiplier * atr_values)
+    breakout = np.where(close > _shift(upperband), 1.0, np.where(close < _shift(lowerband), -1.0, np.nan))
+    # The first bar with an ATR starts in an uptrend; later bars carry the last breakout forward
+    has_atr = ~np.isnan(atr_values)
+    breakout[has_atr & (_shift(has_atr.astype(float)) != 1)] = 1.0
+    trend = np.where(has_atr, _frame(breakout).ffill().to_numpy(), np.nan)
+    return np.where(trend == 1, lowerband, upperband), np.where(trend == -1, upperband, lowerband)
+
+
+def _warmup(x: np.ndarray, rows: int) -> np.ndarray:
+    result = x.copy()
+    result[:rows] = np.nan
+    return result
+
+
+_OPS: Dict[str, Callable[..., Any]] = {
+    'change': _diff,
+    'gain': lambda x: np.clip(x, 0, None),
+    'loss': lambda x: np.clip(-x, 0, None),
+    'window_mean': _window_mean,
+    'ema': lambda x, n: _frame(x).ewm(span=n).mean().to_numpy(),
+    'std': lambda x, n: _frame(x).rolling(window=n).std().to_numpy(),
+    'max': lambda x, n: _frame(x).rolling(window=n).max().to_numpy(),
+    'min': lambda x, n: _frame(x).rolling(window=n).min().to_numpy(),
+    'true_range': _true_range,
+    'typical_price': lambda h, l, c: (h + l + c) / 3,
+    'median_price': lambda h, l: (h + l) / 2,
+    'offset': lambda base, x, multiplier: base + multiplier * x,
+    'difference': lambda a, b: a - b,
+    'warmup': _warmup,
+    'rsi': lambda avg_gain, avg_loss: 100 - (100 / (1 + avg_gain / avg_loss)),
+    'dm_plus': lambda high_change, low_change: _directional_movement(high_change, low_change, plus=True),
+    'dm_minus': lambda high_change, low_change: _directional_movement(high_change, low_change, plus=False),
+    'dx': _dx,
+    'stochastic_k': lambda close, highest, lowest: 100 * ((close - lowest) / (highest - lowest)),
+    'supertrend': _supertrend_bands,
+}
+
+
+def _columns(data: GraphData) -> Dict[str, np.ndarray]:
+    if isinstance(data, RollingWindow):
+        return {'open': data.get_opens(), 'high': data.get_highs(), 'low': data.get_lows(),
+                'close': data.get_closes(), 'volume': data.get_volumes()}
+    if isinstance(data, np.ndarray):
+        return {'close': data}
+    return dict(data)
+
+
+def _as_values(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim not in (1, 2):
+        raise ValueError("inputs must be 1-D series or 2-D (time x symbol) panels")
+    return values
+
+
+class IndicatorGraph:
+    """
+    A set of indicator requests resolved into one shared computation DAG.
+
+    Args:
+        requests: ``IndicatorRequest`` objects or bare indicator names (default parameters)
+    """
+
+    def __init__(self, requests: Iterable[Union[IndicatorRequest, str]]):
+        self.requests: List[IndicatorRequest] = [request(r) if isinstance(r, str) else r for r in requests]
+        self.outputs: Dict[str, Union[Node, Tuple[Node, ...]]] = {}
+        for req in self.requests:
+            if req.key in self.outputs:
+                raise ValueError(f"Duplicate indicator request: {req.key}")
+            if req.name not in INDICATORS:
+                raise ValueError(f"Unknown indicator: {req.name}")
+            self.outputs[req.key] = INDICATORS[req.name](**dict(req.params))
+
+        self.nodes: List[Node] = []  # topological order
+        seen = set()
+        for output in self.outputs.values():
+            for node in output if isinstance(output, tuple) else (output,):
+                self._visit(node, seen)
+
+        # Remaining consumers per node, so intermediates can be released as soon as they are spent
+        self._consumers: Dict[Node, int] = {node: 0 for node in self.nodes}
+        for node in self.nodes:
+            for dependency in node.inputs:
+                self._consumers[dependency] += 1
+
+    def _visit(self, node: Node, seen: set) -> None:
+        # Iterative post-order DFS; graphs are shallow but indicator chains may grow
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in seen:
+                continue
+            if expanded:
+                seen.add(current)
+                self.nodes.append(current)
+                continue
+            stack.append((current, True))
+            stack.extend((dependency, False) for dependency in reversed(current.inputs) if dependency not in seen)
+
+    def naive_node_count(self) -> int:
+        """Nodes evaluated if every request were computed on its own (no sharing across requests)."""
+        total = 0
+        for output in self.outputs.values():
+            seen: set = set()
+            for node in output if isinstance(output, tuple) else (output,):
+                self._count(node, seen)
+            total += len(seen)
+        return total
+
+    @staticmethod
+    def _count(node: Node, seen: set) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(current.inputs)
+
+    def evaluate(self, data: GraphData) -> Dict[str, Any]:
+        """
+        Evaluate every requested indicator over ``data``.
+
+        Args:
+            data: Mapping of OHLCV columns ('open', 'high', 'low', 'close', 'volume'),
+                each 1-D or a 2-D (time x symbol) panel; a ``RollingWindow``; or a close array
+
+        Returns:
+            Request key -> full-length array (or tuple of arrays for multi-output indicators)
+        """
+        columns = _columns(data)
+        keep = set()
+        for output in self.outputs.values():
+            keep.update(output if isinstance(output, tuple) else (output,))
+
+        values: Dict[Node, Any] = {}
+        remaining = dict(self._consumers)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for node in self.nodes:
+                if node.op == 'source':
+                    field = node.params[0]
+                    if field not in columns:
+                        raise ValueError(f"Indicator graph needs '{field}' data")
+                    values[node] = _as_values(columns[field])
+                else:
+                    values[node] = _OPS[node.op](*(values[d] for d in node.inputs), *node.params)
+                for dependency in node.inputs:
+                    remaining[dependency] -= 1
+                    if remaining[dependency] == 0 and dependency not in keep:
+                        del values[dependency]
+
+        results = {}
+        for key, output in self.outputs.items():
+            if isinstance(output, tuple):
+                results[key] = tuple(values[node] for node in output)
+            else:
+                results[key] = values[output]
+        return results
@@ -682,8 +682,8 @@ def detect_three_methods(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
     last_bullish = closes[4:] > opens[4:]
 
     # Middle three candles should be small and contained within first and last
-    middle_highs = np.max(highs[1:-3], axis=0)
-    middle_lows = np.min(lows[1:-3], axis=0)
+    middle_highs = np.maximum(np.maximum(highs[1:-3], highs[2:-2]), highs[3:-1])
+    middle_lows = np.minimum(np.minimum(lows[1:-3], lows[2:-2]), lows[3:-1])
 
     rising_methods = (
         first_bullish &
@@ -723,14 +723,197 @@ def detect_tasuki_gap(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, cl
     third_bearish = closes[2:] < opens[2:]
 
     # Upside Tasuki: rising window, third bullish candle closes gap
-    upside_tasuki = rising_window[:-1] & third_bullish & (closes[2:] > (opens[1:-1] + closes[1:-1]) / 2)
+    upside_tasuki = rising_window & third_bullish & (closes[2:] > (opens[1:-1] + closes[1:-1]) / 2)
 
     # Downside Tasuki: falling window, third bearish candle closes gap
-    downside_tasuki = falling_window[:-1] & third_bearish & (closes[2:] < (opens[1:-1] + closes[1:-1]) / 2)
+    downside_tasuki = falling_window & third_bearish & (closes[2:] < (opens[1:-1] + closes[1:-1]) / 2)
 
     return upside_tasuki, downside_tasuki
 
 
+# Fused candlestick scanner
+
+CANDLESTICK_PATTERNS: Tuple[str, ...] = (
+    'doji', 'hammer', 'spinning_top', 'bullish_engulfing', 'bearish_engulfing', 'morning_star', 'evening_star',
+    'three_white_soldiers', 'three_black_crows', 'piercing_line', 'dark_cloud_cover', 'bullish_harami',
+    'bearish_harami', 'white_marubozu', 'black_marubozu', 'bullish_abandoned_baby', 'bearish_abandoned_baby',
+    'bullish_kicking', 'bearish_kicking', 'tweezer_top', 'tweezer_bottom', 'rising_window', 'falling_window',
+    'rising_three_methods', 'falling_three_methods', 'upside_tasuki_gap', 'downside_tasuki_gap',
+)
+
+# Bit of each pattern in the scanner's per-bar bitmask
+PATTERN_BITS: Dict[str, int] = {name: 1 << index for index, name in enumerate(CANDLESTICK_PATTERNS)}
+
+# Candles in each pattern; a pattern is flagged on its last candle
+PATTERN_CANDLES: Dict[str, int] = {
+    name: 1 for name in ('doji', 'hammer', 'spinning_top', 'white_marubozu', 'black_marubozu')
+}
+PATTERN_CANDLES.update({
+    name: 2 for name in ('bullish_engulfing', 'bearish_engulfing', 'piercing_line', 'dark_cloud_cover',
+                         'bullish_harami', 'bearish_harami', 'bullish_kicking', 'bearish_kicking',
+                         'tweezer_top', 'tweezer_bottom', 'rising_window', 'falling_window')
+})
+PATTERN_CANDLES.update({
+    name: 3 for name in ('morning_star', 'evening_star', 'three_white_soldiers', 'three_black_crows',
+                         'bullish_abandoned_baby', 'bearish_abandoned_baby', 'upside_tasuki_gap', 'downside_tasuki_gap')
+})
+PATTERN_CANDLES.update({'rising_three_methods': 5, 'falling_three_methods': 5})
+
+PATTERN_LOOKBACK = max(PATTERN_CANDLES.values())
+
+
+@dataclass
+class CandleAnatomy:
+    """Per-bar candle measurements shared by all candlestick patterns."""
+    bullish: np.ndarray
+    bearish: np.ndarray
+    body_high: np.ndarray
+    body_low: np.ndarray
+    midpoint: np.ndarray
+    range: np.ndarray
+    body_ratio: np.ndarray
+    upper_ratio: np.ndarray
+    lower_ratio: np.ndarray
+    shadow_ratio: np.ndarray
+
+
+def candle_anatomy(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> CandleAnatomy:
+    """
+    Measure every candle once: direction, body bounds, midpoint and body/shadow ratios.
+
+    Ratios are taken against the high-low range, with a zero range replaced by 1e-8 as in detect_doji.
+    """
+    if not len(opens) == len(highs) == len(lows) == len(closes):
+        raise ValueError("opens, highs, lows and closes must have the same length")
+
+    body_high = np.maximum(opens, closes)
+    body_low = np.minimum(opens, closes)
+    upper_shadow = highs - body_high
+    lower_shadow = body_low - lows
+    total_range = highs - lows
+    safe_range = np.where(total_range == 0, 1e-8, total_range)
+
+    return CandleAnatomy(
+        bullish=closes > opens,
+        bearish=closes < opens,
+        body_high=body_high,
+        body_low=body_low,
+        midpoint=(opens + closes) / 2,
+        range=total_range,
+        body_ratio=np.abs(closes - opens) / safe_range,
+        upper_ratio=upper_shadow / safe_range,
+        lower_ratio=lower_shadow / safe_range,
+        shadow_ratio=(upper_shadow + lower_shadow) / safe_range,
+    )
+
+
+def _candle(n: int, position: int, candles: int) -> slice:
+    """Bars holding candle ``position`` of every ``candles``-bar window in a series of ``n`` bars."""
+    return slice(position, max(n - candles + 1 + position, position))
+
+
+def scan_candlestick_bitmask(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                             closes: np.ndarray) -> np.ndarray:
+    """
+    Scan all candlestick patterns in one pass over shared candle anatomy.
+
+    Each pattern uses the same rules as its detect_* function (default thresholds).
+
+    Returns uint32 array, one bitmask per bar: bit PATTERN_BITS[name] is set on the
+    last candle of each occurrence of ``name``.
+    """
+    a = candle_anatomy(opens, highs, lows, closes)
+    n = len(closes)
+    small_body = a.body_ratio < 0.3
+    doji = a.body_ratio < 0.1
+    marubozu = a.shadow_ratio < 0.05
+    white_marubozu = marubozu & a.bullish
+    black_marubozu = marubozu & a.bearish
+
+    masks = {
+        'doji': doji,
+        'hammer': small_body & (a.lower_ratio > 0.6) & (a.upper_ratio < 0.1),
+        'spinning_top': small_body & (a.upper_ratio > 0.3) & (a.lower_ratio > 0.3),
+        'white_marubozu': white_marubozu,
+        'black_marubozu': black_marubozu,
+    }
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Two candles: previous, current
+        p, c = _candle(n, 0, 2), _candle(n, 1, 2)
+        inside = (a.body_high[c] <= a.body_high[p]) & (a.body_low[c] >= a.body_low[p])
+        rising_window = (lows[c] - highs[p]) / highs[p] > 0.02
+        falling_window = (lows[p] - highs[c]) / lows[p] > 0.02
+        masks.update({
+            'bullish_engulfing': a.bearish[p] & a.bullish[c] & (opens[c] <= closes[p]) & (closes[c] >= opens[p]),
+            'bearish_engulfing': a.bullish[p] & a.bearish[c] & (opens[c] >= closes[p]) & (closes[c] <= opens[p]),
+            'piercing_line': (a.bearish[p] & a.bullish[c] & (opens[c] < closes[p]) &
+                              (closes[c] > a.midpoint[p]) & (closes[c] < opens[p])),
+            'dark_cloud_cover': (a.bullish[p] & a.bearish[c] & (opens[c] > closes[p]) &
+                                 (closes[c] < a.midpoint[p]) & (closes[c] > opens[p])),
+            'bullish_harami': a.bearish[p] & a.bullish[c] & inside,
+            'bearish_harami': a.bullish[p] & a.bearish[c] & inside,
+            'bullish_kicking': black_marubozu[p] & white_marubozu[c],
+            'bearish_kicking': white_marubozu[p] & black_marubozu[c],
+            'tweezer_top': np.abs(highs[c] - highs[p]) / highs[p] < 0.01,
+            'tweezer_bottom': np.abs(lows[c] - lows[p]) / lows[p] < 0.01,
+            'rising_window': rising_window,
+            'falling_window': falling_window,
+        })
+
+    # Three candles: first, middle, last
+    f, m, l = _candle(n, 0, 3), _candle(n, 1, 3), _candle(n, 2, 3)
+    star = small_body[m] & (a.range[m] != 0)  # detect_*_star divide by the raw range
+    masks.update({
+        'morning_star': a.bearish[f] & star & a.bullish[l],
+        'evening_star': a.bullish[f] & star & a.bearish[l],
+        'three_white_soldiers': (a.bullish[f] & a.bullish[m] & a.bullish[l] &
+                                 (closes[m] > closes[f]) & (closes[l] > closes[m])),
+        'three_black_crows': (a.bearish[f] & a.bearish[m] & a.bearish[l] &
+                              (closes[m] < closes[f]) & (closes[l] < closes[m])),
+        'bullish_abandoned_baby': a.bearish[f] & doji[m] & a.bullish[l],
+        'bearish_abandoned_baby': a.bullish[f] & doji[m] & a.bearish[l],
+        'upside_tasuki_gap': rising_window[:n - 2] & a.bullish[l] & (closes[l] > a.midpoint[m]),
+        'downside_tasuki_gap': falling_window[:n - 2] & a.bearish[l] & (closes[l] < a.midpoint[m]),
+    })
+
+    # Five candles: the middle three must stay inside the first candle's range
+    first, last = _candle(n, 0, 5), _candle(n, 4, 5)
+    middle_high = np.maximum(np.maximum(highs[_candle(n, 1, 5)], highs[_candle(n, 2, 5)]), highs[_candle(n, 3, 5)])
+    middle_low = np.minimum(np.minimum(lows[_candle(n, 1, 5)], lows[_candle(n, 2, 5)]), lows[_candle(n, 3, 5)])
+    contained = (middle_high < highs[first]) & (middle_low > lows[first])
+    masks['rising_three_methods'] = a.bullish[first] & a.bullish[last] & contained
+    masks['falling_three_methods'] = a.bearish[first] & a.bearish[last] & contained
+
+    bitmask = np.zeros(n, dtype=np.uint32)
+    for index, name in enumerate(CANDLESTICK_PATTERNS):
+        bitmask[PATTERN_CANDLES[name] - 1:] |= masks[name].astype(np.uint32) << np.uint32(index)
+    return bitmask
+
+
+def scan_latest_candle(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> int:
+    """
+    Scan candlestick patterns completing on the most recent bar only.
+
+    Only the last PATTERN_LOOKBACK bars are read, so the cost per new bar is constant;
+    the result equals the last entry of scan_candlestick_bitmask over the full history.
+    """
+    if len(closes) == 0:
+        return 0
+    tail = slice(-PATTERN_LOOKBACK, None)
+    return int(scan_candlestick_bitmask(opens[tail], highs[tail], lows[tail], closes[tail])[-1])
+
+
+def pattern_masks(bitmask: np.ndarray) -> Dict[str, np.ndarray]:
+    """Unpack a scan_candlestick_bitmask result into one boolean array per pattern."""
+    return {name: (bitmask & bit) != 0 for name, bit in PATTERN_BITS.items()}
+
+
+def decode_patterns(bits: int) -> List[str]:
+    """Names of the patterns set in one bar's bitmask."""
+    return [name for name, bit in PATTERN_BITS.items() if bits & bit]
+
+
 # Helper functions
 
 def get_pattern_strength(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
@@ -763,55 +946,10 @@ def scan_all_patterns(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, cl
     """
     results = {}
 
-    # Candlestick patterns
-    results['doji'] = detect_doji(opens, highs, lows, closes)
-    results['hammer'] = detect_hammer(opens, highs, lows, closes)
-    results['spinning_top'] = detect_spinning_top(opens, highs, lows, closes)
-
-    bullish_engulfing, bearish_engulfing = detect_engulfing(opens, highs, lows, closes)
-    results['bullish_engulfing'] = bullish_engulfing
-    results['bearish_engulfing'] = bearish_engulfing
-
-    results['morning_star'] = detect_morning_star(opens, highs, lows, closes)
-    results['evening_star'] = detect_evening_star(opens, highs, lows, closes)
-
-    results['three_white_soldiers'] = detect_three_white_soldiers(opens, highs, lows, closes)
-    results['three_black_crows'] = detect_three_black_crows(opens, highs, lows, closes)
-
-    results['piercing_line'] = detect_piercing_line(opens, highs, lows, closes)
-    results['dark_cloud_cover'] = detect_dark_cloud_cover(opens, highs, lows, closes)
-
-    bullish_harami, bearish_harami = detect_harami(opens, highs, lows, closes)
-    results['bullish_harami'] = bullish_harami
-    results['bearish_harami'] = bearish_harami
-
-    white_marubozu, black_marubozu = detect_marubozu(opens, highs, lows, closes)
-    results['white_marubozu'] = white_marubozu
-    results['black_marubozu'] = black_marubozu
-
-    bullish_abandoned, bearish_abandoned = detect_abandoned_baby(opens, highs, lows, closes)
-    results['bullish_abandoned_baby'] = bullish_abandoned
-    results['bearish_abandoned_baby'] = bearish_abandoned
-
-    bullish_kicking, bearish_kicking = detect_kicking(opens, highs, lows, closes)
-    results['bullish_kicking'] = bullish_kicking
-    results['bearish_kicking'] = bearish_kicking
-
-    tweezer_top, tweezer_bottom = detect_tweezer_top_bottom(highs, lows, closes)
-    results['tweezer_top'] = tweezer_top
-    results['tweezer_bottom'] = tweezer_bottom
-
-    rising_window, falling_window = detect_rising_falling_window(opens, highs, lows, closes)
-    results['rising_window'] = rising_window
-    results['falling_window'] = falling_window
-
-    rising_methods, falling_methods = detect_three_methods(opens, highs, lows, closes)
-    results['rising_three_methods'] = rising_methods
-    results['falling_three_methods'] = falling_methods
-
-    upside_tasuki, downside_tasuki = detect_tasuki_gap(opens, highs, lows, closes)
-    results['upside_tasuki_gap'] = upside_tasuki
-    results['downside_tasuki_gap'] = downside_tasuki
+    # Candlestick patterns, from one fused scan; each array starts at the first bar a pattern can complete on
+    masks = pattern_masks(scan_candlestick_bitmask(opens, highs, lows, closes))
+    for name in CANDLESTICK_PATTERNS:
+        results[name] = masks[name][PATTERN_CANDLES[name] - 1:]
 
     # Chart patterns (return lists of dictionaries)
     results['flags_pennants'] = detect_flag_pennant(highs, lows, closes)
@@ -6,11 +6,11 @@ for real-time algorithmic trading. It uses a stateful RollingWindow for data buf
 and pure functions for indicator calculations.
 """
 
-from collections import deque
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict, Any
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 @dataclass
@@ -25,46 +25,101 @@ class Candle:
 
 class RollingWindow:
     """
-    A fixed-size buffer for storing the last N candles using collections.deque.
+    A fixed-size buffer for storing the last N candles as NumPy columns.
 
-    This class manages the state of historical data, allowing efficient addition
-    of new candles and retrieval as numpy arrays for vectorized calculations.
+    Open, high, low, close and volume live in one preallocated float64 array
+    (one row per field) with room for twice ``max_length`` bars. New bars
+    are written after the last one; when the spare room runs out, the last
+    ``max_length`` bars are moved back to the start, so appends are O(1)
+    amortized and every accessor returns a contiguous read-only view.
+
+    Views alias the buffer: they stay valid until the next ``add_candle``
+    or ``extend`` call. Copy them to keep values across updates.
     """
 
+    _FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
     def __init__(self, max_length: int):
+        if max_length <= 0:
+            raise ValueError("max_length must be positive")
         self.max_length = max_length
-        self.buffer: deque[Candle] = deque(maxlen=max_length)
+        self._data = np.empty((len(self._FIELDS), 2 * max_length), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def _make_room(self, n: int) -> None:
+        """Ensure ``n`` bars fit after the end, moving the bars still in the window to the front."""
+        if self._end + n <= self._data.shape[1]:
+            return
+        keep = min(self._end - self._start, self.max_length - n)
+        self._data[:, :keep] = self._data[:, self._end - keep:self._end]
+        self._start, self._end = 0, keep
 
     def add_candle(self, candle: Candle) -> None:
         """Add a new candle to the rolling window."""
-        self.buffer.append(candle)
+        self._make_room(1)
+        column = self._data[:, self._end]
+        column[0], column[1], column[2], column[3], column[4] = (
+            candle.open, candle.high, candle.low, candle.close, candle.volume)
+        self._end += 1
+        if self._end - self._start > self.max_length:
+            self._start += 1
+
+    def extend(self, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+               closes: np.ndarray, volumes: np.ndarray) -> None:
+        """Append bars from equal-length column arrays (oldest first); only the last ``max_length`` are kept."""
+        columns = [np.asarray(c, dtype=np.float64).ravel() for c in (opens, highs, lows, closes, volumes)]
+        n = len(columns[0])
+        if any(len(c) != n for c in columns):
+            raise ValueError("extend() columns must have equal lengths")
+        if n == 0:
+            return
+        if n >= self.max_length:
+            self._data[:, :self.max_length] = [c[-self.max_length:] for c in columns]
+            self._start, self._end = 0, self.max_length
+            return
+        self._make_room(n)
+        self._data[:, self._end:self._end + n] = columns
+        self._end += n
+        self._start = max(self._start, self._end - self.max_length)
+
+    def _view(self, row: int) -> np.ndarray:
+        view = self._data[row, self._start:self._end]
+        view.flags.writeable = False
+        return view
 
     def get_closes(self) -> np.ndarray:
         """Return array of closing prices."""
-        return np.array([c.close for c in self.buffer])
+        return self._view(3)
 
     def get_highs(self) -> np.ndarray:
         """Return array of high prices."""
-        return np.array([c.high for c in self.buffer])
+        return self._view(1)
 
     def get_lows(self) -> np.ndarray:
         """Return array of low prices."""
-        return np.array([c.low for c in self.buffer])
+        return self._view(2)
 
     def get_opens(self) -> np.ndarray:
         """Return array of opening prices."""
-        return np.array([c.open for c in self.buffer])
+        return self._view(0)
 
     def get_volumes(self) -> np.ndarray:
         """Return array of volumes."""
-        return np.array([c.volume for c in self.buffer])
+        return self._view(4)
+
+    def latest(self) -> Optional[Candle]:
+        """Return the most recent bar as a ``Candle`` (None when empty)."""
+        if self._end == self._start:
+            return None
+        return Candle(*self._data[:, self._end - 1].tolist())
 
     def is_full(self) -> bool:
         """Check if the buffer is at maximum capacity."""
-        return len(self.buffer) == self.max_length
+        return len(self) == self.max_length
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        return self._end - self._start
 
 
 def twenty_four_hour_volume(volumes: np.ndarray) -> float:
@@ -167,23 +222,19 @@ def aroon(highs: np.ndarray, lows: np.ndarray, period: int) -> Tuple[np.ndarray,
     Formula:
     Aroon Up = ((period - days_since_highest_high) / period) * 100
     Aroon Down = ((period - days_since_lowest_low) / period) * 100
+
+    The highest high / lowest low positions come from argmax/argmin over a
+    sliding-window view (first occurrence on ties).
     """
     if len(highs) < period or len(lows) < period:
         return np.array([]), np.array([])
 
-    aroon_up = np.zeros(len(highs) - period + 1)
-    aroon_down = np.zeros(len(highs) - period + 1)
-
-    for i in range(period - 1, len(highs)):
-        high_window = highs[i-period+1:i+1]
-        low_window = lows[i-period+1:i+1]
-
-        days_since_high = period - 1 - np.argmax(high_window)
-        days_since_low = period - 1 - np.argmin(low_window)
-
-        aroon_up[i - period + 1] = ((period - days_since_high) / period) * 100
-        aroon_down[i - period + 1] = ((period - days_since_low) / period) * 100
+    n = len(highs) - period + 1
+    days_since_high = period - 1 - sliding_window_view(highs, period)[:n].argmax(axis=1)
+    days_since_low = period - 1 - sliding_window_view(lows, period)[:n].argmin(axis=1)
 
+    aroon_up = ((period - days_since_high) / period) * 100
+    aroon_down = ((period - days_since_low) / period) * 100
     return aroon_up, aroon_down
 
 
@@ -199,23 +250,17 @@ def get_pivots(highs: np.ndarray, lows: np.ndarray, length: int) -> Tuple[np.nda
     if len(highs) < 2 * length + 1:
         return np.array([]), np.array([])
 
-    pivot_highs = []
-    pivot_lows = []
-
-    for i in range(length, len(highs) - length):
-        # Check for pivot high
-        is_high = all(highs[i] > highs[i-j] for j in range(1, length+1)) and \
-                  all(highs[i] > highs[i+j] for j in range(1, length+1))
-        if is_high:
-            pivot_highs.append(i)
-
-        # Check for pivot low
-        is_low = all(lows[i] < lows[i-j] for j in range(1, length+1)) and \
-                 all(lows[i] < lows[i+j] for j in range(1, length+1))
-        if is_low:
-            pivot_lows.append(i)
+    def strict_extremes(values: np.ndarray, greater: bool) -> np.ndarray:
+        windows = sliding_window_view(values, 2 * length + 1)
+        center = windows[:, length]
+        if greater:
+            mask = (center > windows[:, :length].max(axis=1)) & (center > windows[:, length + 1:].max(axis=1))
+        else:
+            mask = (center < windows[:, :length].min(axis=1)) & (center < windows[:, length + 1:].min(axis=1))
+        indices = np.flatnonzero(mask) + length
+        return indices if len(indices) else np.array([])
 
-    return np.array(pivot_highs), np.array(pivot_lows)
+    return strict_extremes(highs, True), strict_extremes(lows[:len(highs)], False)
 
 
 def auto_fib_retracement(highs: np.ndarray, lows: np.ndarray, length: int = 5) -> Dict[str, float]:
@@ -876,41 +921,46 @@ def parabolic_sar(highs: np.ndarray, lows: np.ndarray, acceleration: float = 0.0
     Calculate Parabolic SAR.
 
     Formula: SAR = prev_SAR + acceleration * (EP - prev_SAR), EP = highest high or lowest low
+
+    The recurrence is sequential; it runs as a single pass over Python floats
+    with the state in locals, avoiding per-element NumPy scalar indexing.
     """
     if len(highs) < 2:
         return np.array([])
 
-    sar = np.zeros(len(highs))
-    sar[0] = lows[0]  # Initial SAR
-    ep = highs[0]  # Extreme Point
+    high_values = highs.tolist()
+    low_values = lows.tolist()
+    sar = [0.0] * len(high_values)
+    sar[0] = prev = low_values[0]  # Initial SAR
+    ep = high_values[0]  # Extreme Point
     af = acceleration  # Acceleration Factor
     uptrend = True
 
-    for i in range(1, len(highs)):
-        sar[i] = sar[i-1] + af * (ep - sar[i-1])
+    for i in range(1, len(high_values)):
+        current = prev + af * (ep - prev)
+        high, low = high_values[i], low_values[i]
 
         if uptrend:
-            if lows[i] <= sar[i]:
+            if low <= current:
                 uptrend = False
-                sar[i] = ep
-                ep = lows[i]
+                current = ep
+                ep = low
                 af = acceleration
-            else:
-                if highs[i] > ep:
-                    ep = highs[i]
-                    af = min(af + acceleration, max_acceleration)
+            elif high > ep:
+                ep = high
+                af = min(af + acceleration, max_acceleration)
         else:
-            if highs[i] >= sar[i]:
+            if high >= current:
                 uptrend = True
-                sar[i] = ep
-                ep = highs[i]
+                current = ep
+                ep = high
                 af = acceleration
-            else:
-                if lows[i] < ep:
-                    ep = lows[i]
-                    af = min(af + acceleration, max_acceleration)
+            elif low < ep:
+                ep = low
+                af = min(af + acceleration, max_acceleration)
+        sar[i] = prev = current
 
-    return sar
+    return np.array(sar, dtype=np.float64)
 
 
 def performance(closes: np.ndarray) -> np.ndarray:
@@ -1045,30 +1095,32 @@ def supertrend(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period:
     Calculate Supertrend.
 
     Formula: ATR-based bands with trend logic.
-    Returns: (upper_band, lower_band)
+    Returns: (upper_band, lower_band), one value per ATR value (bars ``period`` onwards)
+
+    The trend flips up when the close breaks above the previous upper band,
+    down when it breaks below the previous lower band, and otherwise carries
+    over; the carry is a forward fill of the last breakout.
     """
     atr = average_true_range(highs, lows, closes, period)
     if len(atr) == 0:
         return np.array([]), np.array([])
 
-    hl2 = (highs + lows) / 2
+    # ATR value j covers the true ranges of bars j+1 .. j+period
+    start = len(closes) - len(atr)
+    hl2 = (highs[start:] + lows[start:]) / 2
     upperband = hl2 + (multiplier * atr)
     lowerband = hl2 - (multiplier * atr)
 
-    trend = np.zeros(len(closes))
-    trend[0] = 1  # assume uptrend
-
-    for i in range(1, len(closes)):
-        if closes[i] > upperband[i-1]:
-            trend[i] = 1
-        elif closes[i] < lowerband[i-1]:
-            trend[i] = -1
-        else:
-            trend[i] = trend[i-1]
+    closes = closes[start:]
+    breakout = np.zeros(len(closes))
+    breakout[0] = 1  # assume uptrend
+    breakout[1:] = np.where(closes[1:] > upperband[:-1], 1, np.where(closes[1:] < lowerband[:-1], -1, 0))
+    last_breakout = np.maximum.accumulate(np.where(breakout != 0, np.arange(len(breakout)), 0))
+    trend = breakout[last_breakout]
 
     final_upper = np.where(trend == 1, lowerband, upperband)
     final_lower = np.where(trend == -1, upperband, lowerband)
-    return final_upper[period-1:], final_lower[period-1:]
+    return final_upper, final_lower
 
 
 def trix(closes: np.ndarray, period: int = 15) -> np.ndarray:
@@ -1298,21 +1350,27 @@ def zig_zag(highs: np.ndarray, lows: np.ndarray, threshold: float = 0.05) -> Lis
     Calculate Zig Zag indicator.
 
     Returns list of (price, index) pivots that filter out movements smaller than threshold.
+
+    Midpoints are computed in one vectorized step; the pivot state machine is a
+    single pass over Python floats.
     """
     if len(highs) < 3:
         return []
-    pivots = []
+    midpoints = (highs + lows) / 2
+    prices = midpoints.tolist()
+    up, down = 1 + threshold, 1 - threshold
+    pivot_indices = []
     direction = 0  # 0: none, 1: up, -1: down
-    last_pivot_price = (highs[0] + lows[0]) / 2
+    last_pivot_price = prices[0]
     last_index = 0
-    for i in range(1, len(highs)):
-        current_price = (highs[i] + lows[i]) / 2
+    for i in range(1, len(prices)):
+        current_price = prices[i]
         if direction == 0:
-            if current_price > last_pivot_price * (1 + threshold):
+            if current_price > last_pivot_price * up:
                 direction = 1
                 last_pivot_price = current_price
                 last_index = i
-            elif current_price < last_pivot_price * (1 - threshold):
+            elif current_price < last_pivot_price * down:
                 direction = -1
                 last_pivot_price = current_price
                 last_index = i
@@ -1320,23 +1378,23 @@ def zig_zag(highs: np.ndarray, lows: np.ndarray, threshold: float = 0.05) -> Lis
             if current_price > last_pivot_price:
                 last_pivot_price = current_price
                 last_index = i
-            elif current_price < last_pivot_price * (1 - threshold):
-                pivots.append((last_pivot_price, last_index))
+            elif current_price < last_pivot_price * down:
+                pivot_indices.append(last_index)
                 direction = -1
                 last_pivot_price = current_price
                 last_index = i
-        elif direction == -1:
+        else:
             if current_price < last_pivot_price:
                 last_pivot_price = current_price
                 last_index = i
-            elif current_price > last_pivot_price * (1 + threshold):
-                pivots.append((last_pivot_price, last_index))
+            elif current_price > last_pivot_price * up:
+                pivot_indices.append(last_index)
                 direction = 1
                 last_pivot_price = current_price
                 last_index = i
-    if last_index != len(highs) - 1:
-        pivots.append((last_pivot_price, last_index))
-    return pivots
+    if last_index != len(prices) - 1:
+        pivot_indices.append(last_index)
+    return [(midpoints[i], i) for i in pivot_indices]
 
 
 def true_strength_index(closes: np.ndarray, short_period: int = 25, long_period: int = 13) -> np.ndarray:
@@ -1548,20 +1606,15 @@ def rank_correlation_index(closes: np.ndarray, period: int) -> np.ndarray:
     """
     Calculate Rank Correlation Index (RCI).
 
-    Spearman's rank correlation between time and price.
+    Spearman's rank correlation between time and price, with every window
+    ranked at once over a sliding-window view (ties keep ``argsort`` order).
     """
     if len(closes) < period:
         return np.array([])
-    result = np.zeros(len(closes) - period + 1)
-    for i in range(period, len(closes) + 1):
-        prices = closes[i-period:i]
-        time_idx = np.arange(period)
-        # Manual Spearman
-        price_rank = np.argsort(np.argsort(prices))
-        time_rank = np.argsort(np.argsort(time_idx))
-        d = price_rank - time_rank
-        result[i - period] = 1 - 6 * np.sum(d**2) / (period * (period**2 - 1))
-    return result
+    windows = sliding_window_view(closes, period)
+    price_rank = np.argsort(np.argsort(windows, axis=1), axis=1)
+    d = price_rank - np.arange(period)
+    return 1 - 6 * np.sum(d**2, axis=1) / (period * (period**2 - 1))
 
 
 def rci_ribbon(closes: np.ndarray, periods: List[int] = [9, 14, 21]) -> Dict[str, np.ndarray]:
@@ -0,0 +1,404 @@
+"""
+Streaming Technical Indicators Module for FINBOT
+
+This module provides stateful, constant-time-per-candle counterparts of the
+window-based indicators in ``indicators.realtime``. Instead of recomputing
+over a full ``RollingWindow`` on every tick, each indicator keeps running
+sums, recursion state or monotonic deques and advances one candle at a time.
+
+After every update, ``value`` equals the last element of the matching batch
+function applied to all candles seen so far (to within floating point
+rounding), e.g. ``StreamingSMA(20)`` tracks ``moving_average_simple(closes, 20)[-1]``.
+Indicators return None until the batch function would return a value.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from .realtime import Candle, RollingWindow
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """IEEE division for Python floats: x/0 is +/-inf and 0/0 is NaN, as in the NumPy batch code."""
+    if denominator == 0:
+        if numerator == 0 or math.isnan(numerator):
+            return math.nan
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+
+class _RollingSum:
+    """
+    Sum of the last ``period`` values held in a ring buffer.
+
+    The running total is re-summed exactly (``math.fsum``) each time the ring
+    wraps, so add/subtract rounding never accumulates beyond one period and the
+    cost stays O(1) amortized. A window of zeros sums to exactly 0.0.
+    """
+
+    def __init__(self, period: int):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+        self.count = 0
+        self.total = 0.0
+        self._values = [0.0] * period
+        self._index = 0
+        self._nonzero = 0
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.period
+
+    def push(self, value: float) -> float:
+        """Add ``value``, drop the value ``period`` pushes back and return the new total."""
+        old = self._values[self._index]
+        if old != 0:
+            self._nonzero -= 1
+        if value != 0:
+            self._nonzero += 1
+        self._values[self._index] = value
+        self.total += value - old
+        self.count += 1
+        self._index += 1
+        if self._index == self.period:
+            self._index = 0
+            self.total = math.fsum(self._values)
+        if self._nonzero == 0:
+            self.total = 0.0
+        return self.total
+
+    def mean(self) -> float:
+        return self.total / self.period
+
+
+class _RollingMoments:
+    """Rolling mean and sample standard deviation (ddof=1) via a windowed Welford update."""
+
+    def __init__(self, period: int):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._values = [0.0] * period
+        self._index = 0
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.period
+
+    def push(self, value: float) -> None:
+        if self.count < self.period:
+            n = self.count + 1
+            delta = value - self.mean
+            self.mean += delta / n
+            self._m2 += delta * (value - self.mean)
+        else:
+            old = self._values[self._index]
+            mean = self.mean + (value - old) / self.period
+            self._m2 += (value - old) * (value - mean + old - self.mean)
+            self.mean = mean
+        self._values[self._index] = value
+        self.count += 1
+        self._index += 1
+        if self._index == self.period:
+            # Exact two-pass recompute once per period bounds the drift
+            self._index = 0
+            self.mean = math.fsum(self._values) / self.period
+            self._m2 = math.fsum((v - self.mean) ** 2 for v in self._values)
+
+    def std(self) -> float:
+        n = min(self.count, self.period)
+        if n < 2:
+            return math.nan
+        return math.sqrt(max(self._m2, 0.0) / (n - 1))
+
+
+class _WindowExtreme:
+    """Maximum (or minimum) of the last ``period`` values via a monotonic deque."""
+
+    def __init__(self, period: int, maximum: bool = True):
+        self.period = period
+        self.maximum = maximum
+        self.count = 0
+        self._window: Deque[Tuple[int, float]] = deque()
+
+    def push(self, value: float) -> float:
+        window = self._window
+        if self.maximum:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((self.count, value))
+        self.count += 1
+        if window[0][0] <= self.count - 1 - self.period:
+            window.popleft()
+        return window[0][1]
+
+
+class StreamingIndicator:
+    """Base class for streaming indicators: ``update`` one candle, read ``value``."""
+
+    value = None
+
+    def update(self, candle: Candle):
+        """Advance by one candle and return the current value (None until warmed up)."""
+        raise NotImplementedError
+
+    def prime(self, window: RollingWindow):
+        """Feed every bar in ``window`` (oldest first) and return the current value."""
+        for bar in zip(window.get_opens().tolist(), window.get_highs().tolist(), window.get_lows().tolist(),
+                       window.get_closes().tolist(), window.get_volumes().tolist()):
+            self.update(Candle(*bar))
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+
+class StreamingSMA(StreamingIndicator):
+    """Streaming ``moving_average_simple``: running sum over ``period`` closes."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._sum = _RollingSum(period)
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        self._sum.push(candle.close)
+        if self._sum.full:
+            self.value = self._sum.mean()
+        return self.value
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Streaming ``moving_average_exponential``.
+
+    The batch function uses ``pandas.Series.ewm(span=period).mean()``, which is
+    the bias-adjusted EMA (``adjust=True``): a weighted mean of all closes so
+    far with weights ``(1 - alpha) ** age``. The recursion below is the one
+    pandas uses, carrying the weighted mean and the total weight.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self._decay = 1.0 - 2.0 / (period + 1)
+        self._mean = math.nan
+        self._weight = 0.0
+        self.count = 0
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        close = candle.close
+        if self.count == 0:
+            self._mean, self._weight = close, 1.0
+        else:
+            self._weight *= self._decay
+            if self._mean != close:
+                self._mean = (self._weight * self._mean + close) / (self._weight + 1.0)
+            self._weight += 1.0
+        self.count += 1
+        if self.count >= self.period:
+            self.value = self._mean
+        return self.value
+
+
+class StreamingRSI(StreamingIndicator):
+    """Streaming ``relative_strength_index``: rolling sums of gains and losses over ``period`` changes."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gains = _RollingSum(period)
+        self._losses = _RollingSum(period)
+        self._prev_close: Optional[float] = None
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        close = candle.close
+        prev, self._prev_close = self._prev_close, close
+        if prev is None:
+            return self.value
+        self._gains.push(close - prev if close > prev else 0.0)
+        self._losses.push(prev - close if close < prev else 0.0)
+        if self._gains.full:
+            rs = _divide(self._gains.mean(), self._losses.mean())
+            self.value = 100 - (100 / (1 + rs))
+        return self.value
+
+
+class StreamingATR(StreamingIndicator):
+    """Streaming ``average_true_range``: rolling mean of the true range."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._true_ranges = _RollingSum(period)
+        self._prev_close: Optional[float] = None
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        prev, self._prev_close = self._prev_close, candle.close
+        if prev is None:
+            return self.value
+        high, low = candle.high, candle.low
+        self._true_ranges.push(max(high - low, abs(high - prev), abs(low - prev)))
+        if self._true_ranges.full:
+            self.value = self._true_ranges.mean()
+        return self.value
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Streaming ``bollinger_bands``; ``value`` is ``(upper, middle, lower)`` with a sample (ddof=1) std."""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.period = period
+        self.std_dev = std_dev
+        self._moments = _RollingMoments(period)
+        self.value: Optional[Tuple[float, float, float]] = None
+
+    def update(self, candle: Candle) -> Optional[Tuple[float, float, float]]:
+        self._moments.push(candle.close)
+        if self._moments.full:
+            middle = self._moments.mean
+            width = self.std_dev * self._moments.std()
+            self.value = (middle + width, middle, middle - width)
+        return self.value
+
+
+class StreamingStochastic(StreamingIndicator):
+    """
+    Streaming ``stochastic_oscillator``; ``value`` is ``(k, d)``.
+
+    Window highs and lows come from monotonic deques. ``d`` is None until
+    ``d_period`` values of %K exist, and %K is NaN when the window has no range.
+    """
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self.k_period = k_period
+        self.d_period = d_period
+        self._highest = _WindowExtreme(k_period, maximum=True)
+        self._lowest = _WindowExtreme(k_period, maximum=False)
+        self._k_values: Deque[float] = deque(maxlen=d_period)
+        self.value: Optional[Tuple[float, Optional[float]]] = None
+
+    def update(self, candle: Candle) -> Optional[Tuple[float, Optional[float]]]:
+        highest = self._highest.push(candle.high)
+        lowest = self._lowest.push(candle.low)
+        if self._highest.count < self.k_period:
+            return self.value
+        k = 100 * _divide(candle.close - lowest, highest - lowest)
+        self._k_values.append(k)
+        d = sum(self._k_values) / self.d_period if len(self._k_values) == self.d_period else None
+        self.value = (k, d)
+        return self.value
+
+
+class StreamingCCI(StreamingIndicator):
+    """
+    Streaming ``commodity_channel_index``.
+
+    The SMA of the typical price is a running sum. The mean absolute deviation
+    around that SMA has no constant-time update (every deviation changes when
+    the mean moves), so it is one vectorized pass over a ``period``-sized ring
+    buffer per candle, independent of the history length.
+    """
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self._sum = _RollingSum(period)
+        self._typical = np.zeros(period)
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        typical = (candle.high + candle.low + candle.close) / 3
+        self._typical[self._sum.count % self.period] = typical
+        self._sum.push(typical)
+        if self._sum.full:
+            mean = float(self._typical.mean())
+            mad = float(np.abs(self._typical - mean).mean())
+            self.value = _divide(typical - self._sum.mean(), 0.015 * mad)
+        return self.value
+
+
+class StreamingMFI(StreamingIndicator):
+    """Streaming ``money_flow_index``: rolling positive and negative money-flow sums."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._positive = _RollingSum(period)
+        self._negative = _RollingSum(period)
+        self._prev_typical: Optional[float] = None
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        typical = (candle.high + candle.low + candle.close) / 3
+        prev, self._prev_typical = self._prev_typical, typical
+        if prev is None:
+            return self.value
+        flow = typical * candle.volume
+        self._positive.push(flow if typical > prev else 0.0)
+        self._negative.push(flow if typical < prev else 0.0)
+        if self._positive.full:
+            ratio = _divide(self._positive.total, self._negative.total)
+            self.value = 100 - (100 / (1 + ratio))
+        return self.value
+
+
+class StreamingOBV(StreamingIndicator):
+    """Streaming ``on_balance_volume``, starting from the first candle's volume."""
+
+    def __init__(self):
+        self._obv = 0.0
+        self._prev_close: Optional[float] = None
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        prev, self._prev_close = self._prev_close, candle.close
+        if prev is None:
+            self._obv = candle.volume
+            return self.value
+        if candle.close > prev:
+            self._obv += candle.volume
+        elif candle.close < prev:
+            self._obv -= candle.volume
+        self.value = self._obv
+        return self.value
+
+
+class StreamingVWAP(StreamingIndicator):
+    """Streaming ``volume_weighted_average_price``: cumulative typical price x volume over cumulative volume."""
+
+    def __init__(self):
+        self._price_volume = 0.0
+        self._volume = 0.0
+        self.value: Optional[float] = None
+
+    def update(self, candle: Candle) -> Optional[float]:
+        typical = (candle.high + candle.low + candle.close) / 3
+        self._price_volume += typical * candle.volume
+        self._volume += candle.volume
+        self.value = _divide(self._price_volume, self._volume)
+        return self.value
+
+
+# Batch function in ``indicators.realtime`` -> streaming counterpart
+STREAMING_COUNTERPARTS: Dict[str, type] = {
+    'moving_average_simple': StreamingSMA,
+    'moving_average_exponential': StreamingEMA,
+    'relative_strength_index': StreamingRSI,
+    'average_true_range': StreamingATR,
+    'bollinger_bands': StreamingBollingerBands,
+    'stochastic_oscillator': StreamingStochastic,
+    'commodity_channel_index': StreamingCCI,
+    'money_flow_index': StreamingMFI,
+    'on_balance_volume': StreamingOBV,
+    'volume_weighted_average_price': StreamingVWAP,
+}
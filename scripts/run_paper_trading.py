@@ -1,11 +1,13 @@
 import argparse
 import json
 import logging
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
 from backtester.engine import EventBacktester
 from backtester.config import BacktestConfig
+from backtester.reporting import BacktestReporter
 from strategies.ema_crossover.strategy import (
     EMACrossoverConfig,
     EMACrossoverStrategy,
@@ -71,17 +73,16 @@ async def run_paper_trading_session(config_path: str):
 
     # 5. Run the backtest
     report_path = f"reports/paper_trade_report_{datetime.now():%Y%m%d_%H%M%S}.json"
-    plot_path = f"reports/equity_curve_{datetime.now():%Y%m%d_%H%M%S}.png"
+    plot_path = f"reports/equity_curve_{datetime.now():%Y%m%d_%H%M%S}.html"
     Path("reports").mkdir(exist_ok=True)
 
     report = backtester.run(events=candles, plot_path=plot_path)
 
     # 6. Log results and summary
     logging.info("Paper trading session finished.")
-    logging.info(f"Performance Report:\n{report.performance.to_dict()}")
+    logging.info(f"Performance Report:\n{asdict(report.metrics)}")
 
-    with open(report_path, "w") as f:
-        json.dump(report.to_dict(), f, indent=4)
+    BacktestReporter(equity=report.equity_arrays).export_json(report, report_path)
     logging.info(f"Full report saved to {report_path}")
     logging.info(f"Equity curve plot saved to {plot_path}")
 
@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import batch, realtime
+
+
+def _panel(rows=700, cols=300, seed=0):
+    """Random-walk OHLC panel with staggered listings and a flat (suspended) stretch in column 3."""
+    rng = np.random.default_rng(seed)
+    closes = 2500 * np.exp(np.cumsum(rng.normal(0, 0.01, (rows, cols)), axis=0))
+    highs = closes * (1 + rng.uniform(0, 0.01, (rows, cols)))
+    lows = closes * (1 - rng.uniform(0, 0.01, (rows, cols)))
+    closes[300:340, 3] = highs[300:340, 3] = lows[300:340, 3] = closes[299, 3]
+    starts = rng.integers(0, 200, cols)
+    starts[0] = 0
+    for col, start in enumerate(starts):
+        closes[:start, col] = highs[:start, col] = lows[:start, col] = np.nan
+    return highs, lows, closes, starts
+
+
+def _assert_matches(panel_values, per_symbol, starts, warmup, skip=()):
+    for col, start in enumerate(starts):
+        if col in skip:
+            continue
+        got = panel_values[start:, col]
+        expected = per_symbol(col, start)
+        assert np.isnan(panel_values[:start, col]).all()
+        assert np.isnan(got[:warmup]).all() and len(got) - warmup == len(expected)
+        np.testing.assert_allclose(got[warmup:], expected, rtol=1e-9, atol=1e-9, err_msg=f"column {col}")
+
+
+@pytest.mark.parametrize("cols", [40, 300])  # narrow and wide panels take different code paths
+def test_batch_matches_per_symbol_functions(cols):
+    highs, lows, closes, starts = _panel(cols=cols)
+    h, l, c = (lambda col, start, a=a: a[start:, col] for a in (highs, lows, closes))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _assert_matches(batch.moving_average_simple(closes, 20),
+                        lambda i, s: realtime.moving_average_simple(c(i, s), 20), starts, 19)
+        _assert_matches(batch.moving_average_exponential(closes, 20),
+                        lambda i, s: realtime.moving_average_exponential(c(i, s), 20), starts, 19)
+        _assert_matches(batch.relative_strength_index(closes, 14),
+                        lambda i, s: realtime.relative_strength_index(c(i, s), 14), starts, 14)
+        _assert_matches(batch.average_true_range(highs, lows, closes, 14),
+                        lambda i, s: realtime.average_true_range(h(i, s), l(i, s), c(i, s), 14), starts, 14)
+        _assert_matches(batch.average_directional_index(highs, lows, closes, 14),
+                        lambda i, s: realtime.average_directional_index(h(i, s), l(i, s), c(i, s), 14), starts, 14)
+        # pandas leaves rounding noise in the std of the flat column 3; see test_flat_windows_are_exact
+        for band in range(3):
+            _assert_matches(batch.bollinger_bands(closes, 20, 2.0)[band],
+                            lambda i, s: realtime.bollinger_bands(c(i, s), 20, 2.0)[band][19:], starts, 19, skip=(3,))
+        for line, warmup in zip(range(3), (25, 33, 33)):
+            _assert_matches(batch.moving_average_convergence_divergence(closes)[line],
+                            lambda i, s: realtime.moving_average_convergence_divergence(c(i, s))[line], starts, warmup)
+        for line, warmup in zip(range(2), (13, 15)):
+            _assert_matches(batch.stochastic_oscillator(highs, lows, closes, 14, 3)[line],
+                            lambda i, s: realtime.stochastic_oscillator(h(i, s), l(i, s), c(i, s), 14, 3)[line],
+                            starts, warmup)
+
+
+def test_flat_windows_are_exact():
+    highs, lows, closes, _ = _panel(cols=4)
+    upper, middle, lower = batch.bollinger_bands(closes, 20)
+    assert (upper[320:340, 3] == middle[320:340, 3]).all() and (lower[320:340, 3] == middle[320:340, 3]).all()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        assert np.isnan(batch.relative_strength_index(closes, 14)[315:340, 3]).all()
+
+
+def test_gaps_and_delisting():
+    rng = np.random.default_rng(1)
+    closes = 100 + np.cumsum(rng.normal(0, 1, (120, 2)), axis=0)
+    closes[50, 0] = np.nan  # one missing bar
+    closes[100:, 1] = np.nan  # delisted
+
+    sma = batch.moving_average_simple(closes, 10)
+    assert np.isnan(sma[50:60, 0]).all()
+    np.testing.assert_allclose(sma[60, 0], closes[51:61, 0].mean(), rtol=1e-12)
+    assert np.isnan(sma[100:, 1]).all() and not np.isnan(sma[99, 1])
+
+    ema = batch.moving_average_exponential(closes, 10)
+    expected = pd.Series(closes[:, 0]).ewm(span=10).mean().to_numpy()
+    assert np.isnan(ema[50, 0])
+    np.testing.assert_allclose(ema[51:, 0], expected[51:], rtol=1e-12)
+    assert np.isnan(ema[100:, 1]).all()
+
+
+def test_dataframe_in_dataframe_out():
+    highs, lows, closes, _ = _panel(rows=400, cols=4)
+    index = pd.date_range("2024-01-01", periods=400, freq="B")
+    frames = [pd.DataFrame(a, index=index, columns=["INFY", "TCS", "SBIN", "ITC"]) for a in (highs, lows, closes)]
+
+    k, d = batch.stochastic_oscillator(*frames)
+    assert isinstance(k, pd.DataFrame) and k.index.equals(index) and list(d.columns) == ["INFY", "TCS", "SBIN", "ITC"]
+    np.testing.assert_array_equal(k.to_numpy(), batch.stochastic_oscillator(highs, lows, closes)[0])
+
+
+def test_rejects_bad_shapes():
+    with pytest.raises(ValueError):
+        batch.moving_average_simple(np.arange(10.0), 3)
+    with pytest.raises(ValueError):
+        batch.average_true_range(np.ones((5, 2)), np.ones((5, 3)), np.ones((5, 2)))
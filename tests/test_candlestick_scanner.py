@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from indicators import patterns
+from indicators.patterns import (
+    CANDLESTICK_PATTERNS,
+    PATTERN_BITS,
+    PATTERN_CANDLES,
+    decode_patterns,
+    pattern_masks,
+    scan_candlestick_bitmask,
+    scan_latest_candle,
+)
+
+
+def _candles(n=400, seed=0):
+    """Rounded random candles (so ties, zero-range bars and exact gaps occur) with one missing close."""
+    rng = np.random.default_rng(seed)
+    base = np.round(100 + np.cumsum(rng.normal(0, 2, n)), 1)
+    opens = base + np.round(rng.normal(0, 1, n), 1)
+    closes = base + np.round(rng.normal(0, 1, n), 1)
+    highs = np.maximum(opens, closes) + np.round(np.abs(rng.normal(0, 0.5, n)), 1) * (rng.random(n) < 0.7)
+    lows = np.minimum(opens, closes) - np.round(np.abs(rng.normal(0, 0.5, n)), 1) * (rng.random(n) < 0.7)
+    opens[50] = highs[50] = lows[50] = closes[50]
+    closes[90] = np.nan
+    return opens, highs, lows, closes
+
+
+def _detectors(o, h, l, c):
+    results = {
+        'doji': patterns.detect_doji(o, h, l, c),
+        'hammer': patterns.detect_hammer(o, h, l, c),
+        'spinning_top': patterns.detect_spinning_top(o, h, l, c),
+        'morning_star': patterns.detect_morning_star(o, h, l, c),
+        'evening_star': patterns.detect_evening_star(o, h, l, c),
+        'three_white_soldiers': patterns.detect_three_white_soldiers(o, h, l, c),
+        'three_black_crows': patterns.detect_three_black_crows(o, h, l, c),
+        'piercing_line': patterns.detect_piercing_line(o, h, l, c),
+        'dark_cloud_cover': patterns.detect_dark_cloud_cover(o, h, l, c),
+    }
+    pairs = {
+        ('bullish_engulfing', 'bearish_engulfing'): patterns.detect_engulfing(o, h, l, c),
+        ('bullish_harami', 'bearish_harami'): patterns.detect_harami(o, h, l, c),
+        ('white_marubozu', 'black_marubozu'): patterns.detect_marubozu(o, h, l, c),
+        ('bullish_abandoned_baby', 'bearish_abandoned_baby'): patterns.detect_abandoned_baby(o, h, l, c),
+        ('bullish_kicking', 'bearish_kicking'): patterns.detect_kicking(o, h, l, c),
+        ('tweezer_top', 'tweezer_bottom'): patterns.detect_tweezer_top_bottom(h, l, c),
+        ('rising_window', 'falling_window'): patterns.detect_rising_falling_window(o, h, l, c),
+        ('rising_three_methods', 'falling_three_methods'): patterns.detect_three_methods(o, h, l, c),
+        ('upside_tasuki_gap', 'downside_tasuki_gap'): patterns.detect_tasuki_gap(o, h, l, c),
+    }
+    for names, values in pairs.items():
+        results.update(zip(names, values))
+    return results
+
+
+def test_fused_scan_matches_detectors():
+    o, h, l, c = _candles()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = _detectors(o, h, l, c)
+    bitmask = scan_candlestick_bitmask(o, h, l, c)
+    masks = pattern_masks(bitmask)
+
+    assert bitmask.dtype == np.uint32 and len(bitmask) == len(c)
+    for name in CANDLESTICK_PATTERNS:
+        lag = PATTERN_CANDLES[name] - 1
+        assert not masks[name][:lag].any()
+        np.testing.assert_array_equal(masks[name][lag:], expected[name], err_msg=name)
+
+
+def test_latest_candle_matches_full_scan():
+    o, h, l, c = _candles(120)
+    bitmask = scan_candlestick_bitmask(o, h, l, c)
+    for end in range(1, len(c) + 1):
+        assert scan_latest_candle(o[:end], h[:end], l[:end], c[:end]) == bitmask[end - 1]
+    assert scan_latest_candle(o[:0], h[:0], l[:0], c[:0]) == 0
+
+
+def test_bitmask_flags_last_candle():
+    # Bearish candle engulfed by a bullish one
+    opens = np.array([10.0, 8.5])
+    closes = np.array([9.0, 10.5])
+    highs = np.array([10.2, 10.6])
+    lows = np.array([8.8, 8.4])
+    bitmask = scan_candlestick_bitmask(opens, highs, lows, closes)
+
+    assert bitmask[1] & PATTERN_BITS['bullish_engulfing']
+    assert 'bullish_engulfing' in decode_patterns(int(bitmask[1]))
+    assert not bitmask[0] & PATTERN_BITS['bullish_engulfing']
+
+
+def test_scan_all_patterns_uses_detector_alignment():
+    o, h, l, c = _candles()
+    results = patterns.scan_all_patterns(o, h, l, c)
+    for name in CANDLESTICK_PATTERNS:
+        assert len(results[name]) == len(c) - PATTERN_CANDLES[name] + 1
+
+
+def test_three_methods_checks_middle_candles_only():
+    # After an unrelated first bar: a long white candle, three small candles inside its range,
+    # and a second long white candle
+    opens = np.array([95.0, 100.0, 108.0, 106.0, 105.0, 104.0])
+    closes = np.array([96.0, 110.0, 106.0, 105.0, 104.0, 112.0])
+    highs = np.array([200.0, 111.0, 108.5, 106.5, 105.5, 113.0])
+    lows = np.array([94.0, 99.0, 105.5, 104.5, 103.5, 103.0])
+    rising, _ = patterns.detect_three_methods(opens, highs, lows, closes)
+    assert rising.tolist() == [False, True]
+    assert scan_latest_candle(opens, highs, lows, closes) & PATTERN_BITS['rising_three_methods']
@@ -0,0 +1,130 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from indicators import batch, graph, realtime
+from indicators.graph import IndicatorGraph, request
+
+PANEL = ['macd', 'bollinger_bands', 'keltner_channels', request('atr', period=14),
+         request('adx', period=14), request('supertrend', period=10, multiplier=3.0)]
+
+
+def _bars(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = closes * rng.uniform(0, 0.01, n)
+    highs, lows = closes + spread, closes - spread
+    closes[200:230] = highs[200:230] = lows[200:230] = closes[200]
+    return highs, lows, closes
+
+
+def _assert_aligned(values, expected, warmup):
+    assert np.isnan(values[:warmup]).all()
+    np.testing.assert_allclose(values[warmup:], expected, rtol=1e-9, atol=1e-9)
+
+
+def test_graph_matches_realtime_functions():
+    h, l, c = _bars()
+    requests = PANEL + ['rsi', 'stochastic', request('ema', period=20), request('sma', period=20)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = IndicatorGraph(requests).evaluate({'high': h, 'low': l, 'close': c})
+
+        for line, warmup in zip(range(3), (25, 33, 33)):
+            _assert_aligned(values['macd'][line], realtime.moving_average_convergence_divergence(c)[line], warmup)
+        for band in range(3):
+            _assert_aligned(values['bollinger_bands'][band], realtime.bollinger_bands(c)[band][19:], 19)
+        _assert_aligned(values['atr_14'], realtime.average_true_range(h, l, c, 14), 14)
+        _assert_aligned(values['adx_14'], realtime.average_directional_index(h, l, c, 14), 14)
+        for band in range(2):
+            _assert_aligned(values['supertrend_10_3.0'][band], realtime.supertrend(h, l, c, 10, 3.0)[band], 10)
+        _assert_aligned(values['rsi'], realtime.relative_strength_index(c), 14)
+        _assert_aligned(values['stochastic'][0], realtime.stochastic_oscillator(h, l, c)[0], 13)
+        _assert_aligned(values['stochastic'][1], realtime.stochastic_oscillator(h, l, c)[1], 15)
+        _assert_aligned(values['ema_20'], realtime.moving_average_exponential(c, 20), 19)
+        _assert_aligned(values['sma_20'], realtime.moving_average_simple(c, 20), 19)
+
+
+def test_keltner_channels_bands_follow_atr():
+    h, l, c = _bars()
+    upper, middle, lower = IndicatorGraph(['keltner_channels']).evaluate({'high': h, 'low': l, 'close': c})[
+        'keltner_channels']
+    ema = realtime.moving_average_exponential((h + l + c) / 3, 20)
+    atr = realtime.average_true_range(h, l, c, 20)
+    _assert_aligned(middle, ema, 19)
+    np.testing.assert_allclose(upper[20:], ema[1:] + 2.0 * atr, rtol=1e-12)
+    np.testing.assert_allclose(lower[20:], ema[1:] - 2.0 * atr, rtol=1e-12)
+    assert np.isnan(upper[:20]).all() and np.isnan(lower[:20]).all()
+
+
+def test_shared_intermediates_are_computed_once(monkeypatch):
+    h, l, c = _bars()
+    calls = Counter()
+    for op, fn in list(graph._OPS.items()):
+        monkeypatch.setitem(graph._OPS, op, lambda *args, _op=op, _fn=fn: (calls.update([_op]), _fn(*args))[1])
+
+    plan = IndicatorGraph(PANEL + [request('ema', period=26)])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plan.evaluate({'high': h, 'low': l, 'close': c})
+
+    # One true range for the ATRs of Keltner (20), ATR and ADX (14) and Supertrend (10);
+    # ATR-14 shared by ATR and ADX; EMA-26 of close shared by MACD and the EMA request
+    assert calls['true_range'] == 1
+    assert plan.nodes.count(graph.true_range()) == 1
+    assert calls['window_mean'] == 7  # ATR 10/14/20, SMA-20 of close, and ADX's means of +DM, -DM and DX
+    assert plan.nodes.count(graph.atr(14)) == 1
+    assert plan.nodes.count(graph.ema(graph.source('close'), 26)) == 1
+    assert calls['ema'] == 4  # close 12 and 26, MACD signal, typical price 20
+    assert len(plan.nodes) < plan.naive_node_count()
+    assert sum(calls.values()) == len([node for node in plan.nodes if node.op != 'source'])
+
+
+def test_panel_inputs_match_single_symbol():
+    h, l, c = _bars()
+    plan = IndicatorGraph(PANEL)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        single = plan.evaluate({'high': h, 'low': l, 'close': c})
+        panel = plan.evaluate({'high': np.column_stack([h, h * 2]), 'low': np.column_stack([l, l * 2]),
+                               'close': np.column_stack([c, c * 2])})
+    for key, value in single.items():
+        for got, expected in zip(panel[key] if isinstance(value, tuple) else (panel[key],),
+                                 value if isinstance(value, tuple) else (value,)):
+            assert got.shape == (len(c), 2)
+            np.testing.assert_allclose(got[:, 0], expected, rtol=1e-13)
+
+
+def test_rolling_means_match_batch_functions():
+    h, l, c = _bars()
+    panel = {'high': np.column_stack([h, h * 2]), 'low': np.column_stack([l, l * 2]),
+             'close': np.column_stack([c, c * 2])}
+    requests = [request('sma', period=20), request('atr', period=14), request('rsi', period=14)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = IndicatorGraph(requests).evaluate(panel)
+        np.testing.assert_array_equal(values['sma_20'], batch.moving_average_simple(panel['close'], 20))
+        np.testing.assert_array_equal(values['atr_14'],
+                                      batch.average_true_range(panel['high'], panel['low'], panel['close'], 14))
+        np.testing.assert_array_equal(values['rsi_14'], batch.relative_strength_index(panel['close'], 14))
+    # The flat stretch has all-zero true ranges, and its ATR stays exactly zero
+    assert (values['atr_14'][214:230] == 0).all()
+
+
+def test_rolling_window_input():
+    h, l, c = _bars()
+    window = realtime.RollingWindow(120)
+    window.extend(c, h, l, c, np.ones(len(c)))
+    h, l, c = h[-120:], l[-120:], c[-120:]
+    values = IndicatorGraph([request('atr', period=14)]).evaluate(window)
+    _assert_aligned(values['atr_14'], realtime.average_true_range(h, l, c, 14), 14)
+
+
+def test_rejects_bad_requests():
+    with pytest.raises(ValueError):
+        request('not_an_indicator')
+    with pytest.raises(ValueError):
+        IndicatorGraph(['rsi', 'rsi'])
+    with pytest.raises(ValueError):
+        IndicatorGraph(['atr']).evaluate({'close': np.ones(50)})
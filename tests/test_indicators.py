@@ -30,6 +30,32 @@ from indicators.realtime import (
     bull_bear_power,
     chaikin_money_flow,
     chaikin_oscillator,
+    Candle,
+    RollingWindow,
+    commodity_channel_index,
+    money_flow_index,
+    moving_average_exponential,
+    moving_average_simple,
+    on_balance_volume,
+    relative_strength_index,
+    stochastic_oscillator,
+    volume_weighted_average_price,
+    parabolic_sar,
+    rank_correlation_index,
+    supertrend,
+    zig_zag,
+)
+from indicators.streaming import (
+    StreamingATR,
+    StreamingBollingerBands,
+    StreamingCCI,
+    StreamingEMA,
+    StreamingMFI,
+    StreamingOBV,
+    StreamingRSI,
+    StreamingSMA,
+    StreamingStochastic,
+    StreamingVWAP,
 )
 
 
@@ -252,6 +278,179 @@ def test_chaikin_oscillator():
     assert len(result) == 15, f"Expected length 15, got {len(result)}"
 
 
+def test_rolling_window_matches_deque():
+    from collections import deque
+
+    rng = np.random.default_rng(0)
+    window = RollingWindow(50)
+    reference = deque(maxlen=50)
+    for step in range(400):
+        if step % 7 == 0:
+            n = int(rng.integers(0, 80))
+            bars = rng.normal(100, 5, (5, n))
+            window.extend(*bars)
+            reference.extend(bars.T.tolist())
+        else:
+            bar = rng.normal(100, 5, 5).tolist()
+            window.add_candle(Candle(*bar))
+            reference.append(bar)
+        expected = np.array(reference).reshape(-1, 5)
+        assert len(window) == len(reference)
+        assert window.is_full() == (len(reference) == 50)
+        for column, getter in enumerate((window.get_opens, window.get_highs, window.get_lows,
+                                         window.get_closes, window.get_volumes)):
+            np.testing.assert_array_equal(getter(), expected[:, column])
+    assert window.latest() == Candle(*reference[-1])
+
+
+def test_rolling_window_views_are_zero_copy():
+    window = RollingWindow(4)
+    for i in range(11):
+        window.add_candle(Candle(i, i + 1, i - 1, i + 0.5, 10 * i))
+    closes = window.get_closes()
+    assert closes.flags.c_contiguous
+    assert not closes.flags.writeable
+    assert np.shares_memory(closes, window._data)
+    np.testing.assert_array_equal(closes, [7.5, 8.5, 9.5, 10.5])
+
+
+def test_rolling_window_extend_keeps_last_bars():
+    window = RollingWindow(3)
+    assert window.latest() is None
+    values = np.arange(10, dtype=float)
+    window.extend(values, values + 1, values - 1, values, values * 10)
+    np.testing.assert_array_equal(window.get_closes(), [7.0, 8.0, 9.0])
+    np.testing.assert_array_equal(window.get_volumes(), [70.0, 80.0, 90.0])
+
+
+def _streaming_bars(n=400, seed=7):
+    """Random OHLCV bars with a flat stretch at 150-179."""
+    rng = np.random.default_rng(seed)
+    closes = 2500 + np.cumsum(rng.normal(0, 2, n))
+    closes[150:180] = closes[149]  # flat stretch: zero gains/losses and no range
+    highs = closes + rng.uniform(0, 3, n)
+    lows = closes - rng.uniform(0, 3, n)
+    highs[150:180] = lows[150:180] = closes[149]
+    opens = closes + rng.normal(0, 1, n)
+    volumes = rng.integers(100, 5000, n).astype(float)
+    return opens, highs, lows, closes, volumes
+
+
+def test_streaming_indicators_match_batch():
+    opens, highs, lows, closes, volumes = _streaming_bars()
+    cases = [
+        (StreamingSMA(20), lambda o, h, l, c, v: moving_average_simple(c, 20)),
+        (StreamingEMA(12), lambda o, h, l, c, v: moving_average_exponential(c, 12)),
+        (StreamingRSI(14), lambda o, h, l, c, v: relative_strength_index(c, 14)),
+        (StreamingATR(14), lambda o, h, l, c, v: average_true_range(h, l, c, 14)),
+        (StreamingBollingerBands(20, 2.0), lambda o, h, l, c, v: np.array(bollinger_bands(c, 20, 2.0))[:, 19:].T),
+        (StreamingCCI(20), lambda o, h, l, c, v: commodity_channel_index(h, l, c, 20)),
+        (StreamingMFI(14), lambda o, h, l, c, v: money_flow_index(h, l, c, v, 14)),
+        (StreamingOBV(), lambda o, h, l, c, v: on_balance_volume(c, v)),
+        (StreamingVWAP(), lambda o, h, l, c, v: volume_weighted_average_price(h, l, c, v)),
+    ]
+    for indicator, batch in cases:
+        for n in range(1, len(closes) + 1):
+            value = indicator.update(Candle(opens[n-1], highs[n-1], lows[n-1], closes[n-1], volumes[n-1]))
+            expected = batch(opens[:n], highs[:n], lows[:n], closes[:n], volumes[:n])
+            if len(expected) == 0:
+                assert value is None, (type(indicator).__name__, n)
+            else:
+                np.testing.assert_allclose(value, expected[-1], rtol=1e-9, atol=1e-9,
+                                           err_msg=f"{type(indicator).__name__} after {n} bars")
+
+
+def test_streaming_stochastic_matches_batch():
+    opens, highs, lows, closes, volumes = _streaming_bars()
+    indicator = StreamingStochastic(14, 3)
+    for n in range(1, len(closes) + 1):
+        value = indicator.update(Candle(opens[n-1], highs[n-1], lows[n-1], closes[n-1], volumes[n-1]))
+        k, d = stochastic_oscillator(highs[:n], lows[:n], closes[:n], 14, 3)
+        if len(k) == 0:
+            assert value is None
+            continue
+        np.testing.assert_allclose(value[0], k[-1], rtol=1e-9, atol=1e-9)
+        if len(d) == 0:
+            assert value[1] is None
+        else:
+            np.testing.assert_allclose(value[1], d[-1], rtol=1e-9, atol=1e-9)
+
+
+def test_streaming_indicator_primed_from_window():
+    opens, highs, lows, closes, volumes = (column[:60] for column in _streaming_bars())
+    window = RollingWindow(50)
+    window.extend(opens, highs, lows, closes, volumes)
+    np.testing.assert_allclose(StreamingSMA(20).prime(window), moving_average_simple(window.get_closes(), 20)[-1],
+                               rtol=1e-12)
+    np.testing.assert_allclose(StreamingEMA(10).prime(window), moving_average_exponential(window.get_closes(), 10)[-1],
+                               rtol=1e-12)
+
+
+def test_window_indicators_match_per_bar_definitions():
+    rng = np.random.default_rng(11)
+    closes = np.round(100 + np.cumsum(rng.normal(0, 1, 300)))  # rounded to force ties
+    highs, lows = closes + rng.integers(0, 3, 300), closes - rng.integers(0, 3, 300)
+
+    up, down = aroon(highs, lows, 14)
+    expected_up = [(14 - (13 - np.argmax(highs[i - 13:i + 1]))) / 14 * 100 for i in range(13, 300)]
+    expected_down = [(14 - (13 - np.argmin(lows[i - 13:i + 1]))) / 14 * 100 for i in range(13, 300)]
+    np.testing.assert_array_equal(up, expected_up)
+    np.testing.assert_array_equal(down, expected_down)
+
+    high_pivots, low_pivots = get_pivots(highs, lows, 3)
+    neighbours = [j for j in range(-3, 4) if j]
+    assert high_pivots.tolist() == [i for i in range(3, 297) if all(highs[i] > highs[i + j] for j in neighbours)]
+    assert low_pivots.tolist() == [i for i in range(3, 297) if all(lows[i] < lows[i + j] for j in neighbours)]
+    assert get_pivots(np.arange(10.0), np.arange(10.0), 2)[0].dtype == np.float64  # empty result as before
+
+    rci = rank_correlation_index(closes, 9)
+    for i in range(len(rci)):
+        d = np.argsort(np.argsort(closes[i:i + 9])) - np.arange(9)
+        assert rci[i] == 1 - 6 * np.sum(d**2) / (9 * 80)
+
+
+def test_parabolic_sar_kernel():
+    rng = np.random.default_rng(12)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 500))
+    highs, lows = closes + rng.uniform(0, 1, 500), closes - rng.uniform(0, 1, 500)
+
+    expected = np.zeros(500)
+    expected[0], ep, af, uptrend = lows[0], highs[0], 0.02, True
+    for i in range(1, 500):
+        expected[i] = expected[i - 1] + af * (ep - expected[i - 1])
+        if uptrend and lows[i] <= expected[i] or not uptrend and highs[i] >= expected[i]:
+            uptrend, expected[i], ep, af = not uptrend, ep, highs[i] if not uptrend else lows[i], 0.02
+        elif uptrend and highs[i] > ep or not uptrend and lows[i] < ep:
+            ep, af = highs[i] if uptrend else lows[i], min(af + 0.02, 0.2)
+    np.testing.assert_array_equal(parabolic_sar(highs, lows), expected)
+
+
+def test_zig_zag_pivots():
+    midpoints = np.array([100.0, 106.0, 110.0, 104.0, 98.0, 103.0])
+    assert zig_zag(midpoints + 1, midpoints - 1, 0.05) == [(110.0, 2), (98.0, 4)]
+    assert zig_zag(midpoints[:5] + 1, midpoints[:5] - 1, 0.05) == [(110.0, 2)]
+
+
+def test_supertrend_aligned_with_atr():
+    rng = np.random.default_rng(13)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 200))
+    highs, lows = closes + rng.uniform(0, 2, 200), closes - rng.uniform(0, 2, 200)
+    upper, lower = supertrend(highs, lows, closes, 7, 3.0)
+    atr = average_true_range(highs, lows, closes, 7)
+    assert len(upper) == len(lower) == len(atr) == 193
+
+    hl2 = (highs[7:] + lows[7:]) / 2
+    lowerband, upperband = hl2 - 3.0 * atr, hl2 + 3.0 * atr
+    trend = 1
+    for i in range(193):
+        if i and closes[7 + i] > upperband[i - 1]:
+            trend = 1
+        elif i and closes[7 + i] < lowerband[i - 1]:
+            trend = -1
+        band = lowerband[i] if trend == 1 else upperband[i]
+        assert upper[i] == lower[i] == band
+
+
 if __name__ == "__main__":
     test_twenty_four_hour_volume()
     test_accumulation_distribution()
@@ -278,4 +477,14 @@ if __name__ == "__main__":
     test_bull_bear_power()
     test_chaikin_money_flow()
     test_chaikin_oscillator()
+    test_rolling_window_matches_deque()
+    test_rolling_window_views_are_zero_copy()
+    test_rolling_window_extend_keeps_last_bars()
+    test_streaming_indicators_match_batch()
+    test_streaming_stochastic_matches_batch()
+    test_streaming_indicator_primed_from_window()
+    test_window_indicators_match_per_bar_definitions()
+    test_parabolic_sar_kernel()
+    test_zig_zag_pivots()
+    test_supertrend_aligned_with_atr()
     print("All tests passed!")
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 from typing import List, Tuple
 
+import pytest
+
 from backtester import (
     BacktestConfig,
     CostModel,
@@ -49,10 +51,10 @@ def test_event_backtester_runs_with_costs():
     backtester = EventBacktester(config, strategies=[strategy], cost_model=cost_model)
     report = backtester.run(bars)
 
-    assert report.trades
-    assert report.performance.fees_paid > 0
-    assert len(report.equity_curve) == len(bars) + 1
-    assert report.performance.total_return > -1.0
+    assert backtester.trades
+    assert backtester.simulator.fees_paid > 0
+    assert len(report.equity_arrays) == len(bars) + 1
+    assert report.metrics.total_return_pct > -100.0
 
 
 def test_walk_forward_runner_yields_multiple_windows():
@@ -67,6 +69,13 @@ def test_walk_forward_runner_yields_multiple_windows():
 
     reports = runner.run(bars)
     assert len(reports) >= 2
-    assert any(r.trades for r in reports)
+    assert any(r.metrics.total_trades for r in reports)
     for report in reports:
-        assert report.equity_curve
+        assert len(report.equity_arrays)
+
+
+def test_walk_forward_runner_requires_window_size():
+    start, bars = _sample_bars()
+    base_config = BacktestConfig(start=start, end=bars[-1].timestamp)
+    with pytest.raises(ValueError, match="window_size"):
+        WalkForwardRunner(base_config, WalkForwardConfig(train_period=timedelta(days=5)), lambda: [])